@@ -165,6 +165,14 @@ def create_app(storage_root: Optional[Path] = None) -> Optional[FastAPI]:
         openapi_url="/openapi.json"
     )
     
+    # Drain the background telemetry exporter on shutdown
+    app.add_event_handler("shutdown", flush_telemetry)
+
+    # Hot-reload event data: new snapshots are swapped in without a restart
+    from src.storage.snapshots import start_snapshot_watcher, stop_snapshot_watcher
+    app.add_event_handler("startup", start_snapshot_watcher)
+    app.add_event_handler("shutdown", stop_snapshot_watcher)
+
     # Add rate limiter to app state
     app.state.limiter = limiter
     
@@ -380,6 +388,9 @@ def create_app(storage_root: Optional[Path] = None) -> Optional[FastAPI]:
     if chat_router:
         app.include_router(chat_router)
         logger.info("✓ Chat router registered")
+
+        from src.api.llm_client import close_llm_client
+        app.add_event_handler("shutdown", close_llm_client)
     
     # ===== Error Handlers =====
     
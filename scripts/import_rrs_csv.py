@@ -280,8 +280,12 @@ def main():
     print(f"\n💾 Writing to {json_path}...")
     try:
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(json_path, 'w', encoding='utf-8') as f:
+        # Write to a temp file and rename so a running server's hot reload
+        # never sees a half-written file
+        tmp_path = json_path.with_suffix(json_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, json_path)
         print(f"✓ Successfully wrote {json_path}")
     except Exception as e:
         print(f"\n❌ Error writing JSON: {e}")
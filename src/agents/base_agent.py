@@ -20,6 +20,7 @@ except ImportError:
     ChatCompletionsClient = None
 
 from src.core.schemas import BaseKnowledgeArtifact, SourceType
+from src.storage.extraction_cache import ExtractionCache, get_extraction_cache
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ class BaseKnowledgeAgent(ABC):
         model: Optional[str] = None,
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache: Optional[ExtractionCache] = None,
     ):
         """
         Initialize base agent.
@@ -52,11 +54,13 @@ class BaseKnowledgeAgent(ABC):
             model: Model name (overrides env config)
             temperature: LLM temperature (0.0-1.0)
             max_tokens: Max tokens in response
+            cache: Extraction cache (defaults to the shared cache; disabled via EXTRACTION_CACHE_ENABLED)
         """
         self.source_type = source_type
         self.llm_provider = llm_provider
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache if cache is not None else get_extraction_cache()
 
         # Initialize LLM client
         self.client = self._initialize_llm_client(model)
@@ -133,6 +137,14 @@ class BaseKnowledgeAgent(ABC):
         """
         pass
 
+    def extraction_params(self) -> Dict[str, Any]:
+        """
+        Settings that change what extract_from_source returns.
+
+        Part of the parsed-text cache key; override in agents that have any.
+        """
+        return {}
+
     @abstractmethod
     def parse_extraction_output(self, llm_response: str) -> BaseKnowledgeArtifact:
         """
@@ -209,14 +221,34 @@ class BaseKnowledgeAgent(ABC):
             Structured knowledge artifact
         """
         logger.info(f"Starting extraction from {self.source_type.value} source")
-
-        # 1. Extract content from source
-        content = self.extract_from_source(source_input)
+        agent_type = self.__class__.__name__
+        source_hash = self.cache.digest(source_input) if self.cache else None
+
+        # 1. Extract content from source (parsed text is cached per input and parameters)
+        params = self.extraction_params()
+        content = self.cache.get_text(source_hash, agent_type, params) if self.cache else None
+        if content is None:
+            content = self.extract_from_source(source_input)
+            if self.cache:
+                self.cache.put_text(source_hash, agent_type, content, params)
         logger.info(f"Extracted {len(content)} characters from source")
 
         # 2. Get prompts for this agent type
         prompts = self.get_prompts()
 
+        key = None
+        if self.cache:
+            # Keyed on the text actually sent, not the source, so parser or
+            # truncation changes never reuse an artifact built from other text
+            prompt_version = self.cache.prompt_version(prompts["system_prompt"], prompts["extraction_prompt"])
+            key = self.cache.artifact_key(
+                self.cache.text_digest(content), agent_type, prompt_version, self.model, self.temperature
+            )
+            artifact = self.cache.get_artifact(key)
+            if artifact is not None:
+                logger.info(f"Extraction cache hit: {artifact.title}")
+                return artifact
+
         # 3. Call LLM
         llm_response = self.call_llm(prompts["system_prompt"], prompts["extraction_prompt"] + "\n\n" + content)
         logger.info(f"LLM response: {len(llm_response)} characters")
@@ -225,6 +257,9 @@ class BaseKnowledgeAgent(ABC):
         artifact = self.parse_extraction_output(llm_response)
         logger.info(f"Successfully extracted knowledge artifact: {artifact.title}")
 
+        if self.cache:
+            self.cache.put_artifact(key, artifact)
+
         return artifact
 
     def save_artifact(self, artifact: BaseKnowledgeArtifact, output_dir: str = "outputs/structured") -> str:
@@ -10,7 +10,7 @@ Replaces direct LLM client usage with Agent Framework for:
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from agent_framework import ChatAgent
 from agent_framework_azure_ai import AzureAIAgentClient
@@ -19,6 +19,7 @@ from azure.identity import DefaultAzureCredential
 from config import get_settings
 from src.core.schemas import BaseKnowledgeArtifact, SourceType
 from observability import setup_tracing
+from src.storage.extraction_cache import ExtractionCache, get_extraction_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class ModernKnowledgeAgent:
         agent_name: str,
         instructions: str,
         tools: Optional[list] = None,
+        cache: Optional[ExtractionCache] = None,
     ):
         """
         Initialize modern agent with Agent Framework.
@@ -50,11 +52,13 @@ class ModernKnowledgeAgent:
             agent_name: Display name for the agent
             instructions: System instructions for the agent
             tools: Optional list of tool functions for function calling
+            cache: Extraction cache (defaults to the shared cache; disabled via EXTRACTION_CACHE_ENABLED)
         """
         self.source_type = source_type
         self.agent_name = agent_name
         self.instructions = instructions
         self.settings = get_settings()
+        self.cache = cache if cache is not None else get_extraction_cache()
         
         # Initialize tracing
         setup_tracing()
@@ -102,22 +106,23 @@ class ModernKnowledgeAgent:
         Returns:
             Structured knowledge artifact
         """
-        # Create a new thread for this extraction
-        thread = self.agent.get_new_thread()
-        
-        # Build extraction prompt
-        extraction_prompt = self._build_extraction_prompt(input_data)
-        
-        # Stream response
-        full_response = ""
-        async for chunk in self.agent.run_stream(extraction_prompt, thread=thread):
-            if chunk.text:
-                full_response += chunk.text
-        
-        # Parse response into structured artifact
-        artifact = self._parse_response(full_response, input_data)
+        async def run() -> BaseKnowledgeArtifact:
+            # Create a new thread for this extraction
+            thread = self.agent.get_new_thread()
+            
+            # Build extraction prompt
+            extraction_prompt = self._build_extraction_prompt(input_data)
+            
+            # Stream response
+            full_response = ""
+            async for chunk in self.agent.run_stream(extraction_prompt, thread=thread):
+                if chunk.text:
+                    full_response += chunk.text
+            
+            # Parse response into structured artifact
+            return self._parse_response(full_response, input_data)
         
-        return artifact
+        return await self._cached_extract(input_data, run)
     
     async def extract_sync(self, input_data: str) -> BaseKnowledgeArtifact:
         """
@@ -129,12 +134,38 @@ class ModernKnowledgeAgent:
         Returns:
             Structured knowledge artifact
         """
-        thread = self.agent.get_new_thread()
-        extraction_prompt = self._build_extraction_prompt(input_data)
+        async def run() -> BaseKnowledgeArtifact:
+            thread = self.agent.get_new_thread()
+            extraction_prompt = self._build_extraction_prompt(input_data)
+            
+            result = await self.agent.run(extraction_prompt, thread=thread)
+            return self._parse_response(result.text, input_data)
         
-        result = await self.agent.run(extraction_prompt, thread=thread)
-        artifact = self._parse_response(result.text, input_data)
+        return await self._cached_extract(input_data, run)
+    
+    async def _cached_extract(
+        self,
+        input_data: str,
+        run: Callable[[], Awaitable[BaseKnowledgeArtifact]]
+    ) -> BaseKnowledgeArtifact:
+        """Return the cached artifact for unchanged input/instructions/model, else run and cache."""
+        if self.cache is None:
+            return await run()
+        
+        key = self.cache.artifact_key(
+            self.cache.digest(input_data),
+            self.__class__.__name__,
+            self.cache.prompt_version(self.instructions),
+            self.settings.foundry_model_deployment,
+            None,  # Agent Framework uses the deployment's default temperature
+        )
+        artifact = self.cache.get_artifact(key)
+        if artifact is not None:
+            logger.info(f"Extraction cache hit for {self.agent_name}")
+            return artifact
         
+        artifact = await run()
+        self.cache.put_artifact(key, artifact)
         return artifact
     
     def _build_extraction_prompt(self, input_data: str) -> str:
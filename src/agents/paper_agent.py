@@ -8,7 +8,6 @@ import json
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
-import pdfplumber
 
 from ..core.schemas.base_schema import BaseKnowledgeArtifact, SourceType
 from ..core.schemas.paper_schema import (
@@ -16,6 +15,7 @@ from ..core.schemas.paper_schema import (
     DatasetInfo,
 )
 from .base_agent import BaseKnowledgeAgent
+from .pdf_text import DEFAULT_TOKEN_BUDGET, extract_pdf_text
 from ..prompts.paper_prompts import get_paper_prompts
 
 
@@ -31,6 +31,7 @@ class PaperAgent(BaseKnowledgeAgent):
         model: Optional[str] = None,
         temperature: float = 0.3,
         max_tokens: int = 4000,
+        source_token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
     ):
         """Initialize PaperAgent
 
@@ -39,6 +40,7 @@ class PaperAgent(BaseKnowledgeAgent):
             model: Model name (uses environment defaults if not provided)
             temperature: LLM temperature (lower = more deterministic)
             max_tokens: Maximum tokens for LLM response
+            source_token_budget: Approximate token limit for extracted paper text (None for no limit)
         """
         super().__init__(
             source_type=SourceType.PAPER,
@@ -47,12 +49,17 @@ class PaperAgent(BaseKnowledgeAgent):
             temperature=temperature,
             max_tokens=max_tokens,
         )
+        self.source_token_budget = source_token_budget
         logger.info(f"Initialized PaperAgent with provider={llm_provider}, model={model}")
 
     def get_prompts(self) -> Dict[str, str]:
         """Get paper extraction prompts"""
         return get_paper_prompts()
 
+    def extraction_params(self) -> Dict[str, Any]:
+        """Paper text is truncated to the source token budget."""
+        return {"token_budget": self.source_token_budget}
+
     def extract_from_source(self, source_input: str) -> str:
         """Extract text from PDF file
 
@@ -73,30 +80,7 @@ class PaperAgent(BaseKnowledgeAgent):
         logger.info(f"Extracting text from PDF: {pdf_path}")
 
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                logger.info(f"PDF has {len(pdf.pages)} pages")
-
-                # Extract metadata
-                if pdf.metadata:
-                    text += f"Title: {pdf.metadata.get('Title', 'Unknown')}\n"
-                    text += f"Author: {pdf.metadata.get('Author', 'Unknown')}\n\n"
-
-                # Extract text from pages, limiting to first 50 pages to avoid token explosion
-                max_pages = min(len(pdf.pages), 50)
-                for i, page in enumerate(pdf.pages[:max_pages]):
-                    text += f"\n--- Page {i+1} ---\n"
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text
-
-                    # Log progress for long documents
-                    if (i + 1) % 10 == 0:
-                        logger.debug(f"Extracted {i+1} pages from PDF")
-
-            if len(pdf.pages) > 50:
-                text += f"\n[Note: PDF has {len(pdf.pages)} pages; extracted first 50]"
-
+            text = extract_pdf_text(pdf_path, token_budget=self.source_token_budget)
             logger.info(f"Successfully extracted {len(text)} characters from PDF")
             return text
 
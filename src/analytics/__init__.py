@@ -3,20 +3,45 @@
 Aggregation, dashboards, and reporting for system metrics and performance analysis.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import json
+import math
 
-from sqlalchemy import Column, String, DateTime, JSON, Float, Integer
+from sqlalchemy import Column, String, DateTime, JSON, Float, Integer, Index, cast, func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from infra.models import Base
-from src.observability.monitoring import ApplicationMetrics, Logger
+from src.observability.monitoring import ApplicationMetrics, Logger, get_metrics
 
 
 logger = Logger(__name__)
 
+# Percentiles reported for every metric in period summaries
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Linearly interpolated percentile of pre-sorted values.
+    
+    Matches PostgreSQL percentile_cont and NumPy's default interpolation.
+    
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile (0-100)
+        
+    Returns:
+        Percentile value, or None if there are no values
+    """
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
 
 class MetricType(str, Enum):
     """Types of metrics."""
@@ -38,6 +63,11 @@ class MetricsSnapshot(Base):
     tags = Column(JSON, nullable=True)  # {environment, service, version}
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     
+    # Serves per-metric aggregation over a time window from the index alone
+    __table_args__ = (
+        Index("ix_metrics_snapshots_name_timestamp", "metric_name", "timestamp", "value"),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -113,18 +143,419 @@ class DailyMetricsSummary(Base):
         }
 
 
+class MetricsRollup(Base):
+    """Pre-aggregated metric values for one time bucket.
+    
+    Values are summarized by count/sum/min/max plus a log-bucketed
+    histogram (keys from rollup_bucket) that merges across buckets and
+    yields percentiles within ROLLUP_RELATIVE_ERROR.
+    """
+    __tablename__ = "metrics_rollups"
+    
+    granularity = Column(String(10), primary_key=True)  # minute, hour, day
+    bucket_start = Column(DateTime, primary_key=True)
+    metric_name = Column(String(255), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)  # Snapshots, including null values
+    value_count = Column(Integer, nullable=False, default=0)
+    value_sum = Column(Float, nullable=False, default=0.0)
+    value_min = Column(Float, nullable=True)
+    value_max = Column(Float, nullable=True)
+    histogram = Column(JSON, nullable=False, default=dict)
+    
+    __table_args__ = (
+        Index("ix_metrics_rollups_tier_time", "granularity", "bucket_start"),
+    )
+
+
+# Rollup tiers, finest first
+ROLLUP_GRANULARITIES: Dict[str, timedelta] = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1)
+}
+
+# Default age after which raw snapshots and each rollup tier are compacted (None keeps forever)
+ROLLUP_RETENTION: Dict[str, Optional[timedelta]] = {
+    "raw": timedelta(days=7),
+    "minute": timedelta(days=2),
+    "hour": timedelta(days=90),
+    "day": None
+}
+
+_GAMMA = 1.02  # Histogram bucket growth factor
+_LOG_GAMMA = math.log(_GAMMA)
+ROLLUP_RELATIVE_ERROR = (_GAMMA - 1) / (_GAMMA + 1)
+
+
+def rollup_bucket(value: float) -> str:
+    """Histogram key for a value: 'z' for zero, 'p<k>'/'n<k>' for log-scale magnitudes."""
+    if value == 0:
+        return "z"
+    k = math.ceil(math.log(abs(value)) / _LOG_GAMMA)
+    return f"{'p' if value > 0 else 'n'}{k}"
+
+
+def _bucket_value(key: str) -> float:
+    """Representative value of a histogram key (midpoint in relative terms)."""
+    if key == "z":
+        return 0.0
+    magnitude = 2 * _GAMMA ** int(key[1:]) / (_GAMMA + 1)
+    return magnitude if key[0] == "p" else -magnitude
+
+
+def floor_time(ts: datetime, granularity: str) -> datetime:
+    """Start of the rollup bucket containing ts."""
+    if granularity == "minute":
+        return ts.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _ceil_time(ts: datetime, granularity: str) -> datetime:
+    start = floor_time(ts, granularity)
+    return start if start == ts else start + ROLLUP_GRANULARITIES[granularity]
+
+
+def plan_rollup_ranges(start: datetime, end: datetime) -> List[Tuple[str, datetime, datetime]]:
+    """Cover [start, end) with the coarsest rollup buckets that fit.
+    
+    Whole days are read from the day tier, the remaining whole hours at
+    either edge from the hour tier, and the rest from the minute tier, so
+    the number of rollup rows read is bounded regardless of range length.
+    The range is widened to whole minutes.
+    
+    Returns:
+        (granularity, range start, range end) segments
+    """
+    segments: List[Tuple[str, datetime, datetime]] = []
+    
+    def cover(lo: datetime, hi: datetime, tiers: List[str]) -> None:
+        if lo >= hi:
+            return
+        tier, finer = tiers[0], tiers[1:]
+        if not finer:
+            segments.append((tier, lo, hi))
+            return
+        inner_lo, inner_hi = _ceil_time(lo, tier), floor_time(hi, tier)
+        if inner_lo < inner_hi:
+            cover(lo, inner_lo, finer)
+            segments.append((tier, inner_lo, inner_hi))
+            cover(inner_hi, hi, finer)
+        else:
+            cover(lo, hi, finer)
+    
+    cover(floor_time(start, "minute"), _ceil_time(end, "minute"), ["day", "hour", "minute"])
+    return sorted(segments, key=lambda segment: segment[1])
+
+
+class _RollupStats:
+    """Mergeable accumulator for rollup rows."""
+    
+    def __init__(self):
+        self.count = 0
+        self.value_count = 0
+        self.value_sum = 0.0
+        self.value_min: Optional[float] = None
+        self.value_max: Optional[float] = None
+        self.histogram: Dict[str, int] = {}
+    
+    def merge(self, row: MetricsRollup) -> None:
+        self.count += row.count
+        self.value_count += row.value_count
+        self.value_sum += row.value_sum
+        if row.value_min is not None:
+            self.value_min = row.value_min if self.value_min is None else min(self.value_min, row.value_min)
+        if row.value_max is not None:
+            self.value_max = row.value_max if self.value_max is None else max(self.value_max, row.value_max)
+        for key, n in (row.histogram or {}).items():
+            self.histogram[key] = self.histogram.get(key, 0) + n
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.value_count:
+            return None
+        rank = round((self.value_count - 1) * pct / 100.0)
+        seen = 0
+        for key in sorted(self.histogram, key=_bucket_value):
+            seen += self.histogram[key]
+            if seen > rank:
+                return min(max(_bucket_value(key), self.value_min), self.value_max)
+        return self.value_max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        stats = {
+            "count": self.count,
+            "sum": self.value_sum if self.value_count else None,
+            "avg": self.value_sum / self.value_count if self.value_count else None,
+            "min": self.value_min,
+            "max": self.value_max
+        }
+        for p in SUMMARY_PERCENTILES:
+            stats[f"p{p}"] = self.percentile(p)
+        return stats
+
+
+class MetricsRollups:
+    """Maintains and queries per-minute, per-hour and per-day metric rollups.
+    
+    Every recorded snapshot updates its bucket in each tier, so range
+    queries read at most a few hundred pre-aggregated rows (see
+    plan_rollup_ranges) instead of every raw snapshot. compact() then
+    bounds storage by dropping raw snapshots and fine tiers past their
+    retention.
+    
+    Percentiles come from the merged histograms and are accurate to
+    within ROLLUP_RELATIVE_ERROR (1%) of the true value.
+    """
+    
+    def __init__(self, retention: Optional[Dict[str, Optional[timedelta]]] = None):
+        """Initialize rollups.
+        
+        Args:
+            retention: Overrides for ROLLUP_RETENTION ("raw", "minute", "hour", "day")
+        """
+        self.retention = {**ROLLUP_RETENTION, **(retention or {})}
+    
+    def record(self, db: Session, metric_name: str, timestamp: datetime, value: Optional[float]) -> None:
+        """Add one snapshot to every tier (in the caller's transaction).
+        
+        On PostgreSQL and SQLite each bucket is updated with a single
+        INSERT ... ON CONFLICT DO UPDATE that increments the stored
+        counters, so concurrent writers never lose updates. Other databases
+        lock the bucket row before updating it.
+        
+        Args:
+            db: Database session
+            metric_name: Metric name
+            timestamp: Snapshot timestamp
+            value: Snapshot value (None, NaN and infinities count as a
+                snapshot without a value)
+        """
+        if value is not None and not math.isfinite(value):
+            logger.debug(f"Rolling up non-finite {metric_name} value {value} without its value")
+            value = None
+        dialect = db.get_bind().dialect.name
+        for granularity in ROLLUP_GRANULARITIES:
+            bucket_start = floor_time(timestamp, granularity)
+            if dialect in ("postgresql", "sqlite"):
+                db.execute(self._upsert(dialect, granularity, bucket_start, metric_name, value))
+            else:
+                self._update_locked(db, granularity, bucket_start, metric_name, value)
+    
+    @staticmethod
+    def _upsert(dialect: str, granularity: str, bucket_start: datetime, metric_name: str, value: Optional[float]):
+        """Atomic insert-or-increment of one rollup row."""
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        has_value = value is not None
+        bucket = rollup_bucket(value) if has_value else None
+        stmt = insert(MetricsRollup).values(
+            granularity=granularity, bucket_start=bucket_start, metric_name=metric_name,
+            count=1, value_count=int(has_value), value_sum=value if has_value else 0.0,
+            value_min=value, value_max=value, histogram={bucket: 1} if has_value else {}
+        )
+        
+        row, new = MetricsRollup.__table__.c, stmt.excluded
+        updates = {"count": row.count + 1}
+        if has_value:
+            # PostgreSQL LEAST/GREATEST skip NULLs; SQLite's scalar MIN/MAX return NULL instead
+            least, greatest = (func.least, func.greatest) if dialect == "postgresql" else (func.min, func.max)
+            n = func.coalesce(row.histogram[bucket].as_integer(), 0) + 1
+            if dialect == "postgresql":
+                histogram = cast(
+                    cast(row.histogram, postgresql.JSONB).op("||")(func.jsonb_build_object(bucket, n)), JSON
+                )
+            else:
+                histogram = func.json_set(row.histogram, f'$."{bucket}"', n)
+            updates.update(
+                value_count=row.value_count + 1,
+                value_sum=row.value_sum + new.value_sum,
+                value_min=func.coalesce(least(row.value_min, new.value_min), new.value_min),
+                value_max=func.coalesce(greatest(row.value_max, new.value_max), new.value_max),
+                histogram=histogram
+            )
+        return stmt.on_conflict_do_update(
+            index_elements=["granularity", "bucket_start", "metric_name"], set_=updates
+        )
+    
+    @staticmethod
+    def _update_locked(
+        db: Session, granularity: str, bucket_start: datetime, metric_name: str, value: Optional[float]
+    ) -> None:
+        """Read-modify-write of one rollup row under a row lock."""
+        key = (granularity, bucket_start, metric_name)
+        row = db.get(MetricsRollup, key, with_for_update=True)
+        if row is None:
+            row = MetricsRollup(
+                granularity=granularity, bucket_start=bucket_start, metric_name=metric_name,
+                count=0, value_count=0, value_sum=0.0, histogram={}
+            )
+            db.add(row)
+        row.count += 1
+        if value is not None:
+            row.value_count += 1
+            row.value_sum += value
+            row.value_min = value if row.value_min is None else min(row.value_min, value)
+            row.value_max = value if row.value_max is None else max(row.value_max, value)
+            bucket = rollup_bucket(value)
+            # Reassign so the JSON column is marked dirty
+            row.histogram = {**row.histogram, bucket: row.histogram.get(bucket, 0) + 1}
+    
+    def rebuild(self, db: Session, start: datetime, end: datetime) -> int:
+        """Recompute rollups for [start, end) from raw snapshots (e.g. for existing history).
+        
+        The range is widened to whole days, so every deleted bucket in every
+        tier is replayed from exactly the snapshots it covers.
+        
+        Returns:
+            Number of snapshots rolled up
+        """
+        start, end = floor_time(start, "day"), _ceil_time(end, "day")
+        for granularity in ROLLUP_GRANULARITIES:
+            db.query(MetricsRollup).filter(
+                MetricsRollup.granularity == granularity,
+                MetricsRollup.bucket_start >= start,
+                MetricsRollup.bucket_start < end
+            ).delete()
+        
+        count = 0
+        rows = db.query(
+            MetricsSnapshot.metric_name, MetricsSnapshot.timestamp, MetricsSnapshot.value
+        ).filter(
+            MetricsSnapshot.timestamp >= start,
+            MetricsSnapshot.timestamp < end
+        ).order_by(MetricsSnapshot.timestamp).all()
+        for name, timestamp, value in rows:
+            self.record(db, name, timestamp, value)
+            count += 1
+        db.commit()
+        return count
+    
+    def _align(self, ts: datetime, now: datetime, ceil: bool) -> datetime:
+        """Widen a range edge to the resolution still retained at its age."""
+        for tier, coarser in (("minute", "hour"), ("hour", "day")):
+            keep = self.retention.get(tier)
+            if keep is not None and ts < now - keep:
+                ts = _ceil_time(ts, coarser) if ceil else floor_time(ts, coarser)
+        return ts
+    
+    def _rows(
+        self,
+        db: Session,
+        start: datetime,
+        end: datetime,
+        metric_names: Optional[Iterable[str]],
+        now: Optional[datetime]
+    ):
+        now = now or datetime.utcnow()
+        start, end = self._align(start, now, ceil=False), self._align(end, now, ceil=True)
+        for granularity, lo, hi in plan_rollup_ranges(start, end):
+            query = db.query(MetricsRollup).filter(
+                MetricsRollup.granularity == granularity,
+                MetricsRollup.bucket_start >= lo,
+                MetricsRollup.bucket_start < hi
+            )
+            if metric_names is not None:
+                query = query.filter(MetricsRollup.metric_name.in_(list(metric_names)))
+            yield from query
+    
+    def summarize(
+        self,
+        db: Session,
+        start: datetime,
+        end: datetime,
+        metric_names: Optional[Iterable[str]] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-metric statistics for [start, end) from the coarsest sufficient tiers.
+        
+        Args:
+            db: Database session
+            start: Range start (widened to the minute, or to the hour/day
+                once minute/hour rollups for that age are compacted)
+            end: Range end (widened likewise)
+            metric_names: Metrics to include (default: all)
+            now: Current time for retention checks (default: utcnow)
+            
+        Returns:
+            Metric name -> count, sum, avg, min, max, p50, p95, p99
+        """
+        merged: Dict[str, _RollupStats] = {}
+        for row in self._rows(db, start, end, metric_names, now):
+            merged.setdefault(row.metric_name, _RollupStats()).merge(row)
+        return {name: merged[name].to_dict() for name in sorted(merged)}
+    
+    def series(
+        self,
+        db: Session,
+        metric_name: str,
+        start: datetime,
+        end: datetime,
+        granularity: str = "hour"
+    ) -> List[Dict[str, Any]]:
+        """Per-bucket statistics of one metric at a single tier.
+        
+        Returns:
+            Buckets in time order, each with bucket_start and the summarize() statistics
+        """
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Unknown rollup granularity: {granularity}")
+        rows = db.query(MetricsRollup).filter(
+            MetricsRollup.granularity == granularity,
+            MetricsRollup.metric_name == metric_name,
+            MetricsRollup.bucket_start >= floor_time(start, granularity),
+            MetricsRollup.bucket_start < end
+        ).order_by(MetricsRollup.bucket_start)
+        
+        series = []
+        for row in rows:
+            stats = _RollupStats()
+            stats.merge(row)
+            series.append({"bucket_start": row.bucket_start.isoformat(), **stats.to_dict()})
+        return series
+    
+    def compact(self, db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Delete raw snapshots and rollup rows older than their retention.
+        
+        Cut-offs are aligned to the next coarser tier, so compacted ranges
+        are always still covered by a coarser rollup.
+        
+        Returns:
+            Rows deleted per tier ("raw", "minute", "hour", "day")
+        """
+        now = now or datetime.utcnow()
+        coarser = {"raw": "minute", "minute": "hour", "hour": "day", "day": "day"}
+        deleted = {}
+        for tier, keep in self.retention.items():
+            if keep is None:
+                continue
+            cutoff = floor_time(now - keep, coarser[tier])
+            if tier == "raw":
+                query = db.query(MetricsSnapshot).filter(MetricsSnapshot.timestamp < cutoff)
+            else:
+                query = db.query(MetricsRollup).filter(
+                    MetricsRollup.granularity == tier,
+                    MetricsRollup.bucket_start < cutoff
+                )
+            deleted[tier] = query.delete()
+        db.commit()
+        logger.info(f"Compacted metrics: {deleted}")
+        return deleted
+
+
 class MetricsAggregator:
     """Aggregates metrics into snapshots and summaries."""
     
-    def __init__(self, db: Session, metrics: ApplicationMetrics = None):
+    def __init__(self, db: Session, metrics: ApplicationMetrics = None, rollups: MetricsRollups = None):
         """Initialize aggregator.
         
         Args:
             db: Database session
             metrics: ApplicationMetrics instance
+            rollups: Rollup tiers maintained as snapshots are recorded
         """
         self.db = db
-        self.metrics = metrics or ApplicationMetrics()
+        self.metrics = metrics or ApplicationMetrics(logger, get_metrics())
+        self.rollups = rollups or MetricsRollups()
     
     def record_snapshot(
         self,
@@ -157,6 +588,7 @@ class MetricsAggregator:
         )
         
         self.db.add(snapshot)
+        self.rollups.record(self.db, metric_name, snapshot.timestamp, value)
         self.db.commit()
         
         logger.info(f"Recorded metric: {metric_name} = {value}", extra={"metric_type": metric_type.value})
@@ -199,38 +631,112 @@ class MetricsAggregator:
             Daily summary dictionary
         """
         start = datetime(date.year, date.month, date.day, 0, 0, 0)
-        end = start + timedelta(days=1)
+        summary_data = self.calculate_period_summary(start, start + timedelta(days=1))
+        summary_data["date"] = start
+        return summary_data
+    
+    def calculate_period_summary(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        """Calculate per-metric statistics for snapshots in [start, end).
         
-        # Aggregate metrics for the day
-        summaries = self.db.query(MetricsSnapshot).filter(
+        Count, sum, average, min and max are computed by the database with
+        GROUP BY metric_name. Percentiles use percentile_cont on PostgreSQL;
+        other databases return the values as one column sorted by
+        (metric_name, value), so each percentile is an index lookup. No ORM
+        objects are loaded either way.
+        
+        Args:
+            start: Period start (inclusive)
+            end: Period end (exclusive)
+            
+        Returns:
+            Summary with total_snapshots and metrics_by_name statistics
+            (count, sum, avg, min, max, p50, p95, p99)
+        """
+        in_period = (
             MetricsSnapshot.timestamp >= start,
             MetricsSnapshot.timestamp < end
-        ).all()
+        )
+        value = MetricsSnapshot.value
+        pushdown = self.db.get_bind().dialect.name == "postgresql"
+        
+        columns = [
+            MetricsSnapshot.metric_name,
+            func.count(),
+            func.count(value),
+            func.sum(value),
+            func.avg(value),
+            func.min(value),
+            func.max(value)
+        ]
+        if pushdown:
+            columns += [func.percentile_cont(p / 100.0).within_group(value) for p in SUMMARY_PERCENTILES]
+        
+        rows = self.db.query(*columns).filter(*in_period).group_by(
+            MetricsSnapshot.metric_name
+        ).order_by(MetricsSnapshot.metric_name).all()
+        
+        sorted_values: List[float] = []
+        if not pushdown and rows:
+            sorted_values = [
+                v for (v,) in self.db.query(value).filter(*in_period, value.isnot(None)).order_by(
+                    MetricsSnapshot.metric_name, value
+                )
+            ]
         
-        summary_data = {
-            "date": start,
-            "total_snapshots": len(summaries),
-            "metrics_by_name": {}
+        metrics_by_name: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        for name, count, value_count, total, avg, minimum, maximum, *percentiles in rows:
+            if not pushdown:
+                values = sorted_values[offset:offset + value_count]
+                offset += value_count
+                percentiles = [percentile(values, p) for p in SUMMARY_PERCENTILES]
+            stats = {
+                "count": count,
+                "sum": total,
+                "avg": float(avg) if avg is not None else None,
+                "min": minimum,
+                "max": maximum
+            }
+            for p, result in zip(SUMMARY_PERCENTILES, percentiles):
+                stats[f"p{p}"] = float(result) if result is not None else None
+            metrics_by_name[name] = stats
+        
+        return {
+            "start": start,
+            "end": end,
+            "total_snapshots": sum(stats["count"] for stats in metrics_by_name.values()),
+            "metrics_by_name": metrics_by_name
         }
+    
+    def summarize_metrics(
+        self,
+        start: datetime,
+        end: datetime,
+        metric_names: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-metric statistics for [start, end), read from the rollups.
         
-        # Group by metric name
-        for snapshot in summaries:
-            if snapshot.metric_name not in summary_data["metrics_by_name"]:
-                summary_data["metrics_by_name"][snapshot.metric_name] = []
-            summary_data["metrics_by_name"][snapshot.metric_name].append(snapshot.value)
-        
-        # Calculate statistics
-        for metric_name, values in summary_data["metrics_by_name"].items():
-            if values:
-                summary_data["metrics_by_name"][metric_name] = {
-                    "count": len(values),
-                    "sum": sum(values),
-                    "avg": sum(values) / len(values),
-                    "min": min(values),
-                    "max": max(values)
-                }
+        Falls back to calculate_period_summary over raw snapshots when the
+        range has no rollups, e.g. for history recorded before rollups were
+        maintained (MetricsRollups.rebuild backfills it).
         
-        return summary_data
+        Args:
+            start: Period start
+            end: Period end
+            metric_names: Metrics to include (default: all)
+            
+        Returns:
+            Metric name -> count, sum, avg, min, max, p50, p95, p99
+        """
+        names = list(metric_names) if metric_names is not None else None
+        metrics = self.rollups.summarize(self.db, start, end, names)
+        if metrics:
+            return metrics
+        
+        metrics = self.calculate_period_summary(start, end)["metrics_by_name"]
+        if names is not None:
+            metrics = {name: stats for name, stats in metrics.items() if name in names}
+        return metrics
     
     def store_daily_summary(self, summary: DailyMetricsSummary) -> str:
         """Store daily summary in database.
@@ -320,8 +826,16 @@ class DashboardAPI:
         end = datetime.utcnow()
         start = end - timedelta(hours=hours)
         
-        request_times = self.aggregator.get_metric_range("http_request_duration_ms", start, end, limit=1000)
-        query_times = self.aggregator.get_metric_range("db_query_duration_ms", start, end, limit=1000)
+        names = ("http_request_duration_ms", "db_query_duration_ms")
+        summary = self.aggregator.summarize_metrics(start, end, names)
+        
+        def performance(name: str) -> Dict[str, Any]:
+            stats = summary.get(name, {})
+            return {
+                "samples": stats.get("count", 0),
+                "summary": stats,
+                "metrics": self.aggregator.get_metric_range(name, start, end, limit=10)  # Last 10
+            }
         
         return {
             "period": {
@@ -329,14 +843,8 @@ class DashboardAPI:
                 "end": end.isoformat(),
                 "hours": hours
             },
-            "request_performance": {
-                "samples": len(request_times),
-                "metrics": request_times[:10]  # Last 10
-            },
-            "database_performance": {
-                "samples": len(query_times),
-                "metrics": query_times[:10]  # Last 10
-            }
+            "request_performance": performance("http_request_duration_ms"),
+            "database_performance": performance("db_query_duration_ms")
         }
     
     def get_health_dashboard(self) -> Dict[str, Any]:
@@ -405,6 +913,7 @@ class ReportGenerator:
         start_date = end_date - timedelta(days=7)
         
         summaries = self.aggregator.get_daily_summaries(start_date, end_date)
+        metrics = self.aggregator.summarize_metrics(start_date, end_date)
         
         return {
             "period": {
@@ -413,6 +922,7 @@ class ReportGenerator:
             },
             "report_type": "weekly",
             "daily_summaries": summaries,
+            "metrics": metrics,
             "generated_at": datetime.utcnow().isoformat()
         }
     
@@ -454,6 +964,7 @@ class ReportGenerator:
                 "error_rate_percent": (total_errors / total_requests * 100) if total_requests > 0 else 0,
                 "daily_count": len(summaries)
             },
+            "metrics": self.aggregator.summarize_metrics(start_date, end_date),
             "generated_at": datetime.utcnow().isoformat()
         }
     
@@ -20,6 +20,7 @@ class ActionMetadata:
     handler: "BaseActionHandler"
     requires_foundry: bool = False
     description: Optional[str] = None
+    cacheable: bool = False
     supported_platforms: List[str] = field(default_factory=lambda: ["teams", "web"])
 
 
@@ -121,6 +122,7 @@ class ActionRegistry:
         handler: BaseActionHandler,
         requires_foundry: bool = False,
         description: Optional[str] = None,
+        cacheable: bool = False,
     ) -> None:
         """
         Register an action handler.
@@ -130,6 +132,8 @@ class ActionRegistry:
             handler: BaseActionHandler instance
             requires_foundry: Whether action needs Foundry delegation capability
             description: Human-readable description
+            cacheable: Whether execute() output depends only on the payload and
+                event data, so its encoded response may be reused
             
         Raises:
             ValueError: If action_name already registered
@@ -142,6 +146,7 @@ class ActionRegistry:
             handler=handler,
             requires_foundry=requires_foundry,
             description=description,
+            cacheable=cacheable,
         )
         self._handlers[action_name] = metadata
         self.logger.info(
@@ -202,6 +207,21 @@ class ActionRegistry:
             )
             raise
 
+    async def apply_context(
+        self,
+        action_name: str,
+        payload: Dict[str, Any],
+        context: Any,
+    ) -> None:
+        """Apply a handler's context update without executing it.
+
+        Used when a cacheable action's response is served from cache so the
+        conversation context still advances as if the handler had run.
+        """
+        if action_name not in self._handlers:
+            raise KeyError(f"Action '{action_name}' not registered")
+        await self._handlers[action_name].handler.update_context(payload, context)
+
     def get_handler(self, action_name: str) -> Optional[BaseActionHandler]:
         """Get registered handler by name."""
         metadata = self._handlers.get(action_name)
@@ -214,6 +234,7 @@ class ActionRegistry:
                 "description": metadata.description,
                 "requires_foundry": metadata.requires_foundry,
                 "handler_class": metadata.handler.__class__.__name__,
+                "cacheable": metadata.cacheable,
             }
             for name, metadata in self._handlers.items()
         }
@@ -222,6 +243,11 @@ class ActionRegistry:
         """Check if action is registered."""
         return action_name in self._handlers
 
+    def is_cacheable(self, action_name: str) -> bool:
+        """Check if an action's response may be served from cache."""
+        metadata = self._handlers.get(action_name)
+        return metadata.cacheable if metadata else False
+
 
 # Global singleton instance
 _registry: Optional[ActionRegistry] = None
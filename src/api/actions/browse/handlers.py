@@ -5,9 +5,9 @@ from typing import Dict, Any, Tuple, Optional
 
 from src.api.actions.base import BaseActionHandler
 from src.api.actions.decorators import register_action
-from src.api.actions.helpers import build_project_carousel, apply_filter
+from src.api.actions.helpers import build_project_carousel
 from src.api.caching import get_session_cache
-from src.storage.event_data import get_event_data
+from src.storage.catalog import get_project_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 @register_action(
     "browse_all",
     description="Display all or featured projects with carousel card",
+    cacheable=True,
 )
 class BrowseAllHandler(BaseActionHandler):
     """Handler for browse_all action."""
@@ -25,17 +26,12 @@ class BrowseAllHandler(BaseActionHandler):
         """Execute browse_all action."""
         try:
             cache = get_session_cache()
-            
-            # Try to get from cache first
-            projects = cache.get("projects")
-            if projects is None:
-                # Load fresh from storage
-                event_data = get_event_data()
-                projects = event_data.get("projects", [])
-                # Cache for future requests
-                cache.set("projects", {"list": projects})
-            else:
-                projects = projects.get("list", [])
+
+            # Concurrent misses share a single load from storage
+            cached = await cache.get_or_load(
+                "projects", lambda: {"list": get_project_catalog().projects}
+            )
+            projects = cached.get("list", [])
 
             logger.info(f"Browse all: loaded {len(projects)} projects")
 
@@ -65,6 +61,7 @@ class BrowseAllHandler(BaseActionHandler):
 @register_action(
     "show_featured",
     description="Show only featured/highlighted projects",
+    cacheable=True,
 )
 class ShowFeaturedHandler(BaseActionHandler):
     """Handler for show_featured action."""
@@ -74,13 +71,8 @@ class ShowFeaturedHandler(BaseActionHandler):
     ) -> Tuple[str, Optional[Dict[str, Any]]]:
         """Execute show_featured action."""
         try:
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            # Filter for featured projects
-            featured = apply_filter(
-                all_projects, lambda p: p.get("featured", False)
-            )
+            catalog = get_project_catalog()
+            featured = catalog.rows(catalog.featured_rows())
 
             logger.info(f"Show featured: found {len(featured)} projects")
 
@@ -109,6 +101,7 @@ class ShowFeaturedHandler(BaseActionHandler):
 @register_action(
     "recent_projects",
     description="Show recently added projects sorted by date",
+    cacheable=True,
 )
 class RecentProjectsHandler(BaseActionHandler):
     """Handler for recent_projects action."""
@@ -118,8 +111,7 @@ class RecentProjectsHandler(BaseActionHandler):
     ) -> Tuple[str, Optional[Dict[str, Any]]]:
         """Execute recent_projects action."""
         try:
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
+            all_projects = get_project_catalog().projects
 
             # Filter projects with dates and sort
             dated_projects = [p for p in all_projects if p.get("date")]
@@ -15,6 +15,7 @@ def register_action(
     action_name: str,
     description: Optional[str] = None,
     requires_foundry: bool = False,
+    cacheable: bool = False,
 ):
     """
     Decorator to register an action handler.
@@ -29,6 +30,8 @@ def register_action(
         action_name: Unique action identifier
         description: Human-readable description
         requires_foundry: If True, handler can delegate to Foundry agents
+        cacheable: If True, execute() depends only on the payload and event
+            data and its encoded response may be reused across requests
     """
 
     def decorator(cls: Type) -> Type:
@@ -45,6 +48,7 @@ def register_action(
                 handler_instance,
                 requires_foundry=requires_foundry,
                 description=description,
+                cacheable=cacheable,
             )
             logger.info(f"Registered action handler: {action_name}")
         except ValueError as e:
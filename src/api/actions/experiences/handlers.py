@@ -9,6 +9,7 @@ from src.observability.telemetry import track_event
 from src.api.actions.base import BaseActionHandler
 from src.api.actions.decorators import register_action
 from src.api.actions.helpers import build_agenda_card, build_presenter_carousel
+from src.storage.catalog import get_project_catalog
 from src.storage.event_data import get_event_data
 
 logger = logging.getLogger(__name__)
@@ -189,14 +190,12 @@ class DownloadPosterPDFHandler(BaseActionHandler):
             if not project_id:
                 return "Please specify which poster to download.", None
 
-            event_data = get_event_data()
-            projects = event_data.get("projects", [])
-            for p in projects:
-                if p.get("id") == project_id:
-                    pdf = p.get("posterUrl")
-                    if pdf:
-                        return f"Here is the poster PDF:\n{pdf}", None
-                    return "This project doesn't have a poster PDF yet.", None
+            project = get_project_catalog().get(project_id)
+            if project:
+                pdf = project.get("posterUrl")
+                if pdf:
+                    return f"Here is the poster PDF:\n{pdf}", None
+                return "This project doesn't have a poster PDF yet.", None
 
             return "I couldn't find that project.", None
         except Exception as e:
@@ -5,8 +5,8 @@ from typing import Dict, Any, Tuple, Optional
 
 from src.api.actions.base import BaseActionHandler
 from src.api.actions.decorators import register_action
-from src.api.actions.helpers import build_project_carousel, apply_filter, format_project_list
-from src.storage.event_data import get_event_data
+from src.api.actions.helpers import build_project_carousel, format_project_list
+from src.storage.catalog import get_project_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 @register_action(
     "filter_by_status",
     description="Filter projects by status",
+    cacheable=True,
 )
 class FilterByStatusHandler(BaseActionHandler):
     """Handler for filter_by_status action."""
@@ -27,13 +28,8 @@ class FilterByStatusHandler(BaseActionHandler):
             if not status:
                 raise ValueError("Status parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: p.get("status", "").lower() == status,
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.filter(exact=True, status=status)
 
             logger.info(f"Filter by status '{status}': found {len(filtered)} projects")
 
@@ -51,6 +47,7 @@ class FilterByStatusHandler(BaseActionHandler):
 @register_action(
     "filter_by_team_size",
     description="Filter projects by team size range",
+    cacheable=True,
 )
 class FilterByTeamSizeHandler(BaseActionHandler):
     """Handler for filter_by_team_size action."""
@@ -66,13 +63,8 @@ class FilterByTeamSizeHandler(BaseActionHandler):
             if min_size > max_size:
                 raise ValueError("min cannot be greater than max")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: min_size <= len(p.get("team", [])) <= max_size,
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.rows(catalog.team_size_rows(min_size, max_size))
 
             logger.info(
                 f"Filter by team size {min_size}-{max_size}: found {len(filtered)} projects"
@@ -89,6 +81,7 @@ class FilterByTeamSizeHandler(BaseActionHandler):
 @register_action(
     "filter_by_audience",
     description="Filter projects by target audience",
+    cacheable=True,
 )
 class FilterByAudienceHandler(BaseActionHandler):
     """Handler for filter_by_audience action."""
@@ -102,13 +95,8 @@ class FilterByAudienceHandler(BaseActionHandler):
             if not audience:
                 raise ValueError("Audience parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: audience in p.get("targetAudience", "").lower(),
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.filter(targetAudience=audience)
 
             logger.info(f"Filter by audience '{audience}': found {len(filtered)} projects")
 
@@ -123,6 +111,7 @@ class FilterByAudienceHandler(BaseActionHandler):
 @register_action(
     "filter_by_location",
     description="Filter projects by placement location",
+    cacheable=True,
 )
 class FilterByLocationHandler(BaseActionHandler):
     """Handler for filter_by_location action."""
@@ -136,13 +125,8 @@ class FilterByLocationHandler(BaseActionHandler):
             if not location:
                 raise ValueError("Location parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: location in p.get("placement", "").lower(),
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.filter(placement=location)
 
             logger.info(f"Filter by location '{location}': found {len(filtered)} projects")
 
@@ -157,6 +141,7 @@ class FilterByLocationHandler(BaseActionHandler):
 @register_action(
     "equipment_filter",
     description="Filter projects by equipment needs",
+    cacheable=True,
 )
 class EquipmentFilterHandler(BaseActionHandler):
     """Handler for equipment_filter action."""
@@ -170,13 +155,8 @@ class EquipmentFilterHandler(BaseActionHandler):
             if not equipment:
                 raise ValueError("Equipment parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: equipment in ", ".join(p.get("equipment", [])).lower(),
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.filter(equipment=equipment)
 
             logger.info(f"Equipment filter '{equipment}': found {len(filtered)} projects")
 
@@ -191,6 +171,7 @@ class EquipmentFilterHandler(BaseActionHandler):
 @register_action(
     "recording_filter",
     description="Filter projects by recording availability",
+    cacheable=True,
 )
 class RecordingFilterHandler(BaseActionHandler):
     """Handler for recording_filter action."""
@@ -202,15 +183,12 @@ class RecordingFilterHandler(BaseActionHandler):
         try:
             available = payload.get("available", True)
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: (
-                    p.get("recordingPermission", "").lower() == "yes"
-                ) == available,
-            )
+            catalog = get_project_catalog()
+            recordable = catalog.lookup("recordingPermission", "yes")
+            if available:
+                filtered = catalog.rows(recordable)
+            else:
+                filtered = catalog.rows(set(range(len(catalog))) - recordable)
 
             logger.info(
                 f"Recording filter (available={available}): found {len(filtered)} projects"
@@ -235,6 +213,7 @@ class RecordingFilterHandler(BaseActionHandler):
 @register_action(
     "filter_by_area",
     description="Filter projects by research area",
+    cacheable=True,
 )
 class FilterByAreaHandler(BaseActionHandler):
     """Handler for filter_by_area action."""
@@ -248,13 +227,8 @@ class FilterByAreaHandler(BaseActionHandler):
             if not area:
                 raise ValueError("Area parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: area in p.get("researchArea", "").lower(),
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.filter(researchArea=area)
 
             logger.info(f"Filter by area '{area}': found {len(filtered)} projects")
 
@@ -280,4 +254,6 @@ class FilterByAreaHandler(BaseActionHandler):
         area = payload.get("area", "")
         if area:
             context.add_category(area)
+            # Recorded here rather than in execute, which is skipped on cache hits
+            context.set_results(get_project_catalog().filter(researchArea=area.lower()))
         context.conversation_stage = "show_results"
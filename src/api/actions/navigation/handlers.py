@@ -5,8 +5,8 @@ from typing import Dict, Any, Tuple, Optional
 
 from src.api.actions.base import BaseActionHandler
 from src.api.actions.decorators import register_action
-from src.api.actions.helpers import format_project_list, apply_filter
-from src.storage.event_data import get_event_data
+from src.api.actions.helpers import format_project_list
+from src.storage.catalog import get_project_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +27,7 @@ class ViewProjectHandler(BaseActionHandler):
             if not project_id:
                 raise ValueError("projectId parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            project = next(
-                (p for p in all_projects if p.get("id") == project_id), None
-            )
+            project = get_project_catalog().get(project_id)
 
             if not project:
                 logger.warning(f"Project not found: {project_id}")
@@ -92,13 +87,14 @@ class BackToResultsHandler(BaseActionHandler):
     ) -> Tuple[str, Optional[Dict[str, Any]]]:
         """Execute back_to_results action."""
         try:
-            if not context.last_results:
+            results = context.get_results()
+            if not results:
                 return "No previous results available.", None
 
-            logger.info(f"Back to results: {len(context.last_results)} results")
+            logger.info(f"Back to results: {len(results)} results")
 
-            text = f"📊 Showing {len(context.last_results)} results\n\n"
-            text += format_project_list(context.last_results, limit=5)
+            text = f"📊 Showing {len(results)} results\n\n"
+            text += format_project_list(results, limit=5)
 
             return text, None
 
@@ -115,7 +111,7 @@ class BackToResultsHandler(BaseActionHandler):
 
 @register_action(
     "find_similar",
-    description="Find projects similar to current project by research area",
+    description="Find projects similar to current project (falls back to research area)",
 )
 class FindSimilarHandler(BaseActionHandler):
     """Handler for find_similar action."""
@@ -125,17 +121,25 @@ class FindSimilarHandler(BaseActionHandler):
     ) -> Tuple[str, Optional[Dict[str, Any]]]:
         """Execute find_similar action."""
         try:
-            research_area = payload.get("researchArea", "").lower()
-            if not research_area:
-                raise ValueError("researchArea parameter is required")
-
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            similar = apply_filter(
-                all_projects,
-                lambda p: research_area in p.get("researchArea", "").lower(),
-            )[:5]
+            project_id = payload.get("projectId") or ""
+            research_area = (payload.get("researchArea") or "").lower()
+            if not project_id and not research_area:
+                raise ValueError("projectId or researchArea parameter is required")
+
+            catalog = get_project_catalog()
+            project = catalog.get(project_id) if project_id else None
+            if project:
+                similar = catalog.similar(project_id, limit=5)
+                logger.info(f"Find similar to '{project_id}': found {len(similar)} projects")
+                if similar:
+                    text = f"🔍 Found {len(similar)} projects similar to {project.get('name', project_id)}:\n\n"
+                    text += format_project_list(similar)
+                    return text, None
+                research_area = research_area or (project.get("researchArea") or "").lower()
+                if not research_area:
+                    return f"No similar projects found for {project.get('name', project_id)}.", None
+
+            similar = [p for p in catalog.filter(researchArea=research_area) if p is not project][:5]
 
             logger.info(f"Find similar in '{research_area}': found {len(similar)} projects")
 
@@ -155,6 +159,7 @@ class FindSimilarHandler(BaseActionHandler):
 @register_action(
     "category_select",
     description="Select a research category",
+    cacheable=True,
 )
 class CategorySelectHandler(BaseActionHandler):
     """Handler for category_select action."""
@@ -183,7 +183,8 @@ class FindSimilarPayload(NavigationPayload):
     """Schema for find_similar action."""
 
     action: str = Field("find_similar")
-    researchArea: str = Field(..., description="Research area for similar projects")
+    projectId: Optional[str] = Field(None, description="Project to find similar projects for")
+    researchArea: Optional[str] = Field(None, description="Research area fallback when no project is given")
 
 
 class CategorySelectPayload(NavigationPayload):
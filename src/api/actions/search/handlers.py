@@ -5,8 +5,8 @@ from typing import Dict, Any, Tuple, Optional
 
 from src.api.actions.base import BaseActionHandler
 from src.api.actions.decorators import register_action
-from src.api.actions.helpers import build_project_carousel, apply_filter, format_project_list
-from src.storage.event_data import get_event_data
+from src.api.actions.helpers import build_project_carousel, format_project_list
+from src.storage.catalog import get_project_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +27,8 @@ class KeywordSearchHandler(BaseActionHandler):
             if not keyword:
                 raise ValueError("Keyword parameter is required")
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: (
-                    keyword in p.get("description", "").lower()
-                    or keyword in p.get("name", "").lower()
-                ),
-            )
+            filtered = get_project_catalog().search(keyword)
+            context.set_results(filtered)
 
             logger.info(f"Keyword search '{keyword}': found {len(filtered)} projects")
 
@@ -84,16 +76,9 @@ class ResearcherSearchHandler(BaseActionHandler):
                 text = "Please enter a researcher name to search for their projects."
                 return text, None
 
-            event_data = get_event_data()
-            all_projects = event_data.get("projects", [])
-
-            filtered = apply_filter(
-                all_projects,
-                lambda p: any(
-                    researcher in m.get("name", "").lower()
-                    for m in p.get("team", [])
-                ),
-            )
+            catalog = get_project_catalog()
+            filtered = catalog.filter(team=researcher)
+            context.set_results(filtered)
 
             logger.info(f"Researcher search '{researcher}': found {len(filtered)} projects")
 
@@ -2,16 +2,29 @@
 Session-level caching for event data.
 
 Configurable caching to optimize data loading while allowing on-demand
-fetches for real-time updates.
+fetches for real-time updates. The cache is bounded by entry count and
+estimated byte size, evicts least-recently-used entries first, and
+collapses concurrent misses for the same key into a single load.
+
+With a version provider (e.g. the event data snapshot version), every
+entry is tagged with the version it was loaded under and is treated as a
+miss once the data has been swapped for a newer snapshot.
 """
 
+import asyncio
+import inspect
+import json
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from datetime import datetime
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+Loader = Callable[[], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+
 
 @dataclass
 class CacheEntry:
@@ -20,6 +33,8 @@ class CacheEntry:
     data: Dict[str, Any]
     created_at: datetime = field(default_factory=datetime.now)
     ttl_seconds: int = 3600  # 1 hour default
+    size_bytes: int = 0
+    version: Optional[int] = None
 
     def is_expired(self) -> bool:
         """Check if cache entry has expired."""
@@ -27,56 +42,168 @@ class CacheEntry:
         return age > self.ttl_seconds
 
 
+@dataclass
+class KeyStats:
+    """Hit/miss/eviction counters for a single cache key."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def estimate_size(data: Any) -> int:
+    """Estimate the in-memory footprint of cached data from its JSON size."""
+    try:
+        return len(json.dumps(data, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
 class SessionCache:
     """
     Session-level cache for event data.
-    
+
     Stores project/session data with optional expiration.
     Can be disabled per request via cache_enabled flag.
-    
+
     Usage:
         cache = SessionCache(enabled=True, ttl_seconds=3600)
         cache.set("projects", projects_data)
         projects = cache.get("projects")
+
+        # Concurrent misses for "projects" share one loader call
+        projects = await cache.get_or_load("projects", load_projects)
     """
 
-    def __init__(self, enabled: bool = True, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        name: str = "session",
+        metrics: Optional[Any] = None,
+        key_label: Optional[Callable[[str], str]] = None,
+        version_provider: Optional[Callable[[], int]] = None,
+    ):
         """
         Initialize cache.
-        
+
         Args:
             enabled: If False, cache is bypassed (on-demand mode)
             ttl_seconds: Time-to-live for cached entries
+            max_entries: Maximum number of entries before LRU eviction
+            max_bytes: Maximum estimated total size before LRU eviction
+            name: Cache name used as the metrics label
+            metrics: Optional MetricsCollector to export counters to
+            key_label: Optional mapping from cache key to the label stats are
+                grouped under (keeps metric cardinality bounded for
+                high-cardinality keys)
+            version_provider: Optional callable returning the current data
+                version; entries stored under an older version are misses
         """
         self.enabled = enabled
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, CacheEntry] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.name = name
+        self.metrics = metrics
+        self.key_label = key_label
+        self.version_provider = version_provider
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, KeyStats] = {}
         self.logger = logging.getLogger(f"{__name__}.SessionCache")
 
-    def set(self, key: str, data: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+    def _record(self, key: str, result: str, reason: Optional[str] = None) -> None:
+        """Update per-key counters and export them to Prometheus if configured."""
+        if self.key_label is not None:
+            key = self.key_label(key)
+        stats = self._stats.setdefault(key, KeyStats())
+        if result == "hit":
+            stats.hits += 1
+        elif result == "miss":
+            stats.misses += 1
+        else:
+            stats.evictions += 1
+
+        if self.metrics is None:
+            return
+        if result == "eviction":
+            self.metrics.cache_evictions_total.labels(cache=self.name, key=key, reason=reason).inc()
+        else:
+            self.metrics.cache_requests_total.labels(cache=self.name, key=key, result=result).inc()
+        self.metrics.cache_entries.labels(cache=self.name).set(len(self._cache))
+        self.metrics.cache_bytes.labels(cache=self.name).set(self._bytes)
+
+    def _remove(self, key: str, reason: Optional[str] = None) -> None:
+        """Remove an entry, counting it as an eviction when a reason is given."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size_bytes
+        if reason is not None:
+            self._record(key, "eviction", reason)
+
+    def _evict(self) -> None:
+        """Evict least-recently-used entries until within limits."""
+        while self._cache and (len(self._cache) > self.max_entries or self._bytes > self.max_bytes):
+            key = next(iter(self._cache))
+            reason = "entries" if len(self._cache) > self.max_entries else "bytes"
+            self._remove(key, reason)
+            self.logger.debug(f"Evicted '{key}' ({reason} limit)")
+
+    def _current_version(self) -> Optional[int]:
+        return self.version_provider() if self.version_provider is not None else None
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        ttl_seconds: Optional[int] = None,
+        size_bytes: Optional[int] = None,
+        version: Optional[int] = None,
+    ) -> None:
         """
         Store data in cache.
-        
+
         Args:
             key: Cache key (e.g., "projects", "sessions")
             data: Data to cache
             ttl_seconds: Optional TTL override for this entry
+            size_bytes: Optional size override; estimated from JSON size if omitted
+            version: Data version the value was derived from; defaults to
+                the current version
         """
         if not self.enabled:
             self.logger.debug(f"Cache disabled, skipping set for key: {key}")
             return
 
         ttl = ttl_seconds or self.ttl_seconds
-        self._cache[key] = CacheEntry(data=data, ttl_seconds=ttl)
-        self.logger.debug(f"Cached '{key}' (TTL: {ttl}s)")
+        size = size_bytes if size_bytes is not None else estimate_size(data)
+        if size > self.max_bytes:
+            self.logger.warning(f"Not caching '{key}': {size} bytes exceeds max_bytes {self.max_bytes}")
+            return
+
+        if version is None:
+            version = self._current_version()
+
+        with self._lock:
+            self._remove(key)
+            self._cache[key] = CacheEntry(data=data, ttl_seconds=ttl, size_bytes=size, version=version)
+            self._bytes += size
+            self._evict()
+        self.logger.debug(f"Cached '{key}' (TTL: {ttl}s, {size} bytes)")
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve data from cache.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached data or None if not found/expired
         """
@@ -84,39 +211,101 @@ class SessionCache:
             self.logger.debug(f"Cache disabled, skipping get for key: {key}")
             return None
 
-        entry = self._cache.get(key)
-        if entry is None:
-            self.logger.debug(f"Cache miss for key: {key}")
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.logger.debug(f"Cache miss for key: {key}")
+                self._record(key, "miss")
+                return None
 
-        if entry.is_expired():
-            self.logger.debug(f"Cache expired for key: {key}, removing")
-            del self._cache[key]
-            return None
+            if entry.is_expired():
+                self.logger.debug(f"Cache expired for key: {key}, removing")
+                self._remove(key, "ttl")
+                self._record(key, "miss")
+                return None
+
+            if entry.version is not None and entry.version != self._current_version():
+                self.logger.debug(f"Cache entry for key: {key} predates data version, removing")
+                self._remove(key, "version")
+                self._record(key, "miss")
+                return None
+
+            self._cache.move_to_end(key)
+            self._record(key, "hit")
+            self.logger.debug(f"Cache hit for key: {key}")
+            return entry.data
+
+    async def get_or_load(
+        self, key: str, loader: Loader, ttl_seconds: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a cached value, loading it on miss with single-flight semantics.
 
-        self.logger.debug(f"Cache hit for key: {key}")
-        return entry.data
+        Concurrent callers that miss on the same key await one loader call
+        instead of each reloading. Loader exceptions propagate to every
+        waiter and nothing is cached. The entry is tagged with the data
+        version seen before loading, so a load that races a snapshot swap
+        is not served after it.
+
+        Args:
+            key: Cache key
+            loader: Sync or async callable producing the data
+            ttl_seconds: Optional TTL override for the loaded entry
+
+        Returns:
+            Cached or freshly loaded data
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            version = self._current_version()
+            result = loader()
+            if inspect.isawaitable(result):
+                result = await result
+            self.set(key, result, ttl_seconds=ttl_seconds, version=version)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure does not log a warning
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
 
     def invalidate(self, key: str) -> None:
         """
         Manually invalidate a cache entry.
-        
+
         Args:
             key: Cache key to invalidate
         """
-        if key in self._cache:
-            del self._cache[key]
-            self.logger.debug(f"Invalidated cache for key: {key}")
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                self.logger.debug(f"Invalidated cache for key: {key}")
 
     def clear(self) -> None:
         """Clear entire cache."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
         self.logger.debug("Cleared entire cache")
 
     def toggle(self, enabled: bool) -> None:
         """
         Toggle cache on/off.
-        
+
         Args:
             enabled: If True, enable caching; if False, bypass cache
         """
@@ -130,29 +319,66 @@ class SessionCache:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        return {
-            "enabled": self.enabled,
-            "entries": len(self._cache),
-            "keys": list(self._cache.keys()),
-        }
+        with self._lock:
+            hits = sum(s.hits for s in self._stats.values())
+            misses = sum(s.misses for s in self._stats.values())
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._cache),
+                "keys": list(self._cache.keys()),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "evictions": sum(s.evictions for s in self._stats.values()),
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "per_key": {
+                    key: {"hits": s.hits, "misses": s.misses, "evictions": s.evictions}
+                    for key, s in self._stats.items()
+                },
+            }
 
 
 # Global cache instance
 _session_cache: Optional[SessionCache] = None
 
 
+def default_cache_metrics() -> Optional[Any]:
+    """Get the Prometheus metrics collector if monitoring dependencies are installed."""
+    try:
+        from src.observability.monitoring import get_metrics
+    except ImportError:
+        return None
+    return get_metrics()
+
+
+def _event_data_version() -> int:
+    from src.storage.catalog import get_data_version
+
+    return get_data_version()
+
+
 def get_session_cache(enabled: bool = True, ttl_seconds: int = 3600) -> SessionCache:
     """
     Get the session cache singleton.
-    
+
+    Entries are keyed on the event data snapshot version, so cached event
+    data is dropped as soon as a new snapshot is published.
+
     Args:
         enabled: Enable/disable caching (default: True)
         ttl_seconds: Time-to-live for entries (default: 3600)
-        
+
     Returns:
         SessionCache: Global cache instance
     """
     global _session_cache
     if _session_cache is None:
-        _session_cache = SessionCache(enabled=enabled, ttl_seconds=ttl_seconds)
+        _session_cache = SessionCache(
+            enabled=enabled,
+            ttl_seconds=ttl_seconds,
+            metrics=default_cache_metrics(),
+            version_provider=_event_data_version,
+        )
     return _session_cache
@@ -7,13 +7,14 @@ Enhanced with:
 - Conditional rendering ($when property)
 - Fallback text for all cards
 - Advanced data substitution
+- Templates compiled once per load (see card_templates)
 """
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from string import Template
-import re
+from typing import Dict, Any, Optional, List, Tuple
+
+from src.api.card_templates import CompiledTemplate, compile_condition, get_path
 
 
 class AdaptiveCardRenderer:
@@ -22,6 +23,7 @@ class AdaptiveCardRenderer:
     def __init__(self, templates_dir: str = "data/cards"):
         self.templates_dir = Path(templates_dir)
         self._template_cache: Dict[str, Dict[str, Any]] = {}
+        self._compiled_cache: Dict[Tuple[str, bool], CompiledTemplate] = {}
     
     def _load_template(self, template_name: str) -> Dict[str, Any]:
         """Load and cache a card template."""
@@ -38,124 +40,34 @@ class AdaptiveCardRenderer:
         self._template_cache[template_name] = template
         return template
     
+    def _compile(self, template_name: str, conditionals: bool = True) -> CompiledTemplate:
+        """Get the compiled form of a template, compiling it on first use."""
+        key = (template_name, conditionals)
+        compiled = self._compiled_cache.get(key)
+        if compiled is None:
+            compiled = CompiledTemplate(self._load_template(template_name), conditionals)
+            self._compiled_cache[key] = compiled
+        return compiled
+
     def _evaluate_condition(self, condition: str, data: Dict[str, Any]) -> bool:
         """
         Evaluate a conditional expression.
-        Supports: $data.field == "value", $data.field != "value", $data.field, !$data.field
+        Supports: $data.field == "value", $data.field != "value", $data.field, not $data.field
         """
-        if not condition:
-            return True
-        
-        # Replace $data.field with actual values
-        def replace_data_refs(match):
-            field_path = match.group(1)
-            value = self._get_nested_value(data, field_path)
-            if isinstance(value, str):
-                return f'"{value}"'
-            elif isinstance(value, bool):
-                return str(value)
-            elif value is None:
-                return 'None'
-            else:
-                return str(value)
-        
-        # Replace $data.field references with values
-        condition = re.sub(r'\$data\.([a-zA-Z0-9_.]+)', replace_data_refs, condition)
-        
-        try:
-            # Simple safe evaluation for basic comparisons
-            # Only allow safe operators: ==, !=, and, or, not, True, False, None
-            allowed_tokens = {'==', '!=', 'and', 'or', 'not', 'True', 'False', 'None', '(', ')'}
-            tokens = re.findall(r'[a-zA-Z_]+|[!<>=]+|\d+|"[^"]*"', condition)
-            
-            # Check if all tokens are safe
-            for token in tokens:
-                if token not in allowed_tokens and not (token.startswith('"') or token.isdigit()):
-                    return True  # If unsafe, default to showing the element
-            
-            # Evaluate the condition
-            return eval(condition, {"__builtins__": {}})
-        except Exception:
-            # If evaluation fails, default to showing the element
-            return True
-    
+        predicate = compile_condition(condition)
+        return predicate is None or predicate(data)
+
     def _get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
         """Get nested value from data using dot notation (e.g., 'user.name')."""
-        keys = path.split('.')
-        value = data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-        return value
-    
-    def _substitute_data_binding(self, text: str, data: Dict[str, Any]) -> str:
-        """
-        Substitute $data.field references with actual values.
-        Supports nested paths like $data.user.name
-        """
-        def replace_binding(match):
-            field_path = match.group(1)
-            value = self._get_nested_value(data, field_path)
-            return str(value) if value is not None else ""
-        
-        # Replace $data.field with actual values
-        return re.sub(r'\$data\.([a-zA-Z0-9_.]+)', replace_binding, text)
-    
-    def _process_conditional_elements(self, obj: Any, data: Dict[str, Any]) -> Any:
-        """
-        Process elements with $when property for conditional rendering.
-        Elements with $when that evaluate to false are removed.
-        """
-        if isinstance(obj, dict):
-            # Check for $when condition
-            if "$when" in obj:
-                condition = obj["$when"]
-                if not self._evaluate_condition(condition, data):
-                    return None  # Remove this element
-                # Remove the $when property after evaluation
-                obj = {k: v for k, v in obj.items() if k != "$when"}
-            
-            # Process nested objects
-            result = {}
-            for k, v in obj.items():
-                processed = self._process_conditional_elements(v, data)
-                if processed is not None:
-                    result[k] = processed
-            return result
-        elif isinstance(obj, list):
-            # Process list items and filter out None values
-            return [
-                processed
-                for item in obj
-                if (processed := self._process_conditional_elements(item, data)) is not None
-            ]
-        else:
-            return obj
-    
+        return get_path(data, tuple(path.split('.')))
+
     def _substitute_variables(self, obj: Any, data: Dict[str, Any]) -> Any:
         """
-        Recursively substitute template variables in JSON structure.
+        Substitute template variables in an uncached JSON structure.
         Supports both ${variable} and $data.field syntax.
         """
-        if isinstance(obj, dict):
-            return {k: self._substitute_variables(v, data) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._substitute_variables(item, data) for item in obj]
-        elif isinstance(obj, str):
-            # First, handle $data.field syntax
-            result = self._substitute_data_binding(obj, data)
-            
-            # Then, handle ${variable} syntax for backwards compatibility
-            try:
-                template = Template(result)
-                return template.safe_substitute(data)
-            except (KeyError, ValueError):
-                return result
-        else:
-            return obj
-    
+        return CompiledTemplate(obj, conditionals=False).render(data)
+
     def render_with_data(self, template_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Render a card template with data binding and conditional rendering.
@@ -167,13 +79,7 @@ class AdaptiveCardRenderer:
         Returns:
             Rendered card JSON with substitutions applied and conditions evaluated
         """
-        template = self._load_template(template_name)
-        
-        # First, process conditional elements ($when)
-        template = self._process_conditional_elements(template, data)
-        
-        # Then, substitute variables ($data.field and ${variable})
-        return self._substitute_variables(template, data)
+        return self._compile(template_name).render(data)
     
     def render_project_card(
         self,
@@ -186,8 +92,6 @@ class AdaptiveCardRenderer:
         details_url: str = "#"
     ) -> Dict[str, Any]:
         """Render a project card with given data."""
-        template = self._load_template("project_card_template")
-        
         data = {
             "title": title,
             "researchArea": research_area,
@@ -198,7 +102,7 @@ class AdaptiveCardRenderer:
             "detailsUrl": details_url
         }
         
-        return self._substitute_variables(template, data)
+        return self._compile("project_card_template", conditionals=False).render(data)
     
     def render_session_card(
         self,
@@ -212,8 +116,6 @@ class AdaptiveCardRenderer:
         agenda_url: str = "#"
     ) -> Dict[str, Any]:
         """Render a session card with given data."""
-        template = self._load_template("session_card_template")
-        
         data = {
             "title": title,
             "sessionType": session_type,
@@ -225,12 +127,13 @@ class AdaptiveCardRenderer:
             "agendaUrl": agenda_url
         }
         
-        return self._substitute_variables(template, data)
+        return self._compile("session_card_template", conditionals=False).render(data)
     
     def render_welcome_card(self) -> Dict[str, Any]:
         """Render the welcome card with action buttons."""
         # Always reload welcome card to pick up latest template changes
         self._template_cache.pop("welcome_card_template", None)
+        self._compiled_cache.pop(("welcome_card_template", True), None)
         template = self._load_template("welcome_card_template")
         return template
     
@@ -242,7 +145,6 @@ class AdaptiveCardRenderer:
         security_count: int = 0
     ) -> Dict[str, Any]:
         """Render category selection card with project counts."""
-        template = self._load_template("category_select_card_template")
         
         data = {
             "ai_count": str(ai_count),
@@ -251,7 +153,7 @@ class AdaptiveCardRenderer:
             "security_count": str(security_count)
         }
         
-        return self._substitute_variables(template, data)
+        return self._compile("category_select_card_template", conditionals=False).render(data)
     
     def render_project_detail_card(
         self,
@@ -266,8 +168,6 @@ class AdaptiveCardRenderer:
         target_audience: str = "General"
     ) -> Dict[str, Any]:
         """Render a detailed project information card."""
-        template = self._load_template("project_detail_card_template")
-        
         # Truncate description if too long
         if len(description) > 500:
             description = description[:497] + "..."
@@ -284,7 +184,7 @@ class AdaptiveCardRenderer:
             "targetAudience": target_audience if target_audience else "General audience"
         }
         
-        return self._substitute_variables(template, data)
+        return self._compile("project_detail_card_template", conditionals=False).render(data)
     
     def create_card_attachment(self, card_json: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,328 @@
+"""
+Compiled Adaptive Card templates.
+
+A card template is walked once at load time and turned into a tree of
+render closures. String values are pre-split into literal text, $data.path
+bindings (with the path already split on dots) and ${variable} slots, and
+$when conditions are parsed into a small expression tree. Rendering then
+only visits those precomputed slots instead of running regex substitution
+and eval over every node on every call.
+
+Supported $when grammar (anything else is treated as "always show", which
+is what the previous eval-based renderer did for unrecognized input):
+
+    expr       := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | comparison
+    comparison := operand (("==" | "!=") operand)*
+    operand    := $data.path | "string" | number | True | False | None | "(" expr ")"
+"""
+
+import re
+from string import Template
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+RenderFn = Callable[[Dict[str, Any]], Any]
+Condition = Callable[[Dict[str, Any]], bool]
+
+# Returned by a node that must be removed from its parent ($when false or null)
+_DROP = object()
+
+_BINDING_RE = re.compile(r"\$data\.([a-zA-Z0-9_.]+)")
+_CONDITION_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"\$data\.(?P<ref>[a-zA-Z0-9_.]+)"
+    r'|"(?P<str>[^"]*)"'
+    r"|(?P<num>\d+(?:\.\d+)?)"
+    r"|(?P<op>==|!=|\(|\))"
+    r"|(?P<word>[a-zA-Z_]+)"
+    r")"
+)
+_KEYWORDS = {"and", "or", "not"}
+_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+def get_path(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Resolve a pre-split dot path against nested dictionaries."""
+    value: Any = data
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+        else:
+            return None
+    return value
+
+
+# ----------------------------------------------------------------------
+# String slots
+# ----------------------------------------------------------------------
+
+
+def _template_segments(text: str) -> List[Tuple[str, Any]]:
+    """Split literal text into text and ${variable} segments (safe_substitute rules)."""
+    segments: List[Tuple[str, Any]] = []
+    pos = 0
+    for match in Template.pattern.finditer(text):
+        if match.start() > pos:
+            segments.append(("text", text[pos:match.start()]))
+        name = match.group("named") or match.group("braced")
+        if name is not None:
+            segments.append(("var", (name, match.group(0))))
+        elif match.group("escaped") is not None:
+            segments.append(("text", Template.delimiter))
+        else:
+            segments.append(("text", match.group(0)))
+        pos = match.end()
+    if pos < len(text):
+        segments.append(("text", text[pos:]))
+    return segments
+
+
+def compile_string(text: str) -> RenderFn:
+    """Compile a template string into a render function."""
+    if "$" not in text:
+        return lambda data: text
+
+    segments: List[Tuple[str, Any]] = []
+    pos = 0
+    for match in _BINDING_RE.finditer(text):
+        segments.extend(_template_segments(text[pos:match.start()]))
+        segments.append(("bind", tuple(match.group(1).split("."))))
+        pos = match.end()
+    segments.extend(_template_segments(text[pos:]))
+
+    # Merge adjacent literal text so rendering touches as few slots as possible
+    merged: List[Tuple[str, Any]] = []
+    for kind, value in segments:
+        if kind == "text" and merged and merged[-1][0] == "text":
+            merged[-1] = ("text", merged[-1][1] + value)
+        else:
+            merged.append((kind, value))
+
+    if len(merged) == 1 and merged[0][0] == "text":
+        constant = merged[0][1]
+        return lambda data: constant
+    if not merged:
+        return lambda data: ""
+
+    slots = tuple(merged)
+
+    def render(data: Dict[str, Any]) -> str:
+        parts = []
+        for kind, value in slots:
+            if kind == "text":
+                parts.append(value)
+            elif kind == "bind":
+                bound = get_path(data, value)
+                parts.append(str(bound) if bound is not None else "")
+            else:
+                name, original = value
+                parts.append("%s" % (data[name],) if name in data else original)
+        return "".join(parts)
+
+    return render
+
+
+# ----------------------------------------------------------------------
+# $when conditions
+# ----------------------------------------------------------------------
+
+
+class _ConditionParser:
+    """Recursive-descent parser producing closures for $when expressions."""
+
+    def __init__(self, source: str):
+        self.tokens = self._tokenize(source)
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(source: str) -> List[Tuple[str, Any]]:
+        tokens: List[Tuple[str, Any]] = []
+        pos = 0
+        source = source.rstrip()
+        while pos < len(source):
+            match = _CONDITION_TOKEN_RE.match(source, pos)
+            if match is None or match.end() == pos:
+                raise ValueError(f"Unsupported condition syntax at {pos}: {source!r}")
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "word":
+                if value in _CONSTANTS:
+                    kind, value = "const", _CONSTANTS[value]
+                elif value not in _KEYWORDS:
+                    raise ValueError(f"Unsupported identifier in condition: {value!r}")
+            elif kind == "num":
+                kind, value = "const", float(value) if "." in value else int(value)
+            elif kind == "str":
+                kind = "const"
+            elif kind == "ref":
+                value = tuple(value.split("."))
+            tokens.append((kind, value))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[Tuple[str, Any]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, value: str) -> bool:
+        token = self._peek()
+        if token is not None and token[0] in ("word", "op") and token[1] == value:
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> Callable[[Dict[str, Any]], Any]:
+        expr = self._or()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected token in condition: {self._peek()!r}")
+        return expr
+
+    def _or(self):
+        operands = [self._and()]
+        while self._accept("or"):
+            operands.append(self._and())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda data: any(op(data) for op in operands)
+
+    def _and(self):
+        operands = [self._not()]
+        while self._accept("and"):
+            operands.append(self._not())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda data: all(op(data) for op in operands)
+
+    def _not(self):
+        if self._accept("not"):
+            inner = self._not()
+            return lambda data: not inner(data)
+        return self._comparison()
+
+    def _comparison(self):
+        left = self._operand()
+        comparisons = []
+        while True:
+            if self._accept("=="):
+                comparisons.append((True, self._operand()))
+            elif self._accept("!="):
+                comparisons.append((False, self._operand()))
+            else:
+                break
+        if not comparisons:
+            return left
+
+        def compare(data: Dict[str, Any]) -> bool:
+            # Chained like Python: a == b != c means (a == b) and (b != c)
+            current = left(data)
+            for equal, operand in comparisons:
+                other = operand(data)
+                if (current == other) != equal:
+                    return False
+                current = other
+            return True
+
+        return compare
+
+    def _operand(self):
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of condition")
+        kind, value = token
+        if kind == "op" and value == "(":
+            self.pos += 1
+            inner = self._or()
+            if not self._accept(")"):
+                raise ValueError("Unbalanced parentheses in condition")
+            return inner
+        self.pos += 1
+        if kind == "const":
+            return lambda data: value
+        if kind == "ref":
+            return lambda data: get_path(data, value)
+        raise ValueError(f"Unexpected token in condition: {token!r}")
+
+
+def compile_condition(condition: Any) -> Optional[Condition]:
+    """
+    Compile a $when expression.
+
+    Returns None when the element should always be shown (empty or
+    unsupported expressions), otherwise a predicate over the card data.
+    """
+    if not isinstance(condition, str):
+        return None if condition else (lambda data: False)
+    if not condition.strip():
+        return None
+    try:
+        expr = _ConditionParser(condition).parse()
+    except ValueError:
+        return None
+    return lambda data: bool(expr(data))
+
+
+# ----------------------------------------------------------------------
+# Template trees
+# ----------------------------------------------------------------------
+
+
+def _compile_node(node: Any, conditionals: bool) -> RenderFn:
+    if isinstance(node, dict):
+        return _compile_dict(node, conditionals)
+    if isinstance(node, list):
+        items = [_compile_node(item, conditionals) for item in node]
+
+        def render_list(data: Dict[str, Any]) -> List[Any]:
+            result = []
+            for render_item in items:
+                value = render_item(data)
+                if value is not _DROP:
+                    result.append(value)
+            return result
+
+        return render_list
+    if isinstance(node, str):
+        return compile_string(node)
+    if node is None and conditionals:
+        return lambda data: _DROP
+    return lambda data: node
+
+
+def _compile_dict(node: Dict[str, Any], conditionals: bool) -> RenderFn:
+    condition: Optional[Condition] = None
+    items = list(node.items())
+    if conditionals and "$when" in node:
+        condition = compile_condition(node["$when"])
+        items = [(k, v) for k, v in items if k != "$when"]
+    fields = [(key, _compile_node(value, conditionals)) for key, value in items]
+
+    def render_dict(data: Dict[str, Any]) -> Any:
+        if condition is not None and not condition(data):
+            return _DROP
+        result = {}
+        for key, render_value in fields:
+            value = render_value(data)
+            if value is not _DROP:
+                result[key] = value
+        return result
+
+    return render_dict
+
+
+class CompiledTemplate:
+    """
+    A card template compiled into render closures.
+
+    Args:
+        template: Parsed card JSON
+        conditionals: Evaluate and strip $when properties and drop null values
+    """
+
+    def __init__(self, template: Any, conditionals: bool = True):
+        self.conditionals = conditionals
+        self._render = _compile_node(template, conditionals)
+
+    def render(self, data: Dict[str, Any]) -> Any:
+        """Render the template; returns None if the root element is hidden."""
+        result = self._render(data)
+        return None if result is _DROP else result
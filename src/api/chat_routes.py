@@ -11,12 +11,11 @@ This module implements a hybrid chat router that:
 import logging
 import os
 import json
-from typing import Generator, Iterable, List, Optional, Dict, Any
+from typing import AsyncGenerator, List, Optional, Dict, Any
 from datetime import datetime
 import time
 import asyncio
 
-import requests
 from azure.identity import DefaultAzureCredential
 
 # Import action system to ensure handlers are registered
@@ -32,6 +31,8 @@ from src.observability.telemetry import (
     track_fallback_event
 )
 from src.observability.intent_metrics import IntentMetrics
+from src.api.llm_client import BearerTokenCache, UpstreamError, get_llm_client
+from src.api.sse_cache import DONE_FRAME, EncodedResponse, get_sse_cache
 from src.integrations.foundry_wrapper import (
     stream_foundry_response,
     get_foundry_agent,
@@ -50,6 +51,7 @@ except ModuleNotFoundError:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 credential = DefaultAzureCredential(exclude_interactive_browser_credential=True)
+token_cache = BearerTokenCache(credential)
 
 # Initialize intent metrics tracking (singleton)
 intent_metrics = IntentMetrics()
@@ -59,6 +61,8 @@ DEFAULT_API_VERSION = "2024-02-15-preview"
 DELEGATE_TO_FOUNDRY = os.getenv("DELEGATE_TO_FOUNDRY", "false").lower() == "true"
 FOUNDRY_ALLOW_PER_REQUEST_OVERRIDE = os.getenv("FOUNDRY_ALLOW_PER_REQUEST_OVERRIDE", "true").lower() == "true"
 FOUNDRY_REQUIRED_ROLE = os.getenv("FOUNDRY_REQUIRED_ROLE", "")
+FOUNDRY_ENDPOINT = os.getenv("FOUNDRY_ENDPOINT", "")
+FOUNDRY_AGENT_ID = os.getenv("FOUNDRY_AGENT_ID", "")
 
 
 class ChatMessage(BaseModel):
@@ -71,6 +75,10 @@ class ChatMessage(BaseModel):
 class ChatRequest(BaseModel):
     """Chat request model."""
     messages: List[ChatMessage]
+    # With a conversation id, context is kept server-side; set delta when
+    # messages hold only the turns since the previous request
+    conversation_id: Optional[str] = None
+    delta: bool = False
     temperature: Optional[float] = 0.3
     max_tokens: Optional[int] = 400
 
@@ -91,18 +99,9 @@ def _get_required_env(name: str) -> str:
     return value.rstrip("/")
 
 
-def _get_bearer_token() -> str:
-    """Get Azure bearer token."""
-    token = credential.get_token(AZURE_OPENAI_SCOPE)
-    return token.token
-
-
-def _iter_azure_stream(resp: requests.Response) -> Iterable[str]:
-    """Iterate over Azure streaming response."""
-    for raw in resp.iter_lines(decode_unicode=True):
-        if not raw:
-            continue
-        yield raw
+async def _get_bearer_token() -> str:
+    """Get Azure bearer token (cached until shortly before expiry)."""
+    return await token_cache.get_token(AZURE_OPENAI_SCOPE)
 
 
 def _should_delegate_to_foundry(request: Request) -> tuple[bool, bool]:
@@ -136,8 +135,8 @@ def _should_delegate_to_foundry(request: Request) -> tuple[bool, bool]:
     return True, debug_enabled
 
 
-def _forward_stream(payload: ChatRequest) -> Generator[str, None, None]:
-    """Forward request to Azure OpenAI."""
+async def _forward_stream(payload: ChatRequest) -> AsyncGenerator[str, None]:
+    """Forward request to Azure OpenAI over the shared pooled HTTP client."""
     endpoint = _get_required_env("AZURE_OPENAI_ENDPOINT")
     deployment = _get_required_env("AZURE_OPENAI_DEPLOYMENT")
     api_version = os.getenv("AZURE_OPENAI_VERSION", DEFAULT_API_VERSION)
@@ -152,31 +151,30 @@ def _forward_stream(payload: ChatRequest) -> Generator[str, None, None]:
     }
 
     headers = {
-        "Authorization": f"Bearer {_get_bearer_token()}",
+        "Authorization": f"Bearer {await _get_bearer_token()}",
         "Content-Type": "application/json",
     }
 
-    with requests.post(url, headers=headers, json=data, stream=True, timeout=300) as resp:
-        if not resp.ok:
-            detail = resp.text or resp.reason
-            logger.error("Azure OpenAI request failed: %s %s", resp.status_code, detail)
-            
-            # Log as refusal if it's a content filter (400) or rate limit (429)
-            if resp.status_code in (400, 429):
-                log_refusal(
-                    refusal_reason="azure_openai_filter" if resp.status_code == 400 else "rate_limit",
-                    query_context=detail[:200],
-                    handler_name="azure_openai_forward",
-                    user_id=None,
-                    conversation_id=None
-                )
-            
-            raise HTTPException(status_code=resp.status_code, detail=detail)
-
-        for line in _iter_azure_stream(resp):
-            if not line.startswith("data:"):
-                continue
+    try:
+        async for line in get_llm_client().stream_sse(url, headers=headers, json=data):
             yield f"{line}\n\n"
+    except UpstreamError as e:
+        logger.error("Azure OpenAI request failed: %s %s", e.status_code, e.detail)
+
+        if e.status_code == 401:
+            token_cache.invalidate(AZURE_OPENAI_SCOPE)
+
+        # Log as refusal if it's a content filter (400) or rate limit (429)
+        if e.status_code in (400, 429):
+            log_refusal(
+                refusal_reason="azure_openai_filter" if e.status_code == 400 else "rate_limit",
+                query_context=e.detail[:200],
+                handler_name="azure_openai_forward",
+                user_id=None,
+                conversation_id=None
+            )
+
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
 
 def get_chat_router():
@@ -195,7 +193,9 @@ def get_chat_router():
         limiter = None
         logger.warning("slowapi not installed - rate limiting disabled")
 
-    def _stream_fallback_message(query: str, context: Any, session_id: str = "fallback"):
+    def _stream_fallback_message(
+        query: str, context: Any, session_id: str = "fallback", foundry_attempted: bool = False
+    ):
         """Stream a graceful fallback message with core chat abilities."""
         from src.observability.telemetry import track_fallback_event
         
@@ -203,8 +203,8 @@ def get_chat_router():
         track_fallback_event(
             original_query=query,
             session_id=session_id,
-            foundry_attempt=delegate_to_foundry,
-            foundry_failed_reason="foundry_attempt_failed" if delegate_to_foundry else "foundry_disabled",
+            foundry_attempt=foundry_attempted,
+            foundry_failed_reason="foundry_attempt_failed" if foundry_attempted else "foundry_disabled",
             conversation_turn=getattr(context, "turn_count", 1),
             user_id=getattr(context, "user_id", None),
             deterministic_confidence=0.0
@@ -224,8 +224,8 @@ Try rewording your question or ask me about any of these topics!"""
         intent_metrics.log_fallback(
             query=query,
             session_id=session_id,
-            foundry_attempted=delegate_to_foundry,
-            foundry_failed_reason="foundry_attempt_failed" if delegate_to_foundry else "foundry_disabled",
+            foundry_attempted=foundry_attempted,
+            foundry_failed_reason="foundry_attempt_failed" if foundry_attempted else "foundry_disabled",
             conversation_turn=getattr(context, "turn_count", 1)
         )
         
@@ -240,17 +240,21 @@ Try rewording your question or ask me about any of these topics!"""
 
     async def handle_card_action_unified(
         action_type: str, card_action: Dict[str, Any], context: Any
-    ) -> tuple[str, Optional[Dict[str, Any]]]:
+    ) -> EncodedResponse:
         """
         Unified card action dispatcher using action registry.
         
         Replaces ~500 lines of duplicated handler code with declarative dispatch.
         All handlers are registered via @register_action decorator.
+
+        Responses of cacheable actions are served pre-encoded from the SSE
+        cache; only the handler's context update runs on a hit.
         """
         from src.api.actions.base import get_registry
         from src.api.actions.schemas import validate_action_payload
         from src.api.actions.middleware import ActionExecutionError, ActionValidationError
         from src.api.actions.helpers import build_error_card
+        from src.storage.catalog import get_data_version
 
         try:
             # Validate action payload against schema
@@ -262,28 +266,40 @@ Try rewording your question or ask me about any of these topics!"""
                 logger.warning(f"Action not registered: {action_type}")
                 raise KeyError(f"Action '{action_type}' not registered")
 
+            cache_key = None
+            if registry.is_cacheable(action_type):
+                sse_cache = get_sse_cache()
+                cache_key = sse_cache.key(action_type, validated_payload, get_data_version())
+                cached = sse_cache.get(cache_key)
+                if cached is not None:
+                    await registry.apply_context(action_type, validated_payload, context)
+                    logger.debug(f"Action '{action_type}' served from SSE cache")
+                    return cached
+
             # Execute handler
             result_text, result_card = await registry.dispatch(
                 action_type, validated_payload, context
             )
 
             logger.debug(f"Action '{action_type}' completed successfully")
-            return result_text, result_card
+            if cache_key is not None:
+                return get_sse_cache().put(cache_key, result_text, result_card)
+            return EncodedResponse.encode(result_text, result_card)
 
         except (ActionValidationError, ActionExecutionError) as e:
             logger.error(f"Action '{action_type}' failed: {str(e)}")
             error_card = build_error_card(str(e), action_type)
-            return str(e), error_card
+            return EncodedResponse.encode(str(e), error_card)
         except KeyError:
             logger.error(f"Unregistered action: {action_type}")
             error_msg = f"Action '{action_type}' is not available"
             error_card = build_error_card(error_msg, action_type)
-            return error_msg, error_card
+            return EncodedResponse.encode(error_msg, error_card)
         except Exception as e:
             logger.error(f"Unexpected error in action '{action_type}': {str(e)}", exc_info=True)
             error_msg = "An unexpected error occurred while processing your request"
             error_card = build_error_card(error_msg, action_type)
-            return error_msg, error_card
+            return EncodedResponse.encode(error_msg, error_card)
 
     @router.get("/health")
     async def chat_health():
@@ -321,14 +337,14 @@ Try rewording your question or ask me about any of these topics!"""
         Rate Limits (DOSA compliance):
         - 20 requests/minute per IP (chat queries)
         - Fail-closed on rate limit (429 + telemetry)
-        \"\"\"
+        """
         # Apply rate limiting if available
         if limiter:
             try:
                 await limiter.check_request_limit(
                     request=request,
                     endpoint_func=stream_chat,
-                    rate_limit=\"20/minute\"
+                    rate_limit="20/minute"
                 )
             except Exception:
                 pass  # Rate limit handler in main.py will catch
@@ -336,7 +352,7 @@ Try rewording your question or ask me about any of these topics!"""
         try:
             from src.api.query_router import DeterministicRouter
             from src.api.router_config import router_config
-            from src.api.conversation_context import extract_context_from_messages
+            from src.api.conversation_context import extract_context_from_messages, get_context_store
 
             # Extract user query
             user_query = payload.messages[-1].content if payload.messages else ""
@@ -347,14 +363,19 @@ Try rewording your question or ask me about any of these topics!"""
                     refusal_reason="empty_query",
                     query_context="",
                     handler_name="chat_router",
-                    user_id=context.user_id if hasattr(context, "user_id") else None,
-                    conversation_id=getattr(context, "conversation_id", None)
+                    user_id=None,
+                    conversation_id=payload.conversation_id
                 )
                 raise HTTPException(status_code=400, detail="No query provided")
 
             # Extract conversation context
-            context = extract_context_from_messages([m.model_dump() for m in payload.messages])
-            context.advance_turn()
+            messages = [m.model_dump() for m in payload.messages]
+            if payload.conversation_id:
+                # Applies only the turns the store has not seen yet
+                context = get_context_store().update(payload.conversation_id, messages, delta=payload.delta)
+            else:
+                context = extract_context_from_messages(messages)
+                context.advance_turn()
             logger.info(f"Conversation context: {context.to_dict()}")
 
             # Check if Foundry delegation is allowed/requested
@@ -375,7 +396,7 @@ Try rewording your question or ask me about any of these topics!"""
                 start_time = time.time()
 
                 try:
-                    result_text, result_card = await handle_card_action_unified(
+                    response = await handle_card_action_unified(
                         action_type, card_action, context
                     )
                     
@@ -387,7 +408,7 @@ Try rewording your question or ask me about any of these topics!"""
                         properties={
                             "action_type": action_type,
                             "conversation_id": context.conversation_id,
-                            "has_card": str(result_card is not None),
+                            "has_card": str(response.has_card),
                             "success": "true"
                         },
                         measurements={
@@ -395,29 +416,18 @@ Try rewording your question or ask me about any of these topics!"""
                         }
                     )
 
-                    logger.info(f"Card action result: text='{result_text}', card={result_card is not None}")
-                    if result_card:
-                        logger.debug(f"Card keys: {list(result_card.keys())}, size: {len(json.dumps(result_card))} bytes")
+                    logger.info(f"Card action result: text='{response.text}', card={response.has_card}")
 
                     async def action_response_stream():
-                        payload_data = {
-                            "delta": result_text,
-                        }
-                        if result_card:
-                            payload_data["adaptive_card"] = result_card
-                        payload_data["context"] = context.to_dict()
+                        frame = response.frame(context.to_dict())
 
-                        logger.info(f"Streaming payload keys: {list(payload_data.keys())}, has adaptive_card: {'adaptive_card' in payload_data}")
-                        
-                        # Log the size of what we're sending
-                        json_str = json.dumps(payload_data)
-                        logger.info(f"Payload JSON size: {len(json_str)} bytes")
-                        
-                        # Log first 500 chars for debugging
-                        logger.debug(f"Payload preview: {json_str[:500]}...")
-                        
-                        yield f"data: {json_str}\n\n"
-                        yield "data: [DONE]\n\n"
+                        # Log the size of what we're sending (measured on the encoded frame)
+                        logger.info(f"Payload size: {len(frame)} bytes, has adaptive_card: {response.has_card}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Payload preview: {frame[:500].decode('utf-8', errors='replace')}...")
+
+                        yield frame
+                        yield DONE_FRAME
 
                     return StreamingResponse(
                         action_response_stream(), media_type="text/event-stream"
@@ -506,7 +516,7 @@ Try rewording your question or ask me about any of these topics!"""
                                     "reason": str(e)[:200],
                                 },
                             )
-                            for line in _forward_stream(payload):
+                            async for line in _forward_stream(payload):
                                 yield line
                             yield "data: [DONE]\n\n"
 
@@ -519,15 +529,10 @@ Try rewording your question or ask me about any of these topics!"""
             logger.info(f"Routing query: {user_query[:100]}...")
             router = DeterministicRouter()
             routing_start_time = time.time()
-            intent_type, confidence = router.classify(user_query)
-            
-            # Extract patterns matched for metrics
-            patterns_matched = []
-            query_lower = user_query.lower()
-            if intent_type in router.patterns and intent_type != "unmatched":
-                for pattern in router.patterns[intent_type]:
-                    if pattern.search(query_lower):
-                        patterns_matched.append(pattern.pattern)
+            # Memoized: hot queries skip classification and plan building
+            routed = router.route(user_query)
+            intent_type, confidence = routed.intent, routed.confidence
+            patterns_matched = routed.patterns_matched
 
             logger.info(
                 "Intent classified",
@@ -597,28 +602,60 @@ Try rewording your question or ask me about any of these topics!"""
                                 )
                                 
                                 # Show graceful fallback message
-                                yield from _stream_fallback_message(user_query, context, session_id="unmatched_foundry_failed")
+                                for frame in _stream_fallback_message(
+                                    user_query, context, session_id="unmatched_foundry_failed", foundry_attempted=True
+                                ):
+                                    yield frame
                         
                         return StreamingResponse(fallback_with_foundry_stream(), media_type="text/event-stream")
                     except Exception as e:
                         logger.error(f"[Fallback Flow] Foundry initialization failed: {e}")
                         # Show fallback message
                         async def fallback_error_stream():
-                            yield from _stream_fallback_message(user_query, context, session_id="foundry_init_failed")
+                            for frame in _stream_fallback_message(
+                                user_query, context, session_id="foundry_init_failed", foundry_attempted=True
+                            ):
+                                yield frame
                         return StreamingResponse(fallback_error_stream(), media_type="text/event-stream")
                 
                 else:
                     # Foundry not enabled, show fallback directly
                     logger.info(f"[Fallback Flow] Foundry disabled, showing fallback message")
                     async def fallback_disabled_stream():
-                        yield from _stream_fallback_message(user_query, context, session_id="foundry_disabled")
+                        for frame in _stream_fallback_message(user_query, context, session_id="foundry_disabled"):
+                            yield frame
                     return StreamingResponse(fallback_disabled_stream(), media_type="text/event-stream")
 
             # Step 3: Use deterministic routing if high confidence
             if confidence >= router_config.deterministic_threshold:
-                logger.info("Using deterministic routing result")
-                # Deterministic routing logic here (existing code)
-                pass
+                from src.api.query_executor import format_results, get_query_executor
+
+                executor = get_query_executor()
+                if executor.supports(routed.query_plan):
+                    logger.info("Using deterministic routing result")
+                    results = executor.run(routed)
+                    context.set_results(
+                        row for result in results if result.resource == "project" for row in result.rows
+                    )
+                    intent_metrics.log_classification(
+                        query=user_query,
+                        predicted_intent=intent_type,
+                        confidence=confidence,
+                        patterns_matched=patterns_matched,
+                        execution_path=execution_path,
+                        latency_ms=(time.time() - routing_start_time) * 1000,
+                    )
+
+                    async def deterministic_stream():
+                        response = {
+                            "delta": format_results(results),
+                            "query_results": [result.to_dict() for result in results],
+                            "context": context.to_dict(),
+                        }
+                        yield f"data: {json.dumps(response, default=str)}\n\n"
+                        yield "data: [DONE]\n\n"
+
+                    return StreamingResponse(deterministic_stream(), media_type="text/event-stream")
 
             # Step 4: Fall back to Azure OpenAI for general queries
             logger.info(f"Using {execution_path} for query (confidence: {confidence:.2f})")
@@ -659,7 +696,7 @@ Try rewording your question or ask me about any of these topics!"""
                 async def tracked_stream():
                     completion_tokens = 0
                     try:
-                        for chunk in stream:
+                        async for chunk in stream:
                             # Estimate tokens (rough approximation)
                             if chunk.startswith("data: ") and not chunk.startswith("data: [DONE]"):
                                 completion_tokens += len(chunk.split()) // 4
@@ -698,6 +735,8 @@ Try rewording your question or ask me about any of these topics!"""
                 )
                 raise
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Chat error: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -798,10 +837,13 @@ Try rewording your question or ask me about any of these topics!"""
     async def routing_quality_metrics():
         """Get real-time routing quality metrics."""
         try:
+            from src.api.routing_cache import get_routing_cache
+
             coverage = intent_metrics.get_coverage_stats()
             
             return {
                 "coverage": coverage,
+                "routing_cache": get_routing_cache().get_stats(),
                 "report": intent_metrics.generate_report(),
                 "application_insights": {
                     "message": "For comprehensive metrics, query Application Insights with KQL",
@@ -812,29 +854,6 @@ Try rewording your question or ask me about any of these topics!"""
             logger.error(f"Failed to get routing metrics: {e}")
             raise HTTPException(status_code=500, detail="Failed to get routing metrics")
 
-        return {
-            "provider": "hybrid",
-            "auth": "managed-identity",
-            "endpoint": bool(os.getenv("AZURE_OPENAI_ENDPOINT")),
-            "deployment": bool(os.getenv("AZURE_OPENAI_DEPLOYMENT")),
-            "apiVersion": os.getenv("AZURE_OPENAI_VERSION", DEFAULT_API_VERSION),
-            "capabilities": [
-                "Project search and filtering",
-                "Team member lookup",
-                "Category browsing",
-                "Session information",
-                "Equipment and logistics",
-                "Recording status",
-            ],
-            "routing": {
-                "deterministic_enabled": router_config.enable_deterministic_routing,
-                "deterministic_threshold": router_config.deterministic_threshold,
-                "foundry_delegation_enabled": router_config.delegate_to_foundry,
-                "foundry_delegation_threshold": router_config.foundry_delegation_threshold,
-                "foundry_configured": bool(router_config.foundry_endpoint),
-            },
-        }
-
     @router.post("/telemetry/event-visit")
     async def track_event_visit_endpoint(payload: EventVisit):
         """Track pre/post/during event visits."""
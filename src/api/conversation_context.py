@@ -1,12 +1,97 @@
 """
 Conversation context tracking for multi-turn dialogues.
 Maintains state across conversation turns for contextual routing and responses.
+
+Contexts are kept server-side in a ConversationContextStore keyed by
+conversation id. Each request applies only the user messages the store has
+not seen yet, so per-turn cost does not grow with conversation length and
+clients may send just the new turn. Interest keywords are matched with a
+single precompiled scan per message rather than one substring test per
+keyword.
+
+Configuration (environment):
+    CONVERSATION_CONTEXT_MAX_ENTRIES  contexts kept before LRU eviction (default 10000)
+    CONVERSATION_CONTEXT_IDLE_TTL     seconds an idle context is kept (default 3600)
+    CONVERSATION_CONTEXT_SNAPSHOT     optional JSON snapshot path, loaded at startup
+                                      and written at exit
 """
 
-from typing import Dict, List, Any, Optional, Set
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Mapping, Optional, Sequence, Set, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from src.storage.catalog import get_project_catalog
+
+logger = logging.getLogger(__name__)
+
+# Category label -> keywords that signal interest in it
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "artificial intelligence": ["ai", "artificial intelligence", "machine learning", "ml"],
+    "systems": ["systems", "networking", "distributed"],
+    "hci": ["human-computer", "hci", "interaction", "visualization"],
+    "security": ["security", "privacy", "encryption"],
+    "data science": ["data science", "analytics"],
+}
+
+# Equipment label -> keywords that signal the need for it
+EQUIPMENT_KEYWORDS: Dict[str, List[str]] = {
+    "large display": ["large display", "display"],
+    "monitor": ["monitor", "27\""],
+    "recording": ["recording", "video"],
+    "technician": ["technician", "tech support"],
+}
+
+
+class KeywordAutomaton:
+    """
+    Precompiled multi-keyword substring matcher.
+
+    One scan with a lookahead alternation (longest keyword first) reports
+    the longest keyword starting at each position; keywords that are
+    prefixes of it are recovered from a precomputed closure. The labels
+    returned are exactly those for which ``any(kw in text for kw in
+    keywords)`` holds.
+    """
+
+    def __init__(self, labeled_keywords: Mapping[str, Sequence[str]]):
+        """
+        Args:
+            labeled_keywords: Label to the lowercase keywords that imply it
+        """
+        self._labels: Dict[str, Set[str]] = {}
+        for label, keywords in labeled_keywords.items():
+            for keyword in keywords:
+                self._labels.setdefault(keyword, set()).add(label)
+
+        keywords = sorted(self._labels, key=len, reverse=True)
+        self._scanner = re.compile("(?=(" + "|".join(re.escape(k) for k in keywords) + "))") if keywords else None
+        self._closure: Dict[str, Set[str]] = {
+            k: set().union(*(self._labels[p] for p in keywords if k.startswith(p))) for k in keywords
+        }
+
+    def labels(self, text: str) -> Set[str]:
+        """Labels with at least one keyword occurring in text (already lowercased)."""
+        found: Set[str] = set()
+        if self._scanner is None:
+            return found
+        for keyword in set(self._scanner.findall(text)):
+            found |= self._closure[keyword]
+        return found
+
+
+_CATEGORY_AUTOMATON = KeywordAutomaton(CATEGORY_KEYWORDS)
+_EQUIPMENT_AUTOMATON = KeywordAutomaton(EQUIPMENT_KEYWORDS)
+
 
 @dataclass
 class ConversationContext:
@@ -20,11 +105,13 @@ class ConversationContext:
     
     # Conversation flow state
     conversation_stage: str = "welcome"  # welcome, ask_interests, show_results, project_detail
-    last_results: List[Dict[str, Any]] = field(default_factory=list)
+    # Project ids of the last results (see set_results)
+    last_results: Sequence[Any] = ()
     viewed_projects: Set[str] = field(default_factory=set)
     current_project_id: Optional[str] = None
     
     # Metadata
+    conversation_id: Optional[str] = None
     turn_count: int = 0
     started_at: datetime = field(default_factory=datetime.now)
     
@@ -42,6 +129,32 @@ class ConversationContext:
             "turn_count": self.turn_count,
         }
     
+    def to_state(self) -> Dict[str, Any]:
+        """Full state for snapshots (unlike to_dict, keeps results and timestamps)."""
+        state = self.to_dict()
+        del state["last_results_count"]
+        state["last_results"] = list(self.last_results)
+        state["conversation_id"] = self.conversation_id
+        state["started_at"] = self.started_at.isoformat()
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ConversationContext":
+        """Restore a context saved with to_state()."""
+        return cls(
+            selected_categories=set(state.get("selected_categories", [])),
+            selected_researchers=set(state.get("selected_researchers", [])),
+            interests_keywords=set(state.get("interests_keywords", [])),
+            equipment_filters=set(state.get("equipment_filters", [])),
+            conversation_stage=state.get("conversation_stage", "welcome"),
+            last_results=tuple(state.get("last_results", [])),
+            viewed_projects=set(state.get("viewed_projects", [])),
+            current_project_id=state.get("current_project_id"),
+            conversation_id=state.get("conversation_id"),
+            turn_count=state.get("turn_count", 0),
+            started_at=datetime.fromisoformat(state["started_at"]) if state.get("started_at") else datetime.now(),
+        )
+
     def add_category(self, category: str) -> None:
         """Add a research category interest."""
         self.selected_categories.add(category.lower())
@@ -58,9 +171,29 @@ class ConversationContext:
         """Add an equipment filter."""
         self.equipment_filters.add(equipment.lower())
     
-    def set_results(self, results: List[Dict[str, Any]]) -> None:
-        """Update the last query results."""
-        self.last_results = results
+    def set_results(self, results: Iterable[Union[str, Dict[str, Any]]]) -> None:
+        """Update the last query results.
+
+        Only project ids are kept; projects are given as dicts or ids.
+        """
+        ids = (result if isinstance(result, str) else result.get("id") for result in results)
+        self.last_results = tuple(project_id for project_id in ids if project_id)
+
+    def get_results(self) -> List[Dict[str, Any]]:
+        """The last query results as project dicts, in their original order.
+
+        Ids are resolved against the current catalog, so results reflect
+        event data reloaded since they were recorded; projects removed in
+        the meantime are skipped.
+        """
+        if not self.last_results:
+            return []
+        if isinstance(self.last_results[0], dict):
+            # Assigned directly as dicts rather than through set_results
+            return list(self.last_results)
+        catalog = get_project_catalog()
+        projects = (catalog.get(project_id) for project_id in self.last_results)
+        return [project for project in projects if project is not None]
     
     def mark_project_viewed(self, project_id: str) -> None:
         """Record that user viewed a project."""
@@ -93,43 +226,261 @@ class ConversationContext:
         return " | ".join(parts) if parts else "No preferences set"
 
 
+def apply_user_message(context: ConversationContext, content: str) -> None:
+    """Update a context with the interests expressed in one user message."""
+    content = content.lower()
+    for category in _CATEGORY_AUTOMATON.labels(content):
+        context.add_category(category)
+    for equipment in _EQUIPMENT_AUTOMATON.labels(content):
+        context.add_equipment_filter(equipment)
+
+
+def _user_messages(messages: Iterable[Dict[str, str]]) -> List[str]:
+    return [msg.get("content", "") for msg in messages if msg.get("role") == "user"]
+
+
+def _digest(content: str) -> str:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def extract_context_from_messages(messages: List[Dict[str, str]]) -> ConversationContext:
     """
     Extract conversation context from message history.
     Analyzes previous turns to rebuild context state.
+
+    Prefer ConversationContextStore.update when a conversation id is
+    available; it applies only the turns added since the last request.
     """
     context = ConversationContext()
-    
-    # Scan messages for patterns indicating user interests
-    for msg in messages:
-        if msg.get("role") != "user":
-            continue
-            
-        content = msg.get("content", "").lower()
-        
-        # Detect category selections
-        categories = {
-            "artificial intelligence": ["ai", "artificial intelligence", "machine learning", "ml"],
-            "systems": ["systems", "networking", "distributed"],
-            "hci": ["human-computer", "hci", "interaction", "visualization"],
-            "security": ["security", "privacy", "encryption"],
-            "data science": ["data science", "analytics", "analytics"],
-        }
-        
-        for category, keywords in categories.items():
-            if any(kw in content for kw in keywords):
-                context.add_category(category)
-        
-        # Detect equipment preferences
-        equipment_keywords = {
-            "large display": ["large display", "display"],
-            "monitor": ["monitor", "27\""],
-            "recording": ["recording", "video"],
-            "technician": ["technician", "tech support"],
-        }
-        
-        for equipment, keywords in equipment_keywords.items():
-            if any(kw in content for kw in keywords):
-                context.add_equipment_filter(equipment)
-    
+    for content in _user_messages(messages):
+        apply_user_message(context, content)
     return context
+
+
+@dataclass
+class _StoredContext:
+    """A stored context and the position of the last user message applied to it."""
+
+    context: ConversationContext
+    applied: int = 0
+    last_digest: Optional[str] = None
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class ConversationContextStore:
+    """
+    Server-side conversation contexts, updated incrementally per turn.
+
+    ``update`` accepts either the full message history or, with
+    ``delta=True``, only the messages added since the previous request:
+
+    - delta: every user message is applied on top of the stored context
+    - full history that extends what was applied: only the new user
+      messages are applied
+    - full history that diverges (an edited, regenerated or truncated
+      turn): the context is rebuilt from the history
+
+    Bounded by LRU eviction beyond ``max_entries`` and by dropping
+    contexts idle for longer than ``idle_ttl_seconds``.
+
+    Usage:
+        store = get_context_store()
+        context = store.update(conversation_id, messages)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        idle_ttl_seconds: float = 3600,
+        snapshot_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            max_entries: Contexts kept before least-recently-used eviction
+            idle_ttl_seconds: Seconds since last access before a context expires
+            snapshot_path: Optional JSON file loaded now and written by snapshot()
+        """
+        self.max_entries = max_entries
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._entries: "OrderedDict[str, _StoredContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            self.load_snapshot()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, conversation_id: str) -> bool:
+        return self.get(conversation_id) is not None
+
+    def _expire(self, now: float) -> None:
+        """Drop idle contexts; the LRU head is always the least recently accessed."""
+        while self._entries:
+            conversation_id, entry = next(iter(self._entries.items()))
+            if now - entry.last_access <= self.idle_ttl_seconds:
+                break
+            del self._entries[conversation_id]
+            self.expirations += 1
+
+    def get(self, conversation_id: str) -> Optional[ConversationContext]:
+        """Stored context for a conversation, if it has not expired."""
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(conversation_id)
+            return entry.context if entry is not None else None
+
+    def update(
+        self, conversation_id: str, messages: List[Dict[str, str]], delta: bool = False
+    ) -> ConversationContext:
+        """
+        Apply a request's messages to a conversation's context.
+
+        Args:
+            conversation_id: Conversation the messages belong to
+            messages: Full history, or only the messages since the last request
+            delta: True if messages hold only the new turns
+
+        Returns:
+            The updated context (each applied user message advances the turn)
+        """
+        user_messages = _user_messages(messages)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(conversation_id)
+            if entry is None:
+                entry = _StoredContext(ConversationContext(conversation_id=conversation_id))
+                self._entries[conversation_id] = entry
+                new = user_messages
+            elif delta:
+                new = user_messages
+            elif entry.applied <= len(user_messages) and (
+                entry.applied == 0 or _digest(user_messages[entry.applied - 1]) == entry.last_digest
+            ):
+                new = user_messages[entry.applied:]
+            else:
+                logger.debug(f"History of conversation {conversation_id} diverged; rebuilding context")
+                entry.context = ConversationContext(conversation_id=conversation_id)
+                entry.applied = 0
+                new = user_messages
+
+            for content in new:
+                apply_user_message(entry.context, content)
+                entry.context.advance_turn()
+            if new:
+                entry.applied += len(new)
+                entry.last_digest = _digest(new[-1])
+
+            entry.last_access = now
+            self._entries.move_to_end(conversation_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return entry.context
+
+    def discard(self, conversation_id: str) -> None:
+        """Forget a conversation."""
+        with self._lock:
+            self._entries.pop(conversation_id, None)
+
+    def clear(self) -> None:
+        """Forget every conversation."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "idle_ttl_seconds": self.idle_ttl_seconds,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Write all live contexts to a JSON file (atomically replaced).
+
+        Returns:
+            Number of contexts written
+        """
+        target = Path(path) if path else self.snapshot_path
+        if target is None:
+            raise ValueError("No snapshot path configured")
+
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            records = [
+                {
+                    "id": conversation_id,
+                    "applied": entry.applied,
+                    "last_digest": entry.last_digest,
+                    "idle_seconds": now - entry.last_access,
+                    "context": entry.context.to_state(),
+                }
+                for conversation_id, entry in self._entries.items()
+            ]
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"conversations": records}, f, default=str)
+        os.replace(tmp, target)
+        logger.info(f"Saved {len(records)} conversation contexts to {target}")
+        return len(records)
+
+    def load_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Restore contexts from a snapshot, keeping their idle time.
+
+        Returns:
+            Number of contexts restored
+        """
+        source = Path(path) if path else self.snapshot_path
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                records = json.load(f).get("conversations", [])
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Failed to load conversation snapshot {source}: {e}")
+            return 0
+
+        now = time.monotonic()
+        with self._lock:
+            for record in records:
+                self._entries[record["id"]] = _StoredContext(
+                    context=ConversationContext.from_state(record["context"]),
+                    applied=record.get("applied", 0),
+                    last_digest=record.get("last_digest"),
+                    last_access=now - record.get("idle_seconds", 0.0),
+                )
+            self._expire(now)
+        logger.info(f"Restored {len(records)} conversation contexts from {source}")
+        return len(records)
+
+
+# Global context store
+_context_store: Optional[ConversationContextStore] = None
+
+
+def get_context_store() -> ConversationContextStore:
+    """Get the conversation context store singleton (snapshotted at exit if configured)."""
+    global _context_store
+    if _context_store is None:
+        _context_store = ConversationContextStore(
+            max_entries=int(os.getenv("CONVERSATION_CONTEXT_MAX_ENTRIES", "10000")),
+            idle_ttl_seconds=float(os.getenv("CONVERSATION_CONTEXT_IDLE_TTL", "3600")),
+            snapshot_path=os.getenv("CONVERSATION_CONTEXT_SNAPSHOT") or None,
+        )
+        if _context_store.snapshot_path is not None:
+            atexit.register(_context_store.snapshot)
+    return _context_store
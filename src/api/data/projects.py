@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from src.storage.search_index import SearchIndex
 
 try:
-    from fastapi import APIRouter, HTTPException, Depends
+    from fastapi import APIRouter, HTTPException, Depends, Query
 except ModuleNotFoundError:
     APIRouter = None  # type: ignore
 
+MAX_SEARCH_RESULTS = 500
+
+
+def build_project_search_index(projects: List[Dict[str, Any]]) -> SearchIndex:
+    """Full-text index over repository project dicts (ProjectDefinition.to_dict)."""
+    index = SearchIndex()
+    for project in projects:
+        index.add_document(
+            "project",
+            project.get("id", ""),
+            project,
+            {
+                "name": project.get("name", ""),
+                "description": project.get("description", ""),
+                "researchArea": project.get("research_area", ""),
+                "tags": " ".join(project.get("keywords", []) or []),
+            },
+        )
+    return index
+
 
 def get_data_projects_router(repo=None):
     """
@@ -16,6 +40,7 @@ def get_data_projects_router(repo=None):
     
     Pure CRUD endpoints for project management:
     - GET /data/projects - List all projects
+    - GET /data/projects?search=... - Ranked full-text search over the stored projects
     - GET /data/projects/{projectId} - Get single project
     - POST /data/projects - Create project
     - PATCH /data/projects/{projectId} - Update project
@@ -27,14 +52,40 @@ def get_data_projects_router(repo=None):
     
     router = APIRouter(prefix="/data/projects", tags=["data-projects"])
     
+    # Index over the repository's projects, rebuilt when their contents change
+    search_cache: Dict[str, Any] = {"digest": None, "index": None}
+    
+    def get_search_index() -> SearchIndex:
+        projects = [p.to_dict() for p in repo.list_all()]
+        digest = hashlib.sha1(json.dumps(projects, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        if digest != search_cache["digest"]:
+            search_cache["index"] = build_project_search_index(projects)
+            search_cache["digest"] = digest
+        return search_cache["index"]
+    
     # ===== List All Projects =====
     @router.get("")
-    async def list_data_projects(event_id: Optional[str] = None):
-        """List all projects, optionally filtered by event."""
+    async def list_data_projects(
+        event_id: Optional[str] = None,
+        search: Optional[str] = None,
+        top: int = Query(50, ge=1, le=MAX_SEARCH_RESULTS, description="Max search results to return"),
+    ):
+        """List all projects, optionally filtered by event or ranked by a search query."""
         if not repo:
             raise HTTPException(status_code=503, detail="Project repository not initialized")
         
         try:
+            if search:
+                hits = get_search_index().search(search, kind="project")
+                if event_id:
+                    hits = [h for h in hits if h.document.get("eventId") == event_id]
+                hits = hits[:top]
+                return {
+                    "value": [{**h.document, "@search.score": h.score} for h in hits],
+                    "@odata.context": "https://api.internal.microsoft.com/data/$metadata#projects",
+                    "count": len(hits)
+                }
+            
             if event_id:
                 projects = repo.list_by_event(event_id)
             else:
@@ -73,7 +124,7 @@ def get_data_projects_router(repo=None):
             raise HTTPException(status_code=503, detail="Project repository not initialized")
         
         try:
-            from src.core.event_models import ProjectDefinition
+            from src.core.projects import ProjectDefinition
             
             # Validate required fields
             if "id" not in payload:
@@ -97,7 +148,7 @@ def get_data_projects_router(repo=None):
             raise HTTPException(status_code=503, detail="Project repository not initialized")
         
         try:
-            from src.core.event_models import ProjectDefinition
+            from src.core.projects import ProjectDefinition
             
             # Get current project
             current = repo.get(project_id)
@@ -0,0 +1,174 @@
+"""Single-pass compiled intent classifier for the deterministic router.
+
+Every intent regex is reduced to a required literal "trigger" (the longest
+literal run in its top-level sequence). One scan of the query with a
+combined lookahead alternation finds every trigger occurrence, and only the
+patterns whose trigger occurs are evaluated. Patterns without a usable
+trigger are always evaluated, so results are identical to running every
+pattern while typically touching a handful of regexes per query.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:  # Python 3.11+
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+    from re import _constants as sre_constants  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore[no-redef]
+    import sre_constants  # type: ignore[no-redef]
+
+MIN_TRIGGER_LENGTH = 2
+
+
+@dataclass
+class ClassificationResult:
+    """Outcome of classifying a single query."""
+
+    intent: str
+    confidence: float
+    scores: Dict[str, float] = field(default_factory=dict)
+    matched: Dict[str, List[int]] = field(default_factory=dict)
+    patterns_matched: List[str] = field(default_factory=list)
+
+    def as_tuple(self) -> Tuple[str, float]:
+        """Return the (intent, confidence) pair used by DeterministicRouter.classify."""
+        return self.intent, self.confidence
+
+
+def extract_trigger(pattern: str) -> Optional[str]:
+    """Return a lowercase literal every match of pattern must contain, if any.
+
+    Only literal runs in the top-level sequence are considered; anything
+    inside groups, branches or repeats may be skipped by a match.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+    best = ""
+    run: List[str] = []
+    for op, arg in list(parsed) + [(None, None)]:
+        if op is sre_constants.LITERAL:
+            run.append(chr(arg))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+
+    best = best.lower()
+    return best if len(best) >= MIN_TRIGGER_LENGTH else None
+
+
+class IntentClassifier:
+    """Compiled multi-pattern classifier over an intent -> regex list mapping."""
+
+    def __init__(self, intent_patterns: Mapping[str, Sequence[str]]):
+        """Compile all patterns and the combined trigger scanner.
+
+        Args:
+            intent_patterns: Intent name to list of regex sources
+        """
+        self.patterns: Dict[str, List[re.Pattern]] = {}
+        self._pattern_counts: Dict[str, int] = {}
+        # trigger -> list of (intent, pattern index)
+        self._by_trigger: Dict[str, List[Tuple[str, int]]] = {}
+        self._always: List[Tuple[str, int]] = []
+
+        for intent, sources in intent_patterns.items():
+            self.patterns[intent] = [re.compile(p, re.IGNORECASE) for p in sources]
+            self._pattern_counts[intent] = len(sources)
+            for idx, source in enumerate(sources):
+                trigger = extract_trigger(source)
+                if trigger is None:
+                    self._always.append((intent, idx))
+                else:
+                    self._by_trigger.setdefault(trigger, []).append((intent, idx))
+
+        # Longest-first alternation inside a lookahead reports the longest trigger
+        # starting at each position; shorter triggers that are prefixes of it are
+        # recovered through _prefix_closure.
+        triggers = sorted(self._by_trigger, key=len, reverse=True)
+        self._scanner = (
+            re.compile("(?=(" + "|".join(re.escape(t) for t in triggers) + "))") if triggers else None
+        )
+        self._prefix_closure: Dict[str, List[str]] = {
+            t: [u for u in triggers if t.startswith(u)] for t in triggers
+        }
+
+    @property
+    def trigger_count(self) -> int:
+        """Number of distinct literal triggers."""
+        return len(self._by_trigger)
+
+    def _candidates(self, query_lower: str) -> List[Tuple[str, int]]:
+        """Patterns whose trigger occurs in the query, plus untriggered patterns."""
+        candidates = list(self._always)
+        if self._scanner is None:
+            return candidates
+
+        seen = set()
+        for found in self._scanner.findall(query_lower):
+            if found in seen:
+                continue
+            for trigger in self._prefix_closure[found]:
+                if trigger not in seen:
+                    seen.add(trigger)
+                    candidates.extend(self._by_trigger[trigger])
+        return candidates
+
+    def classify(self, query: str) -> ClassificationResult:
+        """Score every intent in one pass over the query.
+
+        Confidence per intent is min(0.9, 0.5 + matched/total * 0.4), the
+        same formula DeterministicRouter has always used. Ties keep the
+        intent declared first.
+        """
+        query_lower = query.lower()
+        matched: Dict[str, List[int]] = {}
+        for intent, idx in self._candidates(query_lower):
+            if self.patterns[intent][idx].search(query_lower):
+                matched.setdefault(intent, []).append(idx)
+
+        if not matched:
+            return ClassificationResult(intent="unmatched", confidence=0.0)
+
+        scores: Dict[str, float] = {}
+        best_intent, best_score = "unmatched", -1.0
+        for intent in self.patterns:
+            hits = matched.get(intent)
+            if not hits:
+                continue
+            hits.sort()
+            score = min(0.9, 0.5 + (len(hits) / self._pattern_counts[intent]) * 0.4)
+            scores[intent] = score
+            if score > best_score:
+                best_intent, best_score = intent, score
+
+        return ClassificationResult(
+            intent=best_intent,
+            confidence=best_score,
+            scores=scores,
+            matched={intent: matched[intent] for intent in scores},
+            patterns_matched=[self.patterns[best_intent][i].pattern for i in matched[best_intent]],
+        )
+
+
+_classifier_cache: Dict[int, Tuple[Mapping[str, Sequence[str]], Tuple, IntentClassifier]] = {}
+
+
+def _fingerprint(intent_patterns: Mapping[str, Sequence[str]]) -> Tuple:
+    return tuple((intent, tuple(patterns)) for intent, patterns in intent_patterns.items())
+
+
+def get_intent_classifier(intent_patterns: Mapping[str, Sequence[str]]) -> IntentClassifier:
+    """Get a shared compiled classifier, recompiling only if the patterns change."""
+    fingerprint = _fingerprint(intent_patterns)
+    cached = _classifier_cache.get(id(intent_patterns))
+    if cached is not None and cached[0] is intent_patterns and cached[1] == fingerprint:
+        return cached[2]
+    classifier = IntentClassifier(intent_patterns)
+    _classifier_cache[id(intent_patterns)] = (intent_patterns, fingerprint, classifier)
+    return classifier
@@ -3,10 +3,15 @@
 Neo4j integration for relationship mapping, recommendations, and knowledge extraction.
 """
 
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import defaultdict
 import json
+import logging
+import queue
+import threading
+import time
 
 try:
     from neo4j import GraphDatabase, Session as Neo4jSession
@@ -15,6 +20,8 @@ except ImportError:
     GraphDatabase = None
     Neo4jSession = None
 
+logger = logging.getLogger(__name__)
+
 
 class RelationshipType(str, Enum):
     """Types of relationships in knowledge graph."""
@@ -84,7 +91,9 @@ class Neo4jConfig:
         uri: str = "bolt://localhost:7687",
         username: str = "neo4j",
         password: str = "password",
-        database: str = "neo4j"
+        database: str = "neo4j",
+        max_connection_pool_size: int = 50,
+        connection_acquisition_timeout: float = 60.0
     ):
         """Initialize Neo4j configuration.
         
@@ -93,26 +102,85 @@ class Neo4jConfig:
             username: Neo4j username
             password: Neo4j password
             database: Database name
+            max_connection_pool_size: Maximum pooled Bolt connections
+            connection_acquisition_timeout: Seconds to wait for a pooled connection
         """
         self.uri = uri
         self.username = username
         self.password = password
         self.database = database
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+
+
+def _node_rows(nodes: Iterable[GraphNode]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group nodes into UNWIND parameter rows by label (labels cannot be parameters)."""
+    rows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for node in nodes:
+        rows[node.node_type.value].append({"id": node.id, "properties": node.properties or {}})
+    return rows
+
+
+def _edge_rows(
+    edges: Iterable[GraphEdge],
+    labels: Optional[Dict[str, str]] = None
+) -> Dict[Tuple[str, str, str], List[Dict[str, Any]]]:
+    """Group edges by (relationship, source label, target label).
+    
+    Known endpoint labels let MATCH use the per-label id index instead of
+    scanning every node.
+    """
+    labels = labels or {}
+    rows: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = defaultdict(list)
+    for edge in edges:
+        key = (
+            edge.relationship_type.value,
+            labels.get(edge.source_id, ""),
+            labels.get(edge.target_id, ""),
+        )
+        rows[key].append({
+            "source_id": edge.source_id,
+            "target_id": edge.target_id,
+            "properties": edge.properties or {},
+        })
+    return rows
+
+
+def _merge_nodes_query(label: str) -> str:
+    return (
+        "UNWIND $rows AS row "
+        f"MERGE (n:{label} {{id: row.id}}) "
+        "SET n += row.properties, n.type = $type"
+    )
+
+
+def _merge_edges_query(relationship: str, source_label: str, target_label: str) -> str:
+    source = f":{source_label}" if source_label else ""
+    target = f":{target_label}" if target_label else ""
+    return (
+        "UNWIND $rows AS row "
+        f"MATCH (source{source} {{id: row.source_id}}) "
+        f"MATCH (target{target} {{id: row.target_id}}) "
+        f"MERGE (source)-[r:{relationship}]->(target) "
+        "SET r += row.properties"
+    )
 
 
 class GraphDatabase_:
     """Neo4j graph database interface."""
     
-    def __init__(self, config: Neo4jConfig):
+    def __init__(self, config: Neo4jConfig, driver: Any = None):
         """Initialize graph database.
         
         Args:
             config: Neo4j configuration
+            driver: Existing Neo4j driver (skips connecting; used for tests)
         """
         self.config = config
-        self.driver = None
+        self.driver = driver
         self.session = None
-        self._connect()
+        if driver is None:
+            self._connect()
     
     def _connect(self):
         """Connect to Neo4j."""
@@ -123,7 +191,9 @@ class GraphDatabase_:
         try:
             self.driver = GraphDatabase.driver(
                 self.config.uri,
-                auth=(self.config.username, self.config.password)
+                auth=(self.config.username, self.config.password),
+                max_connection_pool_size=self.config.max_connection_pool_size,
+                connection_acquisition_timeout=self.config.connection_acquisition_timeout
             )
             self.driver.verify_connectivity()
         except ServiceUnavailable:
@@ -145,32 +215,102 @@ class GraphDatabase_:
         if self.driver:
             self.driver.close()
     
-    def create_node(self, node: GraphNode) -> bool:
-        """Create a node.
+    def ensure_indexes(self) -> None:
+        """Create an id index for every node label (speeds up MERGE/MATCH by id)."""
+        if not self.driver:
+            return
+        
+        session = self.get_session()
+        try:
+            for node_type in NodeType:
+                session.run(
+                    f"CREATE INDEX {node_type.value.lower()}_id IF NOT EXISTS "
+                    f"FOR (n:{node_type.value}) ON (n.id)"
+                )
+        finally:
+            session.close()
+    
+    def create_nodes(self, nodes: List[GraphNode], session: Any = None) -> int:
+        """Create or update nodes in one managed transaction.
+        
+        Nodes are grouped by label and written with parameterized
+        UNWIND/MERGE, so a batch costs one round trip per label instead
+        of one per node.
         
         Args:
-            node: Node to create
+            nodes: Nodes to write
+            session: Session to reuse (opens and closes one if None)
             
         Returns:
-            True if successful
+            Number of nodes written
         """
+        if not nodes:
+            return 0
         if not self.driver:
-            return True  # Mock success
+            return len(nodes)  # Mock success
         
-        session = self.get_session()
-        if not session:
-            return False
+        grouped = _node_rows(nodes)
         
+        def write(tx) -> None:
+            for label, rows in grouped.items():
+                tx.run(_merge_nodes_query(label), rows=rows, type=label)
+        
+        self._execute_write(write, session)
+        return len(nodes)
+    
+    def create_edges(
+        self,
+        edges: List[GraphEdge],
+        session: Any = None,
+        labels: Optional[Dict[str, str]] = None
+    ) -> int:
+        """Create or update edges in one managed transaction.
+        
+        Args:
+            edges: Edges to write
+            session: Session to reuse (opens and closes one if None)
+            labels: Optional node id -> label map for endpoint lookups
+            
+        Returns:
+            Number of edges written
+        """
+        if not edges:
+            return 0
+        if not self.driver:
+            return len(edges)  # Mock success
+        
+        grouped = _edge_rows(edges, labels)
+        
+        def write(tx) -> None:
+            for (relationship, source_label, target_label), rows in grouped.items():
+                tx.run(_merge_edges_query(relationship, source_label, target_label), rows=rows)
+        
+        self._execute_write(write, session)
+        return len(edges)
+    
+    def _execute_write(self, work, session: Any = None) -> None:
+        """Run work in a managed (automatically retried) write transaction."""
+        if session is not None:
+            session.execute_write(work)
+            return
+        
+        session = self.get_session()
         try:
-            query = f"""
-            CREATE (n:{node.node_type.value} {{id: $id, ...$ properties}})
-            RETURN n
-            """
-            session.run(query, id=node.id, properties=node.properties)
-            return True
+            session.execute_write(work)
         finally:
             session.close()
     
+    def create_node(self, node: GraphNode) -> bool:
+        """Create a node.
+        
+        Args:
+            node: Node to create
+            
+        Returns:
+            True if successful
+        """
+        return self.create_nodes([node]) == 1
+    
     def create_edge(self, edge: GraphEdge) -> bool:
         """Create an edge.
         
@@ -180,29 +320,7 @@ class GraphDatabase_:
         Returns:
             True if successful
         """
-        if not self.driver:
-            return True  # Mock success
-        
-        session = self.get_session()
-        if not session:
-            return False
-        
-        try:
-            query = f"""
-            MATCH (source {{id: $source_id}})
-            MATCH (target {{id: $target_id}})
-            CREATE (source)-[r:{edge.relationship_type.value} {{...$ properties}}]->(target)
-            RETURN r
-            """
-            session.run(
-                query,
-                source_id=edge.source_id,
-                target_id=edge.target_id,
-                properties=edge.properties or {}
-            )
-            return True
-        finally:
-            session.close()
+        return self.create_edges([edge]) == 1
     
     def get_node(self, node_id: str) -> Optional[GraphNode]:
         """Get node by ID.
@@ -279,6 +397,201 @@ class GraphDatabase_:
         return None
 
 
+@dataclass
+class IngestStats:
+    """Throughput counters for a bulk ingest."""
+    nodes_written: int = 0
+    edges_written: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    elapsed_seconds: float = 0.0
+    blocked_seconds: float = 0.0  # Producer time spent waiting on a full queue
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+    
+    @property
+    def edges_per_second(self) -> float:
+        return self.edges_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes_written": self.nodes_written,
+            "edges_written": self.edges_written,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "nodes_per_second": round(self.nodes_per_second, 1),
+            "edges_per_second": round(self.edges_per_second, 1),
+            "errors": list(self.errors),
+        }
+
+
+class BulkIngestor:
+    """Buffered, batched graph writer.
+    
+    Nodes and edges are buffered into batches that a single writer thread
+    sends as UNWIND/MERGE statements over one reused session. The queue
+    between producers and the writer is bounded, so producers block (and
+    the wait is recorded) when Neo4j falls behind instead of buffering
+    the whole graph in memory. Buffered nodes are always queued before
+    any edge batch, so edges never reference nodes that are not yet written.
+    
+    Usage:
+        with BulkIngestor(db, batch_size=1000) as ingestor:
+            ingestor.add_nodes(nodes)
+            ingestor.add_edges(edges)
+        print(ingestor.stats.to_dict())
+    """
+    
+    def __init__(self, db: GraphDatabase_, batch_size: int = 500, max_pending_batches: int = 4):
+        """Initialize bulk ingestor.
+        
+        Args:
+            db: Graph database
+            batch_size: Rows per UNWIND statement
+            max_pending_batches: Queued batches before producers block
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        self.db = db
+        self.batch_size = batch_size
+        self.stats = IngestStats()
+        self._labels: Dict[str, str] = {}
+        self._nodes: List[GraphNode] = []
+        self._edges: List[GraphEdge] = []
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_pending_batches))
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="graph-bulk-writer", daemon=True)
+        self._writer.start()
+    
+    def __enter__(self) -> "BulkIngestor":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def add_node(self, node: GraphNode) -> None:
+        """Buffer a node."""
+        self.add_nodes([node])
+    
+    def add_nodes(self, nodes: Iterable[GraphNode]) -> None:
+        """Buffer nodes, queueing full batches."""
+        self._check_open()
+        for node in nodes:
+            with self._lock:
+                self._labels[node.id] = node.node_type.value
+                self._nodes.append(node)
+                batch = self._take(self._nodes, full_only=True)
+            if batch:
+                self._put(("nodes", batch))
+    
+    def add_edge(self, edge: GraphEdge) -> None:
+        """Buffer an edge."""
+        self.add_edges([edge])
+    
+    def add_edges(self, edges: Iterable[GraphEdge]) -> None:
+        """Buffer edges, queueing full batches (after any buffered nodes)."""
+        self._check_open()
+        for edge in edges:
+            with self._lock:
+                self._edges.append(edge)
+                batch = self._take(self._edges, full_only=True)
+            if batch:
+                self._flush_nodes()
+                self._put(("edges", batch))
+    
+    def flush(self) -> IngestStats:
+        """Write everything buffered so far and wait for the writer.
+        
+        Returns:
+            Stats so far
+        """
+        self._check_open()
+        self._flush_nodes()
+        with self._lock:
+            edges = self._take(self._edges)
+        if edges:
+            self._put(("edges", edges))
+        self._queue.join()
+        self.stats.elapsed_seconds = time.perf_counter() - self._started
+        return self.stats
+    
+    def close(self) -> IngestStats:
+        """Flush and stop the writer thread.
+        
+        Returns:
+            Final stats
+        """
+        if self._closed:
+            return self.stats
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        logger.info(f"Bulk ingest finished: {self.stats.to_dict()}")
+        return self.stats
+    
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("BulkIngestor is closed")
+    
+    def _take(self, buffer: List, full_only: bool = False) -> List:
+        if not buffer or (full_only and len(buffer) < self.batch_size):
+            return []
+        batch = buffer[:self.batch_size] if full_only else buffer[:]
+        del buffer[:len(batch)]
+        return batch
+    
+    def _flush_nodes(self) -> None:
+        with self._lock:
+            nodes = self._take(self._nodes)
+        for start in range(0, len(nodes), self.batch_size):
+            self._put(("nodes", nodes[start:start + self.batch_size]))
+    
+    def _put(self, item: Tuple[str, List]) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            waited = time.perf_counter()
+            self._queue.put(item)
+            self.stats.blocked_seconds += time.perf_counter() - waited
+    
+    def _write_loop(self) -> None:
+        session = self.db.get_session() if self.db.driver else None
+        try:
+            while True:
+                item = self._queue.get()
+                try:
+                    if item is None:
+                        return
+                    self._write_batch(session, *item)
+                finally:
+                    self._queue.task_done()
+        finally:
+            if session is not None:
+                session.close()
+    
+    def _write_batch(self, session: Any, kind: str, batch: List) -> None:
+        try:
+            if kind == "nodes":
+                self.stats.nodes_written += self.db.create_nodes(batch, session=session)
+            else:
+                # Only looked up by key, so producers adding labels concurrently is safe
+                self.stats.edges_written += self.db.create_edges(batch, session=session, labels=self._labels)
+            self.stats.batches += 1
+        except Exception as e:
+            self.stats.failed_batches += 1
+            self.stats.errors.append(f"{kind} batch of {len(batch)}: {e}")
+            logger.error(f"Failed to write {kind} batch of {len(batch)}: {e}")
+
+
 class NodeQuery:
     """Query interface for nodes."""
     
@@ -372,13 +685,23 @@ class NodeQuery:
 class EdgeQuery:
     """Query interface for edges."""
     
-    def __init__(self, db: GraphDatabase_):
+    def __init__(self, db: GraphDatabase_, local_graph: Any = None):
         """Initialize edge query.
         
         Args:
             db: Graph database instance
+            local_graph: In-memory graph used without a driver (default: global local graph)
         """
         self.db = db
+        self._local_graph = local_graph
+    
+    @property
+    def local_graph(self):
+        """In-memory graph answering queries when no Neo4j driver is configured."""
+        if self._local_graph is None:
+            from .local_graph import get_local_graph
+            return get_local_graph()
+        return self._local_graph
     
     def find_connections(
         self,
@@ -397,7 +720,7 @@ class EdgeQuery:
             List of (source, relationship, target) tuples
         """
         if not self.db.driver:
-            return []
+            return self.local_graph.connections(node_id, relationship_type, depth)
         
         session = self.db.get_session()
         if not session:
@@ -430,15 +753,21 @@ class EdgeQuery:
 class RecommendationEngine:
     """Generates recommendations based on knowledge graph."""
     
-    def __init__(self, db: GraphDatabase_):
+    def __init__(self, db: GraphDatabase_, local_graph: Any = None):
         """Initialize recommendation engine.
         
         Args:
             db: Graph database instance
+            local_graph: In-memory graph used without a driver (default: global local graph)
         """
         self.db = db
         self.node_query = NodeQuery(db)
-        self.edge_query = EdgeQuery(db)
+        self.edge_query = EdgeQuery(db, local_graph)
+    
+    @property
+    def local_graph(self):
+        """In-memory graph scoring recommendations when no Neo4j driver is configured."""
+        return self.edge_query.local_graph
     
     def recommend_papers(self, paper_id: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Recommend related papers.
@@ -451,10 +780,15 @@ class RecommendationEngine:
             List of recommended papers
         """
         if not self.db.driver:
-            # Mock recommendations
             return [
-                {"id": f"paper-{i}", "score": 0.8 - i*0.1, "reason": "Similar research"}
-                for i in range(limit)
+                {
+                    "id": node.id,
+                    "type": node.node_type.value,
+                    "properties": node.properties,
+                    "score": score,
+                    "reason": "Related by shared research graph neighborhood"
+                }
+                for node, score in self._ranked(paper_id, NodeType.PAPER, limit)
             ]
         
         connections = self.edge_query.find_connections(
@@ -495,10 +829,14 @@ class RecommendationEngine:
             List of recommended technologies
         """
         if not self.db.driver:
-            # Mock recommendations
             return [
-                {"id": f"tech-{i}", "name": f"Technology {i}", "score": 0.8 - i*0.1}
-                for i in range(limit)
+                {
+                    "id": node.id,
+                    "name": node.properties.get("name", node.id),
+                    "properties": node.properties,
+                    "score": score
+                }
+                for node, score in self._ranked(project_id, NodeType.TECHNOLOGY, limit)
             ]
         
         connections = self.edge_query.find_connections(
@@ -534,10 +872,16 @@ class RecommendationEngine:
             List of expert authors
         """
         if not self.db.driver:
-            # Mock experts
+            graph = self.local_graph
+            nearby = graph.neighborhood(topic_id, depth=2)
             return [
-                {"id": f"author-{i}", "name": f"Author {i}", "papers": i+5}
-                for i in range(limit)
+                {
+                    "id": node.id,
+                    "name": node.properties.get("name", node.id),
+                    "connections": sum(1 for n in graph.neighbors(node.id) if n.id in nearby),
+                    "score": score
+                }
+                for node, score in self._ranked(topic_id, NodeType.AUTHOR, limit)
             ]
         
         connections = self.edge_query.find_connections(
@@ -580,7 +924,7 @@ class RecommendationEngine:
             Similarity score (0-1)
         """
         if not self.db.driver:
-            return 0.5
+            return self.local_graph.jaccard(node1_id, node2_id)
         
         # Simplified similarity: based on shared connections
         connections1 = set(
@@ -597,3 +941,11 @@ class RecommendationEngine:
         union = len(connections1 | connections2)
         
         return intersection / union if union > 0 else 0.0
+    
+    def _ranked(self, seed_id: str, node_type: NodeType, limit: int) -> List[Tuple[GraphNode, float]]:
+        """Local-graph nodes of a type ranked by personalized PageRank, scaled to 0-1."""
+        ranked = self.local_graph.rank(seed_id, node_type=node_type, limit=limit)
+        if not ranked:
+            return []
+        top = ranked[0][1]
+        return [(node, round(score / top, 4)) for node, score in ranked]
@@ -0,0 +1,621 @@
+"""Embedded in-memory knowledge graph.
+
+Answers the traversal and recommendation queries of EdgeQuery and
+RecommendationEngine in-process when no Neo4j driver is configured, so
+offline deployments get real results instead of canned mock scores and
+similarity does not pay two depth-2 Neo4j round trips per pair.
+
+The graph is an undirected adjacency list (node row -> {neighbor row:
+relationship types}) built from event data (projects, sessions, people)
+and knowledge artifacts. Similarity and personalized PageRank are scored
+over a CSR snapshot of the adjacency with NumPy when it is installed,
+falling back to pure Python otherwise.
+
+Usage:
+    graph = get_local_graph()
+    graph.similar("proj-vision-assist", node_type=NodeType.PROJECT)
+    graph.personalized_pagerank("concept:accessibility")
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from src.api.knowledge_graph import GraphEdge, GraphNode, NodeType, RelationshipType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is missing
+    np = None
+
+logger = logging.getLogger(__name__)
+
+Seeds = Union[str, Iterable[str], Dict[str, float]]
+
+SIMILARITY_METRICS = ("jaccard", "adamic_adar")
+
+
+def _key(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+def _person_name(person: Dict[str, Any]) -> str:
+    return person.get("displayName") or person.get("name") or ""
+
+
+class LocalGraph:
+    """In-memory undirected graph with traversal and link-analysis scoring.
+
+    Edges keep their relationship type (and direction for display) but are
+    traversed in both directions, matching the undirected patterns used by
+    EdgeQuery.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._index: Dict[str, int] = {}
+        self._nodes: List[GraphNode] = []
+        self._adj: List[Dict[int, Set[RelationshipType]]] = []
+        self._edges: Dict[Tuple[int, int], GraphEdge] = {}
+        self._csr = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def add_node(self, node: GraphNode) -> GraphNode:
+        """Add a node, merging properties into an existing node with the same ID.
+
+        Args:
+            node: Node to add
+
+        Returns:
+            The stored node
+        """
+        row = self._index.get(node.id)
+        if row is not None:
+            self._nodes[row].properties.update(node.properties or {})
+            return self._nodes[row]
+
+        self._index[node.id] = len(self._nodes)
+        self._nodes.append(GraphNode(node.id, node.node_type, dict(node.properties or {})))
+        self._adj.append({})
+        self._csr = None
+        return self._nodes[-1]
+
+    def add_edge(self, edge: GraphEdge) -> bool:
+        """Add an edge between existing nodes.
+
+        Like the MATCH ... MERGE used for Neo4j writes, edges whose endpoints
+        are unknown are skipped.
+
+        Args:
+            edge: Edge to add
+
+        Returns:
+            True if the edge was added
+        """
+        source = self._index.get(edge.source_id)
+        target = self._index.get(edge.target_id)
+        if source is None or target is None or source == target:
+            return False
+
+        self._adj[source].setdefault(target, set()).add(edge.relationship_type)
+        self._adj[target].setdefault(source, set()).add(edge.relationship_type)
+        self._edges[(source, target)] = edge
+        self._csr = None
+        return True
+
+    def _link(self, source: GraphNode, relationship: RelationshipType, target: GraphNode) -> None:
+        self.add_edge(GraphEdge(source.id, target.id, relationship))
+
+    def add_project(self, project: Dict[str, Any]) -> Optional[GraphNode]:
+        """Add a project with its team, topics, papers and code repositories."""
+        project_id = project.get("id")
+        if not project_id:
+            return None
+
+        node = self.add_node(GraphNode(project_id, NodeType.PROJECT, {
+            "name": project.get("name", ""),
+            "researchArea": project.get("researchArea", ""),
+            "eventId": project.get("eventId", ""),
+        }))
+
+        for member in project.get("team", []) or []:
+            author = self._author(member)
+            if author:
+                self._link(author, RelationshipType.AUTHOR, node)
+
+        topics = [project.get("researchArea"), project.get("theme")]
+        topics += list(project.get("keywords", []) or []) + list(project.get("tags", []) or [])
+        for topic in topics:
+            if topic:
+                self._link(node, RelationshipType.RELATED_TO, self._concept(topic))
+
+        for url in project.get("papers", []) or []:
+            paper = self.add_node(GraphNode(url, NodeType.PAPER, {"url": url}))
+            self._link(node, RelationshipType.CITES, paper)
+
+        for url in project.get("codeRepos", []) or []:
+            repo = self.add_node(GraphNode(url, NodeType.ARTIFACT, {"url": url}))
+            self._link(repo, RelationshipType.IMPLEMENTS, node)
+        return node
+
+    def add_session(self, session: Dict[str, Any]) -> Optional[GraphNode]:
+        """Add a session (as a Venue) linked to its speakers and projects."""
+        session_id = session.get("id")
+        if not session_id:
+            return None
+
+        node = self.add_node(GraphNode(session_id, NodeType.VENUE, {"title": session.get("title", "")}))
+        for speaker in session.get("speakers", []) or []:
+            author = self._author(speaker)
+            if author:
+                self._link(author, RelationshipType.AUTHOR, node)
+
+        project_ids = list(session.get("projectIds", []) or [])
+        if session.get("projectId"):
+            project_ids.append(session["projectId"])
+        for project_id in project_ids:
+            self.add_edge(GraphEdge(project_id, session_id, RelationshipType.PUBLISHED_IN))
+        return node
+
+    def add_artifact(self, artifact: Any) -> Optional[GraphNode]:
+        """Add a knowledge artifact (model or dict) linked to its project.
+
+        Technologies and topics listed under ``additionalKnowledge`` become
+        Technology and Concept nodes used by the project.
+        """
+        data = artifact.to_dict() if hasattr(artifact, "to_dict") else dict(artifact)
+        artifact_id = data.get("id")
+        if not artifact_id:
+            return None
+
+        node = self.add_node(GraphNode(artifact_id, NodeType.ARTIFACT, {
+            "title": data.get("title", ""),
+            "projectId": data.get("projectId", ""),
+        }))
+        project = self.get_node(data.get("projectId", ""))
+        if project is not None:
+            self._link(node, RelationshipType.DERIVED_FROM, project)
+
+        extra = data.get("additionalKnowledge") or {}
+        for name in extra.get("technologies", []) or []:
+            technology = self.add_node(GraphNode(f"technology:{_key(name)}", NodeType.TECHNOLOGY, {"name": name}))
+            self._link(node, RelationshipType.USES, technology)
+            if project is not None:
+                self._link(project, RelationshipType.USES, technology)
+        for topic in list(extra.get("keywords", []) or []) + list(extra.get("topics", []) or []):
+            self._link(node, RelationshipType.RELATED_TO, self._concept(topic))
+        return node
+
+    def _author(self, person: Dict[str, Any]) -> Optional[GraphNode]:
+        name = _person_name(person)
+        if not name:
+            return None
+        properties = {"name": name}
+        if person.get("email"):
+            properties["email"] = person["email"]
+        return self.add_node(GraphNode(f"author:{_key(name)}", NodeType.AUTHOR, properties))
+
+    def _concept(self, name: str) -> GraphNode:
+        return self.add_node(GraphNode(f"concept:{_key(name)}", NodeType.CONCEPT, {"name": name}))
+
+    @classmethod
+    def from_event_data(cls, data: Dict[str, Any], artifacts: Iterable[Any] = ()) -> "LocalGraph":
+        """Build a graph from an event data dictionary and knowledge artifacts.
+
+        Args:
+            data: Event data with ``projects``, ``sessions`` and ``people``
+            artifacts: KnowledgeArtifact models or dictionaries
+
+        Returns:
+            Populated graph
+        """
+        graph = cls()
+        for person in data.get("people", []) or []:
+            graph._author(person)
+        for project in data.get("projects", []) or []:
+            graph.add_project(project)
+        for session in data.get("sessions", []) or []:
+            graph.add_session(session)
+        for artifact in artifacts:
+            graph.add_artifact(artifact)
+        logger.debug(f"Built local graph: {graph.node_count} nodes, {graph.edge_count} edges")
+        return graph
+
+    # ------------------------------------------------------------------
+    # Lookups and traversal
+    # ------------------------------------------------------------------
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(neighbors) for neighbors in self._adj) // 2
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._index
+
+    def get_node(self, node_id: str) -> Optional[GraphNode]:
+        """Node by ID, or None."""
+        row = self._index.get(node_id)
+        return self._nodes[row] if row is not None else None
+
+    def nodes(self, node_type: Optional[NodeType] = None) -> List[GraphNode]:
+        """All nodes, optionally of one type."""
+        return [n for n in self._nodes if node_type is None or n.node_type == node_type]
+
+    def _relationship(self, a: int, b: int) -> RelationshipType:
+        edge = self._edges.get((a, b)) or self._edges.get((b, a))
+        return edge.relationship_type
+
+    def _neighbors(self, row: int, relationship_type: Optional[RelationshipType]) -> Iterable[int]:
+        if relationship_type is None:
+            return self._adj[row].keys()
+        return [n for n, types in self._adj[row].items() if relationship_type in types]
+
+    def neighbors(self, node_id: str, relationship_type: Optional[RelationshipType] = None) -> List[GraphNode]:
+        """Directly connected nodes."""
+        row = self._index.get(node_id)
+        if row is None:
+            return []
+        return [self._nodes[n] for n in self._neighbors(row, relationship_type)]
+
+    def _bfs(
+        self,
+        start: int,
+        depth: Optional[int],
+        relationship_type: Optional[RelationshipType] = None,
+        goal: Optional[int] = None
+    ) -> Dict[int, Tuple[int, int]]:
+        """Breadth-first search returning row -> (distance, parent row)."""
+        visited = {start: (0, -1)}
+        frontier = deque([start])
+        while frontier:
+            row = frontier.popleft()
+            distance = visited[row][0]
+            if depth is not None and distance >= depth:
+                continue
+            for neighbor in self._neighbors(row, relationship_type):
+                if neighbor not in visited:
+                    visited[neighbor] = (distance + 1, row)
+                    if neighbor == goal:
+                        return visited
+                    frontier.append(neighbor)
+        return visited
+
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int = 1,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> Dict[str, int]:
+        """Nodes within depth hops.
+
+        Args:
+            node_id: Start node ID
+            depth: Maximum hops
+            relationship_type: Only traverse edges of this type
+
+        Returns:
+            Node ID -> distance (start node excluded)
+        """
+        row = self._index.get(node_id)
+        if row is None:
+            return {}
+        visited = self._bfs(row, depth, relationship_type)
+        return {self._nodes[r].id: distance for r, (distance, _) in visited.items() if r != row}
+
+    def connections(
+        self,
+        node_id: str,
+        relationship_type: Optional[RelationshipType] = None,
+        depth: int = 1
+    ) -> List[Tuple[GraphNode, RelationshipType, GraphNode]]:
+        """Nodes within depth hops in EdgeQuery.find_connections form.
+
+        Returns:
+            (start node, relationship of the last hop, target node) tuples,
+            nearest first
+        """
+        row = self._index.get(node_id)
+        if row is None:
+            return []
+        visited = self._bfs(row, depth, relationship_type)
+        ordered = sorted((distance, r, parent) for r, (distance, parent) in visited.items() if r != row)
+        return [
+            (self._nodes[row], self._relationship(parent, r), self._nodes[r])
+            for _, r, parent in ordered
+        ]
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: Optional[int] = None,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> Optional[List[str]]:
+        """Shortest path between two nodes.
+
+        Returns:
+            Node IDs from source to target, or None if unreachable
+        """
+        source = self._index.get(source_id)
+        target = self._index.get(target_id)
+        if source is None or target is None:
+            return None
+
+        visited = self._bfs(source, max_depth, relationship_type, goal=target)
+        if target not in visited:
+            return None
+        path = []
+        row = target
+        while row != -1:
+            path.append(self._nodes[row].id)
+            row = visited[row][1]
+        return path[::-1]
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def jaccard(self, a: str, b: str) -> float:
+        """Jaccard similarity of two nodes' neighbor sets."""
+        row_a, row_b = self._index.get(a), self._index.get(b)
+        if row_a is None or row_b is None:
+            return 0.0
+        neighbors_a, neighbors_b = self._adj[row_a].keys(), self._adj[row_b].keys()
+        union = len(neighbors_a | neighbors_b)
+        return len(neighbors_a & neighbors_b) / union if union else 0.0
+
+    def adamic_adar(self, a: str, b: str) -> float:
+        """Adamic-Adar index: shared neighbors weighted by 1 / log(degree)."""
+        row_a, row_b = self._index.get(a), self._index.get(b)
+        if row_a is None or row_b is None:
+            return 0.0
+        shared = self._adj[row_a].keys() & self._adj[row_b].keys()
+        return sum(1.0 / math.log(len(self._adj[w])) for w in shared if len(self._adj[w]) > 1)
+
+    def _snapshot(self):
+        """CSR arrays (indptr, indices, degrees, node type codes) of the adjacency."""
+        if self._csr is None:
+            count = len(self._nodes)
+            degrees = np.fromiter((len(n) for n in self._adj), dtype=np.int64, count=count)
+            indptr = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(degrees, out=indptr[1:])
+            indices = np.fromiter(
+                (neighbor for neighbors in self._adj for neighbor in neighbors),
+                dtype=np.int64,
+                count=int(indptr[-1])
+            )
+            codes = {node_type: code for code, node_type in enumerate(NodeType)}
+            types = np.fromiter((codes[n.node_type] for n in self._nodes), dtype=np.int64, count=count)
+            self._csr = (indptr, indices, degrees, types, codes)
+        return self._csr
+
+    def similar(
+        self,
+        node_id: str,
+        metric: str = "jaccard",
+        node_type: Optional[NodeType] = None,
+        limit: int = 10
+    ) -> List[Tuple[GraphNode, float]]:
+        """Nodes most similar to node_id by shared neighbors.
+
+        Only nodes two hops away can share a neighbor, so candidates come
+        from the neighbors' adjacency lists rather than the whole graph.
+
+        Args:
+            node_id: Reference node ID
+            metric: "jaccard" or "adamic_adar"
+            node_type: Only return nodes of this type
+            limit: Maximum results
+
+        Returns:
+            (node, score) pairs, best first
+        """
+        if metric not in SIMILARITY_METRICS:
+            raise ValueError(f"Unknown similarity metric: {metric}")
+        row = self._index.get(node_id)
+        if row is None:
+            return []
+
+        if np is not None:
+            scores = self._similar_numpy(row, metric, node_type)
+        else:
+            scores = self._similar_python(row, metric, node_type)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._nodes[item[0]].id))
+        return [(self._nodes[r], score) for r, score in ranked[:limit]]
+
+    def _similar_numpy(self, row: int, metric: str, node_type: Optional[NodeType]) -> Dict[int, float]:
+        indptr, indices, degrees, types, codes = self._snapshot()
+        neighbors = indices[indptr[row]:indptr[row + 1]]
+        if neighbors.size == 0:
+            return {}
+        lengths = degrees[neighbors]
+        two_hop = np.concatenate([indices[indptr[w]:indptr[w + 1]] for w in neighbors])
+
+        if metric == "jaccard":
+            shared = np.bincount(two_hop, minlength=len(degrees)).astype(np.float64)
+            scores = np.divide(shared, degrees[row] + degrees - shared, out=np.zeros_like(shared), where=shared > 0)
+        else:
+            safe = np.maximum(lengths, 2)
+            weights = np.where(lengths > 1, 1.0 / np.log(safe), 0.0)
+            scores = np.bincount(two_hop, weights=np.repeat(weights, lengths), minlength=len(degrees))
+
+        scores[row] = 0.0
+        if node_type is not None:
+            scores[types != codes[node_type]] = 0.0
+        candidates = np.flatnonzero(scores > 0)
+        return dict(zip(candidates.tolist(), scores[candidates].tolist()))
+
+    def _similar_python(self, row: int, metric: str, node_type: Optional[NodeType]) -> Dict[int, float]:
+        shared: Dict[int, float] = {}
+        for neighbor in self._adj[row]:
+            degree = len(self._adj[neighbor])
+            if metric == "jaccard":
+                weight = 1.0
+            else:
+                weight = 1.0 / math.log(degree) if degree > 1 else 0.0
+            for candidate in self._adj[neighbor]:
+                shared[candidate] = shared.get(candidate, 0.0) + weight
+        shared.pop(row, None)
+
+        degree = len(self._adj[row])
+        scores = {}
+        for candidate, value in shared.items():
+            if node_type is not None and self._nodes[candidate].node_type != node_type:
+                continue
+            if metric == "jaccard":
+                value = value / (degree + len(self._adj[candidate]) - value)
+            if value > 0:
+                scores[candidate] = value
+        return scores
+
+    def personalized_pagerank(
+        self,
+        seeds: Seeds,
+        alpha: float = 0.85,
+        max_iter: int = 50,
+        tol: float = 1e-8
+    ) -> Dict[str, float]:
+        """Personalized PageRank (random walk with restart to the seeds).
+
+        Args:
+            seeds: Node ID, IDs, or ID -> restart weight
+            alpha: Probability of following an edge rather than restarting
+            max_iter: Maximum power iterations
+            tol: L1 convergence threshold
+
+        Returns:
+            Node ID -> score (scores sum to 1; unreachable nodes omitted)
+        """
+        if isinstance(seeds, str):
+            seeds = {seeds: 1.0}
+        elif not isinstance(seeds, dict):
+            seeds = {seed: 1.0 for seed in seeds}
+        restart = {self._index[s]: w for s, w in seeds.items() if s in self._index and w > 0}
+        total = sum(restart.values())
+        if not total:
+            return {}
+        restart = {row: weight / total for row, weight in restart.items()}
+
+        if np is not None:
+            ranks = self._pagerank_numpy(restart, alpha, max_iter, tol)
+        else:
+            ranks = self._pagerank_python(restart, alpha, max_iter, tol)
+        return {self._nodes[row].id: score for row, score in ranks.items() if score > 0}
+
+    def _pagerank_numpy(self, restart: Dict[int, float], alpha: float, max_iter: int, tol: float) -> Dict[int, float]:
+        indptr, indices, degrees, _, _ = self._snapshot()
+        count = len(degrees)
+        teleport = np.zeros(count)
+        teleport[list(restart)] = list(restart.values())
+        sources = np.repeat(np.arange(count), degrees)
+        inverse_degree = np.divide(1.0, degrees, out=np.zeros(count), where=degrees > 0)
+        dangling = degrees == 0
+
+        rank = teleport.copy()
+        for _ in range(max_iter):
+            spread = np.bincount(indices, weights=(rank * inverse_degree)[sources], minlength=count)
+            updated = alpha * (spread + rank[dangling].sum() * teleport) + (1 - alpha) * teleport
+            converged = np.abs(updated - rank).sum() < tol
+            rank = updated
+            if converged:
+                break
+        nonzero = np.flatnonzero(rank)
+        return dict(zip(nonzero.tolist(), rank[nonzero].tolist()))
+
+    def _pagerank_python(self, restart: Dict[int, float], alpha: float, max_iter: int, tol: float) -> Dict[int, float]:
+        rank = dict(restart)
+        for _ in range(max_iter):
+            updated = {row: (1 - alpha) * weight for row, weight in restart.items()}
+            dangling = 0.0
+            for row, score in rank.items():
+                neighbors = self._adj[row]
+                if not neighbors:
+                    dangling += score
+                    continue
+                share = alpha * score / len(neighbors)
+                for neighbor in neighbors:
+                    updated[neighbor] = updated.get(neighbor, 0.0) + share
+            for row, weight in restart.items():
+                updated[row] += alpha * dangling * weight
+            delta = sum(abs(updated.get(row, 0.0) - rank.get(row, 0.0)) for row in updated.keys() | rank.keys())
+            rank = updated
+            if delta < tol:
+                break
+        return rank
+
+    def rank(
+        self,
+        seeds: Seeds,
+        node_type: Optional[NodeType] = None,
+        limit: int = 10,
+        exclude: Iterable[str] = ()
+    ) -> List[Tuple[GraphNode, float]]:
+        """Nodes ranked by personalized PageRank from the seeds.
+
+        Args:
+            seeds: Node ID, IDs, or ID -> restart weight (seeds are excluded)
+            node_type: Only return nodes of this type
+            limit: Maximum results
+            exclude: Additional node IDs to leave out
+
+        Returns:
+            (node, score) pairs, best first
+        """
+        seed_ids = {seeds} if isinstance(seeds, str) else set(seeds)
+        skip = seed_ids | set(exclude)
+        scores = self.personalized_pagerank(seeds)
+        ranked = []
+        for node_id, score in scores.items():
+            node = self.get_node(node_id)
+            if node_id in skip or (node_type is not None and node.node_type != node_type):
+                continue
+            ranked.append((node, score))
+        ranked.sort(key=lambda item: (-item[1], item[0].id))
+        return ranked[:limit]
+
+
+# Global local graph, rebuilt only when a new event data snapshot is published
+_local_graph: Optional[LocalGraph] = None
+_local_graph_version: Optional[int] = None
+_local_graph_lock = threading.Lock()
+
+
+def get_local_graph() -> LocalGraph:
+    """
+    Get the global in-memory graph built from the event data.
+
+    The graph is reused until a new event data snapshot is published
+    (see src.storage.catalog.get_snapshot).
+    """
+    global _local_graph, _local_graph_version
+    from src.storage.catalog import get_snapshot
+
+    snapshot = get_snapshot()
+    with _local_graph_lock:
+        if _local_graph is None or snapshot.version != _local_graph_version:
+            _local_graph = LocalGraph.from_event_data(snapshot.data)
+            _local_graph_version = snapshot.version
+        return _local_graph
+
+
+def set_local_graph(graph: Optional[LocalGraph]) -> None:
+    """
+    Replace the global graph (e.g. one that also includes artifacts); None resets it.
+
+    The graph is kept until the next event data snapshot is published.
+    """
+    global _local_graph, _local_graph_version
+    from src.storage.catalog import get_snapshot
+
+    with _local_graph_lock:
+        _local_graph = graph
+        _local_graph_version = get_snapshot().version if graph is not None else None
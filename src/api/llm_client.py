@@ -0,0 +1,194 @@
+"""
+Shared async HTTP client for the Azure OpenAI fallback path.
+
+One app-scoped httpx.AsyncClient keeps a keep-alive connection pool (HTTP/2
+when the h2 package is installed) so fallback chats reuse TLS connections
+instead of opening one per request. Bearer tokens are cached and refreshed
+shortly before expiry; the synchronous azure-identity call runs in a worker
+thread so it never blocks the event loop.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = httpx.Timeout(300.0, connect=10.0) if httpx else None
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+
+
+class UpstreamError(Exception):
+    """Raised when the upstream LLM endpoint returns a non-success status."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass
+class _CachedToken:
+    token: str
+    expires_on: float
+
+
+class BearerTokenCache:
+    """
+    Caches bearer tokens per scope and refreshes them before expiry.
+
+    Works with both sync (azure.identity) and async (azure.identity.aio)
+    credentials. Concurrent callers during a refresh share one get_token call.
+    """
+
+    def __init__(self, credential: Any, refresh_margin_seconds: int = 300):
+        """
+        Args:
+            credential: Object with a get_token(scope) method returning an AccessToken
+            refresh_margin_seconds: Refresh when a token expires within this window
+        """
+        self.credential = credential
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._tokens: Dict[str, _CachedToken] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.refresh_count = 0
+
+    def _valid(self, scope: str) -> Optional[str]:
+        cached = self._tokens.get(scope)
+        if cached and cached.expires_on - self.refresh_margin_seconds > time.time():
+            return cached.token
+        return None
+
+    async def get_token(self, scope: str) -> str:
+        """Get a bearer token for scope, fetching a new one only when needed."""
+        token = self._valid(scope)
+        if token is not None:
+            return token
+
+        lock = self._locks.setdefault(scope, asyncio.Lock())
+        async with lock:
+            token = self._valid(scope)
+            if token is not None:
+                return token
+
+            get_token = self.credential.get_token
+            if inspect.iscoroutinefunction(get_token):
+                access_token = await get_token(scope)
+            else:
+                access_token = await asyncio.to_thread(get_token, scope)
+
+            self._tokens[scope] = _CachedToken(access_token.token, float(access_token.expires_on))
+            self.refresh_count += 1
+            logger.debug(f"Refreshed bearer token for {scope}")
+            return access_token.token
+
+    def invalidate(self, scope: Optional[str] = None) -> None:
+        """Drop cached tokens (e.g., after a 401)."""
+        if scope is None:
+            self._tokens.clear()
+        else:
+            self._tokens.pop(scope, None)
+
+
+class AsyncLLMClient:
+    """
+    Pooled async HTTP client that streams server-sent event lines.
+
+    Usage:
+        client = get_llm_client()
+        async for line in client.stream_sse(url, headers=headers, json=body):
+            yield f"{line}\\n\\n"
+    """
+
+    def __init__(
+        self,
+        http2: Optional[bool] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+        timeout: Any = None,
+        transport: Any = None,
+    ):
+        """
+        Args:
+            http2: Enable HTTP/2 (default: when h2 is installed)
+            max_connections: Pool size
+            max_keepalive_connections: Idle connections kept open
+            timeout: httpx timeout (default: 300s read, 10s connect)
+            transport: Optional httpx transport (for tests)
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for the async LLM client. Install with: pip install httpx[http2]")
+
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout or DEFAULT_TIMEOUT,
+            transport=transport,
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    async def stream_sse(
+        self, url: str, headers: Dict[str, str], json: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        POST a request and yield non-empty "data:" lines as they arrive.
+
+        Raises:
+            UpstreamError: If the endpoint returns a non-success status
+        """
+        async with self._client.stream("POST", url, headers=headers, json=json) as resp:
+            if resp.is_error:
+                body = (await resp.aread()).decode("utf-8", errors="replace")
+                raise UpstreamError(resp.status_code, body or resp.reason_phrase)
+
+            async for line in resp.aiter_lines():
+                if line.startswith("data:"):
+                    yield line
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+
+# App-scoped client, created on first use and closed on shutdown
+_llm_client: Optional[AsyncLLMClient] = None
+
+
+def get_llm_client() -> AsyncLLMClient:
+    """Get the shared async LLM client."""
+    global _llm_client
+    if _llm_client is None or _llm_client.is_closed:
+        _llm_client = AsyncLLMClient()
+        logger.info(f"Created pooled LLM HTTP client (http2={_llm_client.http2})")
+    return _llm_client
+
+
+async def close_llm_client() -> None:
+    """Close the shared client; registered as an app shutdown handler."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
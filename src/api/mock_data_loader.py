@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from src.storage.search_index import SearchIndex
+
 
 class MockDataLoader:
     """Load and query mock event data from JSON file."""
@@ -14,6 +16,7 @@ class MockDataLoader:
     def __init__(self, data_path: str):
         self.data_path = Path(data_path)
         self.data: Dict[str, Any] = {}
+        self.search_index = SearchIndex()
         self._load_data()
     
     def _load_data(self) -> None:
@@ -23,6 +26,12 @@ class MockDataLoader:
         
         with open(self.data_path, 'r', encoding='utf-8') as f:
             self.data = json.load(f)
+
+        self.search_index = SearchIndex.from_event_data(
+            self.data.get('projects', []),
+            self.data.get('sessions', []),
+            self.data.get('people', []),
+        )
     
     def get_event(self) -> Optional[Dict[str, Any]]:
         """Get the main event information."""
@@ -43,7 +52,7 @@ class MockDataLoader:
         
         Args:
             research_area: Filter by research area (e.g., "AI", "Quantum Computing")
-            search_query: Search in name/description (case-insensitive)
+            search_query: Search in name/description; results are ranked by relevance
             equipment: Filter by equipment type
             requires_monitor: Filter by monitor requirement
             recording_permission: Filter by recording permission ("allowed", "restricted", "not_allowed")
@@ -52,17 +61,15 @@ class MockDataLoader:
         """
         projects = self.data.get('projects', [])
         
+        # Ranked search first so the remaining filters keep relevance order
+        if search_query:
+            hits = self.search_index.search(search_query, kind='project', fields=('name', 'description'))
+            projects = [hit.document for hit in hits]
+        
         # Apply filters
         if research_area:
             projects = [p for p in projects if p.get('researchArea', '').lower() == research_area.lower()]
         
-        if search_query:
-            query = search_query.lower()
-            projects = [
-                p for p in projects
-                if query in p.get('name', '').lower() or query in p.get('description', '').lower()
-            ]
-        
         if equipment:
             projects = [
                 p for p in projects
@@ -99,9 +106,8 @@ class MockDataLoader:
     
     def search_projects_by_name(self, name: str) -> List[Dict[str, Any]]:
         """Search projects by name (case-insensitive partial match)."""
-        projects = self.data.get('projects', [])
-        name_lower = name.lower()
-        return [p for p in projects if name_lower in p.get('name', '').lower()]
+        hits = self.search_index.search(name, kind='project', fields=('name',))
+        return [hit.document for hit in hits]
     
     def get_sessions(
         self,
@@ -115,9 +121,13 @@ class MockDataLoader:
         Args:
             session_type: Filter by session type ("keynote", "workshop", "panel", "demo")
             target_audience: Filter by target audience ("general", "technical", "leadership")
-            search_query: Search in title/description (case-insensitive)
+            search_query: Search in title/description; results are ranked by relevance
         """
         sessions = self.data.get('sessions', [])
+
+        if search_query:
+            hits = self.search_index.search(search_query, kind='session', fields=('name', 'description'))
+            sessions = [hit.document for hit in hits]
         
         if session_type:
             sessions = [s for s in sessions if s.get('sessionType', '').lower() == session_type.lower()]
@@ -125,13 +135,6 @@ class MockDataLoader:
         if target_audience:
             sessions = [s for s in sessions if s.get('targetAudience', '').lower() == target_audience.lower()]
         
-        if search_query:
-            query = search_query.lower()
-            sessions = [
-                s for s in sessions
-                if query in s.get('title', '').lower() or query in s.get('description', '').lower()
-            ]
-        
         return sessions
     
     def get_session_by_id(self, session_id: str) -> Optional[Dict[str, Any]]:
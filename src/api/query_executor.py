@@ -0,0 +1,456 @@
+"""
+Local execution of DeterministicRouter query plans.
+
+``DeterministicRouter.build_query_plan`` describes each deterministic
+intent as a list of steps (operation, endpoint or source, params,
+return_fields). This module compiles those steps into lookups against the
+indexed event data instead of handing them to an LLM:
+
+- the endpoint (or RRS source) selects the resource: the event, its
+  sessions, or its projects
+- filter params are pushed down to the ProjectCatalog posting sets and the
+  SearchIndex, so only matching rows are ever materialized; params the
+  indexes cannot answer are applied as residual predicates on those rows
+- ``return_fields`` is applied as a projection, resolving API and RRS
+  field names to the fields the event data actually stores
+
+Results are memoized per (plan step, bindings, data version), so repeated
+deterministic questions are answered from cache until event data reloads.
+
+Usage:
+    intent = DeterministicRouter().route("Show me projects about robotics")
+    results = get_query_executor().run(intent)
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from src.api.caching import SessionCache, default_cache_metrics
+from src.storage.catalog import ProjectCatalog, get_data_version, get_project_catalog
+
+logger = logging.getLogger(__name__)
+
+# Rows returned per step when the plan does not set a limit
+DEFAULT_LIMIT = 25
+RRS_SOURCE = "rrs_source_of_truth_table"
+
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+
+Getter = Callable[[Dict[str, Any]], Any]
+
+
+class UnsupportedPlanError(ValueError):
+    """Raised when a plan step targets a resource or operation with no local implementation."""
+
+
+def _path(*keys: str) -> Getter:
+    """Getter for a (possibly nested) dictionary path."""
+
+    def get(row: Dict[str, Any]) -> Any:
+        value: Any = row
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return get
+
+
+def _first(*getters: Getter) -> Getter:
+    """Getter returning the first non-empty value among several getters."""
+
+    def get(row: Dict[str, Any]) -> Any:
+        for getter in getters:
+            value = getter(row)
+            if value not in (None, "", []):
+                return value
+        return None
+
+    return get
+
+
+def _names(key: str) -> Getter:
+    """Getter for the display names of a list of people."""
+
+    def get(row: Dict[str, Any]) -> Optional[List[str]]:
+        people = row.get(key) or []
+        names = [p.get("displayName") or p.get("name") for p in people if isinstance(p, dict)]
+        return [name for name in names if name] or None
+
+    return get
+
+
+def _has_equipment(term: str) -> Getter:
+    """Getter for whether a project's equipment list mentions a term."""
+
+    def get(row: Dict[str, Any]) -> bool:
+        return any(term in str(item).lower() for item in row.get("equipment", []) or [])
+
+    return get
+
+
+# Return-field names that differ from the stored field, per resource. Any
+# field not listed here is read from the row under its own name.
+FIELD_ALIASES: Dict[str, Dict[str, Getter]] = {
+    "session": {
+        "startDateTime": _first(_path("startDateTime"), _path("schedule", "startDate")),
+        "endDateTime": _first(_path("endDateTime"), _path("schedule", "endDate")),
+        "location": _first(_path("location"), _path("schedule", "location")),
+        "speakers": _names("speakers"),
+    },
+    "project": {
+        "location": _first(_path("location"), _path("placement")),
+        "team": _names("team"),
+        "posterUrl": _first(_path("posterUrl"), _path("assets", "poster")),
+        "imageUrl": _first(_path("imageUrl"), _path("assets", "image")),
+        "repositories": _first(_path("repositories"), _path("repos")),
+    },
+    RRS_SOURCE: {
+        "ID": _path("id"),
+        "Project Title": _path("name"),
+        "Brief Project Description": _path("description"),
+        "Team Members": _names("team"),
+        "Revised Research Category": _path("researchArea"),
+        "Equipment Needs": _path("equipment"),
+        "Large Display": _first(_path("largeDisplay"), _has_equipment("large display")),
+        "27\" Monitors": _first(_path("monitors27"), _path("requiresMonitor")),
+        "Technician Notes": _path("technicianNotes"),
+        "Placement": _path("placement"),
+        "Location": _first(_path("location"), _path("placement")),
+        "Preferred Presentation Format": _path("preferredFormat"),
+        "Special Demo Requirements": _path("specialRequirements"),
+        "Requires non-floor dedicated space": _path("requiresDedicatedSpace"),
+        "Recording Submitted": _path("recordingSubmitted"),
+        "Recording Edited": _path("recordingEdited"),
+        "Recording Link": _first(_path("recordingLink"), _path("assets", "recording")),
+        "Recording Notes": _path("recordingNotes"),
+        "Inference2030 Flag": _path("inference2030"),
+    },
+}
+
+# RRS boolean/scalar filters evaluated on candidate rows: param -> getter
+_RESIDUAL_FILTERS: Dict[str, Getter] = {
+    "preferredFormat": _path("preferredFormat"),
+    "requiresDedicatedSpace": _path("requiresDedicatedSpace"),
+    "inference2030": _path("inference2030"),
+    "recordingSubmitted": _path("recordingSubmitted"),
+    "recordingEdited": _path("recordingEdited"),
+    "communicationSent": _first(_path("communicationSent"), lambda row: row.get("commsStatus") == "approved"),
+}
+
+
+def project_fields(row: Dict[str, Any], fields: List[str], resource: str) -> Dict[str, Any]:
+    """
+    Project a row onto the requested return fields.
+
+    Fields with no value in the row are omitted rather than returned as null.
+    """
+    aliases = FIELD_ALIASES.get(resource, {})
+    projected: Dict[str, Any] = {}
+    for name in fields:
+        getter = aliases.get(name)
+        value = getter(row) if getter is not None else row.get(name)
+        if value not in (None, "", []):
+            projected[name] = value
+    return projected
+
+
+@dataclass
+class PlanResult:
+    """Rows produced by one executed plan step."""
+
+    operation: str
+    resource: str
+    rows: List[Dict[str, Any]]
+    total: int
+    cached: bool = False
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "operation": self.operation,
+            "resource": self.resource,
+            "params": self.params,
+            "total": self.total,
+            "rows": self.rows,
+        }
+
+
+class QueryPlanExecutor:
+    """
+    Executes router query plans against the in-memory event data.
+
+    Usage:
+        executor = QueryPlanExecutor()
+        for result in executor.execute(intent.query_plan, intent.entities):
+            print(result.total, result.rows)
+    """
+
+    def __init__(
+        self,
+        catalog_provider: Callable[[], ProjectCatalog] = get_project_catalog,
+        version_provider: Callable[[], int] = get_data_version,
+        event_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+        cache: Optional[SessionCache] = None,
+        limit: int = DEFAULT_LIMIT,
+    ):
+        """
+        Args:
+            catalog_provider: Returns the current project catalog
+            version_provider: Returns the current event data version (cache key)
+            event_provider: Returns the event record; defaults to the loaded event data
+            cache: Result memo; a private cache is created if omitted
+            limit: Rows returned per step
+        """
+        self.catalog_provider = catalog_provider
+        self.version_provider = version_provider
+        self.event_provider = event_provider or _loaded_event
+        self.cache = cache or SessionCache(
+            ttl_seconds=3600,
+            max_entries=1024,
+            max_bytes=16 * 1024 * 1024,
+            name="query_plan",
+            metrics=default_cache_metrics(),
+            key_label=lambda key: key.split("|", 1)[0],
+        )
+        self.limit = limit
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def resource_of(step: Dict[str, Any]) -> str:
+        """Resource a plan step reads from: event, session, project or the RRS table."""
+        if step.get("source") == RRS_SOURCE:
+            return RRS_SOURCE
+        endpoint = step.get("endpoint") or ""
+        path = endpoint.split(" ", 1)[-1].rstrip("/")
+        if path.endswith("/sessions"):
+            return "session"
+        if "/projects" in path:
+            return "project"
+        if path.endswith("/events/{eventId}"):
+            return "event"
+        raise UnsupportedPlanError(f"No local executor for plan step: {endpoint or step.get('source')}")
+
+    def supports(self, plan: List[Dict[str, Any]]) -> bool:
+        """Whether every step of a plan can be executed locally."""
+        if not plan:
+            return False
+        try:
+            for step in plan:
+                self.resource_of(step)
+        except UnsupportedPlanError:
+            return False
+        return True
+
+    @staticmethod
+    def _bind(step: Dict[str, Any], bindings: Dict[str, Any]) -> Dict[str, Any]:
+        """Path parameters of a step, resolved from entities."""
+        names = _PATH_PARAM_RE.findall(step.get("endpoint") or "")
+        return {name: bindings.get(name) for name in names if bindings.get(name) is not None}
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def execute(
+        self, plan: List[Dict[str, Any]], bindings: Optional[Dict[str, Any]] = None
+    ) -> List[PlanResult]:
+        """
+        Execute every step of a plan.
+
+        Args:
+            plan: Steps from DeterministicRouter.build_query_plan
+            bindings: Values for endpoint path parameters (e.g. the routed entities)
+
+        Returns:
+            One PlanResult per step
+
+        Raises:
+            UnsupportedPlanError: If a step has no local implementation
+        """
+        return [self.execute_step(step, bindings or {}) for step in plan]
+
+    def run(self, intent: Any) -> List[PlanResult]:
+        """Execute the plan of a routed QueryIntent."""
+        return self.execute(intent.query_plan, intent.entities)
+
+    def execute_step(self, step: Dict[str, Any], bindings: Optional[Dict[str, Any]] = None) -> PlanResult:
+        """Execute one plan step, serving it from the memo when the data is unchanged."""
+        resource = self.resource_of(step)
+        operation = step.get("operation", "filter")
+        params = {k: v for k, v in (step.get("params") or {}).items() if v not in (None, "", [])}
+        path_params = self._bind(step, bindings or {})
+
+        key = "|".join((
+            resource,
+            str(self.version_provider()),
+            json.dumps([step, path_params], sort_keys=True, default=str, separators=(",", ":")),
+        ))
+        entry = self.cache.get(key)
+        if entry is not None:
+            return PlanResult(operation, resource, entry["rows"], entry["total"], cached=True, params=params)
+
+        catalog = self.catalog_provider()
+        if resource == "event":
+            event = self.event_provider()
+            rows = [event] if event else []
+        elif resource == "session":
+            rows = self._sessions(catalog, params)
+        else:
+            rows = self._projects(catalog, operation, params, path_params)
+
+        fields = step.get("return_fields") or []
+        projected = [project_fields(row, fields, resource) if fields else row for row in rows[: self.limit]]
+        self.cache.set(key, {"rows": projected, "total": len(rows)})
+        logger.debug(f"Executed {operation} on {resource}: {len(rows)} rows")
+        return PlanResult(operation, resource, projected, len(rows), params=params)
+
+    def _projects(
+        self,
+        catalog: ProjectCatalog,
+        operation: str,
+        params: Dict[str, Any],
+        path_params: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Projects matching a step: index lookups first, residual predicates last."""
+        if operation == "get" and "projectId" in path_params:
+            project = catalog.get(path_params["projectId"])
+            return [project] if project else []
+
+        postings: List[Set[int]] = []
+        if params.get("category"):
+            postings.append(catalog.match("researchArea", params["category"]))
+        if params.get("person"):
+            postings.append(catalog.match("team", params["person"]))
+        if params.get("largeDisplay"):
+            postings.append(catalog.match("equipment", "large display"))
+        if params.get("equipmentKeywords"):
+            rows: Set[int] = set()
+            for term in params["equipmentKeywords"]:
+                rows |= catalog.match("equipment", term)
+            postings.append(rows)
+        for term in params.get("placementKeywords", []):
+            postings.append(catalog.match("placement", term))
+
+        candidates = _intersect(postings)
+        if candidates is not None and not candidates:
+            return []
+
+        if params.get("keywords"):
+            # Ranked full-text hits, narrowed to the indexed candidates
+            hits = catalog.search_index.search(params["keywords"], kind="project")
+            projects = [hit.document for hit in hits]
+            if candidates is not None:
+                allowed = {id(project) for project in catalog.rows(candidates)}
+                projects = [project for project in projects if id(project) in allowed]
+        elif candidates is None:
+            projects = list(catalog.projects)
+        else:
+            projects = catalog.rows(candidates)
+
+        return [project for project in projects if _matches_residual(project, params)]
+
+    def _sessions(self, catalog: ProjectCatalog, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Sessions matching speaker and keyword params through the search index."""
+        sessions = list(catalog.sessions)
+        for name, fields in (("speaker", ("people",)), ("keywords", None)):
+            if params.get(name):
+                hits = catalog.search_index.search(params[name], kind="session", fields=fields)
+                matched = {id(hit.document) for hit in hits}
+                sessions = [session for session in sessions if id(session) in matched]
+        return sessions
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        self.cache.clear()
+
+
+def _intersect(postings: List[Set[int]]) -> Optional[Set[int]]:
+    """Intersect posting sets smallest first; None when nothing was filtered."""
+    result: Optional[Set[int]] = None
+    for rows in sorted(postings, key=len):
+        result = rows if result is None else result & rows
+        if not result:
+            return set()
+    return result
+
+
+def _matches_residual(project: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    """Apply the filters no index covers."""
+    for name, getter in _RESIDUAL_FILTERS.items():
+        expected = params.get(name)
+        if expected is None:
+            continue
+        value = getter(project)
+        if isinstance(expected, str):
+            if str(value or "").lower() != expected.lower():
+                return False
+        elif bool(value) != bool(expected):
+            return False
+
+    monitors = params.get("monitors27")
+    if monitors is not None:
+        value = FIELD_ALIASES[RRS_SOURCE]["27\" Monitors"](project)
+        count = int(value) if not isinstance(value, bool) and value is not None else int(bool(value))
+        if count < monitors:
+            return False
+    return True
+
+
+def _loaded_event() -> Dict[str, Any]:
+    """Event record from the loaded event data."""
+    from src.storage.event_data import get_event_data
+
+    return get_event_data().get("event", {})
+
+
+def format_results(results: List[PlanResult]) -> str:
+    """Render executed plan results as a short plain-text answer."""
+    lines: List[str] = []
+    for result in results:
+        if result.resource == "event":
+            for event in result.rows:
+                location = event.get("location")
+                if isinstance(location, dict):
+                    location = location.get("displayName")
+                lines.append(f"**{event.get('displayName', 'Event')}**")
+                if event.get("startDate"):
+                    lines.append(f"{event['startDate']} – {event.get('endDate', '')}".rstrip(" –"))
+                if location:
+                    lines.append(str(location))
+                if event.get("description"):
+                    lines.append(event["description"])
+            continue
+
+        noun = "session" if result.resource == "session" else "project"
+        if not result.total:
+            lines.append(f"No matching {noun}s found.")
+            continue
+        lines.append(f"Found {result.total} {noun}{'s' if result.total != 1 else ''}:")
+        for row in result.rows:
+            title = row.get("name") or row.get("title") or row.get("Project Title") or row.get("id") or row.get("ID")
+            details = row.get("researchArea") or row.get("sessionType") or row.get("location")
+            lines.append(f"• {title}" + (f" ({details})" if details else ""))
+        if result.total > len(result.rows):
+            lines.append(f"…and {result.total - len(result.rows)} more.")
+    return "\n".join(lines)
+
+
+# Global executor instance
+_executor: Optional[QueryPlanExecutor] = None
+
+
+def get_query_executor() -> QueryPlanExecutor:
+    """Get the query plan executor singleton."""
+    global _executor
+    if _executor is None:
+        _executor = QueryPlanExecutor()
+    return _executor
@@ -9,11 +9,16 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.api.intent_classifier import ClassificationResult, get_intent_classifier
 from src.api.router_config import router_config
 from src.api.router_prompt import INTENT_PATTERNS, CONFIDENCE_THRESHOLD_DETERMINISTIC
+from src.api.routing_cache import clean_query, get_routing_cache
 
 logger = logging.getLogger(__name__)
 
+# Intents that take a quoted project title from the query verbatim
+QUOTED_TITLE_INTENTS = ("project_detail", "recording_status")
+
 
 class QueryIntent:
     """Represents a classified query intent."""
@@ -25,12 +30,14 @@ class QueryIntent:
         entities: Dict[str, Any],
         filters: Dict[str, Any],
         query_plan: List[Dict[str, Any]],
+        patterns_matched: Optional[List[str]] = None,
     ):
         self.intent = intent
         self.confidence = confidence
         self.entities = entities
         self.filters = filters
         self.query_plan = query_plan
+        self.patterns_matched = patterns_matched or []
 
     def is_deterministic(self) -> bool:
         """Check if this intent can be handled deterministically."""
@@ -51,11 +58,9 @@ class DeterministicRouter:
     """Deterministic query router using regex patterns."""
 
     def __init__(self):
-        """Initialize router with compiled patterns."""
-        self.patterns = {
-            intent: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for intent, patterns in INTENT_PATTERNS.items()
-        }
+        """Initialize router with the shared compiled classifier."""
+        self.classifier = get_intent_classifier(INTENT_PATTERNS)
+        self.patterns = self.classifier.patterns
 
     def classify(self, query: str) -> Tuple[str, float]:
         """Classify query into primary intent with confidence.
@@ -65,23 +70,11 @@ class DeterministicRouter:
             - ("unmatched", 0.0) if query matches no deterministic patterns
             - (intent_name, confidence) for matched intents
         """
-        query_lower = query.lower()
-        intent_scores = {}
+        return self.classifier.classify(query).as_tuple()
 
-        # Score each intent based on pattern matches
-        for intent, patterns in self.patterns.items():
-            matches = sum(1 for p in patterns if p.search(query_lower))
-            if matches > 0:
-                # Confidence = matches / total_patterns for this intent
-                confidence = min(0.9, 0.5 + (matches / len(patterns)) * 0.4)
-                intent_scores[intent] = confidence
-
-        if not intent_scores:
-            return ("unmatched", 0.0)  # Explicit unmatched intent, zero confidence
-
-        # Return highest scoring intent
-        best_intent = max(intent_scores.items(), key=lambda x: x[1])
-        return best_intent
+    def classify_detailed(self, query: str) -> ClassificationResult:
+        """Classify query and return per-intent scores and matched patterns."""
+        return self.classifier.classify(query)
 
     def extract_entities(self, query: str, intent: str) -> Dict[str, Any]:
         """Extract entities from query based on intent."""
@@ -98,7 +91,7 @@ class DeterministicRouter:
 
         # Extract quoted strings as exact matches
         quoted = re.findall(r'["\']([^"\']+)["\']', query)
-        if quoted and intent in ["project_detail", "recording_status"]:
+        if quoted and intent in QUOTED_TITLE_INTENTS:
             entities["projectTitleQuery"] = quoted[0]
 
         # Extract category for category_browse
@@ -133,6 +126,17 @@ class DeterministicRouter:
 
         return entities
 
+    def is_case_sensitive(self, intent: str, entities: Dict[str, Any]) -> bool:
+        """Whether extract_entities depended on the casing of the query.
+
+        Person names are recognized by capitalization, and quoted titles
+        are kept as written; every other extraction works on the
+        lowercased query.
+        """
+        if intent == "people_lookup":
+            return True
+        return intent in QUOTED_TITLE_INTENTS and bool(entities.get("projectTitleQuery"))
+
     def extract_filters(self, query: str, intent: str) -> Dict[str, Any]:
         """Extract filters from query."""
         filters = {
@@ -343,6 +347,11 @@ class DeterministicRouter:
     def route(self, query: str) -> QueryIntent:
         """Route a query to structured plan or LLM fallback.
 
+        Decisions are memoized in the shared routing cache, so repeated and
+        near-duplicate queries skip classification and extraction. The
+        returned QueryIntent may be shared between callers and must be
+        treated as read-only.
+
         Returns:
             QueryIntent with classification and execution plan
         """
@@ -357,8 +366,44 @@ class DeterministicRouter:
                 query_plan=[],
             )
 
-        # Classify intent
-        intent, confidence = self.classify(query)
+        # Trailing punctuation and stray whitespace never change the decision
+        query = clean_query(query)
+        if router_config.routing_cache_size > 0:
+            result = self._route_cached(query)
+        else:
+            result = self._route(query)
+
+        # Log routing decision
+        if router_config.log_routing_decisions:
+            is_deterministic = router_config.should_use_deterministic(result.confidence)
+            logger.info(
+                f"Routed query: intent={result.intent}, confidence={result.confidence:.2f}, "
+                f"strategy={router_config.routing_strategy.value}, "
+                f"deterministic={is_deterministic}, entities={result.entities}"
+            )
+
+        return result
+
+    def _route_cached(self, query: str) -> QueryIntent:
+        """Route a cleaned query through the routing cache."""
+        cache = get_routing_cache()
+        # Compiled patterns and a config snapshot: a change to either invalidates the cache
+        generation = (self.classifier, tuple(vars(router_config).items()))
+        # Classification ignores case, so a lowercase key is safe unless extraction read the casing
+        canonical = query.lower()
+        exact = "=" + query
+
+        result = cache.get((canonical, exact), generation)
+        if result is None:
+            result = self._route(query)
+            key = exact if self.is_case_sensitive(result.intent, result.entities) else canonical
+            cache.set(key, generation, result)
+        return result
+
+    def _route(self, query: str) -> QueryIntent:
+        """Classify a query and build its plan (uncached)."""
+        classification = self.classify_detailed(query)
+        intent, confidence = classification.as_tuple()
 
         # Extract entities and filters
         entities = self.extract_entities(query, intent)
@@ -367,19 +412,11 @@ class DeterministicRouter:
         # Build query plan
         query_plan = self.build_query_plan(intent, entities, filters)
 
-        # Log routing decision
-        is_deterministic = router_config.should_use_deterministic(confidence)
-        if router_config.log_routing_decisions:
-            logger.info(
-                f"Routed query: intent={intent}, confidence={confidence:.2f}, "
-                f"strategy={router_config.routing_strategy.value}, "
-                f"deterministic={is_deterministic}, entities={entities}"
-            )
-
         return QueryIntent(
             intent=intent,
             confidence=confidence,
             entities=entities,
             filters=filters,
             query_plan=query_plan,
+            patterns_matched=classification.patterns_matched,
         )
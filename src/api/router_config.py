@@ -38,6 +38,9 @@ class RouterConfig:
             os.getenv("LLM_ASSIST_CONFIDENCE_THRESHOLD", "0.6")
         )
         
+        # Routing decision cache (0 disables it)
+        self.routing_cache_size = int(os.getenv("ROUTING_CACHE_SIZE", "1024"))
+
         # A/B testing
         self.ab_test_enabled = self._get_bool_env("ROUTING_AB_TEST_ENABLED", default=False)
         self.ab_test_deterministic_ratio = float(
@@ -149,6 +152,7 @@ class RouterConfig:
             "routing_strategy": self.routing_strategy.value,
             "deterministic_threshold": self.deterministic_threshold,
             "llm_assist_threshold": self.llm_assist_threshold,
+            "routing_cache_size": self.routing_cache_size,
             "ab_test_enabled": self.ab_test_enabled,
             "ab_test_deterministic_ratio": self.ab_test_deterministic_ratio,
             "log_routing_decisions": self.log_routing_decisions,
@@ -0,0 +1,137 @@
+"""
+Memoized routing decisions for the deterministic router.
+
+Chat traffic is dominated by a small set of repeated questions, so the
+full QueryIntent produced by DeterministicRouter.route is cached under a
+canonical form of the query (whitespace collapsed, curly quotes and
+trailing punctuation normalized, lowercased). Near-duplicates such as
+"Show me AI projects?" and "show me  ai projects" then share one entry.
+
+Intent classification ignores case, but some entity extraction does not
+(person names, quoted titles). Decisions for those are stored under the
+case-preserving cleaned query instead. The cache is bounded LRU and is
+cleared whenever the router's compiled patterns or the router
+configuration change.
+"""
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s?!.,;:]+$")
+_QUOTE_TABLE = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+
+
+def clean_query(query: str) -> str:
+    """Fold whitespace, curly quotes and trailing punctuation, preserving case."""
+    text = _WHITESPACE_RE.sub(" ", query.translate(_QUOTE_TABLE)).strip()
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query: clean_query, lowercased."""
+    return clean_query(query).lower()
+
+
+class RoutingCache:
+    """
+    Bounded LRU cache of routing decisions.
+
+    Entries are tagged with a generation (the router's compiled classifier
+    and a snapshot of the router configuration); a lookup under a different
+    generation clears the cache first.
+
+    Usage:
+        cache = get_routing_cache()
+        intent = cache.get((normalize_query(query),), generation)
+        if intent is None:
+            cache.set(normalize_query(query), generation, router.route(query))
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: Maximum cached decisions before LRU eviction
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._generation: Optional[Hashable] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_generation(self, generation: Hashable) -> None:
+        if generation != self._generation:
+            if self._entries:
+                self.invalidations += 1
+                logger.debug(f"Routing cache invalidated ({len(self._entries)} entries)")
+            self._entries.clear()
+            self._generation = generation
+
+    def get(self, keys: Tuple[str, ...], generation: Hashable) -> Optional[Any]:
+        """First cached decision among candidate keys; one hit or miss is recorded."""
+        with self._lock:
+            self._check_generation(generation)
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def set(self, key: str, generation: Hashable, value: Any) -> None:
+        """Store a decision, evicting least-recently-used entries beyond max_entries."""
+        with self._lock:
+            self._check_generation(generation)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached decisions."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Global routing cache shared by all router instances
+_routing_cache: Optional[RoutingCache] = None
+
+
+def get_routing_cache() -> RoutingCache:
+    """Get the routing cache singleton, sized by router_config.routing_cache_size."""
+    global _routing_cache
+    if _routing_cache is None:
+        from src.api.router_config import router_config
+
+        _routing_cache = RoutingCache(max_entries=router_config.routing_cache_size)
+    return _routing_cache
@@ -0,0 +1,138 @@
+"""
+Pre-serialized SSE frames for card action responses.
+
+Card actions stream a single ``data: {...}`` frame holding the response
+text, the adaptive card and the conversation context. The text and card of
+cacheable actions depend only on the action, its payload and the event
+data, so their JSON encoding is kept in a SessionCache keyed by
+(action, normalized payload, data version). Only the small per-turn
+context is encoded on each request and spliced onto the cached bytes.
+
+JSON encoding uses orjson when installed and falls back to the stdlib.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.api.caching import SessionCache, default_cache_metrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DONE_FRAME = b"data: [DONE]\n\n"
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str)
+        except TypeError:
+            # e.g. non-string dict keys; the stdlib encoder handles these
+            pass
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@dataclass
+class EncodedResponse:
+    """
+    A card action response with its text and card already JSON-encoded.
+
+    ``body`` is the encoded ``{"delta": ..., "adaptive_card": ...`` object
+    without its closing brace, ready to have the context appended.
+    """
+
+    text: str
+    body: bytes
+    has_card: bool = False
+
+    @classmethod
+    def encode(cls, text: str, card: Optional[Dict[str, Any]]) -> "EncodedResponse":
+        """Encode a handler result."""
+        payload: Dict[str, Any] = {"delta": text}
+        if card:
+            payload["adaptive_card"] = card
+        return cls(text=text, body=dumps(payload)[:-1], has_card=bool(card))
+
+    def frame(self, context: Dict[str, Any]) -> bytes:
+        """Build the full SSE frame for this response and a context snapshot."""
+        return b"".join((b"data: ", self.body, b',"context":', dumps(context), b"}\n\n"))
+
+
+def action_of(key: str) -> str:
+    """Action name a cache key belongs to (used as the metrics label)."""
+    return key.split("|", 1)[0]
+
+
+def normalize_payload(action: str, payload: Dict[str, Any], data_version: int) -> str:
+    """Build a stable cache key from an action, its payload and the data version."""
+    normalized = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return f"{action}|{data_version}|{normalized}"
+
+
+class SSEResponseCache:
+    """
+    Cache of encoded card action responses.
+
+    Usage:
+        cache = get_sse_cache()
+        key = cache.key(action, payload, data_version)
+        response = cache.get(key)
+        if response is None:
+            response = cache.put(key, text, card)
+        yield response.frame(context.to_dict())
+    """
+
+    def __init__(self, store: SessionCache):
+        """
+        Args:
+            store: Backing cache providing TTL, LRU eviction and metrics
+        """
+        self.store = store
+
+    @staticmethod
+    def key(action: str, payload: Dict[str, Any], data_version: int) -> str:
+        """Cache key for an action invocation."""
+        return normalize_payload(action, payload, data_version)
+
+    def get(self, key: str) -> Optional[EncodedResponse]:
+        """Get a cached encoded response."""
+        entry = self.store.get(key)
+        return entry["response"] if entry is not None else None
+
+    def put(self, key: str, text: str, card: Optional[Dict[str, Any]]) -> EncodedResponse:
+        """Encode a handler result and cache it."""
+        response = EncodedResponse.encode(text, card)
+        self.store.set(key, {"response": response}, size_bytes=len(response.body))
+        return response
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self.store.clear()
+
+
+# Global SSE response cache
+_sse_cache: Optional[SSEResponseCache] = None
+
+
+def get_sse_cache() -> SSEResponseCache:
+    """Get the SSE response cache singleton."""
+    global _sse_cache
+    if _sse_cache is None:
+        _sse_cache = SSEResponseCache(
+            SessionCache(
+                ttl_seconds=3600,
+                max_entries=512,
+                max_bytes=32 * 1024 * 1024,
+                name="sse",
+                metrics=default_cache_metrics(),
+                key_label=action_of,
+            )
+        )
+    return _sse_cache
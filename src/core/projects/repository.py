@@ -2,6 +2,7 @@
 
 Provides CRUD operations for ProjectDefinition objects with JSON serialization,
 enabling file-based persistence as an MVP. Future versions will migrate to SQLite.
+Reads are served from the indexed cache in JsonFileRepository.
 """
 
 import json
@@ -11,23 +12,28 @@ from typing import List, Optional
 
 from src.core.projects.exceptions import (
     ProjectAlreadyExistsError,
-    ProjectNotFoundError,
     RepositoryError,
     StorageError,
 )
 from src.core.projects.models import ProjectDefinition
-from src.storage.base_repository import BaseRepository
+from src.storage.json_repository import JsonFileRepository
 from src.storage.storage_manager import StorageManager
 from src.observability.telemetry import telemetry_decorator
 
 
-class ProjectRepository(BaseRepository[ProjectDefinition]):
+class ProjectRepository(JsonFileRepository[ProjectDefinition]):
     """JSON repository for managing projects.
 
     Uses a StorageManager to resolve the projects directory, enabling easy
     migration to future backends (e.g., SQLite) without changing callers.
+    Indexed on event_id.
     """
 
+    model = ProjectDefinition
+    noun = "project"
+    plural_noun = "projects"
+    index_fields = ("event_id",)
+
     def __init__(
         self,
         storage_dir: str = "data/projects",
@@ -42,21 +48,15 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
         Raises:
             StorageError: If the storage directory cannot be created.
         """
-        self.storage_dir = (
+        self._init_storage(
             storage_manager.get_projects_dir()
             if storage_manager is not None
             else Path(storage_dir)
         )
-        try:
-            self.storage_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            raise StorageError(
-                "initialization", f"Cannot create storage directory: {str(e)}"
-            )
     
     def _get_project_path(self, project_id: str) -> Path:
         """Get the file path for a project."""
-        return self.storage_dir / f"{project_id}.json"
+        return self._path(project_id)
     
     @telemetry_decorator("create", "project")
     def create(self, project: ProjectDefinition) -> ProjectDefinition:
@@ -72,21 +72,7 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
             ProjectAlreadyExistsError: If a project with this ID already exists.
             StorageError: If the file cannot be written.
         """
-        project_path = self._get_project_path(project.id)
-        
-        if project_path.exists():
-            raise ProjectAlreadyExistsError(project.id)
-        
-        try:
-            project.updated_at = datetime.now()
-            data = project.to_dict()
-            with open(project_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            return project
-        except ProjectAlreadyExistsError:
-            raise
-        except Exception as e:
-            raise StorageError("create", f"Cannot save project: {str(e)}")
+        return self._create(project, ProjectAlreadyExistsError(project.id), touch=True)
     
     @telemetry_decorator("read", "project")
     def get(self, project_id: str) -> ProjectDefinition:
@@ -102,19 +88,7 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
             ProjectNotFoundError: If the project doesn't exist.
             StorageError: If the file cannot be read.
         """
-        project_path = self._get_project_path(project_id)
-        
-        if not project_path.exists():
-            raise ProjectNotFoundError(project_id)
-        
-        try:
-            with open(project_path, 'r') as f:
-                data = json.load(f)
-            return ProjectDefinition.from_dict(data)
-        except ProjectNotFoundError:
-            raise
-        except Exception as e:
-            raise StorageError("get", f"Cannot load project: {str(e)}")
+        return self._get(project_id)
     
     @telemetry_decorator("update", "project")
     def update(self, project: ProjectDefinition) -> ProjectDefinition:
@@ -130,21 +104,7 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
             ProjectNotFoundError: If the project doesn't exist.
             StorageError: If the file cannot be written.
         """
-        project_path = self._get_project_path(project.id)
-        
-        if not project_path.exists():
-            raise ProjectNotFoundError(project.id)
-        
-        try:
-            project.updated_at = datetime.now()
-            data = project.to_dict()
-            with open(project_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            return project
-        except ProjectNotFoundError:
-            raise
-        except Exception as e:
-            raise StorageError("update", f"Cannot update project: {str(e)}")
+        return self._update(project)
     
     @telemetry_decorator("delete", "project")
     def delete(self, project_id: str) -> None:
@@ -157,17 +117,7 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
             ProjectNotFoundError: If the project doesn't exist.
             StorageError: If the file cannot be deleted.
         """
-        project_path = self._get_project_path(project_id)
-        
-        if not project_path.exists():
-            raise ProjectNotFoundError(project_id)
-        
-        try:
-            project_path.unlink()
-        except ProjectNotFoundError:
-            raise
-        except Exception as e:
-            raise StorageError("delete", f"Cannot delete project: {str(e)}")
+        self._delete(project_id)
     
     @telemetry_decorator("list", "project")
     def list_all(self) -> List[ProjectDefinition]:
@@ -179,19 +129,7 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
         Raises:
             StorageError: If projects cannot be read.
         """
-        try:
-            projects = []
-            for project_file in self.storage_dir.glob("*.json"):
-                try:
-                    with open(project_file, 'r') as f:
-                        data = json.load(f)
-                    projects.append(ProjectDefinition.from_dict(data))
-                except Exception as e:
-                    # Log but continue on individual file errors
-                    print(f"Warning: Could not load project from {project_file}: {str(e)}")
-            return projects
-        except Exception as e:
-            raise StorageError("list_all", f"Cannot list projects: {str(e)}")
+        return self._list_all()
     
     @telemetry_decorator("list", "project")
     def list_by_event(self, event_id: str) -> List[ProjectDefinition]:
@@ -203,39 +141,7 @@ class ProjectRepository(BaseRepository[ProjectDefinition]):
         Returns:
             List of ProjectDefinition objects for the event.
         """
-        return [p for p in self.list_all() if p.event_id == event_id]
-    
-    def exists(self, project_id: str) -> bool:
-        """Check if a project exists.
-        
-        Args:
-            project_id: The ID to check.
-        
-        Returns:
-            True if the project exists, False otherwise.
-        """
-        project_path = self._get_project_path(project_id)
-        return project_path.exists()
-    
-    def count(self) -> int:
-        """Count the number of projects in the repository.
-        
-        Returns:
-            The number of project files.
-        """
-        return len(list(self.storage_dir.glob("*.json")))
-    
-    def clear(self) -> None:
-        """Delete all projects in the repository.
-        
-        Raises:
-            StorageError: If projects cannot be deleted.
-        """
-        try:
-            for project_file in self.storage_dir.glob("*.json"):
-                project_file.unlink()
-        except Exception as e:
-            raise StorageError("clear", f"Cannot clear repository: {str(e)}")
+        return self.find("event_id", event_id)
     
     def export_to_dict(self, project_id: str) -> dict:
         """Export a project as a dictionary.
@@ -0,0 +1,217 @@
+"""
+Streaming, resumable collection of agent responses for evaluation runs.
+
+Test cases are read lazily from the dataset and run through the agent with
+a bounded window of in-flight cases. Each response is appended to the
+responses JSONL as soon as it completes, followed by a checkpoint line
+recording the case index and the responses file size at that point. A
+crashed run restarts by truncating the responses file to the last
+checkpointed size (dropping any partially written or unrecorded line) and
+skipping every checkpointed case.
+
+The checkpoint starts with a fingerprint of the run's inputs (dataset
+contents and agent configuration). Resuming a checkpoint written for a
+different fingerprint is refused rather than mixing responses from two
+configurations in one file.
+
+Responses are written in completion order, not dataset order.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+CHECKPOINT_SUFFIX = ".checkpoint"
+FINGERPRINT_PREFIX = "fingerprint "
+
+Respond = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def dataset_fingerprint(path: str) -> str:
+    """SHA-256 of a dataset file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_test_cases(path: str, skip: Optional[Set[int]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lazily yield (index, test case) pairs from a JSONL dataset.
+
+    Args:
+        path: JSONL dataset path
+        skip: Case indices to skip (already completed)
+    """
+    skip = skip or set()
+    index = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if index not in skip:
+                yield index, json.loads(line)
+            index += 1
+
+
+class ResponseWriter:
+    """
+    Append-only responses file with a crash-safe checkpoint.
+
+    Usage:
+        writer = ResponseWriter(output_dir / "agent_responses.jsonl", resume=True, fingerprint=digest)
+        for index, case in iter_test_cases(dataset, skip=writer.completed):
+            ...
+            writer.write(index, record)
+        writer.close()
+    """
+
+    def __init__(self, responses_file: Path, resume: bool = False, fingerprint: Optional[str] = None):
+        """
+        Args:
+            responses_file: JSONL file receiving one response per line
+            resume: Continue from an existing checkpoint instead of starting over
+            fingerprint: Identifies the run's inputs; a checkpoint recorded
+                with a different fingerprint is not resumed
+
+        Raises:
+            ValueError: If resuming a checkpoint written for another fingerprint
+        """
+        self.responses_file = Path(responses_file)
+        self.checkpoint_file = self.responses_file.with_name(self.responses_file.name + CHECKPOINT_SUFFIX)
+        self.fingerprint = fingerprint
+        self.completed: Set[int] = set()
+
+        offset = self._load_checkpoint() if resume else 0
+
+        self._responses = open(self.responses_file, "a+b")
+        # Drop anything written after the last checkpointed response
+        self._responses.truncate(offset)
+        self._responses.seek(offset)
+        if self.completed:
+            self._checkpoint = open(self.checkpoint_file, "a", encoding="utf-8")
+        else:
+            self._checkpoint = open(self.checkpoint_file, "w", encoding="utf-8")
+            if fingerprint is not None:
+                self._checkpoint.write(f"{FINGERPRINT_PREFIX}{fingerprint}\n")
+                self._checkpoint.flush()
+
+        if self.completed:
+            logger.info(f"Resuming from checkpoint: {len(self.completed)} test cases already completed")
+
+    def _load_checkpoint(self) -> int:
+        if not self.checkpoint_file.exists():
+            return 0
+
+        offset = 0
+        recorded: Optional[str] = None
+        with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(FINGERPRINT_PREFIX):
+                    recorded = line[len(FINGERPRINT_PREFIX):].strip()
+                    continue
+                try:
+                    index, end = (int(part) for part in line.split())
+                except ValueError:
+                    break  # torn final line
+                self.completed.add(index)
+                offset = end
+
+        if self.completed and self.fingerprint is not None and recorded != self.fingerprint:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_file} was written for a different dataset or agent "
+                f"configuration; start over with resume=False"
+            )
+
+        size = self.responses_file.stat().st_size if self.responses_file.exists() else 0
+        if size < offset:
+            logger.warning(f"Responses file shorter than checkpoint; restarting {self.responses_file}")
+            self.completed.clear()
+            return 0
+        return offset
+
+    def write(self, index: int, record: Dict[str, Any]) -> None:
+        """Append a response and checkpoint it."""
+        self._responses.write((json.dumps(record) + "\n").encode("utf-8"))
+        self._responses.flush()
+        os.fsync(self._responses.fileno())
+
+        self._checkpoint.write(f"{index} {self._responses.tell()}\n")
+        self._checkpoint.flush()
+        self.completed.add(index)
+
+    def close(self) -> None:
+        self._responses.close()
+        self._checkpoint.close()
+
+    def __enter__(self) -> "ResponseWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+@dataclass
+class CollectionStats:
+    """Counters for one collection pass."""
+
+    processed: int = 0
+    errors: int = 0
+    skipped: int = 0
+
+
+async def collect_responses(
+    test_dataset: str,
+    respond: Respond,
+    writer: ResponseWriter,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> CollectionStats:
+    """
+    Run respond() over every not-yet-completed test case with at most
+    `concurrency` cases in flight, streaming each result to writer.
+
+    respond() should return the record to write; records carrying an
+    ``{"agent_response": {"error": ...}}`` marker are counted as errors.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    stats = CollectionStats(skipped=len(writer.completed))
+    pending: Dict["asyncio.Task[Dict[str, Any]]", int] = {}
+
+    def drain(done: Set["asyncio.Task[Dict[str, Any]]"]) -> None:
+        for task in done:
+            index = pending.pop(task)
+            record = task.result()
+            writer.write(index, record)
+            stats.processed += 1
+            response = record.get("agent_response")
+            if isinstance(response, dict) and "error" in response:
+                stats.errors += 1
+            if stats.processed % 10 == 0:
+                logger.info(f"Processed {stats.processed} test cases ({stats.errors} errors)")
+
+    try:
+        for index, test_case in iter_test_cases(test_dataset, skip=writer.completed):
+            if len(pending) >= concurrency:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                drain(done)
+            pending[asyncio.create_task(respond(test_case))] = index
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            drain(done)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return stats
@@ -9,6 +9,7 @@ Orchestrates:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 from datetime import datetime
@@ -23,6 +24,7 @@ from .evaluators import (
     StructureCompletenessEvaluator,
     SourceFidelityEvaluator,
 )
+from .response_stream import DEFAULT_CONCURRENCY, ResponseWriter, collect_responses, dataset_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,7 @@ class EvaluationRunner:
         self,
         agent: Any,  # ModernKnowledgeAgent instance
         model_config: Optional[AzureOpenAIModelConfiguration] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ):
         """
         Initialize evaluation runner.
@@ -50,8 +53,10 @@ class EvaluationRunner:
         Args:
             agent: The knowledge extraction agent to evaluate
             model_config: Azure OpenAI config for prompt-based evaluators
+            concurrency: Maximum test cases run through the agent at once
         """
         self.agent = agent
+        self.concurrency = concurrency
         self.settings = get_settings()
         self.model_config = model_config or self._default_model_config()
         
@@ -83,6 +88,7 @@ class EvaluationRunner:
         test_dataset: str,
         run_name: Optional[str] = None,
         save_results: bool = True,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         """
         Run full evaluation pipeline.
@@ -97,6 +103,8 @@ class EvaluationRunner:
             test_dataset: Path to JSONL test dataset
             run_name: Optional name for this evaluation run
             save_results: Whether to save results to disk
+            resume: Continue a previous run with the same run_name from its
+                checkpoint (refused if the dataset or agent configuration changed)
             
         Returns:
             Dict with evaluation results and metrics
@@ -107,7 +115,7 @@ class EvaluationRunner:
         # Step 1: Collect agent responses
         logger.info("Step 1: Running agent on test dataset...")
         agent_responses_file = await self._collect_agent_responses(
-            test_dataset, run_name
+            test_dataset, run_name, resume=resume
         )
         
         # Step 2: Run evaluation using Azure AI evaluate() API
@@ -127,66 +135,72 @@ class EvaluationRunner:
     async def _collect_agent_responses(
         self,
         test_dataset: str,
-        run_name: str
+        run_name: str,
+        resume: bool = False
     ) -> str:
         """
         Run agent on test dataset and collect responses.
         
-        Creates a new JSONL file with original test data plus agent responses.
+        Test cases are streamed from the dataset and run with up to
+        `self.concurrency` in flight. Each response (original test data plus
+        agent response) is appended to the responses JSONL as it completes and
+        checkpointed, so an interrupted run resumes where it stopped.
         
         Args:
             test_dataset: Path to test dataset
             run_name: Name for this run
+            resume: Skip test cases completed by a previous attempt of this run
+                with the same dataset and agent configuration
             
         Returns:
             Path to responses file
         """
-        # Load test cases
-        test_cases = []
-        with open(test_dataset, 'r', encoding='utf-8') as f:
-            for line in f:
-                test_cases.append(json.loads(line))
-        
-        logger.info(f"Loaded {len(test_cases)} test cases")
+        output_dir = self.settings.get_evaluation_dir(run_name)
+        responses_file = output_dir / "agent_responses.jsonl"
         
-        # Run agent on each case
-        responses = []
-        for i, test_case in enumerate(test_cases, 1):
-            logger.info(f"Processing test case {i}/{len(test_cases)}...")
-            
+        async def respond(test_case: Dict[str, Any]) -> Dict[str, Any]:
             try:
-                # Extract input text
+                # Extract input text and run agent
                 source_text = test_case.get("source_text", "")
-                
-                # Run agent
                 artifact = await self.agent.extract_async(source_text)
-                
-                # Combine test case with agent response
-                response_record = {
+                return {
                     **test_case,
                     "agent_response": artifact.model_dump(),
                 }
-                responses.append(response_record)
-                
             except Exception as e:
-                logger.error(f"Error processing test case {i}: {e}")
+                logger.error(f"Error processing test case: {e}")
                 # Still include the test case but mark as error
-                responses.append({
+                return {
                     **test_case,
                     "agent_response": {"error": str(e)},
-                })
-        
-        # Save responses to JSONL
-        output_dir = self.settings.get_evaluation_dir(run_name)
-        responses_file = output_dir / "agent_responses.jsonl"
+                }
         
-        with open(responses_file, 'w', encoding='utf-8') as f:
-            for response in responses:
-                f.write(json.dumps(response) + '\n')
+        fingerprint = self._run_fingerprint(test_dataset)
+        with ResponseWriter(responses_file, resume=resume, fingerprint=fingerprint) as writer:
+            stats = await collect_responses(
+                test_dataset, respond, writer, concurrency=self.concurrency
+            )
         
+        logger.info(
+            f"Processed {stats.processed} test cases ({stats.errors} errors, "
+            f"{stats.skipped} resumed from checkpoint)"
+        )
         logger.info(f"Agent responses saved to: {responses_file}")
         return str(responses_file)
     
+    def _run_fingerprint(self, test_dataset: str) -> str:
+        """Digest of the dataset contents and the agent configuration that produce responses."""
+        agent = {
+            "class": type(self.agent).__name__,
+            "agent_name": getattr(self.agent, "agent_name", None),
+            "source_type": str(getattr(self.agent, "source_type", None)),
+            "instructions": getattr(self.agent, "instructions", None),
+            "model": self.settings.foundry_model_deployment,
+        }
+        digest = hashlib.sha256(dataset_fingerprint(test_dataset).encode("utf-8"))
+        digest.update(json.dumps(agent, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+    
     def _run_evaluators(
         self,
         agent_responses_file: str,
@@ -0,0 +1,468 @@
+"""
+Pooled async Microsoft Graph client.
+
+One long-lived httpx.AsyncClient keeps TCP/TLS connections to Graph alive
+across calls instead of reconnecting per request. Throttled (429) and
+transiently unavailable (502/503/504) responses are retried, waiting for
+the server's Retry-After when it sends one and exponential backoff
+otherwise. Site and drive IDs are memoized, downloads stream to disk,
+large uploads go through chunked upload sessions, and ``batch()`` combines
+many small calls into Graph ``$batch`` requests.
+
+Usage:
+    async with AsyncGraphClient(token_provider=auth.get_access_token) as graph:
+        drive_id = await graph.resolve_drive_id(site_id)
+        await graph.download_to(f"drives/{drive_id}/root:/paper.pdf:/content", Path("paper.pdf"))
+
+BackgroundLoop runs a client on a dedicated event loop thread so
+synchronous callers (M365KnowledgeConnector) share one connection pool.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+BATCH_LIMIT = 20  # Graph $batch accepts at most 20 requests
+SIMPLE_UPLOAD_LIMIT = 4 * 1024 * 1024  # Larger uploads need an upload session
+UPLOAD_CHUNK_SIZE = 10 * 320 * 1024  # Must be a multiple of 320 KiB
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+TokenProvider = Callable[[], Union[str, Awaitable[str]]]
+
+
+class GraphRequestError(Exception):
+    """Raised when a Graph call fails after retries."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def retry_after_seconds(headers: Mapping[str, str], attempt: int, base: float, cap: float) -> float:
+    """
+    Delay before retrying a throttled request.
+
+    Honors Retry-After (seconds or HTTP date); otherwise exponential
+    backoff with jitter.
+    """
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value:
+        try:
+            return min(cap, max(0.0, float(value)))
+        except ValueError:
+            try:
+                return min(cap, max(0.0, parsedate_to_datetime(value).timestamp() - time.time()))
+            except (TypeError, ValueError):
+                pass
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+
+def _error_for(status_code: int, endpoint: str, text: str) -> GraphRequestError:
+    if status_code == 401:
+        return GraphRequestError(401, "Authentication failed: Invalid token")
+    if status_code == 403:
+        return GraphRequestError(403, "Access denied: Insufficient permissions")
+    if status_code == 404:
+        return GraphRequestError(404, f"Resource not found: {endpoint}")
+    return GraphRequestError(status_code, f"API error {status_code}: {text[:200] if text else 'Unknown error'}")
+
+
+def encode_path(path: str) -> str:
+    """URL-encode a drive path for root:/{path} addressing."""
+    return quote(path.strip("/"))
+
+
+class AsyncGraphClient:
+    """Long-lived, retrying Microsoft Graph client."""
+
+    def __init__(
+        self,
+        token_provider: TokenProvider,
+        base_url: str = GRAPH_API_BASE,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        timeout: float = 60.0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        max_backoff: float = 60.0,
+        transport: Any = None,
+    ):
+        """
+        Args:
+            token_provider: Returns a bearer token (sync or async callable)
+            base_url: Graph API root
+            max_connections: Pool size
+            max_keepalive_connections: Idle connections kept open
+            timeout: Per-request timeout in seconds
+            max_retries: Retries for throttled/unavailable responses and network errors
+            backoff_base: First backoff delay when no Retry-After is given
+            max_backoff: Upper bound for any single wait
+            transport: Optional httpx transport (for tests)
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for the Graph client. Install with: pip install httpx")
+
+        self.token_provider = token_provider
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+            # /content answers with a redirect to a pre-authenticated URL; httpx
+            # drops the Authorization header when the redirect leaves the origin
+            follow_redirects=True,
+            transport=transport,
+        )
+        self._site_ids: Dict[str, str] = {}
+        self._drive_ids: Dict[Tuple[str, Optional[str]], str] = {}
+
+        self.requests = 0
+        self.retries = 0
+
+    async def __aenter__(self) -> "AsyncGraphClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    async def _token(self) -> str:
+        token = self.token_provider()
+        if inspect.isawaitable(token):
+            return await token
+        return token
+
+    def _url(self, endpoint: str) -> str:
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        authorize: bool = True,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """Send a request, retrying throttling, transient errors and (idempotent) network failures."""
+        method = method.upper()
+        attempt = 0
+        while True:
+            request_headers = dict(headers or {})
+            if authorize:
+                request_headers["Authorization"] = f"Bearer {await self._token()}"
+            request = self._client.build_request(method, self._url(endpoint), headers=request_headers, **kwargs)
+            self.requests += 1
+            try:
+                response = await self._client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if method not in IDEMPOTENT_METHODS or attempt >= self.max_retries:
+                    raise GraphRequestError(0, f"Network error: {e}") from e
+                delay = retry_after_seconds({}, attempt, self.backoff_base, self.max_backoff)
+                logger.warning(f"Graph {method} {endpoint} failed ({e}); retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = retry_after_seconds(response.headers, attempt, self.backoff_base, self.max_backoff)
+                logger.warning(f"Graph {method} {endpoint} returned {response.status_code}; retrying in {delay:.1f}s")
+                await response.aclose()
+
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Call a Graph endpoint.
+
+        Returns:
+            Parsed JSON for JSON responses, otherwise the raw body bytes
+
+        Raises:
+            GraphRequestError: If the call fails after retries
+        """
+        response = await self._send(method, endpoint, **kwargs)
+        if response.status_code >= 400:
+            raise _error_for(response.status_code, endpoint, response.text)
+        if "application/json" in response.headers.get("content-type", ""):
+            return response.json()
+        return response.content
+
+    # ------------------------------------------------------------------
+    # Sites and drives
+    # ------------------------------------------------------------------
+
+    async def get_site(self, site_path: str) -> Dict[str, Any]:
+        """Get a site by path ("contoso.sharepoint.com:/sites/Research") and memoize its ID."""
+        site = await self.request("GET", f"sites/{site_path}")
+        self._site_ids[site_path] = site["id"]
+        return site
+
+    async def resolve_site_id(self, site_path: str) -> str:
+        """Site ID for a site path (memoized)."""
+        if site_path not in self._site_ids:
+            await self.get_site(site_path)
+        return self._site_ids[site_path]
+
+    async def get_drive(self, site_id: str, drive_name: Optional[str] = None) -> Dict[str, Any]:
+        """Get a site's default drive, or the drive (document library) with the given name."""
+        if drive_name:
+            drives = await self.request("GET", f"sites/{site_id}/drives")
+            for drive in drives.get("value", []):
+                self._drive_ids[(site_id, drive.get("name"))] = drive["id"]
+            for drive in drives.get("value", []):
+                if drive.get("name") == drive_name:
+                    return drive
+            raise GraphRequestError(404, f"Drive not found: {drive_name}")
+
+        drive = await self.request("GET", f"sites/{site_id}/drive")
+        self._drive_ids[(site_id, None)] = drive["id"]
+        return drive
+
+    async def resolve_drive_id(self, site_id: str, drive_name: Optional[str] = None) -> str:
+        """Drive ID for a site's default or named drive (memoized)."""
+        key = (site_id, drive_name or None)
+        if key not in self._drive_ids:
+            await self.get_drive(site_id, drive_name)
+        return self._drive_ids[key]
+
+    def forget_drives(self) -> None:
+        """Drop memoized site and drive IDs."""
+        self._site_ids.clear()
+        self._drive_ids.clear()
+
+    # ------------------------------------------------------------------
+    # Content
+    # ------------------------------------------------------------------
+
+    async def download_to(self, endpoint: str, dest: Path, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> int:
+        """
+        Stream a /content endpoint to a file without buffering it in memory.
+
+        The file is written to a temporary sibling and moved into place on success.
+
+        Returns:
+            Number of bytes written
+        """
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        temp = dest.with_name(f".{dest.name}.{os.getpid()}.part")
+
+        response = await self._send("GET", endpoint, stream=True)
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+                raise _error_for(response.status_code, endpoint, response.text)
+            written = 0
+            with open(temp, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+        finally:
+            await response.aclose()
+
+        os.replace(temp, dest)
+        return written
+
+    async def upload(
+        self,
+        item_endpoint: str,
+        content: Union[bytes, Path],
+        conflict_behavior: str = "replace",
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Upload a file to a drive item path.
+
+        Small payloads use a single PUT; larger ones (or files on disk over
+        the limit) use a chunked upload session, reading one chunk at a time.
+
+        Args:
+            item_endpoint: Item address, e.g. "drives/{id}/root:/folder/file.pdf"
+            content: File bytes or a path to read from
+            conflict_behavior: replace, rename or fail
+            chunk_size: Upload session chunk size (multiple of 320 KiB)
+
+        Returns:
+            Uploaded item metadata
+        """
+        size = Path(content).stat().st_size if isinstance(content, Path) else len(content)
+        if size <= SIMPLE_UPLOAD_LIMIT:
+            body = Path(content).read_bytes() if isinstance(content, Path) else content
+            return await self.request(
+                "PUT",
+                f"{item_endpoint}:/content",
+                content=body,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+
+        session = await self.request(
+            "POST",
+            f"{item_endpoint}:/createUploadSession",
+            json={"item": {"@microsoft.graph.conflictBehavior": conflict_behavior}},
+        )
+        upload_url = session["uploadUrl"]
+
+        def read_chunk(offset: int) -> bytes:
+            if isinstance(content, Path):
+                with open(content, "rb") as f:
+                    f.seek(offset)
+                    return f.read(chunk_size)
+            return content[offset:offset + chunk_size]
+
+        offset = 0
+        result: Dict[str, Any] = {}
+        while offset < size:
+            chunk = read_chunk(offset)
+            end = offset + len(chunk) - 1
+            # The upload URL is pre-authenticated; sending a bearer token is rejected
+            response = await self._send(
+                "PUT",
+                upload_url,
+                authorize=False,
+                content=chunk,
+                headers={"Content-Range": f"bytes {offset}-{end}/{size}"},
+            )
+            if response.status_code >= 400:
+                raise _error_for(response.status_code, item_endpoint, response.text)
+            result = response.json() if response.content else {}
+            offset = end + 1
+        return result
+
+    # ------------------------------------------------------------------
+    # $batch
+    # ------------------------------------------------------------------
+
+    async def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run many Graph calls through $batch, 20 per request.
+
+        Each request is a dict with "method" and "url" (relative, e.g.
+        "/me/drive/items/{id}") plus optional "headers" and "body". Items the
+        batch reports as throttled are retried after their Retry-After.
+
+        Returns:
+            One {"status", "headers", "body"} response per request, in order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        pending = list(range(len(requests)))
+
+        for attempt in range(self.max_retries + 1):
+            groups = [pending[i:i + BATCH_LIMIT] for i in range(0, len(pending), BATCH_LIMIT)]
+            responses = await asyncio.gather(*(self._batch_group(requests, group) for group in groups))
+
+            throttled: List[int] = []
+            delay = 0.0
+            for group_responses in responses:
+                for index, item in group_responses:
+                    status = item.get("status", 0)
+                    if status in RETRY_STATUSES and attempt < self.max_retries:
+                        throttled.append(index)
+                        delay = max(
+                            delay,
+                            retry_after_seconds(item.get("headers") or {}, attempt, self.backoff_base, self.max_backoff),
+                        )
+                    else:
+                        results[index] = item
+            if not throttled:
+                break
+            self.retries += len(throttled)
+            logger.warning(f"Graph $batch throttled {len(throttled)} requests; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            pending = sorted(throttled)
+
+        return [
+            {"status": r.get("status"), "headers": r.get("headers", {}), "body": r.get("body")}
+            for r in results
+            if r is not None
+        ]
+
+    async def _batch_group(self, requests: List[Dict[str, Any]], indexes: List[int]) -> List[Tuple[int, Dict[str, Any]]]:
+        payload = {"requests": []}
+        for index in indexes:
+            item = dict(requests[index])
+            item["id"] = str(index)
+            item["method"] = item.get("method", "GET").upper()
+            if "body" in item and "headers" not in item:
+                item["headers"] = {"Content-Type": "application/json"}
+            payload["requests"].append(item)
+
+        data = await self.request("POST", "$batch", json=payload)
+        by_id = {item["id"]: item for item in data.get("responses", [])}
+        return [(index, by_id.get(str(index), {"status": 0, "body": {"error": "missing from batch response"}})) for index in indexes]
+
+
+class BackgroundLoop:
+    """
+    An event loop on a daemon thread, for driving async clients from sync code.
+
+    Usage:
+        loop = BackgroundLoop("graph")
+        result = loop.run(client.request("GET", "me"))
+        loop.stop()
+    """
+
+    def __init__(self, name: str = "background-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop thread and wait for its result."""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def stop(self) -> None:
+        """Stop the loop thread."""
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5.0)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
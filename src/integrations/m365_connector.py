@@ -13,10 +13,18 @@ import sys
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 import json
 
+from .graph_client import (
+    GRAPH_API_BASE,
+    AsyncGraphClient,
+    BackgroundLoop,
+    GraphRequestError,
+    encode_path,
+)
+
 logger = logging.getLogger(__name__)
 
 # Add parent directory to path for EventKit imports
@@ -51,20 +59,30 @@ class M365KnowledgeConnector:
     - Upload knowledge artifacts to SharePoint
     - Get Teams meeting transcripts
     - Post summaries to Teams channels
+
+    All calls share one pooled AsyncGraphClient running on a background
+    event loop, so the synchronous API reuses keep-alive connections and
+    gets Retry-After aware retries. Call close() when done.
     """
 
-    GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
+    GRAPH_API_BASE = GRAPH_API_BASE
 
     def __init__(
         self,
         auth_client: Optional[GraphAuthClient] = None,
-        settings: Optional[Settings] = None
+        settings: Optional[Settings] = None,
+        base_url: Optional[str] = None,
+        max_retries: int = 4,
+        transport: Any = None
     ):
         """Initialize M365 connector
 
         Args:
             auth_client: Authenticated GraphAuthClient (creates default if None)
             settings: Application settings (loads default if None)
+            base_url: Graph API root (defaults to GRAPH_API_BASE)
+            max_retries: Retries for throttled (429/503) and failed requests
+            transport: Optional httpx transport (for tests)
         """
         # Initialize settings
         if settings is None:
@@ -80,27 +98,66 @@ class M365KnowledgeConnector:
                 raise M365ConnectorError(f"Authentication setup failed: {e}") from e
 
         self.auth_client = auth_client
+        self.base_url = base_url or self.GRAPH_API_BASE
+        self.max_retries = max_retries
+        self._transport = transport
+        self._loop = BackgroundLoop("m365-graph")
+        self._graph: Optional[AsyncGraphClient] = None
         logger.info("Initialized M365KnowledgeConnector")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get authorization headers for Graph API
-
-        Returns:
-            Dict with Authorization and Content-Type headers
+    async def _get_token(self) -> str:
+        """Get an access token (GraphAuthClient may be sync or async)
 
         Raises:
             M365ConnectorError: If token acquisition fails
         """
         try:
             token = self.auth_client.get_access_token()
-            return {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
+            if hasattr(token, "__await__"):
+                token = await token
+            return token
         except GraphAuthError as e:
             logger.error(f"Failed to get access token: {e}")
             raise M365ConnectorError(f"Authentication failed: {e}") from e
 
+    @property
+    def graph(self) -> AsyncGraphClient:
+        """Pooled Graph client (created on first use; only use from the connector's loop)"""
+        if self._graph is None:
+            self._graph = AsyncGraphClient(
+                token_provider=self._get_token,
+                base_url=self.base_url,
+                max_retries=self.max_retries,
+                transport=self._transport
+            )
+        return self._graph
+
+    def _run(self, coro) -> Any:
+        """Run a Graph coroutine on the connector's event loop
+
+        Raises:
+            M365ConnectorError: If the Graph call fails
+        """
+        try:
+            return self._loop.run(coro)
+        except GraphRequestError as e:
+            if e.status_code == 0:
+                logger.error(f"Network error calling Graph API: {e}")
+            raise M365ConnectorError(str(e)) from e
+
+    def close(self) -> None:
+        """Close pooled connections and stop the background loop"""
+        if self._graph is not None:
+            self._loop.run(self._graph.aclose())
+            self._graph = None
+        self._loop.stop()
+
+    def __enter__(self) -> "M365KnowledgeConnector":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def _make_request(
         self,
         method: str,
@@ -112,7 +169,7 @@ class M365KnowledgeConnector:
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE)
             endpoint: API endpoint (without base URL)
-            **kwargs: Additional arguments for httpx request
+            **kwargs: Additional arguments for httpx request (json, content, headers, params)
 
         Returns:
             Response JSON or content
@@ -120,46 +177,11 @@ class M365KnowledgeConnector:
         Raises:
             M365ConnectorError: If request fails
         """
-        import httpx
-
-        url = f"{self.GRAPH_API_BASE}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
+        return self._run(self.graph.request(method, endpoint, **kwargs))
 
-        # Merge headers
-        if 'headers' in kwargs:
-            headers.update(kwargs.pop('headers'))
-
-        try:
-            with httpx.Client(timeout=60.0) as client:
-                response = client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    **kwargs
-                )
-
-                # Handle errors
-                if response.status_code == 401:
-                    raise M365ConnectorError("Authentication failed: Invalid token")
-                elif response.status_code == 403:
-                    raise M365ConnectorError("Access denied: Insufficient permissions")
-                elif response.status_code == 404:
-                    raise M365ConnectorError(f"Resource not found: {endpoint}")
-                elif response.status_code >= 400:
-                    error_msg = response.text[:200] if response.text else "Unknown error"
-                    raise M365ConnectorError(
-                        f"API error {response.status_code}: {error_msg}"
-                    )
-
-                # Return binary content or JSON
-                if 'application/json' in response.headers.get('content-type', ''):
-                    return response.json()
-                else:
-                    return response.content
-
-        except httpx.RequestError as e:
-            logger.error(f"Network error calling Graph API: {e}")
-            raise M365ConnectorError(f"Network error: {e}") from e
+    def _drive_id(self, site_id: str, drive_name: Optional[str] = None) -> str:
+        """Memoized drive ID for a site's default or named drive"""
+        return self._run(self.graph.resolve_drive_id(site_id, drive_name))
 
     # ========== SharePoint Operations ==========
 
@@ -173,7 +195,18 @@ class M365KnowledgeConnector:
             Site object with id, webUrl, etc.
         """
         logger.info(f"Getting SharePoint site: {site_path}")
-        return self._make_request("GET", f"sites/{site_path}")
+        return self._run(self.graph.get_site(site_path))
+
+    def get_site_id(self, site_path: str) -> str:
+        """Get SharePoint site ID by path (memoized)
+
+        Args:
+            site_path: Site path like "contoso.sharepoint.com:/sites/Research"
+
+        Returns:
+            Site ID
+        """
+        return self._run(self.graph.resolve_site_id(site_path))
 
     def get_site_drive(self, site_id: str, drive_name: str = None) -> Dict[str, Any]:
         """Get drive (document library) for a site
@@ -185,16 +218,7 @@ class M365KnowledgeConnector:
         Returns:
             Drive object with id, webUrl, etc.
         """
-        if drive_name:
-            # Search for specific drive by name
-            drives = self._make_request("GET", f"sites/{site_id}/drives")
-            for drive in drives.get('value', []):
-                if drive.get('name') == drive_name:
-                    return drive
-            raise M365ConnectorError(f"Drive not found: {drive_name}")
-        else:
-            # Get default drive
-            return self._make_request("GET", f"sites/{site_id}/drive")
+        return self._run(self.graph.get_drive(site_id, drive_name))
 
     def get_item_by_path(
         self,
@@ -212,14 +236,8 @@ class M365KnowledgeConnector:
         Returns:
             Item object with id, name, size, etc.
         """
-        drive = self.get_site_drive(site_id, drive_name)
-        drive_id = drive['id']
-
-        # URL encode the path
-        from urllib.parse import quote
-        encoded_path = quote(item_path.strip('/'))
-
-        return self._make_request("GET", f"drives/{drive_id}/root:/{encoded_path}")
+        drive_id = self._drive_id(site_id, drive_name)
+        return self._make_request("GET", f"drives/{drive_id}/root:/{encode_path(item_path)}")
 
     def download_file(
         self,
@@ -239,38 +257,63 @@ class M365KnowledgeConnector:
         """
         logger.info(f"Downloading SharePoint file: {file_path}")
 
-        # Get item metadata
-        item = self.get_item_by_path(site_id, file_path, drive_name)
-
-        # Check if it's a file
-        if 'folder' in item:
-            raise M365ConnectorError(f"Path is a folder, not a file: {file_path}")
-
-        # Download content
-        drive = self.get_site_drive(site_id, drive_name)
+        drive_id = self._drive_id(site_id, drive_name)
         content = self._make_request(
             "GET",
-            f"drives/{drive['id']}/items/{item['id']}/content"
+            f"drives/{drive_id}/root:/{encode_path(file_path)}:/content"
         )
 
         logger.info(f"Downloaded {len(content)} bytes from {file_path}")
         return content
 
+    def download_file_to(
+        self,
+        site_id: str,
+        file_path: str,
+        dest: Union[str, Path],
+        drive_name: str = None
+    ) -> Path:
+        """Stream a SharePoint file to disk without buffering it in memory
+
+        Args:
+            site_id: SharePoint site ID
+            file_path: Path to file like "/Shared Documents/paper.pdf"
+            dest: Local destination file
+            drive_name: Optional drive name
+
+        Returns:
+            Path of the written file
+        """
+        logger.info(f"Downloading SharePoint file: {file_path} -> {dest}")
+
+        async def download() -> int:
+            drive_id = await self.graph.resolve_drive_id(site_id, drive_name)
+            return await self.graph.download_to(
+                f"drives/{drive_id}/root:/{encode_path(file_path)}:/content",
+                Path(dest)
+            )
+
+        size = self._run(download())
+        logger.info(f"Downloaded {size} bytes from {file_path}")
+        return Path(dest)
+
     def upload_file(
         self,
         site_id: str,
         folder_path: str,
         filename: str,
-        content: bytes,
+        content: Union[bytes, Path],
         drive_name: str = None
     ) -> Dict[str, Any]:
         """Upload file to SharePoint
 
+        Files over 4 MB are sent in chunks through an upload session.
+
         Args:
             site_id: SharePoint site ID
             folder_path: Folder path like "/Knowledge Artifacts"
             filename: File name
-            content: File content as bytes
+            content: File content as bytes, or a local file path
             drive_name: Optional drive name
 
         Returns:
@@ -278,19 +321,10 @@ class M365KnowledgeConnector:
         """
         logger.info(f"Uploading file to SharePoint: {folder_path}/{filename}")
 
-        drive = self.get_site_drive(site_id, drive_name)
-
-        # URL encode the path
-        from urllib.parse import quote
-        encoded_path = quote(f"{folder_path.strip('/')}/{filename}")
+        drive_id = self._drive_id(site_id, drive_name)
+        encoded_path = encode_path(f"{folder_path.strip('/')}/{filename}")
 
-        # Upload content
-        result = self._make_request(
-            "PUT",
-            f"drives/{drive['id']}/root:/{encoded_path}:/content",
-            content=content,
-            headers={"Content-Type": "application/octet-stream"}
-        )
+        result = self._run(self.graph.upload(f"drives/{drive_id}/root:/{encoded_path}", content))
 
         logger.info(f"Uploaded file: {result.get('webUrl')}")
         return result
@@ -311,19 +345,17 @@ class M365KnowledgeConnector:
         Returns:
             Created folder metadata
         """
-        drive = self.get_site_drive(site_id, drive_name)
+        drive_id = self._drive_id(site_id, drive_name)
 
         # Split path into parent and name
         parent_path = str(Path(folder_path).parent)
         folder_name = Path(folder_path).name
 
         # Get parent folder
-        if parent_path == '.':
-            parent_endpoint = f"drives/{drive['id']}/root"
+        if parent_path in ('.', '/'):
+            parent_endpoint = f"drives/{drive_id}/root"
         else:
-            from urllib.parse import quote
-            encoded_parent = quote(parent_path.strip('/'))
-            parent_endpoint = f"drives/{drive['id']}/root:/{encoded_parent}"
+            parent_endpoint = f"drives/{drive_id}/root:/{encode_path(parent_path)}:"
 
         # Create folder
         result = self._make_request(
@@ -365,9 +397,7 @@ class M365KnowledgeConnector:
             File content as bytes
         """
         logger.info(f"Downloading OneDrive file: {file_path}")
-        from urllib.parse import quote
-        encoded_path = quote(file_path.strip('/'))
-        content = self._make_request("GET", f"me/drive/root:/{encoded_path}:/content")
+        content = self._make_request("GET", f"me/drive/root:/{encode_path(file_path)}:/content")
         logger.info(f"Downloaded {len(content)} bytes from OneDrive")
         return content
 
@@ -375,29 +405,24 @@ class M365KnowledgeConnector:
         self,
         folder_path: str,
         filename: str,
-        content: bytes
+        content: Union[bytes, Path]
     ) -> Dict[str, Any]:
         """Upload file to OneDrive
 
+        Files over 4 MB are sent in chunks through an upload session.
+
         Args:
             folder_path: Folder path like "/Documents/Knowledge"
             filename: File name
-            content: File content as bytes
+            content: File content as bytes, or a local file path
 
         Returns:
             Uploaded file metadata
         """
         logger.info(f"Uploading file to OneDrive: {folder_path}/{filename}")
 
-        from urllib.parse import quote
-        encoded_path = quote(f"{folder_path.strip('/')}/{filename}")
-
-        result = self._make_request(
-            "PUT",
-            f"me/drive/root:/{encoded_path}:/content",
-            content=content,
-            headers={"Content-Type": "application/octet-stream"}
-        )
+        encoded_path = encode_path(f"{folder_path.strip('/')}/{filename}")
+        result = self._run(self.graph.upload(f"me/drive/root:/{encoded_path}", content))
 
         logger.info(f"Uploaded file: {result.get('webUrl')}")
         return result
@@ -509,6 +534,21 @@ class M365KnowledgeConnector:
         logger.info("Posted message to chat")
         return result
 
+    # ========== Batching ==========
+
+    def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several Graph calls with JSON $batch requests (20 per round trip)
+
+        Args:
+            requests: Dicts with "method" and relative "url" (e.g. "/me/drive/items/{id}"),
+                plus optional "headers" and "body"
+
+        Returns:
+            One {"status", "headers", "body"} dict per request, in order
+        """
+        logger.info(f"Sending {len(requests)} Graph requests via $batch")
+        return self._run(self.graph.batch(requests))
+
     # ========== Helper Methods ==========
 
     def parse_site_path(self, site_url: str) -> str:
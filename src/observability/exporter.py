@@ -0,0 +1,185 @@
+"""
+Background batching exporter for telemetry items.
+
+Callers on the request path only enqueue items; a daemon thread drains
+the queue in batches (flushed when a batch fills up or a time interval
+elapses) and hands them to a sink. The queue is bounded and never
+blocks: when it is full, new items are dropped and counted.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Sink = Callable[[List[Any]], None]
+
+_FLUSH = object()  # Queue marker requesting an immediate flush
+_TIMEOUT = object()  # Flush interval elapsed with no new item
+
+
+class BatchingExporter:
+    """
+    Bounded, batching, non-blocking telemetry exporter.
+
+    Usage:
+        exporter = BatchingExporter(sink=send_batch, batch_size=100, flush_interval=2.0)
+        exporter.start()
+        exporter.submit(item)      # never blocks
+        exporter.flush()           # wait until everything queued so far is exported
+        exporter.stop()
+    """
+
+    def __init__(
+        self,
+        sink: Sink,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 2.0,
+        name: str = "telemetry-exporter",
+    ):
+        """
+        Args:
+            sink: Callable receiving each batch (runs on the exporter thread)
+            max_queue_size: Items buffered before new items are dropped
+            batch_size: Export as soon as this many items are pending
+            flush_interval: Export pending items at least this often (seconds)
+            name: Worker thread name
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.name = name
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._flushed = threading.Condition()
+        self._flush_generation = 0
+
+        self.submitted = 0
+        self.dropped = 0
+        self.exported = 0
+        self.batches = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> bool:
+        """
+        Enqueue an item for export without blocking.
+
+        Returns:
+            False if the queue was full and the item was dropped
+        """
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Export everything submitted so far.
+
+        Returns:
+            True if the flush completed within timeout
+        """
+        if not self.running:
+            self._drain()
+            return True
+
+        with self._flushed:
+            target = self._flush_generation + 1
+            try:
+                self._queue.put(_FLUSH, timeout=timeout)
+            except queue.Full:
+                return False
+            return self._flushed.wait_for(lambda: self._flush_generation >= target, timeout=timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush pending items and stop the worker thread."""
+        if not self.running:
+            return
+        # The worker exits after handling the final flush marker
+        self._stopping.set()
+        self.flush(timeout=timeout)
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Exporter counters."""
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "exported": self.exported,
+            "batches": self.batches,
+            "failures": self.failures,
+        }
+
+    def _export(self, batch: List[Any]) -> None:
+        if not batch:
+            return
+        try:
+            self.sink(batch)
+            self.exported += len(batch)
+            self.batches += 1
+        except Exception as e:  # never let telemetry failures kill the worker
+            self.failures += 1
+            logger.warning(f"Telemetry export of {len(batch)} items failed: {e}")
+
+    def _drain(self) -> None:
+        """Synchronously export whatever is queued (used when not running)."""
+        batch: List[Any] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _FLUSH:
+                batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._export(batch)
+                batch = []
+        self._export(batch)
+
+    def _run(self) -> None:
+        batch: List[Any] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = _TIMEOUT
+
+            if item is not _FLUSH and item is not _TIMEOUT:
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+
+            self._export(batch)
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+
+            if item is _FLUSH:
+                with self._flushed:
+                    self._flush_generation += 1
+                    self._flushed.notify_all()
+                if self._stopping.is_set():
+                    return
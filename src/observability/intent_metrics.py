@@ -4,22 +4,86 @@ Intent Classification Metrics and Logging for Quality Tracking
 Integrates with Application Insights for long-term tracking and dashboards.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple
 from datetime import datetime
 import json
-from collections import defaultdict, Counter
+import threading
+import time
+from collections import defaultdict, Counter, deque
 
 # Import existing telemetry infrastructure
 from src.observability.telemetry import track_event
 
+LOW_CONFIDENCE_THRESHOLD = 0.6
+CONFIDENCE_BUCKETS = 10  # Histogram buckets of width 0.1 over [0, 1]
+
+
+class ClassificationRecord(NamedTuple):
+    """Compact in-memory record of a single classification."""
+    timestamp: float
+    query: str
+    intent: str
+    confidence: float
+    execution_path: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.utcfromtimestamp(self.timestamp).isoformat(),
+            "query": self.query,
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "execution_path": self.execution_path,
+        }
+
+
+def _confidence_bucket(confidence: float) -> int:
+    return min(CONFIDENCE_BUCKETS - 1, max(0, int(confidence * CONFIDENCE_BUCKETS)))
+
 
 class IntentMetrics:
-    """Track intent classification quality metrics and log to Application Insights."""
+    """Track intent classification quality metrics and log to Application Insights.
+
+    Recent classifications live in a fixed-size ring buffer. Window
+    aggregates (intent counts, deterministic and low-confidence counts,
+    confidence histogram) are updated incrementally as records enter and
+    leave the window, so logging and reading stats are constant time.
+    """
     
-    def __init__(self):
+    def __init__(self, max_recent: int = 100):
         # Keep minimal in-memory state for real-time API queries
-        self.recent_classifications = []  # Last 100 classifications
-        self.max_recent = 100
+        self.max_recent = max_recent
+        self._recent: deque = deque(maxlen=max_recent)
+        self._lock = threading.Lock()
+
+        # Aggregates over the records currently in the window
+        self._intent_counts: Counter = Counter()
+        self._deterministic = 0
+        self._low_confidence = 0
+        self._confidence_sum = 0.0
+        self._histogram = [0] * CONFIDENCE_BUCKETS
+
+        # Aggregates since process start
+        self.total_classifications = 0
+        self.total_deterministic = 0
+
+    @property
+    def recent_classifications(self) -> List[Dict[str, Any]]:
+        """Recent classifications as dicts, oldest first."""
+        with self._lock:
+            records = list(self._recent)
+        return [record.to_dict() for record in records]
+
+    def _apply(self, record: ClassificationRecord, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a record from the window aggregates."""
+        self._intent_counts[record.intent] += sign
+        if self._intent_counts[record.intent] <= 0:
+            del self._intent_counts[record.intent]
+        if record.execution_path == "deterministic":
+            self._deterministic += sign
+        if record.confidence < LOW_CONFIDENCE_THRESHOLD:
+            self._low_confidence += sign
+        self._confidence_sum += sign * record.confidence
+        self._histogram[_confidence_bucket(record.confidence)] += sign
         
     def log_classification(
         self,
@@ -42,7 +106,7 @@ class IntentMetrics:
                 "patterns_matched_count": str(len(patterns_matched)),
                 "patterns": ",".join(patterns_matched[:5]),  # First 5 patterns
                 "is_deterministic": str(execution_path == "deterministic"),
-                "is_low_confidence": str(confidence < 0.6),
+                "is_low_confidence": str(confidence < LOW_CONFIDENCE_THRESHOLD),
             },
             measurements={
                 "confidence": confidence,
@@ -51,18 +115,15 @@ class IntentMetrics:
         )
         
         # Keep recent in memory for quick API queries
-        record = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "query": query[:100],
-            "intent": predicted_intent,
-            "confidence": confidence,
-            "execution_path": execution_path,
-        }
-        self.recent_classifications.append(record)
-        
-        # Keep only last N records in memory
-        if len(self.recent_classifications) > self.max_recent:
-            self.recent_classifications.pop(0)
+        record = ClassificationRecord(time.time(), query[:100], predicted_intent, confidence, execution_path)
+        with self._lock:
+            if len(self._recent) == self.max_recent:
+                self._apply(self._recent[0], -1)
+            self._recent.append(record)
+            self._apply(record, 1)
+            self.total_classifications += 1
+            if execution_path == "deterministic":
+                self.total_deterministic += 1
             
     def log_user_feedback(
         self,
@@ -102,29 +163,31 @@ class IntentMetrics:
         )
         
     def get_coverage_stats(self) -> Dict[str, Any]:
-        """Get recent coverage statistics from in-memory data."""
-        if not self.recent_classifications:
+        """Get recent coverage statistics from the incrementally maintained aggregates."""
+        with self._lock:
+            total = len(self._recent)
+            if not total:
+                return {
+                    "total_queries": 0,
+                    "deterministic_coverage": 0.0,
+                    "low_confidence_rate": 0.0,
+                    "message": "No recent data. Query Application Insights for historical metrics."
+                }
+
             return {
-                "total_queries": 0,
-                "deterministic_coverage": 0.0,
-                "low_confidence_rate": 0.0,
-                "message": "No recent data. Query Application Insights for historical metrics."
+                "total_queries_recent": total,
+                "deterministic_coverage": self._deterministic / total,
+                "low_confidence_rate": self._low_confidence / total,
+                "mean_confidence": self._confidence_sum / total,
+                "confidence_histogram": {
+                    f"{i / CONFIDENCE_BUCKETS:.1f}-{(i + 1) / CONFIDENCE_BUCKETS:.1f}": count
+                    for i, count in enumerate(self._histogram)
+                },
+                "top_intents_recent": self._intent_counts.most_common(5),
+                "total_queries_lifetime": self.total_classifications,
+                "deterministic_coverage_lifetime": self.total_deterministic / self.total_classifications,
+                "note": f"Based on last {total} classifications. For full metrics, query Application Insights."
             }
-        
-        total = len(self.recent_classifications)
-        deterministic = sum(1 for c in self.recent_classifications if c["execution_path"] == "deterministic")
-        low_conf = sum(1 for c in self.recent_classifications if c["confidence"] < 0.6)
-        
-        # Intent distribution from recent data
-        intent_counts = Counter(c["intent"] for c in self.recent_classifications)
-        
-        return {
-            "total_queries_recent": total,
-            "deterministic_coverage": deterministic / total if total > 0 else 0,
-            "low_confidence_rate": low_conf / total if total > 0 else 0,
-            "top_intents_recent": intent_counts.most_common(5),
-            "note": f"Based on last {total} classifications. For full metrics, query Application Insights."
-        }
     
     def get_intent_accuracy(self) -> Dict[str, str]:
         """Intent accuracy is tracked in Application Insights."""
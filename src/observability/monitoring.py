@@ -188,6 +188,35 @@ class MetricsCollector:
             'Latest evaluation quality score',
             registry=self.registry
         )
+        
+        # Caches
+        self.cache_requests_total = Counter(
+            'cache_requests_total',
+            'Cache lookups by result',
+            ['cache', 'key', 'result'],  # result: hit, miss
+            registry=self.registry
+        )
+        
+        self.cache_evictions_total = Counter(
+            'cache_evictions_total',
+            'Cache evictions',
+            ['cache', 'key', 'reason'],  # reason: entries, bytes, ttl
+            registry=self.registry
+        )
+        
+        self.cache_entries = Gauge(
+            'cache_entries',
+            'Current number of cache entries',
+            ['cache'],
+            registry=self.registry
+        )
+        
+        self.cache_bytes = Gauge(
+            'cache_bytes',
+            'Estimated size of cached data in bytes',
+            ['cache'],
+            registry=self.registry
+        )
 
 
 # Global metrics instance
@@ -6,10 +6,12 @@ Tracks copilot operations, data access, and performance metrics
 import os
 import time
 import re
-from typing import Dict, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
 from functools import wraps
 from datetime import datetime
 
+from src.observability.exporter import BatchingExporter
+
 try:
     from applicationinsights import TelemetryClient
     from applicationinsights.requests import WSGIApplication
@@ -22,6 +24,9 @@ except ImportError:
 # Global telemetry client
 _telemetry_client: Optional[Any] = None
 
+# Background exporter; track_* calls only enqueue onto it
+_exporter: Optional[BatchingExporter] = None
+
 
 _PII_PATTERNS = [
     # Email addresses
@@ -54,6 +59,21 @@ _PII_PATTERNS = [
 ]
 
 
+_SENSITIVE_KEYWORDS = [
+    "password", "passwd", "pwd", "secret", "token", "api_key", "apikey",
+    "auth", "credential", "ssn", "social", "dob", "birthdate", "license"
+]
+
+# Key-value pairs with sensitive keywords, e.g. "password: value" or "password=value"
+_SENSITIVE_KV_PATTERN = re.compile(
+    r"\b(" + "|".join(map(re.escape, _SENSITIVE_KEYWORDS)) + r")[\s:=]+\S+", re.IGNORECASE
+)
+
+
+def _redact_keyword(match: "re.Match") -> str:
+    return f"{match.group(1).lower()}=[REDACTED]"
+
+
 def _sanitize_text(value: str, max_length: int = 200) -> str:
     """Enhanced PII scrubbing with multiple pattern detection."""
     if not value:
@@ -66,16 +86,7 @@ def _sanitize_text(value: str, max_length: int = 200) -> str:
         sanitized = pattern.sub("[REDACTED]", sanitized)
     
     # Additional context-aware sanitization
-    # Redact anything that looks like a key-value pair with sensitive keywords
-    sensitive_keywords = [
-        "password", "passwd", "pwd", "secret", "token", "api_key", "apikey",
-        "auth", "credential", "ssn", "social", "dob", "birthdate", "license"
-    ]
-    
-    for keyword in sensitive_keywords:
-        # Match patterns like "password: value" or "password=value"
-        pattern = re.compile(rf"\b{keyword}[\s:=]+\S+", re.IGNORECASE)
-        sanitized = pattern.sub(f"{keyword}=[REDACTED]", sanitized)
+    sanitized = _SENSITIVE_KV_PATTERN.sub(_redact_keyword, sanitized)
 
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length] + "…"
@@ -83,6 +94,53 @@ def _sanitize_text(value: str, max_length: int = 200) -> str:
     return sanitized
 
 
+class _Redact(NamedTuple):
+    """Property value sanitized on the exporter thread instead of the caller's."""
+    value: str
+    max_length: int = 200
+
+
+class _TelemetryItem(NamedTuple):
+    kind: str  # "event" or "exception"
+    name: str
+    properties: Dict[str, Any]
+    measurements: Optional[Dict[str, float]] = None
+    exception: Optional[Exception] = None
+
+
+def _resolve_properties(properties: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        key: _sanitize_text(value.value, value.max_length) if isinstance(value, _Redact) else value
+        for key, value in properties.items()
+    }
+
+
+def _send_batch(batch: List[_TelemetryItem]) -> None:
+    """Exporter sink: sanitize deferred properties and hand items to the client."""
+    client = _telemetry_client
+    if client is None:
+        return
+    for item in batch:
+        props = _resolve_properties(item.properties)
+        if item.kind == "exception":
+            client.track_exception(type(item.exception), item.exception, None, props)
+        else:
+            client.track_event(item.name, props, item.measurements)
+    client.flush()
+
+
+def _submit(item: _TelemetryItem) -> None:
+    if _exporter is not None and _exporter.running:
+        _exporter.submit(item)
+    else:
+        _send_batch([item])
+
+
+def get_telemetry_stats() -> Dict[str, Any]:
+    """Exporter queue/drop counters (empty if telemetry is disabled)."""
+    return _exporter.get_stats() if _exporter is not None else {}
+
+
 def initialize_telemetry(instrumentation_key: Optional[str] = None) -> Optional[Any]:
     """
     Initialize 1DS telemetry client.
@@ -107,11 +165,27 @@ def initialize_telemetry(instrumentation_key: Optional[str] = None) -> Optional[
     _telemetry_client = TelemetryClient(key)
     _telemetry_client.context.application.ver = "0.3.0"
     _telemetry_client.context.properties["environment"] = os.getenv("ENVIRONMENT", "dev")
+
+    _start_exporter()
     
     print("[Telemetry] 1DS initialized successfully")
     return _telemetry_client
 
 
+def _start_exporter() -> BatchingExporter:
+    """Start the background exporter (queue size, batch size and interval from env)."""
+    global _exporter
+    if _exporter is None:
+        _exporter = BatchingExporter(
+            sink=_send_batch,
+            max_queue_size=int(os.getenv("TELEMETRY_MAX_QUEUE", "10000")),
+            batch_size=int(os.getenv("TELEMETRY_BATCH_SIZE", "100")),
+            flush_interval=float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "2.0")),
+        )
+    _exporter.start()
+    return _exporter
+
+
 def get_telemetry_client() -> Optional[Any]:
     """Get the global telemetry client."""
     return _telemetry_client
@@ -136,7 +210,7 @@ def track_event(
     props = properties or {}
     props["timestamp"] = datetime.utcnow().isoformat()
     
-    _telemetry_client.track_event(name, props, measurements)
+    _submit(_TelemetryItem("event", name, props, measurements))
 
 
 def track_repository_operation(
@@ -268,7 +342,7 @@ def track_user_feedback(
             "rating": rating,
             "user_id": user_id or "anonymous",
             "has_comment": str(bool(comment)),
-            "comment_sanitized": _sanitize_text(comment or "") if comment else ""
+            "comment_sanitized": _Redact(comment) if comment else ""
         }
     )
 
@@ -468,7 +542,7 @@ def track_fallback_event(
     track_event(
         "fallback_event",
         properties={
-            "original_query": _sanitize_text(original_query, max_length=300),
+            "original_query": _Redact(original_query, max_length=300),
             "session_id": session_id,
             "foundry_attempt": str(foundry_attempt),
             "foundry_failed_reason": foundry_failed_reason or "none",
@@ -503,7 +577,7 @@ def log_refusal(
         "ai_content_refusal",
         properties={
             "refusal_reason": refusal_reason,
-            "query_context": _sanitize_text(query_context),
+            "query_context": _Redact(query_context),
             "handler_name": handler_name or "unknown",
             "user_id": user_id or "anonymous",
             "conversation_id": conversation_id or "N/A"
@@ -564,12 +638,7 @@ def track_exception(
     props["timestamp"] = datetime.utcnow().isoformat()
     props["exception_type"] = type(exception).__name__
     
-    _telemetry_client.track_exception(
-        type(exception),
-        exception,
-        None,  # tb
-        props
-    )
+    _submit(_TelemetryItem("exception", type(exception).__name__, props, exception=exception))
 
 
 def telemetry_decorator(operation: str, entity_type: str):
@@ -624,5 +693,10 @@ def flush_telemetry() -> None:
     if not _telemetry_client:
         return
     
+    if _exporter is not None:
+        _exporter.stop()
+        stats = _exporter.get_stats()
+        if stats["dropped"]:
+            print(f"[Telemetry] Dropped {stats['dropped']} items (queue full)")
     _telemetry_client.flush()
     print("[Telemetry] Flushed successfully")
@@ -0,0 +1,360 @@
+"""
+Indexed project catalog for MSR Event Hub.
+
+Builds hash indexes over the project list loaded by EventDataLoader so that
+action handlers can answer filter queries by intersecting posting sets
+instead of rescanning every project dict on each chat turn.
+
+The global catalog is published as an EventDataSnapshot: event data, its
+catalog and a version number that only ever increases. Snapshots are
+swapped in with a single reference assignment, so a reader always sees a
+matching data/catalog pair, and caches keyed on the version never serve
+results derived from older data.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.storage import event_data
+from src.storage.related_projects import RelatedProjectIndex
+from src.storage.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+# Scalar project fields indexed by their normalized (lowercased) value
+INDEXED_FIELDS = (
+    "researchArea",
+    "recordingPermission",
+    "commsStatus",
+    "maturity",
+    "status",
+    "targetAudience",
+    "placement",
+)
+
+# Pseudo-fields backed by list-valued project attributes
+EQUIPMENT_FIELD = "equipment"
+TEAM_FIELD = "team"
+
+
+def _normalize(value: Any) -> str:
+    """Normalize an indexed value for case-insensitive lookup."""
+    if value is None:
+        return ""
+    return str(value).strip().lower()
+
+
+class ProjectCatalog:
+    """
+    In-memory project catalog with secondary hash indexes.
+
+    Projects are addressed by their row position in the source list. Each
+    index maps a normalized field value to the set of rows holding it, so
+    exact lookups are O(1) and substring lookups only scan the distinct
+    values of a field rather than every project.
+
+    Usage:
+        catalog = ProjectCatalog(event_data.get("projects", []))
+        ai = catalog.filter(researchArea="ai", equipment="monitor")
+    """
+
+    def __init__(
+        self,
+        projects: List[Dict[str, Any]],
+        sessions: Optional[List[Dict[str, Any]]] = None,
+        people: Optional[List[Dict[str, Any]]] = None,
+        related: Optional[RelatedProjectIndex] = None,
+    ):
+        """
+        Build the catalog and its indexes.
+
+        Args:
+            projects: Project dictionaries (kept by reference, not copied)
+            sessions: Optional session dictionaries for the same event
+            people: Optional people directory for the same event
+            related: Related-project index from a previous catalog, updated
+                incrementally instead of rebuilt
+        """
+        self._projects: List[Dict[str, Any]] = list(projects)
+        self._sessions: List[Dict[str, Any]] = list(sessions or [])
+        self._by_id: Dict[str, int] = {}
+        self._indexes: Dict[str, Dict[str, Set[int]]] = {
+            name: {} for name in (*INDEXED_FIELDS, EQUIPMENT_FIELD, TEAM_FIELD)
+        }
+        self._by_team_size: Dict[int, Set[int]] = {}
+        self._featured: Set[int] = set()
+
+        for row, project in enumerate(self._projects):
+            self._index_project(row, project)
+
+        self.search_index = SearchIndex.from_event_data(self._projects, self._sessions, people)
+        if related is None:
+            related = RelatedProjectIndex(self._projects)
+        else:
+            related.sync(self._projects)
+        self.related = related
+
+        logger.debug(f"Built project catalog: {len(self._projects)} projects")
+
+    @classmethod
+    def from_event_data(
+        cls, data: Dict[str, Any], related: Optional[RelatedProjectIndex] = None
+    ) -> "ProjectCatalog":
+        """Build a catalog from an event data dictionary."""
+        return cls(data.get("projects", []), data.get("sessions", []), data.get("people", []), related)
+
+    def _index_project(self, row: int, project: Dict[str, Any]) -> None:
+        """Add a single project row to every index."""
+        project_id = project.get("id")
+        if project_id:
+            self._by_id[project_id] = row
+
+        for name in INDEXED_FIELDS:
+            key = _normalize(project.get(name))
+            if key:
+                self._indexes[name].setdefault(key, set()).add(row)
+
+        for item in project.get("equipment", []) or []:
+            key = _normalize(item)
+            if key:
+                self._indexes[EQUIPMENT_FIELD].setdefault(key, set()).add(row)
+
+        team = project.get("team", []) or []
+        for member in team:
+            key = _normalize(member.get("name") or member.get("displayName"))
+            if key:
+                self._indexes[TEAM_FIELD].setdefault(key, set()).add(row)
+        self._by_team_size.setdefault(len(team), set()).add(row)
+
+        if project.get("featured", False):
+            self._featured.add(row)
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def projects(self) -> List[Dict[str, Any]]:
+        """All projects in source order."""
+        return self._projects
+
+    @property
+    def sessions(self) -> List[Dict[str, Any]]:
+        """All sessions in source order."""
+        return self._sessions
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Get a project by ID."""
+        row = self._by_id.get(project_id)
+        return self._projects[row] if row is not None else None
+
+    def rows(self, row_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Materialize row IDs as projects in source order."""
+        return [self._projects[row] for row in sorted(row_ids)]
+
+    def values(self, field: str) -> List[str]:
+        """List the distinct normalized values indexed for a field."""
+        return list(self._index_for(field).keys())
+
+    def _index_for(self, field: str) -> Dict[str, Set[int]]:
+        index = self._indexes.get(field)
+        if index is None:
+            raise ValueError(f"Field '{field}' is not indexed")
+        return index
+
+    # ------------------------------------------------------------------
+    # Posting-set lookups
+    # ------------------------------------------------------------------
+
+    def lookup(self, field: str, value: Any) -> Set[int]:
+        """Rows whose field equals value (case-insensitive)."""
+        return set(self._index_for(field).get(_normalize(value), ()))
+
+    def match(self, field: str, value: Any) -> Set[int]:
+        """Rows whose field contains value as a substring (case-insensitive)."""
+        needle = _normalize(value)
+        index = self._index_for(field)
+        if needle in index:
+            rows = set(index[needle])
+        else:
+            rows = set()
+        for key, postings in index.items():
+            if needle in key and key != needle:
+                rows |= postings
+        return rows
+
+    def featured_rows(self) -> Set[int]:
+        """Rows flagged as featured."""
+        return set(self._featured)
+
+    def team_size_rows(self, min_size: int, max_size: int) -> Set[int]:
+        """Rows whose team size is within [min_size, max_size]."""
+        rows: Set[int] = set()
+        for size, postings in self._by_team_size.items():
+            if min_size <= size <= max_size:
+                rows |= postings
+        return rows
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Full-text search over projects, ranked by relevance."""
+        return [hit.document for hit in self.search_index.search(query, kind="project", limit=limit)]
+
+    def similar(self, project_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Projects most similar to a project (precomputed neighbors, best first)."""
+        return [project for project, _ in self.related.similar(project_id, limit)]
+
+    def filter(self, exact: bool = False, **criteria: Any) -> List[Dict[str, Any]]:
+        """
+        Filter projects by intersecting index posting sets.
+
+        Args:
+            exact: Match whole values instead of substrings
+            **criteria: Field name to value (e.g., researchArea="AI")
+
+        Returns:
+            Matching projects in source order
+        """
+        result: Optional[Set[int]] = None
+        # Intersect smallest posting sets first to keep intermediate sets small
+        postings = sorted(
+            (
+                self.lookup(field, value) if exact else self.match(field, value)
+                for field, value in criteria.items()
+                if value not in (None, "")
+            ),
+            key=len,
+        )
+        for rows in postings:
+            result = rows if result is None else result & rows
+            if not result:
+                return []
+
+        if result is None:
+            return list(self._projects)
+        return self.rows(result)
+
+    def get_category_counts(self) -> Dict[str, int]:
+        """Get project counts by research area (original casing)."""
+        counts: Dict[str, int] = {}
+        for rows in self._indexes["researchArea"].values():
+            area = self._projects[next(iter(rows))].get("researchArea", "Other")
+            counts[area] = counts.get(area, 0) + len(rows)
+        uncategorized = len(self._projects) - sum(counts.values())
+        if uncategorized:
+            counts["Other"] = counts.get("Other", 0) + uncategorized
+        return counts
+
+
+@dataclass(frozen=True)
+class EventDataSnapshot:
+    """
+    Event data together with the catalog built from it.
+
+    Snapshots are never modified after they are published; a data change
+    publishes a new snapshot with a higher version.
+    """
+
+    version: int
+    data: Dict[str, Any]
+    catalog: ProjectCatalog
+    created_at: float = field(default_factory=time.time)
+
+
+# Global snapshot, replaced whenever the underlying event data changes
+_snapshot: Optional[EventDataSnapshot] = None
+_version = 0
+_swap_lock = threading.Lock()
+
+
+def build_catalog(data: Dict[str, Any], previous: Optional[EventDataSnapshot] = None) -> ProjectCatalog:
+    """
+    Build a catalog for new event data.
+
+    The previous snapshot's related-project index is copied and synced, so
+    only changed projects are rescored while the old index keeps serving.
+    """
+    related = previous.catalog.related.copy() if previous is not None else None
+    return ProjectCatalog.from_event_data(data, related=related)
+
+
+def _publish(data: Dict[str, Any], catalog: ProjectCatalog) -> EventDataSnapshot:
+    """Swap in a new snapshot (caller holds _swap_lock)."""
+    global _snapshot, _version
+    _version += 1
+    _snapshot = EventDataSnapshot(version=_version, data=data, catalog=catalog)
+    return _snapshot
+
+
+def get_snapshot() -> EventDataSnapshot:
+    """
+    Get the current event data snapshot.
+
+    The snapshot is built from get_event_data() on first use and rebuilt
+    only when the loader starts returning a different data object.
+    """
+    snapshot = _snapshot
+    if snapshot is not None and event_data.get_event_data() is snapshot.data:
+        return snapshot
+
+    with _swap_lock:
+        snapshot = _snapshot
+        data = event_data.get_event_data()
+        if snapshot is None or data is not snapshot.data:
+            snapshot = _publish(data, build_catalog(data, snapshot))
+        return snapshot
+
+
+def publish_snapshot(data: Dict[str, Any], catalog: ProjectCatalog) -> EventDataSnapshot:
+    """
+    Atomically replace the event data and catalog.
+
+    The loader's data and the snapshot are swapped under one lock, so no
+    reader can pair the new data with the old catalog (which would trigger
+    a redundant rebuild on the request path).
+
+    Args:
+        data: New event data
+        catalog: Catalog already built from data (see build_catalog)
+
+    Returns:
+        The published snapshot
+    """
+    with _swap_lock:
+        event_data.get_event_data_loader().set_all_data(data)
+        snapshot = _publish(data, catalog)
+    logger.info(f"Published event data snapshot v{snapshot.version}: {len(catalog)} projects")
+    return snapshot
+
+
+def get_project_catalog() -> ProjectCatalog:
+    """
+    Get the global project catalog.
+
+    The catalog is built once from get_event_data() and reused for as long
+    as the loader keeps returning the same data object.
+    """
+    return get_snapshot().catalog
+
+
+def get_data_version() -> int:
+    """
+    Version of the event data behind the global catalog.
+
+    Incremented every time a snapshot is published, so it can be used in
+    cache keys for responses derived from event data.
+    """
+    return get_snapshot().version
+
+
+def reset_project_catalog() -> None:
+    """Drop the global catalog so the next access rebuilds it (the version keeps increasing)."""
+    global _snapshot
+    with _swap_lock:
+        _snapshot = None
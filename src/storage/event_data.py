@@ -8,6 +8,10 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from functools import lru_cache
 
+from src.storage.search_index import SearchIndex
+
+DATA_FILE = "mock_event_data.json"
+
 
 class EventDataLoader:
     """Loads and provides access to event and project data."""
@@ -17,36 +21,48 @@ class EventDataLoader:
         self._data_cache: Dict[str, Any] = {}
     
     def _load_json_file(self, filename: str) -> Dict[str, Any]:
-        """Load a JSON file from the data directory."""
+        """Load a JSON file from the data directory.
+
+        A missing or unparseable file is cached as empty data too, so callers
+        that compare the returned object (the catalog snapshot) see the same
+        object until new data is set.
+        """
         if filename in self._data_cache:
             return self._data_cache[filename]
         
         file_path = self.data_dir / filename
-        if not file_path.exists():
-            return {}
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self._data_cache[filename] = data
-            return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Failed to load {filename}: {e}")
-            return {}
+        data: Dict[str, Any] = {}
+        if file_path.exists():
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Failed to load {filename}: {e}")
+        self._data_cache[filename] = data
+        return data
     
+    @property
+    def data_file(self) -> Path:
+        """Path of the event data file."""
+        return self.data_dir / DATA_FILE
+
+    def set_all_data(self, data: Dict[str, Any]) -> None:
+        """Replace the cached event data (used when a new snapshot is published)."""
+        self._data_cache[DATA_FILE] = data
+
     def get_projects(self) -> List[Dict[str, Any]]:
         """Get all projects from mock_event_data.json."""
-        data = self._load_json_file("mock_event_data.json")
+        data = self._load_json_file(DATA_FILE)
         return data.get("projects", [])
     
     def get_sessions(self) -> List[Dict[str, Any]]:
         """Get all sessions from mock_event_data.json."""
-        data = self._load_json_file("mock_event_data.json")
+        data = self._load_json_file(DATA_FILE)
         return data.get("sessions", [])
     
     def get_all_data(self) -> Dict[str, Any]:
         """Get all event data."""
-        return self._load_json_file("mock_event_data.json")
+        return self._load_json_file(DATA_FILE)
     
     def get_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific project by ID."""
@@ -85,21 +101,21 @@ class EventDataLoader:
         
         return filtered
     
+    def get_search_index(self) -> SearchIndex:
+        """Get the full-text index over projects, sessions and people.
+
+        The index is owned by the current catalog snapshot, so it is built
+        once per published data version and shared with the catalog.
+        """
+        # Imported here: the catalog module imports this one
+        from src.storage.catalog import get_project_catalog
+
+        return get_project_catalog().search_index
+
     def search_projects(self, query: str) -> List[Dict[str, Any]]:
-        """Search projects by keyword in title or description."""
-        projects = self.get_projects()
-        query_lower = query.lower()
-        
-        filtered = []
-        for project in projects:
-            title = project.get("name", "").lower()
-            desc = project.get("description", "").lower()
-            area = project.get("researchArea", "").lower()
-            
-            if query_lower in title or query_lower in desc or query_lower in area:
-                filtered.append(project)
-        
-        return filtered
+        """Search projects by keyword in title, description or area, ranked by relevance."""
+        hits = self.get_search_index().search(query, kind="project")
+        return [hit.document for hit in hits]
     
     def get_category_counts(self) -> Dict[str, int]:
         """Get project counts by research area."""
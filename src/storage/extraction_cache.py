@@ -0,0 +1,382 @@
+"""
+Content-addressed cache for knowledge extraction.
+
+Extraction re-parses the same PDFs and repeats the same LLM call every time
+an unchanged paper, transcript or repository goes through the POC workflow
+or an evaluation run. This cache stores two things on disk:
+
+- parsed source text, keyed by (source hash, agent type, extraction
+  parameters such as a token budget), so PDF and repository parsing
+  happens once per input regardless of prompt or model
+- extracted artifacts, keyed by (hash of the text sent, agent type, prompt
+  version, model, temperature)
+
+Parsed text is grouped on disk by an extractor fingerprint, a hash of the
+agent modules in ``src/agents`` that parse sources, so changing a parser
+retires all text it produced. The prompt version is derived from the
+contents of ``src/agents/prompts`` plus the prompt text an agent actually
+sends, so editing a prompt changes every affected key; artifacts are
+grouped on disk by that prompts fingerprint. ``invalidate_stale()`` drops
+the groups of older fingerprints; the rest is bounded by size-based LRU
+eviction (file mtimes are bumped on every hit).
+
+Artifacts are stored pickled: the dataclass/pydantic artifact types do not
+round-trip their subclass-specific fields through to_dict(). Loading a
+pickle can execute arbitrary code, so the cache directory must only be
+writable by the user running extraction. It is created with owner-only
+permissions; do not point EXTRACTION_CACHE_DIR at a shared or
+world-writable location.
+
+Configuration (environment):
+    EXTRACTION_CACHE_ENABLED   "false" disables the default cache
+    EXTRACTION_CACHE_DIR       cache directory (default .cache/extraction,
+                               relative to the working directory; must be trusted)
+    EXTRACTION_CACHE_MAX_MB    size budget in megabytes (default 512)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+AGENTS_DIR = Path(__file__).resolve().parents[1] / "agents"
+PROMPTS_DIR = AGENTS_DIR / "prompts"
+DEFAULT_CACHE_DIR = ".cache/extraction"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_CHUNK_SIZE = 1024 * 1024
+_SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv"}
+
+
+def _sha256(*parts: Union[str, bytes]) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8") if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _hash_file(path: Path, digest: "hashlib._Hash") -> None:
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+
+def source_digest(source: Any) -> str:
+    """
+    Content hash of an extraction input.
+
+    Files are hashed by content, directories (repositories) by the relative
+    paths and contents of their files, and anything else by its text.
+    """
+    if isinstance(source, bytes):
+        return _sha256(b"bytes", source)
+
+    path = Path(source) if isinstance(source, (str, Path)) else None
+    try:
+        is_file = path is not None and path.is_file()
+        is_dir = path is not None and not is_file and path.is_dir()
+    except (OSError, ValueError):  # e.g. long transcript text passed as str
+        is_file = is_dir = False
+
+    digest = hashlib.sha256()
+    if is_file:
+        digest.update(b"file\0")
+        _hash_file(path, digest)
+    elif is_dir:
+        digest.update(b"dir\0")
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in _SKIP_DIRS)
+            for name in sorted(files):
+                file_path = Path(root) / name
+                digest.update(file_path.relative_to(path).as_posix().encode("utf-8") + b"\0")
+                try:
+                    _hash_file(file_path, digest)
+                except OSError:
+                    digest.update(b"<unreadable>")
+    else:
+        digest.update(b"text\0")
+        digest.update(str(source).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def modules_fingerprint(directory: Path) -> str:
+    """Hash of every Python module in a directory (not recursive)."""
+    digest = hashlib.sha256()
+    if directory.is_dir():
+        for path in sorted(directory.glob("*.py")):
+            digest.update(path.name.encode("utf-8") + b"\0")
+            _hash_file(path, digest)
+    return digest.hexdigest()[:16]
+
+
+def prompts_fingerprint(prompts_dir: Path = PROMPTS_DIR) -> str:
+    """Hash of every prompt module, so any prompt edit invalidates cached artifacts."""
+    return modules_fingerprint(prompts_dir)
+
+
+def extractor_fingerprint(agents_dir: Path = AGENTS_DIR) -> str:
+    """Hash of the agent modules that parse sources, so any parser edit invalidates cached text."""
+    return modules_fingerprint(agents_dir)
+
+
+class ExtractionCache:
+    """
+    On-disk content-addressed cache of parsed sources and extracted artifacts.
+
+    Usage:
+        cache = get_extraction_cache()
+        digest = cache.digest(source)
+        text = cache.get_text(digest, "paper", {"token_budget": 60000})
+        ...
+        key = cache.artifact_key(cache.text_digest(text), "paper", cache.prompt_version(prompt), model, 0.3)
+        artifact = cache.get_artifact(key)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        prompts_dir: Path = PROMPTS_DIR,
+        agents_dir: Path = AGENTS_DIR,
+    ):
+        """
+        Args:
+            cache_dir: Directory holding cache entries (trusted: artifacts are unpickled)
+            max_bytes: Size budget; least recently used entries are evicted beyond it
+            prompts_dir: Prompt modules whose contents version cached artifacts
+            agents_dir: Agent modules whose contents version cached source text
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.prompts_dir = prompts_dir
+        self.fingerprint = prompts_fingerprint(prompts_dir)
+        self.extractor_fingerprint = extractor_fingerprint(agents_dir)
+        self._lock = threading.Lock()
+
+        (self.cache_dir / "text").mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / "artifacts").mkdir(parents=True, exist_ok=True)
+        try:
+            # Other users must not be able to plant pickles for get_artifact
+            os.chmod(self.cache_dir, 0o700)
+        except OSError as e:
+            logger.warning(f"Could not restrict permissions of {self.cache_dir}: {e}")
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def digest(source: Any) -> str:
+        """Content hash of an extraction input."""
+        return source_digest(source)
+
+    @staticmethod
+    def text_digest(text: str) -> str:
+        """Hash of parsed text (never interpreted as a path, unlike digest)."""
+        return _sha256("parsed", text)
+
+    def prompt_version(self, *prompts: str) -> str:
+        """Version tag for the prompts an agent sends (includes the prompts fingerprint)."""
+        return f"{self.fingerprint}-{_sha256(*prompts)[:16]}"
+
+    @staticmethod
+    def artifact_key(
+        input_hash: str,
+        agent_type: str,
+        prompt_version: str,
+        model: Optional[str],
+        temperature: Optional[float],
+    ) -> str:
+        """
+        Cache key for an extracted artifact.
+
+        Args:
+            input_hash: Hash of what the LLM is sent; text_digest of the parsed
+                text for agents that parse sources, so parser or truncation
+                changes produce a new key
+        """
+        return _sha256(json.dumps([input_hash, agent_type, prompt_version, model, temperature]))
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def _text_path(self, source_hash: str, agent_type: str, params: Optional[Dict[str, Any]] = None) -> Path:
+        name = f"{source_hash}-{agent_type}"
+        if params:
+            name += "-" + _sha256(json.dumps(params, sort_keys=True, default=str))[:16]
+        return self.cache_dir / "text" / self.extractor_fingerprint / f"{name}.txt"
+
+    def _artifact_path(self, key: str) -> Path:
+        return self.cache_dir / "artifacts" / self.fingerprint / key[:2] / f"{key}.pkl"
+
+    def get_text(
+        self, source_hash: str, agent_type: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Parsed source text for the given extraction parameters, if cached."""
+        path = self._text_path(source_hash, agent_type, params)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        self._touch(path)
+        return text
+
+    def put_text(
+        self, source_hash: str, agent_type: str, text: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Cache parsed source text produced with the given extraction parameters."""
+        self._write(self._text_path(source_hash, agent_type, params), text.encode("utf-8"))
+
+    def get_artifact(self, key: str) -> Optional[Any]:
+        """Cached artifact for key, or None."""
+        path = self._artifact_path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:  # corrupt or from an incompatible code version
+            logger.warning(f"Discarding unreadable extraction cache entry {path.name}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+        self._touch(path)
+        self.hits += 1
+        return entry["artifact"]
+
+    def put_artifact(self, key: str, artifact: Any) -> None:
+        """Cache an extracted artifact."""
+        entry = {"artifact": artifact}
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Artifact of type {type(artifact).__name__} is not cacheable: {e}")
+            return
+        self._write(self._artifact_path(key), data)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate_stale(self) -> int:
+        """
+        Remove artifacts extracted under a different prompts fingerprint and
+        text parsed under a different extractor fingerprint.
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [
+            path for path in (self.cache_dir / "artifacts").glob("*/*/*.pkl")
+            if path.parent.parent.name != self.fingerprint
+        ]
+        stale += [
+            path for path in (self.cache_dir / "text").glob("*/*.txt")
+            if path.parent.name != self.extractor_fingerprint
+        ]
+        # Text written before entries were grouped by extractor fingerprint
+        stale += list((self.cache_dir / "text").glob("*.txt"))
+        for path in stale:
+            self._remove(path)
+        if stale:
+            logger.info(f"Invalidated {len(stale)} extraction cache entries after prompt or parser changes")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path, _, _ in list(self._entries()):
+            self._remove(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "prompts_fingerprint": self.fingerprint,
+            "extractor_fingerprint": self.extractor_fingerprint,
+        }
+
+    def _entries(self) -> Iterable[Tuple[Path, int, float]]:
+        for pattern in ("text/*.txt", "text/*/*.txt", "artifacts/*/*/*.pkl"):
+            for path in self.cache_dir.glob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            previous = path.stat().st_size if path.exists() else 0
+            temp.write_bytes(data)
+            os.replace(temp, path)
+            self._total_bytes += len(data) - previous
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """Evict least recently used entries down to 90% of the budget."""
+        target = int(self.max_bytes * 0.9)
+        entries: List[Tuple[Path, int, float]] = sorted(self._entries(), key=lambda e: e[2])
+        # Resync with disk in case another process wrote to the cache
+        self._total_bytes = sum(size for _, size, _ in entries)
+        for path, _, _ in entries:
+            if self._total_bytes <= target:
+                break
+            self._remove(path)
+            self.evictions += 1
+
+
+# Global extraction cache (None when disabled)
+_extraction_cache: Optional[ExtractionCache] = None
+_extraction_cache_loaded = False
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Get the extraction cache singleton, or None if disabled by configuration."""
+    global _extraction_cache, _extraction_cache_loaded
+    if not _extraction_cache_loaded:
+        _extraction_cache_loaded = True
+        if os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+            logger.info("Extraction cache disabled")
+        else:
+            _extraction_cache = ExtractionCache(
+                cache_dir=os.getenv("EXTRACTION_CACHE_DIR", DEFAULT_CACHE_DIR),
+                max_bytes=int(float(os.getenv("EXTRACTION_CACHE_MAX_MB", "512")) * 1024 * 1024),
+            )
+            _extraction_cache.invalidate_stale()
+    return _extraction_cache
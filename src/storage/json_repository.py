@@ -0,0 +1,395 @@
+"""Indexed, cached base for one-JSON-file-per-item repositories.
+
+Concrete repositories (projects, events, sessions, knowledge artifacts)
+store each item as ``<storage_dir>/<id>.json``. This base keeps decoded
+records in memory, maintains secondary indexes on selected fields and
+records index entries in an append-only manifest, so list and filter
+queries no longer open and parse every file on every call.
+
+Freshness:
+    Each cached record remembers the (mtime_ns, size) signature of its
+    file. Directory listings are re-validated with a single scandir when
+    the storage directory's mtime changes (files added, removed or
+    atomically replaced) and at least every ``revalidate_seconds``
+    otherwise, so in-place edits by other processes are picked up too.
+    Only files whose signature changed are re-read.
+
+Manifest:
+    ``.manifest.jsonl`` records ``put``/``delete`` entries with each
+    item's file signature and indexed field values. On startup it lets
+    the indexes be rebuilt without reading item files; records are then
+    loaded lazily, e.g. ``find("project_id", x)`` only reads the files of
+    matching items. The manifest is compacted when it grows well past the
+    number of live items.
+
+Records are cached as decoded JSON and turned into model objects on each
+read, so callers never share mutable instances with the cache.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Generic, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+from src.core.projects.exceptions import ProjectNotFoundError, StorageError
+from src.storage.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MANIFEST_NAME = ".manifest.jsonl"
+
+Signature = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+def index_key(value: Any) -> Any:
+    """Normalize an indexed field value (enums by value, others as JSON scalars)."""
+    if isinstance(value, Enum):
+        value = value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+@dataclass
+class _Entry:
+    """Cached state of one item file."""
+
+    signature: Signature
+    fields: Dict[str, Any] = field(default_factory=dict)
+    record: Optional[Dict[str, Any]] = None  # decoded JSON, loaded lazily
+
+
+class JsonFileRepository(BaseRepository[T], Generic[T]):
+    """Base class for JSON file repositories with caching and secondary indexes.
+
+    Subclasses set ``model`` (a class with ``to_dict``/``from_dict``),
+    ``noun``/``plural_noun`` for error messages and ``index_fields`` (model
+    attribute names), and expose public CRUD methods that delegate to the
+    ``_create``/``_get``/``_update``/``_delete``/``_list_all`` helpers and
+    ``find`` here.
+    """
+
+    model: Type[Any]
+    noun: str = "item"
+    plural_noun: str = "items"
+    index_fields: Tuple[str, ...] = ()
+    revalidate_seconds: float = 1.0
+
+    def _init_storage(self, storage_dir: Path) -> None:
+        """Create the storage directory and load the manifest."""
+        self.storage_dir = storage_dir
+        try:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise StorageError(
+                "initialization", f"Cannot create storage directory: {str(e)}"
+            )
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, _Entry] = {}
+        self._broken: Dict[str, Signature] = {}
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in self.index_fields}
+        self._dir_mtime: Optional[int] = None
+        self._last_scan = 0.0
+        self._manifest_path = self.storage_dir / MANIFEST_NAME
+        self._manifest_lines = 0
+        self._pending_manifest: List[Dict[str, Any]] = []
+
+        self._load_manifest()
+
+    # ------------------------------------------------------------------
+    # Paths, signatures and manifest
+    # ------------------------------------------------------------------
+
+    def _path(self, item_id: str) -> Path:
+        return self.storage_dir / f"{item_id}.json"
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> Signature:
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_manifest(self) -> None:
+        """Rebuild index entries from the manifest (records stay unloaded)."""
+        if not self._manifest_path.exists():
+            return
+        try:
+            with open(self._manifest_path, "r") as f:
+                for line in f:
+                    self._manifest_lines += 1
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        continue
+                    item_id = op.get("id")
+                    if not item_id:
+                        continue
+                    if op.get("op") == "delete":
+                        self._forget(item_id)
+                    elif op.get("op") == "put":
+                        fields = op.get("fields", {})
+                        self._remember(item_id, _Entry(tuple(op["sig"]), fields))
+        except OSError as e:
+            logger.warning(f"Could not read manifest {self._manifest_path}: {e}")
+
+    def _log(self, op: str, item_id: str, entry: Optional[_Entry] = None) -> None:
+        record: Dict[str, Any] = {"op": op, "id": item_id}
+        if entry is not None:
+            record["sig"] = list(entry.signature)
+            record["fields"] = entry.fields
+        self._pending_manifest.append(record)
+
+    def _flush_manifest(self) -> None:
+        """Append pending manifest records, compacting when it has grown too large."""
+        if not self._pending_manifest:
+            return
+        pending, self._pending_manifest = self._pending_manifest, []
+        try:
+            if self._manifest_lines + len(pending) > 2 * len(self._entries) + 64:
+                self._compact_manifest()
+                return
+            with open(self._manifest_path, "a") as f:
+                f.write("".join(json.dumps(r) + "\n" for r in pending))
+            self._manifest_lines += len(pending)
+        except OSError as e:
+            logger.warning(f"Could not update manifest {self._manifest_path}: {e}")
+
+    def _compact_manifest(self) -> None:
+        tmp_path = self._manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            for item_id, entry in self._entries.items():
+                f.write(json.dumps({"op": "put", "id": item_id, "sig": list(entry.signature), "fields": entry.fields}) + "\n")
+        os.replace(tmp_path, self._manifest_path)
+        self._manifest_lines = len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Cache and index maintenance
+    # ------------------------------------------------------------------
+
+    def _fields_of(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        item = self.model.from_dict(record)
+        return {name: index_key(getattr(item, name, None)) for name in self.index_fields}
+
+    def _remember(self, item_id: str, entry: _Entry) -> None:
+        self._forget(item_id)
+        self._entries[item_id] = entry
+        for name in self.index_fields:
+            self._indexes[name].setdefault(entry.fields.get(name), set()).add(item_id)
+
+    def _forget(self, item_id: str) -> None:
+        entry = self._entries.pop(item_id, None)
+        self._broken.pop(item_id, None)
+        if entry is None:
+            return
+        for name in self.index_fields:
+            postings = self._indexes[name].get(entry.fields.get(name))
+            if postings is not None:
+                postings.discard(item_id)
+                if not postings:
+                    del self._indexes[name][entry.fields.get(name)]
+
+    def _read(self, item_id: str, signature: Signature) -> _Entry:
+        """Read and index one item file (logged to the manifest only if its entry changed)."""
+        with open(self._path(item_id), "r") as f:
+            record = json.load(f)
+        entry = _Entry(signature, self._fields_of(record), record)
+        known = self._entries.get(item_id)
+        self._remember(item_id, entry)
+        if known is None or known.signature != entry.signature or known.fields != entry.fields:
+            self._log("put", item_id, entry)
+        return entry
+
+    def _sync(self, force: bool = False) -> None:
+        """Re-validate cached entries against the storage directory."""
+        try:
+            dir_mtime = self.storage_dir.stat().st_mtime_ns
+        except OSError as e:
+            raise StorageError("list_all", f"Cannot list {self.plural_noun}: {str(e)}")
+
+        now = time.monotonic()
+        if (
+            not force
+            and dir_mtime == self._dir_mtime
+            and now - self._last_scan < self.revalidate_seconds
+        ):
+            return
+
+        seen: Set[str] = set()
+        with os.scandir(self.storage_dir) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith(".json") or not dir_entry.is_file():
+                    continue
+                item_id = dir_entry.name[: -len(".json")]
+                seen.add(item_id)
+                signature = self._signature(dir_entry.stat())
+                cached = self._entries.get(item_id)
+                if cached is not None and cached.signature == signature:
+                    continue
+                if self._broken.get(item_id) == signature:
+                    continue
+                try:
+                    self._read(item_id, signature)
+                except Exception as e:
+                    print(f"Warning: Could not load {self.noun} from {dir_entry.path}: {str(e)}")
+                    self._forget(item_id)
+                    self._broken[item_id] = signature
+
+        for item_id in set(self._entries) - seen:
+            self._forget(item_id)
+            self._log("delete", item_id)
+        for item_id in set(self._broken) - seen:
+            del self._broken[item_id]
+
+        self._dir_mtime = dir_mtime
+        self._last_scan = now
+        self._flush_manifest()
+
+    def _record(self, item_id: str, entry: _Entry) -> Dict[str, Any]:
+        """Decoded record for an entry, reading the file on first access."""
+        if entry.record is None:
+            entry = self._read(item_id, entry.signature)
+        return entry.record
+
+    def _write(self, item_id: str, data: Dict[str, Any]) -> None:
+        """Atomically write an item file and update the cache and manifest."""
+        path = self._path(item_id)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+        # Re-decode so the cache holds exactly what is on disk
+        record = json.loads(json.dumps(data))
+        entry = _Entry(self._signature(path.stat()), self._fields_of(record), record)
+        self._remember(item_id, entry)
+        self._log("put", item_id, entry)
+        self._flush_manifest()
+
+    # ------------------------------------------------------------------
+    # CRUD helpers for subclasses
+    # ------------------------------------------------------------------
+
+    def _create(self, item: T, already_exists: Exception, touch: bool = False) -> T:
+        path = self._path(item.id)
+        with self._lock:
+            if path.exists():
+                raise already_exists
+            try:
+                if touch:
+                    item.updated_at = datetime.now()
+                self._write(item.id, item.to_dict())
+                return item
+            except Exception as e:
+                raise StorageError("create", f"Cannot save {self.noun}: {str(e)}")
+
+    def _get(self, item_id: str) -> T:
+        with self._lock:
+            try:
+                signature = self._signature(self._path(item_id).stat())
+            except FileNotFoundError:
+                raise ProjectNotFoundError(item_id)
+            try:
+                entry = self._entries.get(item_id)
+                if entry is None or entry.signature != signature:
+                    entry = self._read(item_id, signature)
+                    self._flush_manifest()
+                return self.model.from_dict(self._record(item_id, entry))
+            except Exception as e:
+                raise StorageError("get", f"Cannot load {self.noun}: {str(e)}")
+
+    def _update(self, item: T) -> T:
+        with self._lock:
+            if not self._path(item.id).exists():
+                raise ProjectNotFoundError(item.id)
+            try:
+                item.updated_at = datetime.now()
+                self._write(item.id, item.to_dict())
+                return item
+            except Exception as e:
+                raise StorageError("update", f"Cannot update {self.noun}: {str(e)}")
+
+    def _delete(self, item_id: str) -> None:
+        with self._lock:
+            path = self._path(item_id)
+            if not path.exists():
+                raise ProjectNotFoundError(item_id)
+            try:
+                path.unlink()
+            except Exception as e:
+                raise StorageError("delete", f"Cannot delete {self.noun}: {str(e)}")
+            self._forget(item_id)
+            self._log("delete", item_id)
+            self._flush_manifest()
+
+    def _materialize(self, item_ids: Iterable[str]) -> List[T]:
+        items: List[T] = []
+        for item_id in sorted(item_ids):
+            entry = self._entries.get(item_id)
+            if entry is None:
+                continue
+            try:
+                items.append(self.model.from_dict(self._record(item_id, entry)))
+            except Exception as e:
+                print(f"Warning: Could not load {self.noun} from {self._path(item_id)}: {str(e)}")
+        self._flush_manifest()
+        return items
+
+    def _list_all(self) -> List[T]:
+        try:
+            with self._lock:
+                self._sync()
+                return self._materialize(self._entries)
+        except StorageError:
+            raise
+        except Exception as e:
+            raise StorageError("list_all", f"Cannot list {self.plural_noun}: {str(e)}")
+
+    def find(self, field_name: str, value: Any) -> List[T]:
+        """List items whose indexed field equals value."""
+        if field_name not in self._indexes:
+            raise ValueError(f"Field '{field_name}' is not indexed")
+        with self._lock:
+            self._sync()
+            return self._materialize(self._indexes[field_name].get(index_key(value), ()))
+
+    # ------------------------------------------------------------------
+    # BaseRepository methods shared by all JSON repositories
+    # ------------------------------------------------------------------
+
+    def exists(self, item_id: str) -> bool:
+        """Check if an item exists."""
+        return self._path(item_id).exists()
+
+    def count(self) -> int:
+        """Count stored item files (including unreadable ones)."""
+        with self._lock:
+            self._sync()
+            return len(self._entries) + len(self._broken)
+
+    def clear(self) -> None:
+        """Delete all items."""
+        with self._lock:
+            try:
+                for item_file in self.storage_dir.glob("*.json"):
+                    item_file.unlink()
+                if self._manifest_path.exists():
+                    self._manifest_path.unlink()
+            except Exception as e:
+                raise StorageError("clear", f"Cannot clear repository: {str(e)}")
+            for item_id in list(self._entries):
+                self._forget(item_id)
+            self._broken.clear()
+            self._pending_manifest = []
+            self._manifest_lines = 0
+            self._dir_mtime = None
+
+    def invalidate(self) -> None:
+        """Force the next query to re-validate every file."""
+        with self._lock:
+            self._dir_mtime = None
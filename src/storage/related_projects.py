@@ -0,0 +1,364 @@
+"""
+Precomputed related-project index for MSR Event Hub.
+
+Each project is represented as a TF-IDF vector over its name,
+description, research area, keywords/tags and team members, and the top-k
+most cosine-similar projects are computed once when the catalog loads.
+Looking up a project's neighbors is then a dictionary read.
+
+Updates are incremental: upserting or removing a project rescores only
+that project against the rest through an inverted index and patches the
+neighbor lists it enters or leaves. Lists that lose an entry are marked
+stale and recomputed on their next lookup. IDF weights drift as projects
+change, so the index is fully rebuilt once the number of changes since
+the last build exceeds ``rebuild_ratio`` of the catalog.
+
+The full build uses NumPy matrix products when NumPy is installed and
+falls back to the inverted index otherwise.
+
+Usage:
+    index = RelatedProjectIndex(projects)
+    for project, score in index.similar("proj-vision-assist", limit=5):
+        ...
+"""
+
+import hashlib
+import json
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.storage.search_index import FIELD_WEIGHTS, tokenize
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is missing
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NEIGHBORS = 10
+# Rows scored per matrix product during a NumPy build (bounds memory to block x N)
+_BLOCK_ROWS = 256
+
+Neighbors = List[Tuple[str, float]]
+
+
+def project_features(project: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Weighted term frequencies describing a project.
+
+    Text fields contribute tokens weighted by FIELD_WEIGHTS; the research
+    area and team members also contribute whole-value features so that an
+    exact area or shared person counts for more than a shared word.
+    """
+    counts: Dict[str, float] = {}
+
+    def add(feature: str, weight: float) -> None:
+        counts[feature] = counts.get(feature, 0.0) + weight
+
+    for token in tokenize(project.get("name", "")):
+        add(token, FIELD_WEIGHTS["name"])
+    for token in tokenize(project.get("description", "")):
+        add(token, FIELD_WEIGHTS["description"])
+
+    area = project.get("researchArea") or ""
+    for token in tokenize(area):
+        add(token, FIELD_WEIGHTS["researchArea"])
+    if area.strip():
+        add(f"area:{area.strip().lower()}", FIELD_WEIGHTS["researchArea"])
+
+    for tag in list(project.get("keywords", []) or []) + list(project.get("tags", []) or []):
+        for token in tokenize(tag):
+            add(token, FIELD_WEIGHTS["tags"])
+
+    for member in project.get("team", []) or []:
+        name = (member.get("displayName") or member.get("name") or "").strip().lower()
+        if name:
+            add(f"person:{name}", FIELD_WEIGHTS["people"])
+
+    # Sublinear term frequency so long descriptions do not dominate
+    return {feature: 1.0 + math.log(weight) if weight > 1 else weight for feature, weight in counts.items()}
+
+
+def _fingerprint(features: Dict[str, float]) -> str:
+    return hashlib.sha1(json.dumps(features, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class RelatedProjectIndex:
+    """
+    Top-k cosine neighbors of every project, kept current incrementally.
+    """
+
+    def __init__(
+        self,
+        projects: Iterable[Dict[str, Any]] = (),
+        neighbors: int = DEFAULT_NEIGHBORS,
+        rebuild_ratio: float = 0.25,
+    ):
+        """
+        Build the index.
+
+        Args:
+            projects: Project dictionaries (kept by reference)
+            neighbors: Neighbors precomputed per project
+            rebuild_ratio: Fraction of changed projects that triggers a full rebuild
+        """
+        self.k = neighbors
+        self.rebuild_ratio = rebuild_ratio
+        self._projects: Dict[str, Dict[str, Any]] = {}
+        self._features: Dict[str, Dict[str, float]] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._df: Dict[str, int] = {}
+        self._idf: Dict[str, float] = {}
+        self._vectors: Dict[str, Dict[str, float]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._neighbors: Dict[str, Neighbors] = {}
+        self._stale: Set[str] = set()
+        self._changes = 0
+
+        for project in projects:
+            project_id = project.get("id")
+            if project_id:
+                self._store(project_id, project)
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def copy(self) -> "RelatedProjectIndex":
+        """
+        Independent copy of the index.
+
+        Feature and vector dicts are replaced rather than mutated on update,
+        so they are shared; posting and neighbor lists are copied. The copy
+        can be synced to new data while this index keeps serving lookups.
+        """
+        clone = RelatedProjectIndex.__new__(RelatedProjectIndex)
+        clone.k = self.k
+        clone.rebuild_ratio = self.rebuild_ratio
+        clone._projects = dict(self._projects)
+        clone._features = dict(self._features)
+        clone._fingerprints = dict(self._fingerprints)
+        clone._df = dict(self._df)
+        clone._idf = dict(self._idf)
+        clone._vectors = dict(self._vectors)
+        clone._postings = {feature: dict(postings) for feature, postings in self._postings.items()}
+        clone._neighbors = {pid: list(neighbors) for pid, neighbors in self._neighbors.items()}
+        clone._stale = set(self._stale)
+        clone._changes = self._changes
+        return clone
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._projects
+
+    # ------------------------------------------------------------------
+    # Vectors
+    # ------------------------------------------------------------------
+
+    def _store(self, project_id: str, project: Dict[str, Any]) -> None:
+        features = project_features(project)
+        self._projects[project_id] = project
+        self._features[project_id] = features
+        self._fingerprints[project_id] = _fingerprint(features)
+        for feature in features:
+            self._df[feature] = self._df.get(feature, 0) + 1
+
+    def _unstore(self, project_id: str) -> None:
+        self._unpost(project_id)
+        for feature in self._features.pop(project_id, {}):
+            self._df[feature] -= 1
+            if not self._df[feature]:
+                del self._df[feature]
+                self._idf.pop(feature, None)
+        self._projects.pop(project_id, None)
+        self._fingerprints.pop(project_id, None)
+
+    def _idf_of(self, feature: str) -> float:
+        idf = self._idf.get(feature)
+        if idf is None:
+            idf = math.log((1 + len(self._projects)) / (1 + self._df.get(feature, 0))) + 1.0
+            self._idf[feature] = idf
+        return idf
+
+    def _vectorize(self, project_id: str) -> None:
+        weights = {f: tf * self._idf_of(f) for f, tf in self._features[project_id].items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        vector = {f: w / norm for f, w in weights.items()} if norm else {}
+        self._vectors[project_id] = vector
+        for feature, weight in vector.items():
+            self._postings.setdefault(feature, {})[project_id] = weight
+
+    def _unpost(self, project_id: str) -> None:
+        for feature in self._vectors.pop(project_id, {}):
+            postings = self._postings.get(feature)
+            if postings is not None:
+                postings.pop(project_id, None)
+                if not postings:
+                    del self._postings[feature]
+
+    def _scores(self, project_id: str) -> Dict[str, float]:
+        """Cosine similarity of one project against every other via the inverted index."""
+        scores: Dict[str, float] = {}
+        for feature, weight in self._vectors.get(project_id, {}).items():
+            for other, other_weight in self._postings.get(feature, {}).items():
+                if other != project_id:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+        return scores
+
+    def _top(self, scores: Dict[str, float], limit: int) -> Neighbors:
+        ranked = sorted(((pid, s) for pid, s in scores.items() if s > 1e-12), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    # ------------------------------------------------------------------
+    # Build and maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Recompute IDF weights, vectors and every neighbor list."""
+        self._idf = {}
+        self._vectors = {}
+        self._postings = {}
+        for project_id in self._projects:
+            self._vectorize(project_id)
+
+        if np is not None and len(self._projects) > 1:
+            self._neighbors = self._neighbors_numpy()
+        else:
+            self._neighbors = {pid: self._top(self._scores(pid), self.k) for pid in self._projects}
+        self._stale.clear()
+        self._changes = 0
+        logger.debug(f"Built related-project index: {len(self._projects)} projects, {len(self._postings)} features")
+
+    def _neighbors_numpy(self) -> Dict[str, Neighbors]:
+        ids = list(self._projects)
+        columns = {feature: column for column, feature in enumerate(self._postings)}
+        matrix = np.zeros((len(ids), len(columns)), dtype=np.float32)
+        for row, project_id in enumerate(ids):
+            vector = self._vectors[project_id]
+            if vector:
+                matrix[row, [columns[f] for f in vector]] = list(vector.values())
+
+        k = min(self.k, len(ids) - 1)
+        neighbors: Dict[str, Neighbors] = {}
+        for start in range(0, len(ids), _BLOCK_ROWS):
+            block = matrix[start:start + _BLOCK_ROWS] @ matrix.T
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = -1.0  # exclude self
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            for offset, candidates in enumerate(top):
+                scores = {ids[c]: float(block[offset, c]) for c in candidates}
+                neighbors[ids[start + offset]] = self._top(scores, self.k)
+        return neighbors
+
+    def upsert(self, project: Dict[str, Any]) -> bool:
+        """
+        Add or update a project and patch affected neighbor lists.
+
+        Returns:
+            True if the project's features changed
+        """
+        project_id = project.get("id")
+        if not project_id:
+            raise ValueError("Project requires an 'id'")
+
+        features = project_features(project)
+        if self._fingerprints.get(project_id) == _fingerprint(features):
+            self._projects[project_id] = project
+            return False
+
+        self._unstore(project_id)
+        self._store(project_id, project)
+        self._vectorize(project_id)
+        if self._note_change():
+            return True
+
+        scores = self._scores(project_id)
+        self._neighbors[project_id] = self._top(scores, self.k)
+        for other, current in self._neighbors.items():
+            if other == project_id:
+                continue
+            previous = next((s for pid, s in current if pid == project_id), None)
+            score = scores.get(other, 0.0)
+            if previous is not None:
+                current[:] = [(pid, s) for pid, s in current if pid != project_id]
+                if score < previous:
+                    # A project beyond the cached top-k may now outrank it
+                    self._stale.add(other)
+            if score > 1e-12 and (len(current) < self.k or score > current[-1][1]):
+                current.append((project_id, score))
+                current.sort(key=lambda item: (-item[1], item[0]))
+                del current[self.k:]
+        return True
+
+    def remove(self, project_id: str) -> bool:
+        """
+        Remove a project from the index.
+
+        Returns:
+            True if the project was indexed
+        """
+        if project_id not in self._projects:
+            return False
+
+        self._unstore(project_id)
+        self._neighbors.pop(project_id, None)
+        self._stale.discard(project_id)
+        if self._note_change():
+            return True
+
+        for other, current in self._neighbors.items():
+            if any(pid == project_id for pid, _ in current):
+                current[:] = [(pid, s) for pid, s in current if pid != project_id]
+                self._stale.add(other)
+        return True
+
+    def sync(self, projects: Iterable[Dict[str, Any]]) -> int:
+        """
+        Bring the index in line with a new project list.
+
+        Unchanged projects are not rescored, so reloading event data only
+        costs as much as the projects that actually changed.
+
+        Returns:
+            Number of projects added, updated or removed
+        """
+        seen = set()
+        changed = 0
+        for project in projects:
+            project_id = project.get("id")
+            if not project_id:
+                continue
+            seen.add(project_id)
+            changed += self.upsert(project)
+        for project_id in [pid for pid in self._projects if pid not in seen]:
+            changed += self.remove(project_id)
+        return changed
+
+    def _note_change(self) -> bool:
+        """Count a change; rebuild (and return True) once IDF drift warrants it."""
+        self._changes += 1
+        if self._changes > max(1, self.rebuild_ratio * len(self._projects)):
+            self.rebuild()
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def neighbors(self, project_id: str, limit: Optional[int] = None) -> Neighbors:
+        """(project ID, cosine score) pairs most similar to a project, best first."""
+        if project_id not in self._projects:
+            return []
+        limit = self.k if limit is None else limit
+        if limit > self.k:
+            return self._top(self._scores(project_id), limit)
+        if project_id in self._stale:
+            self._neighbors[project_id] = self._top(self._scores(project_id), self.k)
+            self._stale.discard(project_id)
+        return self._neighbors.get(project_id, [])[:limit]
+
+    def similar(self, project_id: str, limit: int = 5) -> List[Tuple[Dict[str, Any], float]]:
+        """Projects most similar to a project with their scores, best first."""
+        return [(self._projects[pid], score) for pid, score in self.neighbors(project_id, limit)]
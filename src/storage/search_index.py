@@ -0,0 +1,273 @@
+"""
+Inverted-index full-text search for MSR Event Hub.
+
+Tokenizes projects, sessions and people into a field-aware inverted index
+and ranks matches with BM25. Query terms are matched conjunctively, and
+each term may also match indexed terms it is a prefix of, so "learn"
+finds "learning". Lookup cost depends on the number of postings touched,
+not on catalog size.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Relative importance of each indexed field when scoring
+FIELD_WEIGHTS: Dict[str, float] = {
+    "name": 3.0,
+    "researchArea": 2.0,
+    "tags": 2.0,
+    "people": 1.5,
+    "role": 1.0,
+    "description": 1.0,
+}
+
+# Score multiplier for terms matched by prefix expansion rather than exactly
+PREFIX_PENALTY = 0.7
+MIN_PREFIX_LENGTH = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass
+class SearchHit:
+    """A ranked search result."""
+
+    kind: str
+    id: str
+    score: float
+    document: Dict[str, Any]
+
+
+class SearchIndex:
+    """
+    Field-aware inverted index with BM25 ranking.
+
+    Usage:
+        index = SearchIndex.from_event_data(event_data)
+        hits = index.search("federated learning", kind="project", limit=10)
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._documents: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._field_lengths: List[Dict[str, int]] = []
+        self._total_field_length: Dict[str, int] = {}
+        # term -> doc index -> field -> term frequency
+        self._postings: Dict[str, Dict[int, Dict[str, int]]] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add_document(self, kind: str, doc_id: str, document: Dict[str, Any], fields: Dict[str, str]) -> None:
+        """
+        Index a document.
+
+        Args:
+            kind: Document type ("project", "session", "person")
+            doc_id: Stable identifier within kind
+            document: Source object returned with hits
+            fields: Field name to text; names should appear in FIELD_WEIGHTS
+        """
+        doc = len(self._documents)
+        self._documents.append((kind, doc_id, document))
+        lengths: Dict[str, int] = {}
+
+        for field, text in fields.items():
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            lengths[field] = len(tokens)
+            self._total_field_length[field] = self._total_field_length.get(field, 0) + len(tokens)
+            for token in tokens:
+                field_tf = self._postings.setdefault(token, {}).setdefault(doc, {})
+                field_tf[field] = field_tf.get(field, 0) + 1
+
+        self._field_lengths.append(lengths)
+        self._vocabulary = None
+
+    def _expand(self, token: str, prefix: bool) -> List[Tuple[str, float]]:
+        """Resolve a query token to indexed terms with their score multipliers."""
+        terms: List[Tuple[str, float]] = []
+        if token in self._postings:
+            terms.append((token, 1.0))
+        if not prefix or len(token) < MIN_PREFIX_LENGTH:
+            return terms
+
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        i = bisect_left(vocabulary, token)
+        while i < len(vocabulary) and vocabulary[i].startswith(token):
+            if vocabulary[i] != token:
+                terms.append((vocabulary[i], PREFIX_PENALTY))
+            i += 1
+        return terms
+
+    def _term_scores(self, term: str, fields: Optional[Iterable[str]]) -> Dict[int, float]:
+        """BM25 contribution of a single term for every document containing it."""
+        postings = self._postings[term]
+        total_docs = len(self._documents)
+        idf = math.log(1.0 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+        allowed = set(fields) if fields is not None else None
+
+        scores: Dict[int, float] = {}
+        for doc, field_tf in postings.items():
+            score = 0.0
+            for field, tf in field_tf.items():
+                if allowed is not None and field not in allowed:
+                    continue
+                avg_length = self._total_field_length[field] / total_docs
+                length = self._field_lengths[doc][field]
+                norm = 1.0 - self.b + self.b * length / avg_length
+                score += FIELD_WEIGHTS.get(field, 1.0) * tf * (self.k1 + 1.0) / (tf + self.k1 * norm)
+            if score:
+                scores[doc] = idf * score
+        return scores
+
+    def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        prefix: bool = True,
+    ) -> List[SearchHit]:
+        """
+        Search the index.
+
+        Every query token must match (exactly or by prefix) for a document
+        to be returned. Results are ordered by descending BM25 score, ties
+        broken by indexing order.
+
+        Args:
+            query: Free-text query
+            kind: Restrict to one document type
+            fields: Restrict matching to these fields
+            limit: Maximum number of hits
+            prefix: Allow prefix matching of query tokens
+
+        Returns:
+            Ranked search hits
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self._documents:
+            return []
+        fields = tuple(fields) if fields is not None else None
+
+        totals: Optional[Dict[int, float]] = None
+        for token in tokens:
+            token_scores: Dict[int, float] = {}
+            for term, multiplier in self._expand(token, prefix):
+                for doc, score in self._term_scores(term, fields).items():
+                    if kind is not None and self._documents[doc][0] != kind:
+                        continue
+                    token_scores[doc] = max(token_scores.get(doc, 0.0), score * multiplier)
+
+            if totals is None:
+                totals = token_scores
+            else:
+                totals = {doc: totals[doc] + score for doc, score in token_scores.items() if doc in totals}
+            if not totals:
+                return []
+
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        hits = []
+        for doc, score in ranked:
+            doc_kind, doc_id, document = self._documents[doc]
+            hits.append(SearchHit(kind=doc_kind, id=doc_id, score=round(score, 4), document=document))
+        return hits
+
+    @classmethod
+    def from_event_data(
+        cls,
+        projects: List[Dict[str, Any]],
+        sessions: Optional[List[Dict[str, Any]]] = None,
+        people: Optional[List[Dict[str, Any]]] = None,
+    ) -> "SearchIndex":
+        """
+        Build an index over projects, sessions and people.
+
+        Team members and speakers that are not listed in people are indexed
+        as people as well, keyed by display name.
+        """
+        index = cls()
+
+        for project in projects:
+            team = [_person_name(m) for m in project.get("team", []) or []]
+            index.add_document(
+                "project",
+                project.get("id", ""),
+                project,
+                {
+                    "name": project.get("name", ""),
+                    "description": project.get("description", ""),
+                    "researchArea": project.get("researchArea", ""),
+                    "tags": " ".join(project.get("tags", []) or []),
+                    "people": " ".join(team),
+                },
+            )
+
+        for session in sessions or []:
+            speakers = [_person_name(s) for s in session.get("speakers", []) or []]
+            index.add_document(
+                "session",
+                session.get("id", ""),
+                session,
+                {
+                    "name": session.get("title", ""),
+                    "description": session.get("description", ""),
+                    "people": " ".join(speakers),
+                },
+            )
+
+        seen = set()
+        for person in people or []:
+            name = _person_name(person)
+            seen.add(name.lower())
+            index.add_document(
+                "person",
+                person.get("id") or name,
+                person,
+                {
+                    "name": name,
+                    "role": person.get("role", ""),
+                    "researchArea": " ".join(person.get("researchAreas", []) or []),
+                },
+            )
+
+        members = [m for p in projects for m in p.get("team", []) or []]
+        members += [s for sess in sessions or [] for s in sess.get("speakers", []) or []]
+        for member in members:
+            name = _person_name(member)
+            if not name or name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            index.add_document("person", name, member, {"name": name, "role": member.get("role", "")})
+
+        return index
+
+
+def _person_name(person: Dict[str, Any]) -> str:
+    return person.get("displayName") or person.get("name") or ""
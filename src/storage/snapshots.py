@@ -0,0 +1,174 @@
+"""
+Hot reload of event data snapshots.
+
+Organizers update the event data file during the event (e.g. by re-running
+scripts/import_rrs_csv.py). SnapshotManager polls the file's modification
+time and size from a background thread; when it changes, the file is parsed
+and a new catalog is built on that thread, then published with
+publish_snapshot. Requests keep using the previous snapshot until the swap,
+and every cache keyed on the data version misses afterwards.
+
+A file that fails to parse (for instance one caught mid-write by a
+non-atomic editor) is skipped and the current snapshot stays live.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.storage import event_data
+from src.storage.catalog import EventDataSnapshot, build_catalog, get_snapshot, publish_snapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_SECONDS = 2.0
+
+Signature = Tuple[int, int]
+
+
+class SnapshotManager:
+    """
+    Watches the event data file and publishes new snapshots when it changes.
+
+    Usage:
+        manager = get_snapshot_manager()
+        manager.start()     # background polling
+        manager.reload()    # or force a reload now
+    """
+
+    def __init__(
+        self,
+        loader: Optional[event_data.EventDataLoader] = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ):
+        """
+        Args:
+            loader: Event data loader whose file is watched (default: global loader)
+            poll_seconds: Interval between file checks
+        """
+        self.loader = loader or event_data.get_event_data_loader()
+        self.poll_seconds = poll_seconds
+        self._signature: Optional[Signature] = self._read_signature()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_seconds = 0.0
+
+    @property
+    def path(self) -> Path:
+        return self.loader.data_file
+
+    def _read_signature(self) -> Optional[Signature]:
+        try:
+            stat = os.stat(self.loader.data_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> Optional[EventDataSnapshot]:
+        """
+        Reload if the file changed since the last check.
+
+        Returns:
+            The new snapshot, or None if nothing was published
+        """
+        signature = self._read_signature()
+        if signature is None or signature == self._signature:
+            return None
+        return self.reload(signature)
+
+    def reload(self, signature: Optional[Signature] = None) -> Optional[EventDataSnapshot]:
+        """
+        Parse the data file, build its catalog and publish it as a new snapshot.
+
+        Returns:
+            The new snapshot, or None if the file could not be loaded
+        """
+        with self._lock:
+            signature = signature or self._read_signature()
+            started = time.perf_counter()
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data: Dict[str, Any] = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                self.failures += 1
+                logger.warning(f"Keeping current event data snapshot; failed to load {self.path}: {e}")
+                return None
+            # Retry a failed parse on the next poll only if the file changes again
+            self._signature = signature
+
+            catalog = build_catalog(data, get_snapshot())
+            snapshot = publish_snapshot(data, catalog)
+            self.reloads += 1
+            self.last_reload_seconds = time.perf_counter() - started
+            return snapshot
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Event data reload failed: {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Start polling the data file in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="event-data-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {self.path} for event data changes (every {self.poll_seconds}s)")
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reload statistics."""
+        snapshot = get_snapshot()
+        return {
+            "version": snapshot.version,
+            "projects": len(snapshot.catalog),
+            "created_at": snapshot.created_at,
+            "watching": self._thread is not None and self._thread.is_alive(),
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload_seconds": self.last_reload_seconds,
+        }
+
+
+# Global snapshot manager instance
+_snapshot_manager: Optional[SnapshotManager] = None
+
+
+def get_snapshot_manager() -> SnapshotManager:
+    """Get the snapshot manager singleton (poll interval from EVENT_DATA_POLL_SECONDS)."""
+    global _snapshot_manager
+    if _snapshot_manager is None:
+        poll_seconds = float(os.getenv("EVENT_DATA_POLL_SECONDS", str(DEFAULT_POLL_SECONDS)))
+        _snapshot_manager = SnapshotManager(poll_seconds=poll_seconds)
+    return _snapshot_manager
+
+
+def start_snapshot_watcher() -> Optional[SnapshotManager]:
+    """Start hot reload unless EVENT_DATA_HOT_RELOAD is "0"."""
+    if os.getenv("EVENT_DATA_HOT_RELOAD", "1") == "0":
+        return None
+    manager = get_snapshot_manager()
+    manager.start()
+    return manager
+
+
+def stop_snapshot_watcher() -> None:
+    """Stop hot reload if it was started."""
+    if _snapshot_manager is not None:
+        _snapshot_manager.stop()
@@ -0,0 +1,170 @@
+"""
+Bounded-concurrency scheduler for artifact extraction.
+
+Extraction is dominated by LLM round trips, so running artifacts one after
+another makes a showcase take the sum of all of them. The scheduler runs
+jobs concurrently under a global limit plus optional per-provider limits
+(so one rate-limited endpoint cannot be flooded), reads input files off the
+event loop, and returns results in job order regardless of completion
+order. Progress is tracked per project.
+
+Usage:
+    scheduler = ExtractionScheduler(max_concurrency=8, provider_limits={"azure-openai": 4})
+    jobs = [ExtractionJob(project="proj-a", artifact_type="papers", source=path, provider="azure-openai")]
+    results = await scheduler.run(jobs, extract)   # extract(job, content) -> artifact
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# How each artifact type's input is read before being handed to its agent
+READ_MODES: Dict[str, Optional[str]] = {
+    "papers": "rb",
+    "talks": "r",
+    "repositories": None,  # repository agents take the directory path
+}
+
+
+@dataclass
+class ExtractionJob:
+    """A single artifact to extract."""
+
+    project: str
+    artifact_type: str
+    source: Path
+    provider: str = "default"
+
+
+@dataclass
+class ExtractionOutcome:
+    """Result of one extraction job."""
+
+    job: ExtractionJob
+    result: Any = None
+    error: Optional[BaseException] = None
+    duration_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ProjectProgress:
+    """Extraction progress for one project."""
+
+    project: str
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def done(self) -> bool:
+        return self.completed + self.failed >= self.total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "project": self.project,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed_seconds": round(time.monotonic() - self.started_at, 3),
+        }
+
+
+ExtractFn = Callable[[ExtractionJob, Any], Awaitable[Any]]
+ProgressCallback = Callable[[ProjectProgress, ExtractionOutcome], None]
+
+
+async def read_source(job: ExtractionJob) -> Any:
+    """Read a job's input without blocking the event loop."""
+    mode = READ_MODES.get(job.artifact_type, "rb")
+    if mode is None:
+        return job.source
+    if mode == "rb":
+        return await asyncio.to_thread(job.source.read_bytes)
+    return await asyncio.to_thread(job.source.read_text, encoding="utf-8")
+
+
+class ExtractionScheduler:
+    """Runs extraction jobs with global and per-provider concurrency limits."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        provider_limits: Optional[Dict[str, int]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        read: Callable[[ExtractionJob], Awaitable[Any]] = read_source,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum extractions in flight overall
+            provider_limits: Maximum extractions in flight per provider
+            on_progress: Called after every job with its project's progress
+            read: Coroutine loading a job's input (defaults to async file reads)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.provider_limits = dict(provider_limits or {})
+        self.on_progress = on_progress
+        self.read = read
+        self.progress: Dict[str, ProjectProgress] = {}
+
+    def _provider_semaphores(self, jobs: List[ExtractionJob]) -> Dict[str, asyncio.Semaphore]:
+        semaphores = {}
+        for job in jobs:
+            if job.provider not in semaphores:
+                limit = self.provider_limits.get(job.provider, self.max_concurrency)
+                semaphores[job.provider] = asyncio.Semaphore(max(1, limit))
+        return semaphores
+
+    async def run(self, jobs: List[ExtractionJob], extract: ExtractFn) -> List[ExtractionOutcome]:
+        """
+        Run all jobs and return their outcomes in the same order as jobs.
+
+        A failing job does not cancel the others; its outcome carries the error.
+        """
+        self.progress = {}
+        for job in jobs:
+            self.progress.setdefault(job.project, ProjectProgress(job.project)).total += 1
+
+        overall = asyncio.Semaphore(self.max_concurrency)
+        providers = self._provider_semaphores(jobs)
+
+        async def run_one(job: ExtractionJob) -> ExtractionOutcome:
+            # Acquire the provider slot first so jobs waiting on a saturated
+            # provider do not hold global slots other providers could use
+            async with providers[job.provider], overall:
+                started = time.monotonic()
+                try:
+                    content = await self.read(job)
+                    outcome = ExtractionOutcome(job, result=await extract(job, content))
+                except Exception as e:
+                    logger.warning(f"Extraction failed for {job.source}: {e}")
+                    outcome = ExtractionOutcome(job, error=e)
+                outcome.duration_seconds = time.monotonic() - started
+
+            progress = self.progress[job.project]
+            if outcome.ok:
+                progress.completed += 1
+            else:
+                progress.failed += 1
+            if self.on_progress is not None:
+                self.on_progress(progress, outcome)
+            return outcome
+
+        return list(await asyncio.gather(*(run_one(job) for job in jobs)))
+
+    def get_progress(self) -> Dict[str, Dict[str, Any]]:
+        """Per-project progress snapshot."""
+        return {name: progress.to_dict() for name, progress in self.progress.items()}
@@ -24,6 +24,23 @@ from src.core.schemas.talk_schema import TalkKnowledgeArtifact
 from src.core.schemas.repository_schema import RepositoryKnowledgeArtifact
 from src.evaluation.expert_review import ExpertReview, ReviewDimension, run_expert_review
 from src.workflows.project_compilation import compile_project_knowledge
+from src.workflows.extraction_scheduler import (
+    DEFAULT_MAX_CONCURRENCY,
+    ExtractionJob,
+    ExtractionOutcome,
+    ExtractionScheduler,
+    ProjectProgress,
+)
+
+
+def _provider_of(agent: Any) -> str:
+    """Concurrency-limit key for an agent: its LLM provider or model deployment."""
+    provider = getattr(agent, "llm_provider", None)
+    if provider:
+        return provider
+    settings = getattr(agent, "settings", None)
+    model = getattr(settings, "agent_model", None)
+    return model or type(agent).__name__
 
 
 class POCWorkflowManager:
@@ -35,7 +52,9 @@ class POCWorkflowManager:
         outputs_dir: Path,
         minimum_expert_rating: float = 3.0,
         require_human_approval: bool = False,
-        max_iterations: int = 2
+        max_iterations: int = 2,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        provider_limits: Optional[Dict[str, int]] = None
     ):
         """
         Initialize POC workflow manager.
@@ -46,12 +65,16 @@ class POCWorkflowManager:
             minimum_expert_rating: Minimum acceptable expert review score (1-5)
             require_human_approval: Whether human approval is required
             max_iterations: Maximum extract-review-iterate cycles
+            max_concurrency: Maximum extractions running at once
+            provider_limits: Per-provider extraction limits (provider -> max in flight)
         """
         self.inputs_dir = Path(inputs_dir)
         self.outputs_dir = Path(outputs_dir)
         self.minimum_expert_rating = minimum_expert_rating
         self.require_human_approval = require_human_approval
         self.max_iterations = max_iterations
+        self.max_concurrency = max_concurrency
+        self.provider_limits = provider_limits or {}
         
         # Create output directories
         self.outputs_dir.mkdir(parents=True, exist_ok=True)
@@ -184,38 +207,47 @@ class POCWorkflowManager:
         """
         print("\n=== STEP 4: Extract Knowledge ===")
         
-        all_extractions = {}
+        # One job per artifact, in project order; results come back in this order
+        jobs = [
+            ExtractionJob(
+                project=project_name,
+                artifact_type=artifact_type,
+                source=path,
+                provider=_provider_of(agents[artifact_type])
+            )
+            for project_name, project_artifacts in projects.items()
+            for artifact_type in ("papers", "talks", "repositories")
+            for path in project_artifacts.get(artifact_type, [])
+        ]
         
-        for project_name, project_artifacts in projects.items():
-            print(f"\nProcessing project: {project_name}")
-            project_extractions = []
-            
-            # Process papers
-            for paper_path in project_artifacts["papers"]:
-                print(f"  Extracting: {paper_path.name}")
-                with open(paper_path, "rb") as f:
-                    content = f.read()
-                
-                result = await agents["papers"].extract(content)
-                project_extractions.append(result)
-            
-            # Process talks
-            for talk_path in project_artifacts["talks"]:
-                print(f"  Extracting: {talk_path.name}")
-                with open(talk_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                result = await agents["talks"].extract(content)
-                project_extractions.append(result)
-            
-            # Process repositories
-            for repo_path in project_artifacts["repositories"]:
-                print(f"  Extracting: {repo_path.name}")
-                result = await agents["repositories"].extract(repo_path)
-                project_extractions.append(result)
-            
-            all_extractions[project_name] = project_extractions
-            print(f"  Extracted {len(project_extractions)} artifacts for {project_name}")
+        def report(progress: ProjectProgress, outcome: ExtractionOutcome) -> None:
+            status = "Extracted" if outcome.ok else "Failed"
+            print(
+                f"  [{progress.project}] {status}: {outcome.job.source.name} "
+                f"({progress.completed + progress.failed}/{progress.total}, "
+                f"{outcome.duration_seconds:.1f}s)"
+            )
+            if progress.done:
+                print(f"  Extracted {progress.completed} artifacts for {progress.project}")
+        
+        async def extract(job: ExtractionJob, content: Any) -> BaseKnowledgeArtifact:
+            return await agents[job.artifact_type].extract(content)
+        
+        scheduler = ExtractionScheduler(
+            max_concurrency=self.max_concurrency,
+            provider_limits=self.provider_limits,
+            on_progress=report
+        )
+        print(f"Scheduling {len(jobs)} extractions (concurrency {self.max_concurrency})")
+        outcomes = await scheduler.run(jobs, extract)
+        
+        failures = [outcome for outcome in outcomes if not outcome.ok]
+        if failures:
+            raise failures[0].error
+        
+        all_extractions = {project_name: [] for project_name in projects}
+        for outcome in outcomes:
+            all_extractions[outcome.job.project].append(outcome.result)
         
         return all_extractions
     
@@ -283,6 +283,23 @@ class TestSearchHandlers:
         assert "alice" in text.lower()
         assert "alice" in context.selected_researchers
 
+    @pytest.mark.asyncio
+    @patch("src.storage.event_data.get_event_data")
+    async def test_search_results_feed_back_to_results(self, mock_get_data, mock_projects, context):
+        """Search results are kept for back_to_results."""
+        from src.api.actions.navigation.handlers import BackToResultsHandler
+        from src.api.actions.search.handlers import ResearcherSearchHandler
+
+        mock_get_data.return_value = {"projects": mock_projects}
+
+        await ResearcherSearchHandler("researcher_search").execute(
+            {"action": "researcher_search", "researcher": "Alice"}, context
+        )
+        assert context.last_results
+
+        text, card = await BackToResultsHandler("back_to_results").execute({}, context)
+        assert f"Showing {len(context.last_results)} results" in text
+
 
 class TestNavigationHandlers:
     """Test navigation action handlers."""
@@ -306,6 +323,24 @@ class TestNavigationHandlers:
         assert "proj-1" in context.viewed_projects
         assert context.conversation_stage == "project_detail"
 
+    @pytest.mark.asyncio
+    @patch("src.storage.event_data.get_event_data")
+    async def test_find_similar(self, mock_get_data, mock_projects, context):
+        """Test find_similar ranks precomputed neighbors of the project."""
+        from src.api.actions.navigation.handlers import FindSimilarHandler
+
+        similar = dict(mock_projects[2], id="proj-4", name="Security Frameworks Lab")
+        mock_get_data.return_value = {"projects": mock_projects + [similar]}
+
+        handler = FindSimilarHandler("find_similar")
+        text, card = await handler.execute({"action": "find_similar", "projectId": "proj-3"}, context)
+
+        assert "Found 1 projects similar to Security Frameworks" in text
+        assert "1. **Security Frameworks Lab**" in text
+
+        text, card = await handler.execute({"action": "find_similar", "researchArea": "Systems"}, context)
+        assert "Systems Programming" in text
+
     @pytest.mark.asyncio
     async def test_back_to_results(self, context):
         """Test back_to_results handler."""
@@ -481,6 +516,68 @@ class TestSessionCache:
         session_cache.toggle(True)
         assert session_cache.enabled
 
+    def test_cache_lru_eviction_by_entries(self):
+        """Test least-recently-used entry is evicted at max_entries."""
+        cache = SessionCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get_stats()["per_key"]["b"]["evictions"] == 1
+
+    def test_cache_eviction_by_bytes(self):
+        """Test entries are evicted to stay under max_bytes."""
+        cache = SessionCache(max_bytes=100)
+        cache.set("a", {"v": "x" * 60})
+        cache.set("b", {"v": "y" * 60})
+
+        stats = cache.get_stats()
+        assert stats["keys"] == ["b"]
+        assert stats["bytes"] <= 100
+
+    def test_cache_hit_rate(self, session_cache):
+        """Test hit/miss accounting."""
+        session_cache.get("projects")
+        session_cache.set("projects", {"list": []})
+        session_cache.get("projects")
+
+        stats = session_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_single_flight(self, session_cache):
+        """Test concurrent misses share one loader call."""
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"list": [1, 2, 3]}
+
+        results = await asyncio.gather(
+            *[session_cache.get_or_load("projects", loader) for _ in range(10)]
+        )
+
+        assert calls == 1
+        assert all(r == {"list": [1, 2, 3]} for r in results)
+        assert session_cache.get("projects") == {"list": [1, 2, 3]}
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_error_not_cached(self, session_cache):
+        """Test loader errors propagate and are not cached."""
+        def loader():
+            raise RuntimeError("storage unavailable")
+
+        with pytest.raises(RuntimeError):
+            await session_cache.get_or_load("projects", loader)
+        assert session_cache.get_stats()["entries"] == 0
+
 
 # Registry tests
 class TestActionRegistry:
@@ -529,6 +626,38 @@ class TestActionRegistry:
         assert "test_action" in actions
         assert actions["test_action"]["description"] == "Test action"
 
+    @pytest.mark.asyncio
+    async def test_cacheable_action_applies_context_only(self, context):
+        """Test apply_context runs update_context without executing."""
+        registry = ActionRegistry()
+
+        class TestHandler(BaseActionHandler):
+            executed = False
+
+            async def execute(self, payload, context):
+                TestHandler.executed = True
+                return "test", None
+
+            async def update_context(self, payload, context):
+                context.conversation_stage = "show_results"
+
+        registry.register("test_action", TestHandler("test"), cacheable=True)
+        assert registry.is_cacheable("test_action")
+        assert not registry.is_cacheable("missing")
+
+        await registry.apply_context("test_action", {}, context)
+        assert context.conversation_stage == "show_results"
+        assert not TestHandler.executed
+
+    def test_deterministic_handlers_are_cacheable(self):
+        """Test data-only handlers opt in to response caching."""
+        from src.api import action_init  # noqa: F401
+
+        registry = get_registry()
+        for action in ("browse_all", "show_featured", "category_select", "filter_by_area"):
+            assert registry.is_cacheable(action)
+        assert not registry.is_cacheable("bookmark")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+"""Tests for compiled Adaptive Card templates."""
+
+from src.api.card_renderer import AdaptiveCardRenderer
+from src.api.card_templates import CompiledTemplate, compile_condition, compile_string
+
+
+def test_compile_string_bindings_and_variables():
+    render = compile_string("$data.user.name works on ${title} ($$5, $missing)")
+    assert render({"user": {"name": "Ana"}, "title": "Graphs"}) == "Ana works on Graphs ($5, $missing)"
+    assert render({}) == " works on ${title} ($5, $missing)"
+
+
+def test_static_string_is_constant():
+    assert compile_string("plain text")({"anything": 1}) == "plain text"
+
+
+def test_compile_condition():
+    assert compile_condition('$data.kind == "demo"')({"kind": "demo"})
+    assert not compile_condition('$data.kind != "demo"')({"kind": "demo"})
+    assert compile_condition("not $data.flag or ($data.count == 3)")({"flag": True, "count": 3})
+    assert not compile_condition("$data.missing.path")({})
+    # Empty and unsupported expressions always show the element
+    assert compile_condition("") is None
+    assert compile_condition("$data.a < 3") is None
+    assert compile_condition("$data.a == false") is None
+
+
+def test_conditional_elements_and_nulls_dropped():
+    template = {
+        "type": "AdaptiveCard",
+        "fallbackText": None,
+        "body": [
+            {"type": "TextBlock", "text": "$data.title", "$when": "$data.title != None"},
+            {"type": "TextBlock", "text": "Hidden", "$when": "$data.show"},
+            None,
+        ],
+    }
+    compiled = CompiledTemplate(template)
+    assert compiled.render({"title": "Hello", "show": False}) == {
+        "type": "AdaptiveCard",
+        "body": [{"type": "TextBlock", "text": "Hello"}],
+    }
+    assert CompiledTemplate({"$when": "$data.show"}).render({}) is None
+
+
+def test_substitution_only_mode_keeps_when_and_nulls():
+    template = {"text": "${title}", "$when": "$data.show", "extra": None}
+    rendered = CompiledTemplate(template, conditionals=False).render({"title": "T", "show": True})
+    assert rendered == {"text": "T", "$when": "True", "extra": None}
+
+
+def test_renders_return_fresh_structures():
+    renderer = AdaptiveCardRenderer()
+    first = renderer.render_project_card("A", "AI", "Desc", "Team")
+    first["body"] = []
+    second = renderer.render_project_card("A", "AI", "Desc", "Team")
+    assert second["body"]
+    assert ("project_card_template", False) in renderer._compiled_cache
@@ -0,0 +1,116 @@
+"""
+Tests for the indexed project catalog.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.storage.catalog import ProjectCatalog, get_project_catalog, reset_project_catalog
+
+
+@pytest.fixture
+def projects():
+    """Small project set covering every indexed field."""
+    return [
+        {
+            "id": "proj-1",
+            "name": "Neural Code Intelligence",
+            "description": "Transformer models for code generation",
+            "researchArea": "Artificial Intelligence",
+            "team": [{"displayName": "Dr. Sarah Chen"}, {"name": "Alex Rodriguez"}],
+            "equipment": ["Large Display", "Demo Laptop"],
+            "recordingPermission": "allowed",
+            "commsStatus": "approved",
+            "maturity": "prototype",
+            "featured": True,
+        },
+        {
+            "id": "proj-2",
+            "name": "Quantum Error Correction",
+            "description": "Fault tolerant qubits",
+            "researchArea": "Quantum Computing",
+            "team": [{"displayName": "Dr. Michael Zhang"}],
+            "equipment": ["Monitor"],
+            "recordingPermission": "restricted",
+            "commsStatus": "pending",
+            "maturity": "early_research",
+        },
+        {
+            "id": "proj-3",
+            "name": "Agentic Assistants",
+            "description": "Interactive AI agents on devices",
+            "researchArea": "AI Agents",
+            "team": [{"displayName": "Sarah Chen"}, {"displayName": "Priya Patel"}, {"displayName": "Li Wei"}],
+            "equipment": ["Large Display"],
+            "recordingPermission": "allowed",
+            "commsStatus": "approved",
+            "maturity": "production",
+        },
+    ]
+
+
+@pytest.fixture
+def catalog(projects):
+    return ProjectCatalog(projects)
+
+
+class TestProjectCatalog:
+    """Index lookups and posting-set intersection."""
+
+    def test_get_by_id(self, catalog):
+        assert catalog.get("proj-2")["name"] == "Quantum Error Correction"
+        assert catalog.get("missing") is None
+
+    def test_lookup_exact_is_case_insensitive(self, catalog):
+        assert catalog.lookup("commsStatus", "APPROVED") == {0, 2}
+        assert catalog.lookup("maturity", "prototype") == {0}
+
+    def test_match_substring(self, catalog):
+        assert catalog.match("researchArea", "intelligence") == {0}
+        assert catalog.match("equipment", "display") == {0, 2}
+
+    def test_filter_intersects_criteria(self, catalog):
+        result = catalog.filter(equipment="large display", team="sarah chen", maturity="production")
+        assert [p["id"] for p in result] == ["proj-3"]
+
+    def test_filter_preserves_source_order(self, catalog):
+        result = catalog.filter(recordingPermission="allowed")
+        assert [p["id"] for p in result] == ["proj-1", "proj-3"]
+
+    def test_filter_no_criteria_returns_all(self, catalog):
+        assert len(catalog.filter()) == 3
+
+    def test_filter_unknown_field_raises(self, catalog):
+        with pytest.raises(ValueError):
+            catalog.filter(colour="blue")
+
+    def test_team_size_and_featured(self, catalog):
+        assert catalog.team_size_rows(2, 3) == {0, 2}
+        assert catalog.featured_rows() == {0}
+
+    def test_search_is_ranked(self, catalog):
+        assert [p["id"] for p in catalog.search("QUBITS")] == ["proj-2"]
+        assert catalog.search("agents")[0]["id"] == "proj-3"
+
+    def test_category_counts(self, catalog):
+        counts = catalog.get_category_counts()
+        assert counts == {"Artificial Intelligence": 1, "Quantum Computing": 1, "AI Agents": 1}
+
+
+class TestGlobalCatalog:
+    """Global catalog tracks the loaded event data."""
+
+    def test_rebuilds_when_data_changes(self, projects):
+        reset_project_catalog()
+        first = {"projects": projects}
+        second = {"projects": projects[:1]}
+
+        with patch("src.storage.event_data.get_event_data", return_value=first):
+            catalog = get_project_catalog()
+            assert get_project_catalog() is catalog
+            assert len(catalog) == 3
+
+        with patch("src.storage.event_data.get_event_data", return_value=second):
+            assert len(get_project_catalog()) == 1
+
+        reset_project_catalog()
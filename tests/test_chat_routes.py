@@ -0,0 +1,102 @@
+"""
+Integration tests for the hybrid chat endpoint.
+
+Skipped when the chat router's Azure/Foundry dependencies cannot be imported.
+"""
+
+import json
+
+import pytest
+
+chat_routes = pytest.importorskip("src.api.chat_routes", exc_type=ImportError)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import conversation_context, query_executor
+from src.api.conversation_context import ConversationContextStore
+from src.api.query_executor import QueryPlanExecutor
+from src.api.router_config import router_config
+from src.storage.catalog import ProjectCatalog
+
+
+PROJECTS = [
+    {"id": "proj-1", "name": "Quantum Error Correction", "researchArea": "Quantum Computing",
+     "description": "Fault tolerant qubits"},
+    {"id": "proj-2", "name": "Neural Code Intelligence", "researchArea": "AI",
+     "description": "Transformer models for code generation"},
+]
+
+
+def _frames(response):
+    """Decode the JSON payloads of an SSE response, dropping the [DONE] marker."""
+    frames = []
+    for line in response.text.splitlines():
+        if line.startswith("data: ") and line != "data: [DONE]":
+            frames.append(json.loads(line[len("data: "):]))
+    return frames
+
+
+@pytest.fixture
+def client(monkeypatch):
+    catalog = ProjectCatalog(PROJECTS)
+    executor = QueryPlanExecutor(catalog_provider=lambda: catalog, version_provider=lambda: 1)
+    monkeypatch.setattr(query_executor, "_executor", executor)
+    monkeypatch.setattr("src.storage.catalog.get_project_catalog", lambda: catalog)
+    monkeypatch.setattr("src.storage.catalog.get_data_version", lambda: 1)
+
+    async def no_llm(payload):
+        raise AssertionError("deterministic queries must not reach Azure OpenAI")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(chat_routes, "_forward_stream", no_llm)
+
+    app = FastAPI()
+    app.include_router(chat_routes.get_chat_router())
+    return TestClient(app)
+
+
+def test_deterministic_plan_is_executed_locally(client, monkeypatch):
+    # Exercise the executor branch independently of classifier calibration
+    monkeypatch.setattr(router_config, "deterministic_threshold", 0.5)
+    response = client.post("/api/chat/stream", json={
+        "messages": [{"role": "user", "content": "Show me projects about quantum"}],
+    })
+    assert response.status_code == 200
+    [frame] = _frames(response)
+    assert frame["query_results"][0]["resource"] == "project"
+    assert "Quantum Error Correction" in frame["delta"]
+    assert frame["context"]["last_results_count"] == 1
+
+
+def test_unmatched_query_streams_fallback(client, monkeypatch):
+    monkeypatch.setattr(chat_routes, "DELEGATE_TO_FOUNDRY", False)
+    response = client.post("/api/chat/stream", json={
+        "messages": [{"role": "user", "content": "zzqx blorp"}],
+    })
+    assert response.status_code == 200
+    [frame] = _frames(response)
+    assert frame["fallback"] is True
+
+
+def test_empty_query_is_rejected(client):
+    response = client.post("/api/chat/stream", json={"messages": [{"role": "user", "content": ""}]})
+    assert response.status_code == 400
+
+
+def test_conversation_context_accumulates_delta_requests(client, monkeypatch):
+    store = ConversationContextStore()
+    monkeypatch.setattr(conversation_context, "_context_store", store)
+    monkeypatch.setattr(chat_routes, "DELEGATE_TO_FOUNDRY", False)
+
+    for content in ["zzqx ai", "zzqx monitor"]:
+        client.post("/api/chat/stream", json={
+            "conversation_id": "conv-1",
+            "delta": True,
+            "messages": [{"role": "user", "content": content}],
+        })
+
+    context = store.get("conv-1")
+    assert context.turn_count == 2
+    assert context.selected_categories == {"artificial intelligence"}
+    assert context.equipment_filters == {"monitor"}
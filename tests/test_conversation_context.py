@@ -0,0 +1,198 @@
+"""Tests for conversation context extraction and the incremental context store."""
+
+import pytest
+
+from src.api import conversation_context
+from src.api.conversation_context import (
+    CATEGORY_KEYWORDS,
+    EQUIPMENT_KEYWORDS,
+    ConversationContext,
+    ConversationContextStore,
+    KeywordAutomaton,
+    extract_context_from_messages,
+)
+from src.storage.catalog import ProjectCatalog
+
+
+def _user(content):
+    return {"role": "user", "content": content}
+
+
+def _assistant(content):
+    return {"role": "assistant", "content": content}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"value": 1000.0}
+    monkeypatch.setattr(conversation_context.time, "monotonic", lambda: now["value"])
+    return now
+
+
+@pytest.fixture
+def applied(monkeypatch):
+    """Record every user message the store actually scans."""
+    seen = []
+    original = conversation_context.apply_user_message
+
+    def spy(context, content):
+        seen.append(content)
+        original(context, content)
+
+    monkeypatch.setattr(conversation_context, "apply_user_message", spy)
+    return seen
+
+
+@pytest.mark.parametrize("text", [
+    "show me ai projects",
+    "i need a large display and a 27\" monitor",
+    "maintaining distributed systems",
+    "human-computer interaction with video recording",
+    "htmL and data science analytics",
+    "nothing relevant here",
+    "",
+])
+@pytest.mark.parametrize("table", [CATEGORY_KEYWORDS, EQUIPMENT_KEYWORDS])
+def test_automaton_matches_substring_checks(table, text):
+    expected = {label for label, keywords in table.items() if any(kw in text.lower() for kw in keywords)}
+    assert KeywordAutomaton(table).labels(text.lower()) == expected
+
+
+def test_automaton_recovers_prefix_keywords():
+    automaton = KeywordAutomaton({"short": ["data"], "long": ["data science"]})
+    assert automaton.labels("data science") == {"short", "long"}
+
+
+def test_extract_context_from_messages():
+    context = extract_context_from_messages([
+        _user("Show me machine learning projects"),
+        _assistant("Here are some security projects"),
+        _user("Which need a large display?"),
+    ])
+    assert context.selected_categories == {"artificial intelligence"}
+    assert context.equipment_filters == {"large display"}
+
+
+def test_store_applies_only_new_turns(applied):
+    store = ConversationContextStore()
+    history = [_user("Show me AI projects"), _assistant("...")]
+    context = store.update("c1", history)
+    assert context.turn_count == 1
+    assert context.conversation_id == "c1"
+
+    history += [_user("Anything on privacy?"), _assistant("...")]
+    assert store.update("c1", history) is context
+    assert context.selected_categories == {"artificial intelligence", "security"}
+    assert context.turn_count == 2
+    assert applied == ["Show me AI projects", "Anything on privacy?"]
+
+    # Clients may send only the new turn
+    store.update("c1", [_user("Which need a monitor?")], delta=True)
+    assert context.equipment_filters == {"monitor"}
+    assert context.turn_count == 3
+
+    # ...and the full history again afterwards
+    history += [_user("Which need a monitor?"), _assistant("..."), _user("And video?")]
+    store.update("c1", history)
+    assert applied[-1] == "And video?"
+    assert context.turn_count == 4
+
+
+def test_store_accumulates_delta_turns(applied):
+    store = ConversationContextStore()
+    store.update("c1", [_user("Show me AI projects")], delta=True)
+    context = store.update("c1", [_user("Which need a large display?")], delta=True)
+    assert context.turn_count == 2
+    assert context.selected_categories == {"artificial intelligence"}
+    assert context.equipment_filters == {"large display"}
+
+    store.update("c1", [_user("Anything on privacy?")], delta=True)
+    assert context.turn_count == 3
+    assert context.selected_categories == {"artificial intelligence", "security"}
+    assert context.equipment_filters == {"large display"}
+    assert len(applied) == 3
+
+
+def test_store_rebuilds_truncated_history():
+    store = ConversationContextStore()
+    store.update("c1", [_user("AI projects"), _user("with a large display")])
+    context = store.update("c1", [_user("security projects")])
+    assert context.selected_categories == {"security"}
+    assert context.equipment_filters == set()
+    assert context.turn_count == 1
+
+
+def test_store_rebuilds_diverged_history(applied):
+    store = ConversationContextStore()
+    store.update("c1", [_user("AI projects"), _user("with a large display")])
+    context = store.update("c1", [_user("AI projects"), _user("security projects")])
+    assert context.selected_categories == {"artificial intelligence", "security"}
+    assert context.equipment_filters == set()
+    assert context.turn_count == 2
+
+
+def test_store_keeps_handler_updates():
+    store = ConversationContextStore()
+    store.update("c1", [_user("hello")]).mark_project_viewed("proj-1")
+    assert store.update("c1", [_user("hello"), _user("next")]).current_project_id == "proj-1"
+
+
+def test_store_lru_and_idle_eviction(clock):
+    store = ConversationContextStore(max_entries=2, idle_ttl_seconds=60)
+    store.update("a", [_user("ai")])
+    store.update("b", [_user("ai")])
+    store.get("a")
+    store.update("a", [_user("ai")])
+    store.update("c", [_user("ai")])
+    assert "b" not in store and "a" in store and "c" in store
+    assert store.get_stats()["evictions"] == 1
+
+    clock["value"] += 30
+    store.update("c", [_user("ai")])
+    clock["value"] += 45
+    assert "a" not in store
+    assert "c" in store
+    assert store.get_stats()["expirations"] == 1
+
+
+def test_snapshot_round_trip(tmp_path, clock):
+    path = tmp_path / "contexts.json"
+    store = ConversationContextStore(idle_ttl_seconds=60, snapshot_path=str(path))
+    context = store.update("c1", [_user("AI projects with a monitor")])
+    context.set_results(["c", "a"])
+    clock["value"] += 10
+    store.update("c2", [_user("security")])
+    assert store.snapshot() == 2
+
+    restored = ConversationContextStore(idle_ttl_seconds=60, snapshot_path=str(path))
+    assert len(restored) == 2
+    copy = restored.get("c1")
+    assert copy.to_dict() == context.to_dict()
+    assert copy.last_results == ("c", "a")
+    assert copy.started_at == context.started_at
+
+    # Idle time survives the round trip; continuation still applies only the delta
+    clock["value"] += 55
+    assert restored.get("c1") is None
+    assert restored.update("c2", [_user("security"), _user("ai")]).turn_count == 2
+
+
+def test_context_state_round_trip():
+    context = ConversationContext(conversation_id="c1", turn_count=3)
+    context.add_category("HCI")
+    assert ConversationContext.from_state(context.to_state()) == context
+
+
+def test_results_are_resolved_by_project_id(monkeypatch):
+    catalog = ProjectCatalog([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}, {"id": "c", "name": "C"}])
+    monkeypatch.setattr(conversation_context, "get_project_catalog", lambda: catalog)
+
+    context = ConversationContext()
+    context.set_results([catalog.get("c"), {"name": "no id"}, "a"])
+    assert context.last_results == ("c", "a")
+    assert context.to_dict()["last_results_count"] == 2
+    assert [p["id"] for p in context.get_results()] == ["c", "a"]
+
+    # After a reload, results follow the new data; removed projects are skipped
+    catalog = ProjectCatalog([{"id": "a", "name": "A (updated)"}, {"id": "b", "name": "B"}])
+    assert [p["name"] for p in context.get_results()] == ["A (updated)"]
@@ -0,0 +1,44 @@
+"""Tests for the /data/projects CRUD and search endpoints."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.data.projects import get_data_projects_router
+from src.core.projects.repository import ProjectRepository
+
+
+def _project(project_id, name, event_id="event-1", **fields):
+    return {
+        "id": project_id, "eventId": event_id, "name": name, "description": "", "research_area": "",
+        "odata_type": "#microsoft.graph.project", **fields,
+    }
+
+
+@pytest.fixture
+def client(tmp_path):
+    repo = ProjectRepository(storage_dir=str(tmp_path / "projects"))
+    app = FastAPI()
+    app.include_router(get_data_projects_router(repo=repo))
+    return TestClient(app)
+
+
+def test_search_covers_created_projects(client):
+    client.post("/data/projects", json=_project("p1", "Federated Learning", keywords=["privacy"]))
+    client.post("/data/projects", json=_project("p2", "Quantum Sensing", event_id="event-2"))
+
+    body = client.get("/data/projects", params={"search": "federated"}).json()
+    assert [p["id"] for p in body["value"]] == ["p1"]
+    assert body["value"][0]["@search.score"] > 0
+    # Same schema as the plain listing
+    listed = {p["id"]: p for p in client.get("/data/projects").json()["value"]}
+    assert {k: v for k, v in body["value"][0].items() if k != "@search.score"} == listed["p1"]
+
+    client.post("/data/projects", json=_project("p3", "Private Learning", event_id="event-2", keywords=["privacy"]))
+    hits = client.get("/data/projects", params={"search": "privacy", "event_id": "event-2"}).json()["value"]
+    assert [p["id"] for p in hits] == ["p3"]
+
+
+def test_search_top_is_validated(client):
+    assert client.get("/data/projects", params={"search": "x", "top": -1}).status_code == 422
+    assert client.get("/data/projects", params={"search": "x", "top": 0}).status_code == 422
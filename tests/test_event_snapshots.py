@@ -0,0 +1,132 @@
+"""Tests for versioned event data snapshots and hot reload."""
+
+import json
+import os
+
+import pytest
+
+from src.api.caching import SessionCache
+from src.storage import catalog as catalog_module
+from src.storage.catalog import get_data_version, get_project_catalog, get_snapshot
+from src.storage.event_data import DATA_FILE, EventDataLoader
+from src.storage.related_projects import RelatedProjectIndex
+from src.storage.snapshots import SnapshotManager
+
+
+def _project(project_id, name, area="AI"):
+    return {"id": project_id, "name": name, "researchArea": area, "description": name}
+
+
+def _write(path, projects, bump=0):
+    path.write_text(json.dumps({"projects": projects}), encoding="utf-8")
+    if bump:
+        # Guarantee a new mtime on filesystems with coarse timestamps
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    path = tmp_path / DATA_FILE
+    _write(path, [_project("p1", "Vision"), _project("p2", "Speech")])
+    loader = EventDataLoader(data_dir=str(tmp_path))
+    monkeypatch.setattr("src.storage.event_data.get_event_data_loader", lambda: loader)
+    monkeypatch.setattr("src.storage.event_data.get_event_data", loader.get_all_data)
+    catalog_module.reset_project_catalog()
+    yield path
+    catalog_module.reset_project_catalog()
+
+
+def test_reload_swaps_snapshot_and_bumps_version(data_file):
+    manager = SnapshotManager(poll_seconds=0.01)
+    before = get_snapshot()
+    assert len(before.catalog) == 2
+    assert manager.check() is None
+
+    _write(data_file, [_project("p1", "Vision"), _project("p2", "Speech"), _project("p3", "Robots")], bump=10**9)
+    after = manager.check()
+    assert after is get_snapshot()
+    assert after.version > before.version
+    assert get_data_version() == after.version
+    assert len(get_project_catalog()) == 3
+    # The old snapshot is untouched for readers still holding it
+    assert len(before.catalog) == 2
+    assert manager.check() is None
+    assert manager.get_stats()["reloads"] == 1
+
+
+def test_unparseable_file_keeps_current_snapshot(data_file):
+    manager = SnapshotManager()
+    before = get_snapshot()
+    data_file.write_text('{"projects": [', encoding="utf-8")
+    assert manager.reload() is None
+    assert get_snapshot() is before
+    assert manager.get_stats()["failures"] == 1
+
+
+def test_reset_keeps_version_monotonic(data_file):
+    first = get_data_version()
+    catalog_module.reset_project_catalog()
+    assert get_data_version() > first
+
+
+def test_version_is_stable_without_data_file(tmp_path, monkeypatch):
+    loader = EventDataLoader(data_dir=str(tmp_path / "missing"))
+    monkeypatch.setattr("src.storage.event_data.get_event_data_loader", lambda: loader)
+    monkeypatch.setattr("src.storage.event_data.get_event_data", loader.get_all_data)
+    catalog_module.reset_project_catalog()
+    try:
+        version = get_data_version()
+        catalog = get_project_catalog()
+        assert get_data_version() == version
+        assert get_project_catalog() is catalog
+        assert len(catalog) == 0
+    finally:
+        catalog_module.reset_project_catalog()
+
+
+def test_loader_search_uses_snapshot_index(data_file):
+    loader = EventDataLoader(data_dir=str(data_file.parent))
+    assert loader.get_search_index() is get_project_catalog().search_index
+    assert [p["id"] for p in loader.search_projects("robots")] == []
+
+    _write(data_file, [_project("p1", "Vision"), _project("p3", "Robots")], bump=10**9)
+    SnapshotManager().reload()
+    assert loader.get_search_index() is get_project_catalog().search_index
+    assert [p["id"] for p in loader.search_projects("robots")] == ["p3"]
+
+
+def test_session_cache_misses_after_version_change():
+    version = {"value": 1}
+    cache = SessionCache(version_provider=lambda: version["value"])
+    cache.set("projects", {"items": [1]})
+    assert cache.get("projects") == {"items": [1]}
+
+    version["value"] = 2
+    assert cache.get("projects") is None
+    assert "projects" not in cache.get_stats()["keys"]
+    assert cache.get_stats()["per_key"]["projects"]["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_tags_entry_with_version_seen_before_load():
+    version = {"value": 1}
+    cache = SessionCache(version_provider=lambda: version["value"])
+
+    def load():
+        version["value"] = 2  # snapshot swapped while loading
+        return {"stale": True}
+
+    assert await cache.get_or_load("projects", load) == {"stale": True}
+    assert cache.get("projects") is None
+
+
+def test_related_index_copy_is_independent():
+    projects = [_project("p1", "vision models"), _project("p2", "vision robots"), _project("p3", "speech")]
+    index = RelatedProjectIndex(projects)
+    before = index.neighbors("p1")
+
+    clone = index.copy()
+    clone.sync(projects[:1] + [_project("p2", "speech audio"), projects[2]])
+    assert index.neighbors("p1") == before
+    assert clone.neighbors("p1") != before
@@ -0,0 +1,160 @@
+"""Tests for the content-addressed extraction cache."""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from src.core.schemas.base_schema import BaseKnowledgeArtifact, SourceType
+from src.storage.extraction_cache import ExtractionCache, source_digest
+
+
+def _artifact(title="Paper"):
+    return BaseKnowledgeArtifact(
+        title=title,
+        contributors=["A. Author"],
+        source_type=SourceType.PAPER,
+        plain_language_overview="overview",
+        technical_problem_addressed="problem",
+        key_methods_approach="methods",
+        primary_claims_capabilities=["claim"],
+        novelty_vs_prior_work="novelty",
+        limitations_constraints=[],
+        potential_impact="impact",
+        open_questions_future_work=[],
+        key_evidence_citations=[],
+        confidence_score=0.9,
+        confidence_reasoning="clear",
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+def _prompts(tmp_path, text="PROMPT = 'v1'"):
+    prompts = tmp_path / "prompts"
+    prompts.mkdir(exist_ok=True)
+    (prompts / "paper_prompts.py").write_text(text)
+    return prompts
+
+
+def _agents(tmp_path, text="def extract_from_source(): return 'v1'"):
+    agents = tmp_path / "agents"
+    agents.mkdir(exist_ok=True)
+    (agents / "paper_agent.py").write_text(text)
+    return agents
+
+
+def test_source_digest_is_content_addressed(tmp_path):
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_bytes(b"%PDF same")
+    b.write_bytes(b"%PDF same")
+    assert source_digest(a) == source_digest(str(b))
+    b.write_bytes(b"%PDF changed")
+    assert source_digest(a) != source_digest(b)
+
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "main.py").write_text("print(1)")
+    before = source_digest(repo)
+    (repo / "src" / "main.py").write_text("print(2)")
+    assert source_digest(repo) != before
+
+    assert source_digest("x" * 10000) == source_digest("x" * 10000)
+    assert source_digest(b"bytes") != source_digest("bytes")
+
+
+def test_artifact_round_trip_and_key_components(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache", prompts_dir=_prompts(tmp_path))
+    version = cache.prompt_version("system", "extract")
+    key = cache.artifact_key("hash", "PaperAgent", version, "gpt-4", 0.3)
+
+    assert cache.get_artifact(key) is None
+    cache.put_artifact(key, _artifact())
+    cached = cache.get_artifact(key)
+    assert cached.title == "Paper"
+    assert cached.created_at == datetime(2025, 1, 1)
+    assert cache.get_stats()["hits"] == 1
+
+    assert key != cache.artifact_key("hash", "PaperAgent", version, "gpt-4", 0.7)
+    assert key != cache.artifact_key("hash", "PaperAgent", version, "gpt-4o", 0.3)
+    assert key != cache.artifact_key("hash", "TalkAgent", version, "gpt-4", 0.3)
+    assert key != cache.artifact_key("hash", "PaperAgent", cache.prompt_version("system", "other"), "gpt-4", 0.3)
+
+
+def test_parsed_text_cache(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache", prompts_dir=_prompts(tmp_path))
+    assert cache.get_text("hash", "PaperAgent") is None
+    cache.put_text("hash", "PaperAgent", "parsed text ü")
+    assert cache.get_text("hash", "PaperAgent") == "parsed text ü"
+    assert cache.get_text("hash", "TalkAgent") is None
+
+
+def test_parsed_text_is_keyed_by_extraction_params(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache", prompts_dir=_prompts(tmp_path))
+    cache.put_text("hash", "PaperAgent", "truncated", {"token_budget": 60000})
+    assert cache.get_text("hash", "PaperAgent", {"token_budget": 60000}) == "truncated"
+    assert cache.get_text("hash", "PaperAgent", {"token_budget": None}) is None
+    assert cache.get_text("hash", "PaperAgent") is None
+
+
+def test_prompt_changes_invalidate_artifacts(tmp_path):
+    prompts = _prompts(tmp_path)
+    cache = ExtractionCache(tmp_path / "cache", prompts_dir=prompts)
+    key = cache.artifact_key("hash", "PaperAgent", cache.prompt_version("p"), "gpt-4", 0.3)
+    cache.put_artifact(key, _artifact())
+    cache.put_text("hash", "PaperAgent", "parsed")
+
+    _prompts(tmp_path, "PROMPT = 'v2'")
+    updated = ExtractionCache(tmp_path / "cache", prompts_dir=prompts)
+    assert updated.fingerprint != cache.fingerprint
+    assert updated.invalidate_stale() == 1
+    assert updated.get_artifact(updated.artifact_key("hash", "PaperAgent", updated.prompt_version("p"), "gpt-4", 0.3)) is None
+    # Parsed source text does not depend on prompts
+    assert updated.get_text("hash", "PaperAgent") == "parsed"
+
+
+def test_parser_changes_invalidate_text(tmp_path):
+    prompts, agents = _prompts(tmp_path), _agents(tmp_path)
+    cache = ExtractionCache(tmp_path / "cache", prompts_dir=prompts, agents_dir=agents)
+    cache.put_text("hash", "PaperAgent", "parsed by v1")
+    # Entry from before text was grouped by extractor fingerprint
+    (tmp_path / "cache" / "text" / "old-PaperAgent.txt").write_text("legacy")
+
+    _agents(tmp_path, "def extract_from_source(): return 'v2'")
+    updated = ExtractionCache(tmp_path / "cache", prompts_dir=prompts, agents_dir=agents)
+    assert updated.extractor_fingerprint != cache.extractor_fingerprint
+    assert updated.get_text("hash", "PaperAgent") is None
+    assert updated.invalidate_stale() == 2
+    assert updated.get_stats()["bytes"] == 0
+
+
+def test_artifacts_are_keyed_on_parsed_text():
+    key = ExtractionCache.artifact_key(ExtractionCache.text_digest("full text"), "PaperAgent", "v", "gpt-4", 0.3)
+    truncated = ExtractionCache.text_digest("full")
+    assert key != ExtractionCache.artifact_key(truncated, "PaperAgent", "v", "gpt-4", 0.3)
+    # Text that happens to name a file is hashed as text, not as the file
+    assert ExtractionCache.text_digest(__file__) != source_digest(__file__)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_cache_dir_is_private(tmp_path):
+    ExtractionCache(tmp_path / "cache", prompts_dir=_prompts(tmp_path))
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+
+
+def test_size_based_lru_eviction(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache", max_bytes=10_000, prompts_dir=_prompts(tmp_path))
+    for i in range(5):
+        cache.put_text(f"h{i}", "PaperAgent", "x" * 3000)
+        os.utime(cache._text_path(f"h{i}", "PaperAgent"), (1000 + i, 1000 + i))
+        if i == 2:
+            # Recently used entries survive eviction
+            cache.get_text("h0", "PaperAgent")
+
+    assert cache.get_stats()["bytes"] <= 10_000
+    assert cache.get_stats()["evictions"] >= 2
+    assert cache.get_text("h4", "PaperAgent") is not None
+    assert cache.get_text("h1", "PaperAgent") is None
+
+    cache.clear()
+    assert cache.get_stats()["bytes"] == 0
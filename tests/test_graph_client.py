@@ -0,0 +1,190 @@
+"""Tests for the pooled Graph client and M365 connector against a local mock Graph server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.integrations import graph_client
+from src.integrations.graph_client import AsyncGraphClient, retry_after_seconds
+from src.integrations.m365_connector import M365ConnectorError, M365KnowledgeConnector
+
+
+class _MockGraph:
+    """Tiny Graph lookalike served over real HTTP/1.1 keep-alive connections."""
+
+    def __init__(self):
+        self.calls = []
+        self.connections = 0
+        self.throttled = set()
+        self.uploads = {}
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                mock.connections += 1
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body=b"", content_type="application/json", headers=None):
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                mock.calls.append((self.command, self.path, dict(self.headers)))
+                mock.route(self, body)
+
+            do_GET = do_PUT = do_POST = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    def route(self, h, body):
+        path = h.path
+        if path == "/v1.0/sites/s1/drive":
+            return h._reply(200, {"id": "d1", "name": "Documents"})
+        if path.startswith("/v1.0/drives/d1/root:/") and path.endswith(":/content") and h.command == "GET":
+            name = path[len("/v1.0/drives/d1/root:/"):-len(":/content")]
+            return h._reply(200, (name.encode() + b"|") * 50000, content_type="application/octet-stream")
+        if path.endswith(":/content") and h.command == "PUT":
+            return h._reply(201, {"id": "small", "size": len(body), "webUrl": f"{self.base}/small"})
+        if path.endswith(":/createUploadSession"):
+            return h._reply(200, {"uploadUrl": f"{self.base}/upload/1"})
+        if path == "/upload/1":
+            start, rest = h.headers["Content-Range"].split(" ")[1].split("-")
+            end, total = (int(x) for x in rest.split("/"))
+            self.uploads.setdefault("1", bytearray()).extend(body)
+            if end + 1 < total:
+                return h._reply(202, {"nextExpectedRanges": [f"{end + 1}-"]})
+            return h._reply(201, {"id": "big", "size": len(self.uploads["1"]), "webUrl": f"{self.base}/big"})
+        if path == "/v1.0/flaky":
+            if "flaky" not in self.throttled:
+                self.throttled.add("flaky")
+                return h._reply(429, {"error": "slow down"}, headers={"Retry-After": "0"})
+            return h._reply(200, {"ok": True})
+        if path == "/v1.0/$batch":
+            responses = []
+            for item in json.loads(body)["requests"]:
+                if item["url"].startswith("/throttle-once/") and item["url"] not in self.throttled:
+                    self.throttled.add(item["url"])
+                    responses.append({"id": item["id"], "status": 429, "headers": {"Retry-After": "0"}})
+                else:
+                    responses.append({"id": item["id"], "status": 200, "body": {"url": item["url"]}})
+            return h._reply(200, {"responses": list(reversed(responses))})
+        return h._reply(404, {"error": "not found"})
+
+    def count(self, method, path):
+        return sum(1 for m, p, _ in self.calls if m == method and p == path)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _Auth:
+    def get_access_token(self):
+        return "token-123"
+
+
+@pytest.fixture
+def mock_graph():
+    graph = _MockGraph()
+    yield graph
+    graph.close()
+
+
+@pytest.fixture
+def connector(mock_graph):
+    connector = M365KnowledgeConnector(auth_client=_Auth(), base_url=f"{mock_graph.base}/v1.0")
+    yield connector
+    connector.close()
+
+
+def test_requests_reuse_pooled_connection_and_memoize_drive(connector, mock_graph):
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        content = connector.download_file("s1", f"/{name}")
+        assert content.startswith(name.encode() + b"|")
+
+    assert mock_graph.count("GET", "/v1.0/sites/s1/drive") == 1
+    assert mock_graph.connections == 1
+    assert all(headers["Authorization"] == "Bearer token-123" for _, _, headers in mock_graph.calls)
+
+
+def test_download_streams_to_disk(connector, mock_graph, tmp_path):
+    dest = connector.download_file_to("s1", "/Shared Documents/paper.pdf", tmp_path / "out" / "paper.pdf")
+    assert dest.read_bytes() == b"Shared%20Documents/paper.pdf|" * 50000
+    assert not list((tmp_path / "out").glob("*.part"))
+
+
+def test_throttled_requests_are_retried(connector, mock_graph):
+    assert connector._make_request("GET", "flaky") == {"ok": True}
+    assert mock_graph.count("GET", "/v1.0/flaky") == 2
+
+
+def test_errors_map_to_connector_errors(connector):
+    with pytest.raises(M365ConnectorError, match="Resource not found"):
+        connector._make_request("GET", "missing")
+
+
+def test_small_and_chunked_uploads(connector, mock_graph, monkeypatch, tmp_path):
+    small = connector.upload_file("s1", "/Knowledge", "a.json", b"{}")
+    assert small["id"] == "small"
+
+    monkeypatch.setattr(graph_client, "SIMPLE_UPLOAD_LIMIT", 1000)
+    big_file = tmp_path / "big.bin"
+    big_file.write_bytes(bytes(range(256)) * 2000)
+    result = connector.upload_to_onedrive("/Documents", "big.bin", big_file)
+
+    assert result["id"] == "big"
+    assert bytes(mock_graph.uploads["1"]) == big_file.read_bytes()
+    chunk_calls = [headers for method, path, headers in mock_graph.calls if path == "/upload/1"]
+    assert len(chunk_calls) == 1  # 512 KB fits in one default-sized chunk
+    assert all("Authorization" not in headers for headers in chunk_calls)
+
+
+async def test_upload_session_sends_ranges_in_chunks(mock_graph, monkeypatch):
+    monkeypatch.setattr(graph_client, "SIMPLE_UPLOAD_LIMIT", 0)
+    async with AsyncGraphClient(token_provider=lambda: "t", base_url=f"{mock_graph.base}/v1.0") as graph:
+        data = b"x" * (3 * 320 * 1024 + 5)
+        result = await graph.upload("me/drive/root:/big.bin", data, chunk_size=320 * 1024)
+
+    assert result["size"] == len(data)
+    ranges = [headers["Content-Range"] for _, path, headers in mock_graph.calls if path == "/upload/1"]
+    assert ranges[0] == f"bytes 0-{320 * 1024 - 1}/{len(data)}"
+    assert len(ranges) == 4
+
+
+async def test_batch_splits_orders_and_retries_throttled_items(mock_graph):
+    async def token():
+        return "t"
+
+    requests = [{"method": "GET", "url": f"/me/drive/items/{i}"} for i in range(25)]
+    requests[3]["url"] = "/throttle-once/3"
+    async with AsyncGraphClient(token_provider=token, base_url=f"{mock_graph.base}/v1.0") as graph:
+        results = await graph.batch(requests)
+
+    assert [r["body"]["url"] for r in results] == [r["url"] for r in requests]
+    assert all(r["status"] == 200 for r in results)
+    # Two groups (20 + 5) plus one retry for the throttled item
+    assert mock_graph.count("POST", "/v1.0/$batch") == 3
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds({"Retry-After": "7"}, 0, 0.5, 60) == 7
+    assert retry_after_seconds({"Retry-After": "600"}, 0, 0.5, 60) == 60
+    assert 0.5 <= retry_after_seconds({}, 2, 0.5, 60) <= 2.0
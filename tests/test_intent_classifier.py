@@ -0,0 +1,101 @@
+"""Tests and micro-benchmark for the single-pass intent classifier."""
+
+import re
+import time
+
+import pytest
+
+from src.api.intent_classifier import IntentClassifier, extract_trigger
+from src.api.router_prompt import INTENT_PATTERNS
+
+QUERIES = [
+    "Show me AI projects",
+    "What projects are about machine learning?",
+    "Find projects by John Smith",
+    "What's happening now?",
+    "Show me sessions at 2:30 PM",
+    "Which projects need large displays?",
+    "Recording link for Healthcare AI project",
+    "Projects in HCI category",
+    "What are the most popular projects?",
+    "Show me similar projects to quantum computing",
+    "What is this event?",
+    "Who is speaking tomorrow?",
+    "Tell me about the AI Research Assistant project",
+    "Details for 'Deep Learning Framework'",
+    "Where is booth 12 on the floor plan?",
+    "Which projects need 2 monitors and AV support?",
+    "Was the LT reviewer note sent?",
+    "Sarah's poster",
+    "hello there",
+    "",
+]
+
+
+def naive_classify(query):
+    """Reference implementation: evaluate every pattern of every intent."""
+    query_lower = query.lower()
+    scores = {}
+    matched = {}
+    for intent, sources in INTENT_PATTERNS.items():
+        hits = [i for i, p in enumerate(sources) if re.search(p, query_lower, re.IGNORECASE)]
+        if hits:
+            scores[intent] = min(0.9, 0.5 + (len(hits) / len(sources)) * 0.4)
+            matched[intent] = hits
+    if not scores:
+        return "unmatched", 0.0, {}, {}
+    best = max(scores.items(), key=lambda x: x[1])
+    return best[0], best[1], scores, matched
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return IntentClassifier(INTENT_PATTERNS)
+
+
+def test_extract_trigger():
+    assert extract_trigger(r"\bsession[s]?\b") == "session"
+    assert extract_trigger(r"\b(what|when|where)\s+(is|are)\s+(this|the)\s+event") == "event"
+    assert extract_trigger(r"\bLT\s+reviewer\b") == "reviewer"
+    assert extract_trigger(r"(a|b)") is None
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_matches_naive_evaluation(classifier, query):
+    intent, confidence, scores, matched = naive_classify(query)
+    result = classifier.classify(query)
+    assert result.intent == intent
+    assert result.confidence == confidence
+    assert result.scores == scores
+    assert result.matched == matched
+
+
+def test_patterns_matched_for_best_intent(classifier):
+    result = classifier.classify("Show me sessions and keynotes on the agenda")
+    assert result.intent == "session_lookup"
+    assert r"\bagenda\b" in result.patterns_matched
+    assert all(p in [c.pattern for c in classifier.patterns["session_lookup"]] for p in result.patterns_matched)
+
+
+@pytest.mark.benchmark
+def test_classification_is_faster_than_pattern_scan(classifier):
+    """Single-pass classification beats scanning every intent's patterns."""
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in QUERIES:
+            classifier.classify(query)
+    per_query_us = (time.perf_counter() - start) / (rounds * len(QUERIES)) * 1e6
+
+    baseline_start = time.perf_counter()
+    compiled = {i: [re.compile(p, re.IGNORECASE) for p in ps] for i, ps in INTENT_PATTERNS.items()}
+    for _ in range(rounds):
+        for query in QUERIES:
+            q = query.lower()
+            for patterns in compiled.values():
+                sum(1 for p in patterns if p.search(q))
+    baseline_us = (time.perf_counter() - baseline_start) / (rounds * len(QUERIES)) * 1e6
+
+    assert per_query_us < baseline_us, (
+        f"intent classification: {per_query_us:.1f}us/query (all-pattern scan: {baseline_us:.1f}us/query)"
+    )
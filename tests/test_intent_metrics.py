@@ -0,0 +1,48 @@
+"""Tests for the ring-buffer IntentMetrics aggregates."""
+
+import random
+from collections import Counter
+
+from src.observability.intent_metrics import IntentMetrics
+
+INTENTS = ["project_search", "session_lookup", "people_lookup", "unmatched"]
+PATHS = ["deterministic", "llm_assisted", "full_llm"]
+
+
+def _log_random(metrics, n, seed=7):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        record = (f"query {i}", rng.choice(INTENTS), round(rng.random(), 3), rng.choice(PATHS))
+        metrics.log_classification(record[0], record[1], record[2], ["p"], record[3])
+        records.append(record)
+    return records
+
+
+def test_empty_stats():
+    stats = IntentMetrics().get_coverage_stats()
+    assert stats["total_queries"] == 0
+    assert stats["deterministic_coverage"] == 0.0
+
+
+def test_window_aggregates_match_recomputation():
+    metrics = IntentMetrics(max_recent=50)
+    records = _log_random(metrics, 237)
+    window = records[-50:]
+
+    stats = metrics.get_coverage_stats()
+    assert stats["total_queries_recent"] == 50
+    assert stats["deterministic_coverage"] == sum(r[3] == "deterministic" for r in window) / 50
+    assert stats["low_confidence_rate"] == sum(r[2] < 0.6 for r in window) / 50
+    assert abs(stats["mean_confidence"] - sum(r[2] for r in window) / 50) < 1e-9
+    assert sum(stats["confidence_histogram"].values()) == 50
+    assert dict(stats["top_intents_recent"]) == dict(Counter(r[1] for r in window).most_common(5))
+    assert stats["total_queries_lifetime"] == 237
+
+
+def test_recent_classifications_ring_buffer():
+    metrics = IntentMetrics(max_recent=3)
+    _log_random(metrics, 5)
+    recent = metrics.recent_classifications
+    assert [r["query"] for r in recent] == ["query 2", "query 3", "query 4"]
+    assert set(recent[0]) == {"timestamp", "query", "intent", "confidence", "execution_path"}
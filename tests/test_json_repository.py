@@ -0,0 +1,124 @@
+"""Tests for the indexed, cached JSON repository base."""
+
+import builtins
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from src.core.graph_models import ODataType
+from src.core.knowledge_models import ApprovalStatus, KnowledgeArtifact, PKAProvenance
+from src.core.knowledge_repository import KnowledgeArtifactRepository
+from src.core.projects.exceptions import ProjectNotFoundError
+from src.storage.json_repository import MANIFEST_NAME
+
+
+def _artifact(i, project="proj-1", status=ApprovalStatus.DRAFT):
+    return KnowledgeArtifact(
+        id=f"artifact-{i}",
+        odata_type=ODataType.KNOWLEDGE_ARTIFACT.value,
+        project_id=project,
+        title=f"Artifact {i}",
+        approval_status=status,
+        provenance=PKAProvenance(
+            agent_name="paper_agent",
+            agent_version="1.0",
+            prompt_version="1.0",
+            run_date_time=datetime.now(),
+        ),
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = KnowledgeArtifactRepository(storage_dir=str(tmp_path / "artifacts"))
+    for i in range(6):
+        repo.create(_artifact(i, project=f"proj-{i % 2}", status=ApprovalStatus.APPROVED if i < 2 else ApprovalStatus.DRAFT))
+    return repo
+
+
+@pytest.fixture
+def open_counter(monkeypatch):
+    calls = []
+    real_open = builtins.open
+
+    def counting_open(path, *args, **kwargs):
+        if str(path).endswith(".json"):
+            calls.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    return calls
+
+
+def test_secondary_indexes(repo):
+    assert [a.id for a in repo.list_by_project("proj-0")] == ["artifact-0", "artifact-2", "artifact-4"]
+    assert [a.id for a in repo.list_by_status(ApprovalStatus.APPROVED)] == ["artifact-0", "artifact-1"]
+    assert repo.count() == 6
+
+
+def test_list_queries_do_not_reopen_files(repo, open_counter):
+    for _ in range(3):
+        assert len(repo.list_all()) == 6
+        repo.list_by_project("proj-1")
+        repo.count()
+    assert open_counter == []
+
+
+def test_updates_move_index_entries(repo):
+    artifact = repo.get("artifact-3")
+    artifact.approval_status = ApprovalStatus.APPROVED
+    repo.update(artifact)
+    assert "artifact-3" in [a.id for a in repo.list_by_status(ApprovalStatus.APPROVED)]
+
+    repo.delete("artifact-0")
+    assert [a.id for a in repo.list_by_status(ApprovalStatus.APPROVED)] == ["artifact-1", "artifact-3"]
+    with pytest.raises(ProjectNotFoundError):
+        repo.get("artifact-0")
+
+
+def test_returned_objects_are_not_shared_with_cache(repo):
+    repo.get("artifact-1").title = "mutated without saving"
+    assert repo.get("artifact-1").title == "Artifact 1"
+
+
+def test_external_changes_are_detected(repo):
+    path = repo.storage_dir / "artifact-5.json"
+    data = json.loads(path.read_text())
+    data["projectId"] = "proj-9"
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(1, 1))  # force a different mtime signature
+    repo.invalidate()
+    assert [a.id for a in repo.list_by_project("proj-9")] == ["artifact-5"]
+
+    (repo.storage_dir / "artifact-4.json").unlink()
+    assert "artifact-4" not in [a.id for a in repo.list_all()]
+    assert repo.count() == 5
+
+
+def test_manifest_rebuilds_indexes_lazily(repo, open_counter):
+    assert (repo.storage_dir / MANIFEST_NAME).exists()
+    fresh = KnowledgeArtifactRepository(storage_dir=str(repo.storage_dir))
+    assert [a.id for a in fresh.list_by_project("proj-1")] == ["artifact-1", "artifact-3", "artifact-5"]
+    assert sorted(os.path.basename(p) for p in open_counter) == ["artifact-1.json", "artifact-3.json", "artifact-5.json"]
+
+
+def test_lazy_loads_do_not_grow_manifest(repo):
+    manifest = repo.storage_dir / MANIFEST_NAME
+    before = manifest.read_text()
+    fresh = KnowledgeArtifactRepository(storage_dir=str(repo.storage_dir))
+    assert len(fresh.list_all()) == 6
+    assert fresh.get("artifact-0").id == "artifact-0"
+    assert manifest.read_text() == before
+
+
+def test_unreadable_files_are_counted_but_skipped(repo, capsys):
+    (repo.storage_dir / "broken.json").write_text("{not json")
+    assert len(repo.list_all()) == 6
+    assert repo.count() == 7
+    assert "Could not load artifact" in capsys.readouterr().out
+
+    repo.clear()
+    assert repo.count() == 0
+    assert repo.list_all() == []
@@ -0,0 +1,160 @@
+"""Tests for batched knowledge graph writes and the bulk ingestor."""
+
+import threading
+
+import pytest
+
+from src.api.knowledge_graph import (
+    BulkIngestor, GraphDatabase_, GraphEdge, GraphNode, Neo4jConfig,
+    NodeType, RelationshipType
+)
+
+
+class FakeTx:
+    def __init__(self, log):
+        self.log = log
+
+    def run(self, query, **params):
+        self.log.append((query, params))
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def execute_write(self, work):
+        self.driver.transactions += 1
+        if self.driver.fail_on and self.driver.transactions == self.driver.fail_on:
+            raise RuntimeError("write failed")
+        if self.driver.gate is not None:
+            self.driver.gate.wait()
+        return work(FakeTx(self.driver.queries))
+
+    def run(self, query, **params):
+        self.driver.queries.append((query, params))
+
+    def close(self):
+        self.driver.closed += 1
+
+
+class FakeDriver:
+    def __init__(self, fail_on=None, gate=None):
+        self.queries = []
+        self.transactions = 0
+        self.sessions = 0
+        self.closed = 0
+        self.fail_on = fail_on
+        self.gate = gate
+
+    def session(self, database=None):
+        self.sessions += 1
+        return FakeSession(self)
+
+
+def _db(driver):
+    return GraphDatabase_(Neo4jConfig(), driver=driver)
+
+
+def _paper(i):
+    return GraphNode(id=f"paper-{i}", node_type=NodeType.PAPER, properties={"title": f"P{i}"})
+
+
+def test_create_nodes_groups_by_label_in_one_transaction():
+    driver = FakeDriver()
+    nodes = [_paper(1), _paper(2), GraphNode(id="a-1", node_type=NodeType.AUTHOR, properties={})]
+
+    assert _db(driver).create_nodes(nodes) == 3
+
+    assert driver.transactions == 1
+    assert driver.closed == 1
+    by_label = {params["type"]: params["rows"] for _, params in driver.queries}
+    assert [row["id"] for row in by_label["Paper"]] == ["paper-1", "paper-2"]
+    query = next(q for q, params in driver.queries if params["type"] == "Paper")
+    assert query.startswith("UNWIND $rows AS row MERGE (n:Paper {id: row.id})")
+
+
+def test_create_edges_uses_known_endpoint_labels():
+    driver = FakeDriver()
+    edge = GraphEdge("a-1", "paper-1", RelationshipType.AUTHOR, {"role": "primary"})
+
+    _db(driver).create_edges([edge], labels={"a-1": "Author", "paper-1": "Paper"})
+
+    query, params = driver.queries[0]
+    assert "MATCH (source:Author {id: row.source_id})" in query
+    assert "MERGE (source)-[r:AUTHOR]->(target)" in query
+    assert params["rows"] == [{"source_id": "a-1", "target_id": "paper-1", "properties": {"role": "primary"}}]
+
+
+def test_single_writes_delegate_to_batches():
+    driver = FakeDriver()
+    db = _db(driver)
+    assert db.create_node(_paper(1)) is True
+    assert db.create_edge(GraphEdge("paper-1", "paper-2", RelationshipType.CITES)) is True
+    assert "MATCH (source {id: row.source_id})" in driver.queries[-1][0]
+
+
+def test_ingestor_batches_and_reuses_one_session():
+    driver = FakeDriver()
+    with BulkIngestor(_db(driver), batch_size=10) as ingestor:
+        ingestor.add_nodes(_paper(i) for i in range(25))
+        ingestor.add_edges(GraphEdge(f"paper-{i}", f"paper-{i + 1}", RelationshipType.CITES) for i in range(24))
+
+    stats = ingestor.stats
+    assert (stats.nodes_written, stats.edges_written) == (25, 24)
+    assert stats.batches == 6  # 3 node batches + 3 edge batches
+    assert driver.sessions == 1 and driver.closed == 1
+
+    kinds = ["edges" if "MATCH" in query else "nodes" for query, _ in driver.queries]
+    assert kinds == ["nodes"] * 3 + ["edges"] * 3
+    assert all("source:Paper" in query for query, _ in driver.queries if "MATCH" in query)
+    assert stats.to_dict()["nodes_written"] == 25
+
+
+def test_edges_wait_for_buffered_nodes():
+    driver = FakeDriver()
+    ingestor = BulkIngestor(_db(driver), batch_size=2)
+    ingestor.add_node(_paper(1))
+    ingestor.add_edges([
+        GraphEdge("paper-1", "paper-2", RelationshipType.CITES),
+        GraphEdge("paper-1", "paper-3", RelationshipType.CITES),
+    ])
+    ingestor.close()
+
+    assert "MERGE (n:Paper" in driver.queries[0][0]
+    assert "MATCH" in driver.queries[1][0]
+
+
+def test_bounded_queue_applies_backpressure():
+    gate = threading.Event()
+    driver = FakeDriver(gate=gate)
+    ingestor = BulkIngestor(_db(driver), batch_size=1, max_pending_batches=1)
+
+    producer = threading.Thread(target=ingestor.add_nodes, args=([_paper(i) for i in range(4)],))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()  # Blocked: one batch in the writer, one queued
+
+    gate.set()
+    producer.join()
+    stats = ingestor.close()
+    assert stats.nodes_written == 4
+    assert stats.blocked_seconds > 0
+
+
+def test_failed_batches_are_counted_and_ingest_continues():
+    driver = FakeDriver(fail_on=1)
+    with BulkIngestor(_db(driver), batch_size=2) as ingestor:
+        ingestor.add_nodes(_paper(i) for i in range(4))
+
+    assert ingestor.stats.failed_batches == 1
+    assert ingestor.stats.nodes_written == 2
+    assert "write failed" in ingestor.stats.errors[0]
+    with pytest.raises(RuntimeError):
+        ingestor.add_node(_paper(9))
+
+
+def test_mock_mode_counts_writes():
+    db = GraphDatabase_(Neo4jConfig())
+    with BulkIngestor(db, batch_size=3) as ingestor:
+        ingestor.add_nodes(_paper(i) for i in range(7))
+    assert ingestor.stats.nodes_written == 7
@@ -0,0 +1,121 @@
+"""Tests for the pooled async LLM client against a local stub server."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.llm_client import AsyncLLMClient, BearerTokenCache, UpstreamError
+
+
+async def _start_stub(status=200, lines=(), delay=0.0):
+    """Start a minimal HTTP/1.1 server that replies with a chunked SSE body."""
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            length = 0
+            for header in head.split(b"\r\n"):
+                if header.lower().startswith(b"content-length:"):
+                    length = int(header.split(b":")[1])
+            await reader.readexactly(length)
+            reason = b"OK" if status == 200 else b"Error"
+            writer.write(
+                b"HTTP/1.1 %d %s\r\nContent-Type: text/event-stream\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n" % (status, reason)
+            )
+            for line in lines:
+                chunk = line.encode() + b"\n\n"
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                await writer.drain()
+                if delay:
+                    await asyncio.sleep(delay)
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/chat", connections
+
+
+async def test_streams_data_lines_and_reuses_connection():
+    server, url, connections = await _start_stub(lines=["data: {\"a\": 1}", ": keepalive", "data: [DONE]"])
+    client = AsyncLLMClient(http2=False)
+    try:
+        for _ in range(3):
+            lines = [line async for line in client.stream_sse(url, headers={}, json={"stream": True})]
+            assert lines == ['data: {"a": 1}', "data: [DONE]"]
+        assert len(connections) == 1
+    finally:
+        await client.aclose()
+        server.close()
+
+
+async def test_error_status_raises_upstream_error():
+    server, url, _ = await _start_stub(status=429, lines=["slow down"])
+    client = AsyncLLMClient(http2=False)
+    try:
+        with pytest.raises(UpstreamError) as exc:
+            async for _ in client.stream_sse(url, headers={}, json={}):
+                pass
+        assert exc.value.status_code == 429
+        assert "slow down" in exc.value.detail
+    finally:
+        await client.aclose()
+        server.close()
+
+
+async def test_streaming_does_not_block_event_loop():
+    server, url, _ = await _start_stub(lines=["data: 1", "data: 2", "data: 3"], delay=0.05)
+    client = AsyncLLMClient(http2=False)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        lines = [line async for line in client.stream_sse(url, headers={}, json={})]
+        assert lines == ["data: 1", "data: 2", "data: 3"]
+        assert ticks >= 5
+    finally:
+        task.cancel()
+        await client.aclose()
+        server.close()
+
+
+class _FakeCredential:
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+        self.calls = 0
+
+    def get_token(self, scope):
+        self.calls += 1
+        return SimpleNamespace(token=f"token-{self.calls}", expires_on=int(time.time()) + self.lifetime)
+
+
+async def test_token_cache_reuses_until_refresh_window():
+    credential = _FakeCredential(lifetime=3600)
+    cache = BearerTokenCache(credential, refresh_margin_seconds=300)
+    tokens = await asyncio.gather(*(cache.get_token("scope") for _ in range(5)))
+    assert tokens == ["token-1"] * 5
+    assert credential.calls == 1
+
+    cache.invalidate("scope")
+    assert await cache.get_token("scope") == "token-2"
+
+
+async def test_token_cache_refreshes_near_expiry():
+    credential = _FakeCredential(lifetime=60)
+    cache = BearerTokenCache(credential, refresh_margin_seconds=300)
+    assert await cache.get_token("scope") == "token-1"
+    assert await cache.get_token("scope") == "token-2"
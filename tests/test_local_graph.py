@@ -0,0 +1,186 @@
+"""Tests for the embedded in-memory knowledge graph."""
+
+import pytest
+
+from src.api.knowledge_graph import (
+    EdgeQuery, GraphDatabase_, Neo4jConfig, NodeType, RecommendationEngine, RelationshipType
+)
+from src.api.knowledge_graph import local_graph as local_graph_module
+from src.api.knowledge_graph.local_graph import LocalGraph
+
+
+EVENT_DATA = {
+    "projects": [
+        {
+            "id": "proj-vision",
+            "name": "Vision Assist",
+            "researchArea": "HCI",
+            "team": [{"name": "Ananya Desai"}, {"name": "Vikram Singh"}],
+            "keywords": ["accessibility", "computer vision"],
+            "papers": ["https://arxiv.org/abs/1"],
+        },
+        {
+            "id": "proj-captions",
+            "name": "Live Captions",
+            "researchArea": "HCI",
+            "team": [{"name": "Vikram Singh"}],
+            "keywords": ["accessibility", "speech"],
+            "papers": ["https://arxiv.org/abs/2"],
+        },
+        {
+            "id": "proj-quantum",
+            "name": "Quantum Crypto",
+            "researchArea": "Quantum Computing",
+            "team": [{"name": "Li Wei"}],
+            "keywords": ["cryptography"],
+            "papers": ["https://arxiv.org/abs/3"],
+        },
+    ],
+    "sessions": [
+        {"id": "sess-1", "title": "Accessibility keynote", "speakers": [{"displayName": "Ananya Desai"}]},
+    ],
+}
+
+ARTIFACTS = [
+    {
+        "id": "pka-1",
+        "projectId": "proj-captions",
+        "title": "Captions PKA",
+        "additionalKnowledge": {"technologies": ["Whisper"]},
+    },
+    {
+        "id": "pka-2",
+        "projectId": "proj-vision",
+        "title": "Vision PKA",
+        "additionalKnowledge": {"technologies": ["ONNX Runtime"]},
+    },
+]
+
+
+@pytest.fixture
+def graph():
+    return LocalGraph.from_event_data(EVENT_DATA, artifacts=ARTIFACTS)
+
+
+@pytest.fixture
+def python_only(monkeypatch):
+    monkeypatch.setattr(local_graph_module, "np", None)
+
+
+def test_builds_typed_nodes_and_edges(graph):
+    assert graph.get_node("proj-vision").node_type == NodeType.PROJECT
+    assert graph.get_node("author:vikram singh").node_type == NodeType.AUTHOR
+    assert graph.get_node("concept:accessibility").node_type == NodeType.CONCEPT
+    assert graph.get_node("sess-1").node_type == NodeType.VENUE
+    assert graph.get_node("technology:whisper").node_type == NodeType.TECHNOLOGY
+    assert {n.id for n in graph.neighbors("proj-captions", RelationshipType.USES)} == {"technology:whisper"}
+
+
+def test_traversal(graph):
+    assert graph.neighborhood("proj-vision", depth=1)["concept:accessibility"] == 1
+    assert graph.neighborhood("proj-vision", depth=2)["proj-captions"] == 2
+    assert "proj-quantum" not in graph.neighborhood("proj-vision", depth=5)
+
+    path = graph.shortest_path("sess-1", "proj-captions")
+    assert path[0] == "sess-1" and path[-1] == "proj-captions" and len(path) == 5
+    assert graph.shortest_path("sess-1", "proj-captions", max_depth=3) is None
+    assert graph.shortest_path("proj-vision", "proj-quantum") is None
+
+    connections = graph.connections("proj-vision", RelationshipType.AUTHOR)
+    assert [(rel, target.id) for _, rel, target in connections] == [
+        (RelationshipType.AUTHOR, "author:ananya desai"),
+        (RelationshipType.AUTHOR, "author:vikram singh"),
+    ]
+
+
+def test_pairwise_similarity(graph):
+    # 8 + 7 neighbors; shared: concept:hci, concept:accessibility, author:vikram singh
+    assert graph.jaccard("proj-vision", "proj-captions") == pytest.approx(3 / 12)
+    assert graph.jaccard("proj-vision", "proj-quantum") == 0.0
+    assert graph.jaccard("proj-vision", "missing") == 0.0
+    assert graph.adamic_adar("proj-vision", "proj-captions") > graph.adamic_adar("proj-vision", "proj-quantum")
+
+
+@pytest.mark.parametrize("metric", ["jaccard", "adamic_adar"])
+def test_similar_matches_pairwise_scores(graph, metric):
+    results = graph.similar("proj-vision", metric=metric, node_type=NodeType.PROJECT)
+    assert [node.id for node, _ in results] == ["proj-captions"]
+    pairwise = getattr(graph, metric)("proj-vision", "proj-captions")
+    assert results[0][1] == pytest.approx(pairwise)
+
+
+def test_similar_python_fallback_matches(graph, python_only):
+    results = graph.similar("proj-vision", metric="adamic_adar", limit=50)
+    assert {node.id for node, _ in results} >= {"proj-captions", "sess-1"}
+    for node, score in results:
+        assert score == pytest.approx(graph.adamic_adar("proj-vision", node.id))
+    with pytest.raises(ValueError):
+        graph.similar("proj-vision", metric="cosine")
+
+
+def test_personalized_pagerank(graph):
+    scores = graph.personalized_pagerank("proj-vision")
+    assert sum(scores.values()) == pytest.approx(1.0)
+    assert "proj-quantum" not in scores
+    assert scores["proj-vision"] == max(scores.values())
+
+    ranked = graph.rank("proj-vision", node_type=NodeType.PROJECT)
+    assert [node.id for node, _ in ranked] == ["proj-captions"]
+    assert graph.personalized_pagerank("missing") == {}
+
+
+def test_pagerank_python_fallback_matches(graph, monkeypatch):
+    expected = graph.personalized_pagerank(["proj-vision", "proj-quantum"])
+    monkeypatch.setattr(local_graph_module, "np", None)
+    graph._csr = None
+    actual = graph.personalized_pagerank(["proj-vision", "proj-quantum"])
+    assert actual.keys() == expected.keys()
+    for node_id, score in expected.items():
+        assert actual[node_id] == pytest.approx(score, abs=1e-6)
+
+
+def test_offline_recommendations_use_local_graph(graph):
+    db = GraphDatabase_(Neo4jConfig())
+    engine = RecommendationEngine(db, local_graph=graph)
+
+    papers = engine.recommend_papers("https://arxiv.org/abs/1")
+    assert papers[0]["id"] == "https://arxiv.org/abs/2"
+    assert papers[0]["score"] == 1.0
+
+    technologies = engine.recommend_technologies("proj-vision")
+    assert [t["name"] for t in technologies][:2] == ["ONNX Runtime", "Whisper"]
+
+    experts = engine.find_experts("concept:accessibility")
+    assert experts[0]["id"] == "author:vikram singh"
+    assert experts[0]["connections"] == 2
+
+    assert engine.calculate_similarity("proj-vision", "proj-captions") == pytest.approx(3 / 12)
+    assert EdgeQuery(db, graph).find_connections("proj-quantum", RelationshipType.CITES)[0][2].id == (
+        "https://arxiv.org/abs/3"
+    )
+
+
+def test_global_graph_follows_snapshot_version(tmp_path, monkeypatch):
+    from src.storage import catalog as catalog_module
+    from src.storage.catalog import build_catalog, publish_snapshot
+    from src.storage.event_data import EventDataLoader
+
+    loader = EventDataLoader(data_dir=str(tmp_path))  # no data file
+    monkeypatch.setattr("src.storage.event_data.get_event_data_loader", lambda: loader)
+    monkeypatch.setattr("src.storage.event_data.get_event_data", loader.get_all_data)
+    catalog_module.reset_project_catalog()
+    try:
+        built = local_graph_module.get_local_graph()
+        assert local_graph_module.get_local_graph() is built
+
+        custom = LocalGraph.from_event_data(EVENT_DATA, artifacts=ARTIFACTS)
+        local_graph_module.set_local_graph(custom)
+        assert local_graph_module.get_local_graph() is custom
+
+        publish_snapshot(EVENT_DATA, build_catalog(EVENT_DATA))
+        rebuilt = local_graph_module.get_local_graph()
+        assert rebuilt is not custom
+        assert rebuilt.get_node("proj-vision") is not None
+    finally:
+        local_graph_module.set_local_graph(None)
+        catalog_module.reset_project_catalog()
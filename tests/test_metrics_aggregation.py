@@ -0,0 +1,108 @@
+"""Tests for SQL-side metrics aggregation and percentiles."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from infra.database import Base
+from src.analytics import (
+    DailyMetricsSummary, MetricsAggregator, MetricsRollup, MetricsSnapshot, MetricType, ReportGenerator, percentile
+)
+
+
+DAY = datetime(2026, 3, 10)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    # Only the analytics tables: other models declare conflicting index names
+    tables = [MetricsSnapshot.__table__, MetricsRollup.__table__, DailyMetricsSummary.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add(db, name, values, day=DAY):
+    for i, value in enumerate(values):
+        db.add(MetricsSnapshot(
+            id=f"{name}-{day.date()}-{i}",
+            timestamp=day + timedelta(minutes=i),
+            metric_type=MetricType.HISTOGRAM.value,
+            metric_name=name,
+            value=value
+        ))
+    db.commit()
+
+
+def test_percentile_interpolates_linearly():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 100) == 4.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) is None
+
+
+def test_daily_summary_statistics(db):
+    latencies = list(range(1, 101))
+    random.Random(3).shuffle(latencies)
+    _add(db, "http_request_duration_ms", [float(v) for v in latencies])
+    _add(db, "db_queries_total", [5.0, 1.0, None])
+    _add(db, "http_request_duration_ms", [1000.0], day=DAY + timedelta(days=1))
+
+    summary = MetricsAggregator(db).calculate_daily_summary(DAY + timedelta(hours=15))
+
+    assert summary["date"] == DAY
+    assert summary["total_snapshots"] == 103
+    latency = summary["metrics_by_name"]["http_request_duration_ms"]
+    assert (latency["count"], latency["sum"], latency["min"], latency["max"]) == (100, 5050.0, 1.0, 100.0)
+    assert latency["avg"] == pytest.approx(50.5)
+    assert latency["p50"] == pytest.approx(50.5)
+    assert latency["p95"] == pytest.approx(95.05)
+    assert latency["p99"] == pytest.approx(99.01)
+
+    queries = summary["metrics_by_name"]["db_queries_total"]
+    assert queries["count"] == 3  # NULL values count as snapshots but not in statistics
+    assert queries["sum"] == 6.0 and queries["p50"] == pytest.approx(3.0)
+
+
+def test_summary_loads_no_orm_objects(db, engine):
+    _add(db, "metric", [1.0, 2.0, 3.0])
+    db.expunge_all()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    summary = MetricsAggregator(db).calculate_daily_summary(DAY)
+
+    assert summary["metrics_by_name"]["metric"]["p99"] == pytest.approx(2.98)
+    assert len(statements) == 2
+    assert "GROUP BY" in statements[0]
+    assert "metrics_snapshots.id" not in statements[1]
+    assert not db.identity_map
+
+
+def test_empty_day(db):
+    summary = MetricsAggregator(db).calculate_daily_summary(DAY)
+    assert summary["total_snapshots"] == 0
+    assert summary["metrics_by_name"] == {}
+
+
+def test_weekly_report_includes_period_percentiles(db):
+    for offset in range(3):
+        _add(db, "http_request_duration_ms", [10.0 * (offset + 1)], day=DAY - timedelta(days=offset))
+
+    report = ReportGenerator(db).generate_weekly_report(DAY + timedelta(days=1))
+
+    latency = report["metrics"]["http_request_duration_ms"]
+    assert latency["count"] == 3
+    assert latency["p50"] == pytest.approx(20.0)
@@ -0,0 +1,191 @@
+"""Tests for incremental metrics rollups and compaction."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from infra.database import Base
+from src.analytics import (
+    DailyMetricsSummary, DashboardAPI, MetricsAggregator, MetricsRollup, MetricsRollups,
+    MetricsSnapshot, MetricType, ROLLUP_RELATIVE_ERROR, floor_time, plan_rollup_ranges, rollup_bucket
+)
+
+
+NOW = datetime(2026, 3, 20, 12, 30, 15)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    tables = [MetricsSnapshot.__table__, MetricsRollup.__table__, DailyMetricsSummary.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _record(db, rollups, name, points):
+    for i, (timestamp, value) in enumerate(points):
+        db.add(MetricsSnapshot(
+            id=f"{name}-{i}-{timestamp.isoformat()}",
+            timestamp=timestamp,
+            metric_type=MetricType.HISTOGRAM.value,
+            metric_name=name,
+            value=value
+        ))
+        rollups.record(db, name, timestamp, value)
+    db.commit()
+
+
+def test_plan_uses_coarsest_tiers():
+    plan = plan_rollup_ranges(datetime(2026, 3, 1, 22, 30, 10), datetime(2026, 3, 4, 1, 15))
+    assert plan == [
+        ("minute", datetime(2026, 3, 1, 22, 30), datetime(2026, 3, 1, 23, 0)),
+        ("hour", datetime(2026, 3, 1, 23), datetime(2026, 3, 2)),
+        ("day", datetime(2026, 3, 2), datetime(2026, 3, 4)),
+        ("hour", datetime(2026, 3, 4), datetime(2026, 3, 4, 1)),
+        ("minute", datetime(2026, 3, 4, 1), datetime(2026, 3, 4, 1, 15)),
+    ]
+    assert plan_rollup_ranges(datetime(2026, 3, 1, 10, 5), datetime(2026, 3, 1, 10, 7)) == [
+        ("minute", datetime(2026, 3, 1, 10, 5), datetime(2026, 3, 1, 10, 7))
+    ]
+
+
+def test_rollups_match_raw_aggregation(db):
+    rng = random.Random(7)
+    rollups = MetricsRollups()
+    start = NOW - timedelta(days=3)
+    points = [(start + timedelta(minutes=rng.randrange(3 * 24 * 60)), rng.lognormvariate(4, 1)) for _ in range(500)]
+    _record(db, rollups, "latency", points)
+    _record(db, rollups, "errors", [(NOW - timedelta(hours=1), None)])
+
+    exact = MetricsAggregator(db, rollups=rollups).calculate_period_summary(start, NOW)["metrics_by_name"]
+    rolled = rollups.summarize(db, start, NOW, now=NOW)
+
+    assert rolled["latency"]["count"] == exact["latency"]["count"] == 500
+    assert rolled["latency"]["sum"] == pytest.approx(exact["latency"]["sum"])
+    assert rolled["latency"]["min"] == exact["latency"]["min"]
+    assert rolled["latency"]["max"] == exact["latency"]["max"]
+    for p in ("p50", "p95", "p99"):
+        assert rolled["latency"][p] == pytest.approx(exact["latency"][p], rel=3 * ROLLUP_RELATIVE_ERROR)
+    assert rolled["errors"] == {
+        "count": 1, "sum": None, "avg": None, "min": None, "max": None, "p50": None, "p95": None, "p99": None
+    }
+
+
+def test_concurrent_sessions_accumulate(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    Base.metadata.create_all(engine, tables=[MetricsRollup.__table__])
+    rollups = MetricsRollups()
+    first, second = sessionmaker(bind=engine)(), sessionmaker(bind=engine)()
+    # Both sessions have seen the bucket before either increments it
+    rollups.record(first, "qps", NOW, 1.0)
+    first.commit()
+    assert second.get(MetricsRollup, ("minute", floor_time(NOW, "minute"), "qps")).count == 1
+    rollups.record(first, "qps", NOW, 2.0)
+    first.commit()
+    rollups.record(second, "qps", NOW, 4.0)
+    second.commit()
+
+    stats = rollups.summarize(second, NOW, NOW + timedelta(minutes=1), now=NOW)["qps"]
+    assert (stats["count"], stats["sum"], stats["min"], stats["max"]) == (3, 7.0, 1.0, 4.0)
+    first.close()
+    second.close()
+
+
+def test_locked_update_matches_upsert(db):
+    rollups = MetricsRollups()
+    points = [(NOW, 5.0), (NOW, 5.0), (NOW, None), (NOW, -2.0)]
+    _record(db, rollups, "upsert", points)
+    for timestamp, value in points:
+        for granularity in ("minute", "hour", "day"):
+            rollups._update_locked(db, granularity, floor_time(timestamp, granularity), "locked", value)
+    db.commit()
+
+    summary = rollups.summarize(db, NOW, NOW + timedelta(minutes=1), now=NOW)
+    assert summary["locked"] == summary["upsert"]
+    row = db.get(MetricsRollup, ("minute", floor_time(NOW, "minute"), "upsert"))
+    assert row.histogram == {rollup_bucket(5.0): 2, rollup_bucket(-2.0): 1}
+
+
+def test_non_finite_values_are_counted_without_value(db):
+    rollups = MetricsRollups()
+    _record(db, rollups, "latency", [(NOW, 10.0), (NOW, float("nan")), (NOW, float("inf"))])
+
+    stats = rollups.summarize(db, NOW, NOW + timedelta(minutes=1), now=NOW)["latency"]
+    assert stats["count"] == 3
+    assert (stats["sum"], stats["max"]) == (10.0, 10.0)
+    assert stats["p99"] == pytest.approx(10.0, rel=ROLLUP_RELATIVE_ERROR)
+
+
+def test_series_and_rebuild(db):
+    rollups = MetricsRollups()
+    base = datetime(2026, 3, 20, 9)
+    _record(db, rollups, "qps", [(base, 1.0), (base + timedelta(minutes=5), 3.0), (base + timedelta(hours=1), 10.0)])
+
+    series = rollups.series(db, "qps", base, base + timedelta(hours=2))
+    assert [(b["bucket_start"], b["count"], b["sum"]) for b in series] == [
+        ("2026-03-20T09:00:00", 2, 4.0),
+        ("2026-03-20T10:00:00", 1, 10.0),
+    ]
+    with pytest.raises(ValueError):
+        rollups.series(db, "qps", base, base, granularity="week")
+
+    before = rollups.summarize(db, base, base + timedelta(hours=2), now=NOW)
+    assert rollups.rebuild(db, base, base + timedelta(days=1)) == 3
+    assert rollups.summarize(db, base, base + timedelta(hours=2), now=NOW) == before
+
+
+def test_rebuild_of_unaligned_range_keeps_every_tier(db):
+    rollups = MetricsRollups()
+    day = datetime(2026, 3, 19)
+    _record(db, rollups, "qps", [(day + timedelta(hours=h, minutes=30), float(h)) for h in range(24)])
+    tiers = {g: rollups.series(db, "qps", day, day + timedelta(days=1), granularity=g) for g in ("minute", "hour", "day")}
+
+    assert rollups.rebuild(db, day + timedelta(hours=10), day + timedelta(hours=14)) == 24
+    for granularity, before in tiers.items():
+        assert rollups.series(db, "qps", day, day + timedelta(days=1), granularity=granularity) == before
+    assert tiers["day"][0]["count"] == 24
+
+
+def test_compaction_keeps_coarse_tiers(db):
+    rollups = MetricsRollups(retention={"raw": timedelta(days=1), "minute": timedelta(days=1)})
+    old = NOW - timedelta(days=5)
+    _record(db, rollups, "latency", [(old + timedelta(minutes=i), float(i)) for i in range(90)])
+    _record(db, rollups, "latency", [(NOW - timedelta(minutes=1), 500.0)])
+
+    deleted = rollups.compact(db, now=NOW)
+
+    assert deleted["raw"] == 90
+    assert deleted["minute"] == 90
+    assert deleted["hour"] == 0
+    assert db.query(MetricsSnapshot).count() == 1
+    # An old range with minute edges is read from the hour tier
+    summary = rollups.summarize(db, old + timedelta(minutes=10), old + timedelta(minutes=20), now=NOW)
+    assert summary["latency"]["count"] == 30  # The whole 12:00 hour holds 30 samples
+
+
+def test_performance_dashboard_reads_rollups(db, engine):
+    aggregator = MetricsAggregator(db)
+    for value in (100.0, 200.0, 300.0):
+        aggregator.record_snapshot("http_request_duration_ms", value, MetricType.HISTOGRAM)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    dashboard = DashboardAPI(db, aggregator).get_performance_dashboard(hours=24)
+
+    requests = dashboard["request_performance"]
+    assert requests["samples"] == 3
+    assert requests["summary"]["max"] == 300.0
+    assert requests["summary"]["p50"] == pytest.approx(200.0, rel=ROLLUP_RELATIVE_ERROR)
+    assert len(requests["metrics"]) == 3
+    assert dashboard["database_performance"]["samples"] == 0
+    assert sum("FROM metrics_snapshots" in s for s in statements) == 2  # Only the two "last 10" lookups
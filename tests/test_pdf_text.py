@@ -0,0 +1,69 @@
+"""Tests for streaming, page-parallel PDF text extraction."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.agents import pdf_text
+from src.agents.pdf_text import extract_pdf_text, iter_pdf_pages
+
+
+class _FakePdf:
+    def __init__(self, pages=30, chars_per_page=1000):
+        self.pages = pages
+        self.chars_per_page = chars_per_page
+        self.extracted = []
+        self.lock = threading.Lock()
+
+    def info(self, path):
+        return self.pages, {"Title": "A Paper", "Author": "A. Author"}
+
+    def extract_range(self, path, start, stop):
+        with self.lock:
+            self.extracted.extend(range(start, stop))
+        return [(i + 1, str(i % 10) * self.chars_per_page) for i in range(start, stop)]
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    pdf = _FakePdf()
+    monkeypatch.setattr(pdf_text, "pdf_info", pdf.info)
+    monkeypatch.setattr(pdf_text, "extract_page_range", pdf.extract_range)
+    return pdf
+
+
+def test_pages_stream_in_order_from_parallel_workers(fake_pdf):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pages = list(iter_pdf_pages("paper.pdf", executor=executor, pages_per_task=3))
+
+    assert [p.number for p in pages] == list(range(1, 31))
+    assert pages[12].text == "2" * 1000
+
+
+def test_short_documents_extract_in_process(fake_pdf):
+    fake_pdf.pages = 5
+    pages = list(iter_pdf_pages("paper.pdf"))
+    assert [p.number for p in pages] == [1, 2, 3, 4, 5]
+
+
+def test_no_budget_keeps_every_page(fake_pdf):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        text = extract_pdf_text("paper.pdf", token_budget=None, executor=executor)
+
+    assert text.startswith("Title: A Paper\nAuthor: A. Author\n\n")
+    assert text.count("--- Page ") == 30
+    assert "[Note:" not in text
+
+
+def test_token_budget_cuts_off_and_stops_scheduling(fake_pdf):
+    fake_pdf.pages = 200
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        text = extract_pdf_text("paper.pdf", token_budget=2500, executor=executor)
+
+    body = text[: text.index("\n[Note:")]
+    assert len(body) == 2500 * pdf_text.CHARS_PER_TOKEN
+    assert "--- Page 10 ---" in text and "--- Page 11 ---" not in text
+    assert "PDF has 200 pages; extracted through page 10" in text
+    # Only a bounded window of ranges beyond the cut-off was ever extracted
+    assert len(fake_pdf.extracted) < 40
@@ -0,0 +1,188 @@
+"""
+Tests for local execution of deterministic query plans.
+"""
+
+import pytest
+
+from src.api.query_executor import QueryPlanExecutor, UnsupportedPlanError, format_results
+from src.api.query_router import DeterministicRouter
+from src.storage.catalog import ProjectCatalog
+
+
+EVENT = {
+    "id": "msr-event-2025",
+    "displayName": "MSR Event 2025",
+    "startDate": "2025-03-15T09:00:00Z",
+    "endDate": "2025-03-17T18:00:00Z",
+    "location": {"displayName": "Building 99"},
+    "status": "active",
+}
+
+PROJECTS = [
+    {
+        "id": "proj-1",
+        "name": "Neural Code Intelligence",
+        "description": "Transformer models for code generation",
+        "researchArea": "AI",
+        "team": [{"displayName": "Sarah Chen"}],
+        "equipment": ["Large Display", "Demo Laptop"],
+        "placement": "Innovation Zone A",
+        "preferredFormat": "demo",
+        "recordingSubmitted": True,
+    },
+    {
+        "id": "proj-2",
+        "name": "Quantum Error Correction",
+        "description": "Fault tolerant qubits",
+        "researchArea": "Quantum Computing",
+        "team": [{"displayName": "Michael Zhang"}],
+        "equipment": ["Monitor"],
+        "preferredFormat": "poster",
+    },
+    {
+        "id": "proj-3",
+        "name": "Accessible Interfaces",
+        "description": "Machine learning for screen readers",
+        "researchArea": "HCI",
+        "team": [{"displayName": "Sarah Chen"}, {"displayName": "Priya Patel"}],
+        "equipment": ["Large Display"],
+    },
+]
+
+SESSIONS = [
+    {
+        "id": "sess-1",
+        "title": "Keynote: The Future of AI",
+        "sessionType": "keynote",
+        "speakers": [{"displayName": "Sarah Chen"}],
+        "schedule": {"startDate": "2025-03-15T09:30:00Z", "endDate": "2025-03-15T11:00:00Z", "location": "Auditorium"},
+    },
+    {
+        "id": "sess-2",
+        "title": "Quantum Panel",
+        "sessionType": "panel",
+        "speakers": [{"displayName": "Michael Zhang"}],
+    },
+]
+
+
+@pytest.fixture
+def version():
+    return {"value": 1}
+
+
+@pytest.fixture
+def executor(version):
+    catalog = ProjectCatalog(PROJECTS, SESSIONS)
+    return QueryPlanExecutor(
+        catalog_provider=lambda: catalog,
+        version_provider=lambda: version["value"],
+        event_provider=lambda: EVENT,
+    )
+
+
+@pytest.fixture
+def router():
+    return DeterministicRouter()
+
+
+def _plan(router, intent, entities=None, filters=None):
+    return router.build_query_plan(intent, entities or {}, filters or {})
+
+
+def test_event_overview_projects_return_fields(executor, router):
+    [result] = executor.execute(_plan(router, "event_overview"))
+    assert result.resource == "event"
+    assert result.rows == [{
+        "displayName": "MSR Event 2025",
+        "startDate": "2025-03-15T09:00:00Z",
+        "endDate": "2025-03-17T18:00:00Z",
+        "location": {"displayName": "Building 99"},
+    }]
+    assert "MSR Event 2025" in format_results([result])
+
+
+def test_session_lookup_resolves_field_aliases(executor, router):
+    [result] = executor.execute(_plan(router, "session_lookup", {"personQuery": "Sarah Chen"}))
+    assert result.total == 1
+    assert result.rows[0] == {
+        "id": "sess-1",
+        "title": "Keynote: The Future of AI",
+        "sessionType": "keynote",
+        "startDateTime": "2025-03-15T09:30:00Z",
+        "endDateTime": "2025-03-15T11:00:00Z",
+        "location": "Auditorium",
+        "speakers": ["Sarah Chen"],
+    }
+
+
+def test_project_search_pushes_filters_down(executor, router):
+    [result] = executor.execute(_plan(router, "project_search", {"projectTitleQuery": "machine learning"}))
+    assert [row["id"] for row in result.rows] == ["proj-3"]
+    assert result.rows[0]["team"] == ["Sarah Chen", "Priya Patel"]
+
+    plan = _plan(router, "project_search", {"projectTitleQuery": "code", "categoryQuery": "HCI"})
+    assert executor.execute(plan)[0].total == 0
+
+
+def test_project_get_binds_path_params(executor, router):
+    plan = _plan(router, "project_detail", {"projectId": "proj-2"})
+    [result] = executor.execute(plan, {"projectId": "proj-2"})
+    assert result.operation == "get"
+    assert [row["name"] for row in result.rows] == ["Quantum Error Correction"]
+    assert executor.execute(plan, {"projectId": "missing"})[0].rows == []
+
+
+def test_people_and_category_filters(executor, router):
+    people = executor.execute(_plan(router, "people_lookup", {"personQuery": "sarah"}))[0]
+    assert [row["id"] for row in people.rows] == ["proj-1", "proj-3"]
+    assert set(people.rows[0]) == {"id", "name", "description", "team", "location"}
+
+    category = executor.execute(_plan(router, "category_browse", {"categoryQuery": "QUANTUM"}))[0]
+    assert [row["id"] for row in category.rows] == ["proj-2"]
+
+
+def test_rrs_plans_use_index_and_residual_filters(executor, router):
+    filters = router.extract_filters("Which projects need a large display?", "logistics_equipment")
+    [result] = executor.execute(_plan(router, "logistics_equipment", filters=filters))
+    assert [row["ID"] for row in result.rows] == ["proj-1", "proj-3"]
+    assert result.rows[0]["Large Display"] is True
+    assert result.rows[0]["Equipment Needs"] == ["Large Display", "Demo Laptop"]
+
+    filters = router.extract_filters("Which projects prefer a demo format?", "logistics_format")
+    assert [row["ID"] for row in executor.execute(_plan(router, "logistics_format", filters=filters))[0].rows] == [
+        "proj-1"
+    ]
+
+    filters = router.extract_filters("Which recordings were submitted?", "recording_status")
+    rows = executor.execute(_plan(router, "recording_status", filters=filters))[0].rows
+    assert rows == [{
+        "ID": "proj-1",
+        "Project Title": "Neural Code Intelligence",
+        "Brief Project Description": "Transformer models for code generation",
+        "Team Members": ["Sarah Chen"],
+        "Recording Submitted": True,
+    }]
+
+
+def test_results_memoized_per_data_version(executor, router, version):
+    plan = _plan(router, "category_browse", {"categoryQuery": "AI"})
+    assert executor.execute(plan)[0].cached is False
+    assert executor.execute(plan)[0].cached is True
+
+    version["value"] = 2
+    assert executor.execute(plan)[0].cached is False
+
+
+def test_unsupported_plans(executor, router):
+    assert executor.supports(_plan(router, "event_overview"))
+    assert not executor.supports([])
+    assert not executor.supports([{"operation": "get", "endpoint": "GET /v1/people"}])
+    with pytest.raises(UnsupportedPlanError):
+        executor.execute([{"operation": "get", "endpoint": "GET /v1/people"}])
+
+
+def test_run_routed_intent(executor, router):
+    results = executor.run(router.route("Show me projects about quantum"))
+    assert results and results[0].resource == "project"
+    assert "Quantum Error Correction" in format_results(results)
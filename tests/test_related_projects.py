@@ -0,0 +1,129 @@
+"""
+Tests for the precomputed related-project index.
+"""
+
+import pytest
+
+from src.storage import related_projects
+from src.storage.catalog import ProjectCatalog
+from src.storage.related_projects import RelatedProjectIndex
+
+
+def _project(project_id, name, area, description="", team=(), keywords=()):
+    return {
+        "id": project_id,
+        "name": name,
+        "researchArea": area,
+        "description": description,
+        "team": [{"name": member} for member in team],
+        "keywords": list(keywords),
+    }
+
+
+@pytest.fixture
+def projects():
+    return [
+        _project("vision", "Vision Assist", "Accessibility", "Scene descriptions for low vision users",
+                 team=["Ananya Desai"], keywords=["computer vision"]),
+        _project("captions", "Live Captions", "Accessibility", "Real-time captions for deaf users",
+                 team=["Ananya Desai"], keywords=["speech"]),
+        _project("sign", "Sign Language Vision", "Accessibility", "Computer vision for sign language",
+                 keywords=["computer vision"]),
+        _project("qkd", "Quantum Key Distribution", "Quantum Computing", "Secure key exchange with qubits"),
+        _project("qec", "Quantum Error Correction", "Quantum Computing", "Fault tolerant qubits"),
+    ]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def index_factory(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(related_projects, "np", None)
+    elif related_projects.np is None:
+        pytest.skip("NumPy not installed")
+    return RelatedProjectIndex
+
+
+def _ids(index, project_id, limit=None):
+    return [pid for pid, _ in index.neighbors(project_id, limit)]
+
+
+def _assert_matches_rebuild(index, projects, scores=True):
+    fresh = RelatedProjectIndex(projects, neighbors=index.k)
+    for project in projects:
+        expected = fresh.neighbors(project["id"])
+        actual = index.neighbors(project["id"])
+        assert [pid for pid, _ in actual] == [pid for pid, _ in expected]
+        if scores:
+            assert [s for _, s in actual] == pytest.approx([s for _, s in expected], rel=1e-4)
+
+
+def test_neighbors_are_ranked(index_factory, projects):
+    index = index_factory(projects)
+    assert _ids(index, "vision")[:2] == ["sign", "captions"]
+    assert _ids(index, "qkd") == ["qec"]
+    scores = [score for _, score in index.neighbors("vision")]
+    assert scores == sorted(scores, reverse=True)
+    assert all(0 < score <= 1.0 + 1e-6 for score in scores)
+    assert index.neighbors("missing") == []
+    assert [p["id"] for p, _ in index.similar("qec", limit=1)] == ["qkd"]
+
+
+def test_incremental_upsert_patches_neighbor_lists(projects):
+    index = RelatedProjectIndex(projects, neighbors=2, rebuild_ratio=10)
+
+    moved = _project("qec", "Vision Tablet", "Accessibility", "Computer vision for low vision users",
+                     keywords=["computer vision"])
+    assert index.upsert(moved) is True
+    assert "qec" in _ids(index, "vision")
+    assert "qec" not in _ids(index, "qkd")
+
+    added = _project("braille", "Braille Display", "Accessibility", "Refreshable display for blind users")
+    index.upsert(added)
+    assert _ids(index, "braille")
+
+    # Same features: nothing to rescore
+    assert index.upsert(dict(added)) is False
+
+    # Scores drift only through IDF; rankings match a fresh build
+    updated = [p for p in projects if p["id"] != "qec"] + [moved, added]
+    _assert_matches_rebuild(index, updated, scores=False)
+
+
+def test_remove_marks_affected_lists_stale(projects):
+    index = RelatedProjectIndex(projects, neighbors=1, rebuild_ratio=10)
+    assert _ids(index, "vision") == ["sign"]
+
+    assert index.remove("sign") is True
+    assert index.remove("sign") is False
+    assert "vision" in index._stale
+    assert _ids(index, "vision") == ["captions"]
+    assert "sign" not in index
+
+
+def test_sync_rescoring_only_changes(projects):
+    index = RelatedProjectIndex(projects, rebuild_ratio=10)
+    renamed = dict(projects[3], name="Quantum Networking")
+    changed = index.sync(projects[:3] + [renamed])
+    assert changed == 2  # one update, one removal
+    assert "qec" not in index
+    assert index.neighbors("qkd") == []
+
+
+def test_rebuild_after_many_changes(projects):
+    index = RelatedProjectIndex(projects, rebuild_ratio=0.2)
+    index.upsert(_project("new-1", "Vision Tools", "Accessibility"))
+    index.upsert(_project("new-2", "Vision Kit", "Accessibility"))
+    assert index._changes == 0  # second change crossed the threshold and rebuilt
+    _assert_matches_rebuild(index, projects + [
+        _project("new-1", "Vision Tools", "Accessibility"),
+        _project("new-2", "Vision Kit", "Accessibility"),
+    ])
+
+
+def test_catalog_reuses_index_across_reloads(projects):
+    catalog = ProjectCatalog(projects)
+    assert [p["id"] for p in catalog.similar("qkd")] == ["qec"]
+
+    reloaded = ProjectCatalog(projects[:4], related=catalog.related)
+    assert reloaded.related is catalog.related
+    assert reloaded.similar("qkd") == []
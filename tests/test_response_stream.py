@@ -0,0 +1,128 @@
+"""Tests for streaming, resumable evaluation response collection."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.evaluation.response_stream import ResponseWriter, collect_responses, dataset_fingerprint, iter_test_cases
+
+
+def _dataset(tmp_path, n):
+    path = tmp_path / "cases.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps({"case": i, "source_text": f"text {i}"}) + "\n")
+        f.write("\n")
+    return str(path)
+
+
+class _Crash(Exception):
+    pass
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+async def test_streams_responses_with_bounded_concurrency(tmp_path):
+    dataset = _dataset(tmp_path, 20)
+    in_flight = peak = 0
+
+    async def respond(case):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (case["case"] % 3))
+        in_flight -= 1
+        if case["case"] == 7:
+            return {**case, "agent_response": {"error": "bad"}}
+        return {**case, "agent_response": {"title": case["source_text"]}}
+
+    out = tmp_path / "agent_responses.jsonl"
+    with ResponseWriter(out) as writer:
+        stats = await collect_responses(dataset, respond, writer, concurrency=5)
+
+    assert peak == 5
+    assert stats.processed == 20
+    assert stats.errors == 1
+    records = _read(out)
+    assert sorted(r["case"] for r in records) == list(range(20))
+
+
+async def test_resumes_after_crash(tmp_path):
+    dataset = _dataset(tmp_path, 10)
+    out = tmp_path / "agent_responses.jsonl"
+
+    async def crashing(case):
+        if case["case"] == 4:
+            raise _Crash  # simulate the process dying mid-run
+        return {**case, "agent_response": {}}
+
+    with pytest.raises(_Crash):
+        with ResponseWriter(out) as writer:
+            await collect_responses(dataset, crashing, writer, concurrency=1)
+
+    # A torn line after the last checkpoint must be discarded on resume
+    with open(out, "a", encoding="utf-8") as f:
+        f.write('{"case": 99, "partial')
+
+    seen = []
+
+    async def respond(case):
+        seen.append(case["case"])
+        return {**case, "agent_response": {}}
+
+    with ResponseWriter(out, resume=True) as writer:
+        stats = await collect_responses(dataset, respond, writer, concurrency=3)
+
+    assert stats.skipped == 4
+    assert sorted(seen) == list(range(4, 10))
+    assert sorted(r["case"] for r in _read(out)) == list(range(10))
+
+
+async def test_restart_without_resume(tmp_path):
+    dataset = _dataset(tmp_path, 3)
+    out = tmp_path / "agent_responses.jsonl"
+
+    async def respond(case):
+        return {**case, "agent_response": {}}
+
+    for _ in range(2):
+        with ResponseWriter(out, resume=False) as writer:
+            await collect_responses(dataset, respond, writer)
+
+    assert len(_read(out)) == 3
+
+
+async def test_resume_requires_matching_fingerprint(tmp_path):
+    dataset = _dataset(tmp_path, 4)
+    out = tmp_path / "agent_responses.jsonl"
+
+    async def respond(case):
+        if case["case"] == 2:
+            raise _Crash
+        return {**case, "agent_response": {}}
+
+    with pytest.raises(_Crash):
+        with ResponseWriter(out, fingerprint=dataset_fingerprint(dataset)) as writer:
+            await collect_responses(dataset, respond, writer, concurrency=1)
+
+    with pytest.raises(ValueError):
+        ResponseWriter(out, resume=True, fingerprint="other-agent")
+
+    with ResponseWriter(out, resume=True, fingerprint=dataset_fingerprint(dataset)) as writer:
+        assert writer.completed == {0, 1}
+
+    # Starting over records the new fingerprint
+    ResponseWriter(out, fingerprint="other-agent").close()
+    with ResponseWriter(out, resume=True, fingerprint="other-agent") as writer:
+        assert writer.completed == set()
+
+
+def test_iter_test_cases_is_lazy_and_skips(tmp_path):
+    dataset = _dataset(tmp_path, 5)
+    cases = iter_test_cases(dataset, skip={0, 2})
+    assert next(cases) == (1, {"case": 1, "source_text": "text 1"})
+    assert [i for i, _ in cases] == [3, 4]
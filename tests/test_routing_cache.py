@@ -0,0 +1,95 @@
+"""Tests for memoized routing decisions."""
+
+import pytest
+
+from src.api import query_router
+from src.api.intent_classifier import IntentClassifier
+from src.api.query_router import DeterministicRouter
+from src.api.router_config import router_config
+from src.api.router_prompt import INTENT_PATTERNS
+from src.api.routing_cache import RoutingCache, normalize_query
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RoutingCache(max_entries=8)
+    monkeypatch.setattr(query_router, "get_routing_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def router():
+    return DeterministicRouter()
+
+
+def test_normalize_query():
+    assert normalize_query("  Show me   AI projects?! ") == "show me ai projects"
+    assert normalize_query("What’s happening now?") == "what's happening now"
+    assert normalize_query('Details for "Vision Assist".') == 'details for "vision assist"'
+
+
+def test_near_duplicates_share_a_decision(cache, router):
+    first = router.route("What's happening now?")
+    again = router.route("what's   happening NOW")
+    assert again is first
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["hit_rate"] == pytest.approx(0.5)
+
+
+def test_case_sensitive_decisions_use_exact_key(cache, router):
+    named = router.route("Find projects by John Smith")
+    assert named.entities["personQuery"] == "John Smith"
+
+    lowered = router.route("find projects by john smith")
+    assert lowered is not named
+    assert lowered.entities["personQuery"] is None
+
+    assert router.route("Find  projects by John Smith?") is named
+
+    # A lowercase decision seen first must not leak to a capitalized variant
+    assert router.route("find projects by jane doe").entities["personQuery"] is None
+    assert router.route("Find projects by Jane Doe").entities["personQuery"] == "Jane Doe"
+
+    quoted = router.route('Tell me about "Vision Assist"')
+    assert router.route('tell me about "vision assist"').entities["projectTitleQuery"] == "vision assist"
+    assert router.route('Tell me about "Vision Assist"') is quoted
+
+
+def test_cached_decision_matches_uncached(cache, router):
+    for query in ["Show me sessions about AI", "Which projects need 2 monitors?", "Projects in HCI category"]:
+        cached = router.route(query)
+        assert cached.to_dict() == router._route(query).to_dict()
+        assert router.route(query) is cached
+
+
+def test_lru_eviction(cache, router):
+    cache.max_entries = 2
+    first = router.route("What is this event?")
+    router.route("Show me sessions about AI")
+    router.route("What is this event?")
+    router.route("Find keynote sessions")
+
+    assert len(cache) == 2
+    assert cache.get_stats()["evictions"] == 1
+    assert router.route("What is this event?") is first
+    assert cache.get_stats()["misses"] == 3
+
+
+def test_invalidated_by_config_and_pattern_changes(cache, router, monkeypatch):
+    first = router.route("What is this event?")
+
+    monkeypatch.setattr(router_config, "deterministic_threshold", 0.5)
+    assert router.route("What is this event?") is not first
+    assert cache.get_stats()["invalidations"] == 1
+
+    second = router.route("What is this event?")
+    router.classifier = IntentClassifier(INTENT_PATTERNS)
+    assert router.route("What is this event?") is not second
+    assert cache.get_stats()["invalidations"] == 2
+
+
+def test_cache_can_be_disabled(cache, router, monkeypatch):
+    monkeypatch.setattr(router_config, "routing_cache_size", 0)
+    router.route("What is this event?")
+    router.route("What is this event?")
+    assert cache.get_stats()["hits"] == cache.get_stats()["misses"] == 0
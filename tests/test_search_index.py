@@ -0,0 +1,76 @@
+"""
+Tests for the BM25 inverted search index.
+"""
+
+import pytest
+
+from src.storage.search_index import SearchIndex, tokenize
+
+
+@pytest.fixture
+def index():
+    projects = [
+        {
+            "id": "proj-1",
+            "name": "Privacy-Preserving Analytics",
+            "description": "Federated learning with differential privacy for healthcare data",
+            "researchArea": "Security & Privacy",
+            "team": [{"displayName": "Priya Patel", "role": "Researcher"}],
+        },
+        {
+            "id": "proj-2",
+            "name": "Learning to Rank",
+            "description": "Ranking models for web search",
+            "researchArea": "Artificial Intelligence",
+            "team": [{"displayName": "Sarah Chen"}],
+        },
+        {
+            "id": "proj-3",
+            "name": "Quantum Networking",
+            "description": "Entanglement distribution over fiber",
+            "researchArea": "Quantum Computing",
+            "team": [{"displayName": "Michael Zhang"}],
+        },
+    ]
+    sessions = [
+        {
+            "id": "sess-1",
+            "title": "Keynote: Quantum Futures",
+            "description": "Where quantum computing is heading",
+            "speakers": [{"displayName": "Michael Zhang"}],
+        }
+    ]
+    return SearchIndex.from_event_data(projects, sessions)
+
+
+def test_tokenize():
+    assert tokenize("Privacy-Preserving, ML 2.0!") == ["privacy", "preserving", "ml", "2", "0"]
+
+
+def test_conjunctive_match(index):
+    hits = index.search("federated learning", kind="project")
+    assert [h.id for h in hits] == ["proj-1"]
+
+
+def test_ranking_prefers_title_matches(index):
+    hits = index.search("learning", kind="project")
+    assert [h.id for h in hits] == ["proj-2", "proj-1"]
+    assert hits[0].score > hits[1].score
+
+
+def test_prefix_matching(index):
+    assert [h.id for h in index.search("quant", kind="project")] == ["proj-3"]
+    assert index.search("quant", kind="project", prefix=False) == []
+
+
+def test_kinds_and_fields(index):
+    assert {h.kind for h in index.search("quantum")} == {"project", "session"}
+    people = index.search("zhang", kind="person")
+    assert [h.id for h in people] == ["Michael Zhang"]
+    assert index.search("fiber", fields=("name",)) == []
+
+
+def test_limit_and_empty_query(index):
+    assert len(index.search("quantum", limit=1)) == 1
+    assert index.search("   ") == []
+    assert index.search("nonexistentterm") == []
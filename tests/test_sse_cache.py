@@ -0,0 +1,55 @@
+"""Tests for pre-serialized SSE card action responses."""
+
+import json
+
+from src.api.caching import SessionCache
+from src.api.sse_cache import EncodedResponse, SSEResponseCache, dumps
+
+
+def _parse(frame: bytes):
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    return json.loads(frame[len(b"data: "):-2])
+
+
+def test_frame_matches_stdlib_payload():
+    card = {"type": "AdaptiveCard", "body": [{"type": "TextBlock", "text": "Café ☕"}]}
+    context = {"conversation_stage": "show_results", "turn_count": 3, "current_project_id": None}
+    frame = EncodedResponse.encode("Found 2 projects.", card).frame(context)
+    expected = {"delta": "Found 2 projects.", "adaptive_card": card, "context": context}
+    assert _parse(frame) == expected
+    assert list(_parse(frame)) == ["delta", "adaptive_card", "context"]
+
+
+def test_frame_without_card():
+    response = EncodedResponse.encode("Category selected.", None)
+    assert not response.has_card
+    assert _parse(response.frame({"turn_count": 1})) == {"delta": "Category selected.", "context": {"turn_count": 1}}
+
+
+def test_dumps_falls_back_for_non_string_keys():
+    assert json.loads(dumps({1: "a"})) == {"1": "a"}
+
+
+def test_cache_keys_are_normalized_and_versioned():
+    cache = SSEResponseCache(SessionCache(name="sse"))
+    key = cache.key("filter_by_area", {"area": "ai", "limit": 10}, 1)
+    assert key == cache.key("filter_by_area", {"limit": 10, "area": "ai"}, 1)
+    assert key != cache.key("filter_by_area", {"limit": 10, "area": "ai"}, 2)
+
+    assert cache.get(key) is None
+    stored = cache.put(key, "Found 1 project.", {"type": "AdaptiveCard"})
+    assert cache.get(key) is stored
+    # Context is spliced per turn onto the same cached bytes
+    assert _parse(stored.frame({"turn_count": 1}))["context"] == {"turn_count": 1}
+    assert _parse(stored.frame({"turn_count": 2}))["context"] == {"turn_count": 2}
+
+
+def test_stats_grouped_by_action():
+    store = SessionCache(name="sse", key_label=lambda key: key.split("|", 1)[0])
+    cache = SSEResponseCache(store)
+    for area in ("ai", "hci", "systems"):
+        key = cache.key("filter_by_area", {"area": area}, 1)
+        cache.get(key)
+        cache.put(key, area, None)
+        cache.get(key)
+    assert store.get_stats()["per_key"] == {"filter_by_area": {"hits": 3, "misses": 3, "evictions": 0}}
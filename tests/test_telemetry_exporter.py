@@ -0,0 +1,125 @@
+"""Tests for the batching telemetry exporter and PII sanitization."""
+
+import re
+import threading
+import time
+
+import pytest
+
+from src.observability import telemetry
+from src.observability.exporter import BatchingExporter
+
+
+def _legacy_sanitize(value, max_length=200):
+    """Previous implementation: compiles one regex per keyword per call."""
+    sanitized = value
+    for pattern in telemetry._PII_PATTERNS:
+        sanitized = pattern.sub("[REDACTED]", sanitized)
+    for keyword in telemetry._SENSITIVE_KEYWORDS:
+        pattern = re.compile(rf"\b{keyword}[\s:=]+\S+", re.IGNORECASE)
+        sanitized = pattern.sub(f"{keyword}=[REDACTED]", sanitized)
+    if len(sanitized) > max_length:
+        sanitized = sanitized[:max_length] + "…"
+    return sanitized
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "my PASSWORD: hunter2 and token=abc123",
+        "email me at jane.doe@example.com or call +1 (425) 555-0100",
+        "auth = xyz; license: D1234567; apikey:zzz",
+        "nothing sensitive here",
+        "Dr. Jane Smith asked about social security " * 10,
+    ],
+)
+def test_sanitize_matches_legacy(text):
+    assert telemetry._sanitize_text(text) == _legacy_sanitize(text)
+
+
+def test_exporter_batches_by_size():
+    batches = []
+    exporter = BatchingExporter(sink=batches.append, batch_size=3, flush_interval=60)
+    exporter.start()
+    try:
+        for i in range(7):
+            assert exporter.submit(i)
+        assert exporter.flush(timeout=2)
+    finally:
+        exporter.stop()
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert exporter.get_stats()["exported"] == 7
+
+
+def test_exporter_flushes_on_interval():
+    exported = threading.Event()
+    exporter = BatchingExporter(sink=lambda batch: exported.set(), batch_size=100, flush_interval=0.05)
+    exporter.start()
+    try:
+        exporter.submit("event")
+        assert exported.wait(timeout=2)
+    finally:
+        exporter.stop()
+
+
+def test_exporter_drops_when_full_without_blocking():
+    release = threading.Event()
+    exporter = BatchingExporter(sink=lambda batch: release.wait(2), max_queue_size=2, batch_size=1, flush_interval=60)
+    exporter.start()
+    try:
+        exporter.submit("blocks-sink")
+        time.sleep(0.05)
+        start = time.perf_counter()
+        results = [exporter.submit(i) for i in range(5)]
+        assert time.perf_counter() - start < 0.05
+        assert results.count(False) == 3
+        assert exporter.get_stats()["dropped"] == 3
+    finally:
+        release.set()
+        exporter.stop()
+
+
+def test_exporter_survives_sink_errors():
+    def sink(batch):
+        raise RuntimeError("ingestion down")
+
+    exporter = BatchingExporter(sink=sink, batch_size=1, flush_interval=60)
+    exporter.start()
+    try:
+        exporter.submit(1)
+        assert exporter.flush(timeout=2)
+        assert exporter.get_stats()["failures"] == 1
+        assert exporter.running
+    finally:
+        exporter.stop()
+
+
+class _FakeClient:
+    def __init__(self):
+        self.events = []
+        self.flushes = 0
+
+    def track_event(self, name, properties, measurements):
+        self.events.append((name, properties, measurements))
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_track_event_sanitizes_on_exporter_thread(monkeypatch):
+    client = _FakeClient()
+    exporter = BatchingExporter(sink=telemetry._send_batch, batch_size=10, flush_interval=60)
+    monkeypatch.setattr(telemetry, "_telemetry_client", client)
+    monkeypatch.setattr(telemetry, "_exporter", exporter)
+    exporter.start()
+    try:
+        telemetry.log_refusal("policy", "contact me at jane@example.com")
+        assert client.events == []  # only enqueued on the caller's thread
+        assert exporter.flush(timeout=2)
+    finally:
+        exporter.stop()
+
+    name, props, _ = client.events[0]
+    assert name == "ai_content_refusal"
+    assert props["query_context"] == "contact me at [REDACTED]"
+    assert client.flushes == 1